@@ -0,0 +1,96 @@
+"""Benchmark the ASGI tool response encoding: legacy path vs fast path.
+
+Legacy path (before the fast JSON path):
+  jsonable_encoder(result) -> audit payload with the full result ->
+  dict returned to FastAPI -> JSONResponse.render (json.dumps)
+
+Fast path (`asgi._ok_response`):
+  one json.dumps of the envelope straight into the body, audit summary only.
+
+Usage:
+  python scripts/bench_asgi_json.py [--repeat 3]
+
+Results cover sizes from 1 KB to 50 MB for two shapes: a scene-dump-like
+nested dict and a base64 image string.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(repo_root, "src"))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from blender_mcp import asgi, logging_utils  # noqa: E402
+
+SIZES = [1 << 10, 64 << 10, 1 << 20, 10 << 20, 50 << 20]
+
+
+def scene_dump(target_bytes: int) -> Dict[str, Any]:
+    objects: List[Dict[str, Any]] = []
+    approx = 0
+    i = 0
+    while approx < target_bytes:
+        obj = {
+            "name": f"Object.{i:06d}",
+            "type": "MESH",
+            "location": [i * 0.1, i * 0.2, i * 0.3],
+            "materials": ["Material.001", "Material.002"],
+            "visible": True,
+        }
+        objects.append(obj)
+        approx += 130
+        i += 1
+    return {"name": "Scene", "object_count": len(objects), "objects": objects}
+
+
+def base64_image(target_bytes: int) -> Dict[str, Any]:
+    raw = os.urandom(max(1, target_bytes * 3 // 4))
+    return {"format": "png", "data": base64.b64encode(raw).decode("ascii")}
+
+
+def legacy_path(result: Any) -> bytes:
+    encoded = jsonable_encoder(result)
+    logging_utils.log_action("asgi", "call_tool", {"tool": "bench", "params": {}}, {"status": "ok", "result": encoded})
+    return JSONResponse(content={"status": "ok", "result": encoded}).body
+
+
+def fast_path(result: Any) -> bytes:
+    return asgi._ok_response("bench", {}, result).body
+
+
+def best_of(fn: Callable[[Any], bytes], result: Any, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(result)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'shape':<8} {'size':>8} {'legacy ms':>11} {'fast ms':>9} {'speedup':>8}")
+    for shape, factory in (("scene", scene_dump), ("base64", base64_image)):
+        for size in SIZES:
+            result = factory(size)
+            assert legacy_path(result) == fast_path(result)
+            legacy = best_of(legacy_path, result, args.repeat)
+            fast = best_of(fast_path, result, args.repeat)
+            label = f"{size // 1024}K" if size < (1 << 20) else f"{size >> 20}M"
+            print(f"{shape:<8} {label:>8} {legacy * 1000:>11.2f} {fast * 1000:>9.2f} {legacy / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark segmented vs single-stream downloads against a local server.
+
+A local range-capable HTTP server caps every connection at a fixed rate
+(as CDNs and long fat links effectively do per TCP stream), then the same
+file is fetched with `downloaders.download_to_file` using 1, 2, 4 and 8
+segments.
+
+Usage:
+  python scripts/bench_segmented_download.py [--size-mb 64] [--rate-mb 32] [--repeat 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(repo_root, "src"))
+
+from blender_mcp import downloaders  # noqa: E402
+
+BLOCK = 64 * 1024
+
+
+def make_handler(payload: bytes, rate: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            body = payload
+            rng = self.headers.get("Range")
+            if rng:
+                first, _, last = rng.split("=")[1].partition("-")
+                start, end = int(first), int(last) if last else len(payload) - 1
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{len(payload)}")
+                body = payload[start : end + 1]
+            else:
+                self.send_response(200)
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", '"bench"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            # Per-connection throttle
+            started = time.perf_counter()
+            for offset in range(0, len(body), BLOCK):
+                self.wfile.write(body[offset : offset + BLOCK])
+                ahead = (offset + BLOCK) / rate - (time.perf_counter() - started)
+                if ahead > 0:
+                    time.sleep(ahead)
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--rate-mb", type=float, default=32.0, help="per-connection cap in MB/s")
+    parser.add_argument("--repeat", type=int, default=2)
+    args = parser.parse_args()
+
+    payload = os.urandom(args.size_mb << 20)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(payload, args.rate_mb * 1e6))
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}/asset.zip"
+
+    print(f"{args.size_mb} MB file, {args.rate_mb:g} MB/s per connection")
+    print(f"{'segments':>8} {'best s':>8} {'MB/s':>8} {'speedup':>8}")
+    baseline = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for segments in (1, 2, 4, 8):
+            best = float("inf")
+            for i in range(args.repeat):
+                dest = os.path.join(tmp, f"asset-{segments}-{i}.zip")
+                t0 = time.perf_counter()
+                downloaders.download_to_file(url, dest, segments=segments, segment_min_size=1, resume=False)
+                best = min(best, time.perf_counter() - t0)
+                with open(dest, "rb") as fh:
+                    assert fh.read() == payload
+                os.unlink(dest)
+            baseline = baseline or best
+            mbps = len(payload) / best / 1e6
+            print(f"{segments:>8} {best:>8.2f} {mbps:>8.1f} {baseline / best:>7.1f}x")
+    httpd.shutdown()
+
+
+if __name__ == "__main__":
+    main()
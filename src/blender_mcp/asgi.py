@@ -1,27 +1,37 @@
 import asyncio
+import contextvars
+import hashlib
 import inspect
+import json
 import logging
+import math
 import os
 import threading
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, cast
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 
-from . import logging_utils
+from . import download_scheduler, http, logging_utils, progress, tool_executors
 from . import server as srv  # defines `mcp` and helpers but does not call run()
+from .dispatchers.strategies.profiling import ProfilingInstrumentationStrategy
 from .errors import (
+    CircuitOpenError,
     ExecutionTimeoutError,
     ExternalServiceError,
     HandlerNotFoundError,
     InvalidParamsError,
     PolicyDeniedError,
+    ServiceBusyError,
 )
 from .errors import (
     HandlerError as CanonicalHandlerError,
 )
+from .health import HealthProber
+from .services import polyhaven_warmup
+from .services.connection import fleet
 
 logger = logging.getLogger("BlenderMCPASGI")
 
@@ -38,6 +48,11 @@ def _map_exception_to_http(exc: Exception) -> Tuple[int, Dict[str, Any]]:
         return 403, {"message": str(exc), "error_code": "policy_denied"}
     if isinstance(exc, ExecutionTimeoutError):
         return 504, {"message": "Handler timed out", "error_code": "timeout"}
+    if isinstance(exc, ServiceBusyError):
+        return 503, {"message": str(exc), "error_code": "busy"}
+    if isinstance(exc, CircuitOpenError):
+        # Not an upstream reply: the call was refused here until the breaker lets one through
+        return 503, {"message": str(exc), "error_code": "circuit_open"}
     if isinstance(exc, ExternalServiceError):
         return 502, {"message": str(exc), "error_code": "external_error"}
     if isinstance(exc, CanonicalHandlerError):
@@ -118,124 +133,779 @@ def _extract_module_level_tools(server: Any) -> list[Dict[str, Any]]:
     return out
 
 
-def make_health(server_module: Any):
-    def health() -> Dict[str, Any]:
-        """Return basic health information about the MCP server and Blender connection."""
-        try:
-            server_module.get_blender_connection()
-            return {"status": "ok", "blender": "connected"}
-        except Exception as e:
-            return {"status": "error", "message": str(e)}
+def make_health(prober: HealthProber):
+    async def health() -> Dict[str, Any]:
+        """Return the last known health of Blender and the providers (never blocks on a probe)."""
+        prober.kick()
+        return prober.snapshot()
 
     return health
 
 
-def make_list_tools(server_module: Any):
-    def list_tools() -> Dict[str, Any]:
-        """Return a list of available tools exposed by the MCP server."""
+def _dumps(obj: Any) -> bytes:
+    # Same settings as starlette's JSONResponse.render
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def _expose_registry_tools() -> bool:
+    # Controlled via env var to avoid changing default behavior / tests.
+    return os.getenv("BLENDER_MCP_EXPOSE_REGISTRY_TOOLS", "").lower() in {"1", "true", "yes"}
+
+
+def _profile_control_allowed() -> bool:
+    # Opt-in: switching the profiler on slows every call and exposes code paths
+    return os.getenv("BLENDER_MCP_DEBUG_PROFILE", "").lower() in {"1", "true", "yes"}
+
+
+def _registry_version() -> int:
+    from .services import registry as services_registry  # local import to avoid cycles
+
+    return services_registry.registry_version()
+
+
+def _collect_tools(server_module: Any, expose_registry: bool) -> List[Dict[str, Any]]:
+    tools_info: List[Dict[str, Any]] = []
+    server = server_module
+    if hasattr(server, "mcp"):
+        tools_info.extend(_extract_tools_from_registry(server.mcp))
+
+    tools_info.extend(_extract_module_level_tools(server))
+
+    # Optional enrichment: expose services registry entries as tools when enabled.
+    if expose_registry:
         try:
-            tools_info: List[Dict[str, Any]] = []
-            server = server_module
-            if hasattr(server, "mcp"):
-                tools_info.extend(_extract_tools_from_registry(server.mcp))
+            from .services import registry as services_registry  # local import to avoid cycles
 
-            tools_info.extend(_extract_module_level_tools(server))
+            for name in services_registry.list_services():
+                tools_info.append({"name": name, "source": "services_registry"})
+        except Exception:
+            # Non-fatal: best-effort enrichment only
+            logger.exception("Failed to include services registry in /tools list")
+    return tools_info
 
-            # Optional enrichment: expose services registry entries as tools when enabled.
-            # Controlled via env var to avoid changing default behavior / tests.
-            expose_registry = os.getenv("BLENDER_MCP_EXPOSE_REGISTRY_TOOLS", "").lower() in {"1", "true", "yes"}
-            if expose_registry:
-                try:
-                    from .services import registry as services_registry  # local import to avoid cycles
 
-                    for name in services_registry.list_services():
-                        tools_info.append({"name": name, "source": "services_registry"})
-                except Exception:
-                    # Non-fatal: best-effort enrichment only
-                    logger.exception("Failed to include services registry in /tools list")
+class ToolCatalog:
+    """Precomputed `GET /tools` body, rebuilt only when its inputs change.
+
+    Introspecting the server module (signatures, docstrings) on every call
+    is wasteful: clients such as `gemini_client` fetch the catalog before
+    each prompt. The catalog keeps the serialized body and its ETag keyed
+    by the services registry version, the registry exposure flag and the
+    server module namespace size; `invalidate` forces a rebuild for
+    changes those cannot see.
+    """
 
-            return {"status": "ok", "tools": tools_info}
+    def __init__(self, server_module: Any) -> None:
+        self._server_module = server_module
+        self._lock = threading.Lock()
+        self._key: Optional[Tuple[Any, ...]] = None
+        self._body = b""
+        self._etag = ""
+        self.builds = 0
+
+    def _current_key(self) -> Tuple[Any, ...]:
+        expose = _expose_registry_tools()
+        # Module namespace size is a cheap O(1) guard against tools being
+        # attached to the server module after startup.
+        namespace = len(getattr(self._server_module, "__dict__", {}))
+        return (expose, _registry_version() if expose else None, namespace)
+
+    def get(self) -> Tuple[bytes, str]:
+        """Return `(body, etag)`, rebuilding the catalog if it is stale."""
+        key = self._current_key()
+        with self._lock:
+            if key != self._key:
+                tools_info = _collect_tools(self._server_module, expose_registry=key[0])
+                self._body = _dumps({"status": "ok", "tools": tools_info})
+                self._etag = '"' + hashlib.sha256(self._body).hexdigest()[:32] + '"'
+                self._key = key
+                self.builds += 1
+            return self._body, self._etag
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._key = None
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    # Weak comparison (RFC 9110 §13.1.2): ignore the W/ prefix
+    return "*" in candidates or any(c.removeprefix("W/") == etag for c in candidates)
+
+
+def make_list_tools(server_module: Any, catalog: Optional[ToolCatalog] = None):
+    catalog = catalog or ToolCatalog(server_module)
+
+    def list_tools(request: Request) -> Response:
+        """Return a list of available tools exposed by the MCP server."""
+        try:
+            body, etag = catalog.get()
         except Exception as e:
             logger.exception("Failed to list tools")
             raise HTTPException(status_code=500, detail=str(e))
 
+        # no-cache: clients may store the catalog but must revalidate it
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
 
     return list_tools
 
 
-def make_call_tool(server_module: Any):
+async def _read_params(request: Request) -> Dict[str, Any]:
+    """Return the `params` mapping of a `{"params": {...}}` JSON body."""
+    try:
+        raw = await request.json()
+    except Exception:
+        raw = {}
+
+    # Normalize to a mapping for type checkers
+    if isinstance(raw, dict):
+        body = cast(Dict[str, Any], raw)
+    else:
+        body = {}
+
+    return cast(Dict[str, Any], body.get("params") or {})
+
+
+def _resolve_tool(server_module: Any, name: str) -> Any:
+    func = getattr(server_module, name, None)
+    if func is None or not callable(func):
+        raise HTTPException(status_code=404, detail=f"Tool '{name}' not found")
+    return func
+
+
+async def _invoke_tool(
+    func: Any,
+    name: str,
+    params: Dict[str, Any],
+    profiler: Optional[ProfilingInstrumentationStrategy] = None,
+) -> Any:
+    """Run a tool function (async directly, sync on its class executor).
+
+    Sync tools run on the dedicated executor of their class (see
+    `tool_executors`) behind a per-tool gate, in a copy of the current
+    context so context variables (e.g. the progress reporter) are visible
+    on the worker thread. Raises `ServiceBusyError` when the tool's queue
+    is full.
+    """
+    if asyncio.iscoroutinefunction(func):
+        return await func(None, **params)
+    ctx = contextvars.copy_context()
+
+    def call() -> Any:
+        if profiler is not None and profiler.enabled:
+            # Only sync tools are profiled. Since Python 3.12 cProfile hooks
+            # sys.monitoring process-wide: the profile also records whatever
+            # other threads run meanwhile (see `make_profile_endpoints`).
+            return profiler.profile_call(name, lambda: func(None, **params))
+        return func(None, **params)
+
+    return await tool_executors.get_tool_executors().run(name, lambda: ctx.run(call), tool=func)
+
+
+def _encode_ok_body(result: Any) -> bytes:
+    """Serialize `{"status": "ok", "result": result}` walking the result once.
+
+    JSON-native results (dict/list/str/numbers/None) are serialized
+    directly into the response body. Anything else (pydantic models,
+    dataclasses, datetimes...) falls back to `jsonable_encoder` first.
+    """
+    try:
+        return _dumps({"status": "ok", "result": result})
+    except (TypeError, ValueError):
+        return _dumps({"status": "ok", "result": jsonable_encoder(result)})
+
+
+def _summarize_result(result: Any, nbytes: int) -> Dict[str, Any]:
+    """Small audit-friendly description of a result (never the full payload)."""
+    summary: Dict[str, Any] = {"type": type(result).__name__, "bytes": nbytes}
+    if isinstance(result, dict):
+        keys = list(cast(Dict[str, Any], result).keys())
+        summary["keys"] = [str(k) for k in keys[:20]]
+        summary["key_count"] = len(keys)
+    elif isinstance(result, (list, tuple, str)):
+        summary["length"] = len(cast(Any, result))
+    return summary
+
+
+def _ok_body(name: str, params: Dict[str, Any], result: Any) -> bytes:
+    """Serialize a successful result and emit its audit summary."""
+    body = _encode_ok_body(result)
+    try:
+        logging_utils.log_action(
+            "asgi",
+            "call_tool",
+            {"tool": name, "params": params},
+            {"status": "ok", "result_summary": _summarize_result(result, len(body))},
+        )
+    except Exception:
+        logger.exception("Failed to emit audit log for successful tool call")
+    return body
+
+
+def _ok_response(name: str, params: Dict[str, Any], result: Any) -> Response:
+    body = _ok_body(name, params, result)
+    # Body is already serialized: a plain Response avoids a second encoding pass
+    return Response(content=body, media_type="application/json")
+
+
+def _error_body(name: str, params: Dict[str, Any], exc: Exception) -> Tuple[int, Dict[str, Any]]:
+    """Map `exc` to an HTTP status and error body, emitting the audit log."""
+    status_code, payload = _map_exception_to_http(exc)
+    # Normalize payload to a concrete typed variable for the editor
+    payload_typed: Dict[str, Any] = payload
+    # Build an explicit error body so the editor can infer concrete types
+    body: Dict[str, Any] = {
+        "status": "error",
+        "message": str(payload_typed.get("message", "")),
+        "error_code": str(payload_typed.get("error_code", "internal_error")),
+    }
+    retry_after = getattr(exc, "retry_after", None)
+    if isinstance(retry_after, (int, float)):
+        # Busy queues and open circuits tell clients when to come back
+        body["retry_after"] = retry_after
+
+    try:
+        logging_utils.log_action(
+            "asgi",
+            "call_tool_error",
+            {"tool": name, "params": params},
+            body,
+        )
+    except Exception:
+        logger.exception("Failed to emit audit log for tool error")
+    return status_code, body
+
+
+def make_call_tool(server_module: Any, profiler: Optional[ProfilingInstrumentationStrategy] = None):
     async def call_tool(name: str, request: Request) -> Any:
+        params = await _read_params(request)
+        func = _resolve_tool(server_module, name)
+
+        try:
+            result = await _invoke_tool(func, name, params, profiler)
+            return _ok_response(name, params, result)
+        except Exception as e:
+            logger.exception("Error calling tool %s", name)
+            status_code, body = _error_body(name, params, e)
+            headers = {"Retry-After": str(math.ceil(body["retry_after"]))} if "retry_after" in body else None
+            return JSONResponse(status_code=status_code, content=body, headers=headers)
+
+    return call_tool
+
+
+def _sse(event: str, data: bytes) -> bytes:
+    # Compact JSON never contains raw newlines, so one data line is enough
+    return b"event: " + event.encode("ascii") + b"\ndata: " + data + b"\n\n"
+
+
+def make_stream_tool(
+    server_module: Any,
+    profiler: Optional[ProfilingInstrumentationStrategy] = None,
+    *,
+    heartbeat: float = 15.0,
+):
+    """Build `POST /tools/{name}/stream`: the tool call as Server-Sent Events.
+
+    Events, in order:
+
+    - ``progress``: stage updates reported via `progress.report_progress`
+    - ``partial``: intermediate results reported via `progress.report_partial`
+    - ``result``: the same body `POST /tools/{name}` returns on success
+    - ``error``: the mapped error body plus its HTTP ``status_code``
+
+    A comment line is sent every `heartbeat` seconds without events so
+    proxies do not close idle connections during long downloads or jobs.
+    """
+
+    async def stream_tool(name: str, request: Request) -> Response:
+        params = await _read_params(request)
+        func = _resolve_tool(server_module, name)
+
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+
+        def _on_progress(event: Dict[str, Any]) -> None:
+            # Called from the executor thread running the tool
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+        with progress.reporting(_on_progress):
+            # The task copies the current context, reporter included
+            task = asyncio.ensure_future(_invoke_tool(func, name, params, profiler))
+
+        # Sentinel queued after every event the tool reported before finishing
+        task.add_done_callback(lambda _t: queue.put_nowait({"type": None}))
+
+        async def _events() -> AsyncIterator[bytes]:
+            try:
+                while True:
+                    try:
+                        event = dict(await asyncio.wait_for(queue.get(), timeout=heartbeat))
+                    except asyncio.TimeoutError:
+                        yield b": keepalive\n\n"
+                        continue
+                    kind = event.pop("type", "progress")
+                    if kind is None:
+                        break
+                    yield _sse(str(kind), _dumps(jsonable_encoder(event)))
+                try:
+                    result = task.result()
+                except Exception as e:
+                    logger.exception("Error calling tool %s", name)
+                    status_code, body = _error_body(name, params, e)
+                    yield _sse("error", _dumps(dict(body, status_code=status_code)))
+                else:
+                    yield _sse("result", _ok_body(name, params, result))
+            finally:
+                # Client went away: async tools can be cancelled, sync ones finish on their thread
+                if not task.done():
+                    task.cancel()
+
+        return StreamingResponse(
+            _events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return stream_tool
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _merge_json_object(meta: Dict[str, Any], body: bytes) -> bytes:
+    # Prepend `meta` keys to an already-serialized JSON object without re-encoding it
+    return _dumps(meta)[:-1] + b"," + body[1:]
+
+
+_BATCH_MODES = {"parallel", "sequential"}
+
+
+def _parse_batch(raw: Any, max_items: int) -> Tuple[List[Any], str, Optional[int], bool]:
+    """Validate a batch body; accepts a bare array or `{"calls": [...], ...}`."""
+    options: Dict[str, Any] = {}
+    if isinstance(raw, list):
+        calls = cast(List[Any], raw)
+    elif isinstance(raw, dict) and isinstance(raw.get("calls"), list):
+        options = cast(Dict[str, Any], raw)
+        calls = cast(List[Any], options["calls"])
+    else:
+        raise HTTPException(status_code=400, detail="Body must be an array of {name, params} or {\"calls\": [...]}")
+    if len(calls) > max_items:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {max_items} calls")
+
+    mode = options.get("mode", "parallel")
+    if mode not in _BATCH_MODES:
+        raise HTTPException(status_code=400, detail=f"mode must be one of: {', '.join(sorted(_BATCH_MODES))}")
+    concurrency = options.get("max_concurrency")
+    if concurrency is not None and (not isinstance(concurrency, int) or concurrency < 1):
+        raise HTTPException(status_code=400, detail="max_concurrency must be a positive integer")
+    return calls, mode, concurrency, bool(options.get("stop_on_error", False))
+
+
+def _batch_error(meta: Dict[str, Any], status_code: int, message: str, error_code: str) -> bytes:
+    body = {"status": "error", "message": message, "error_code": error_code}
+    return _dumps(dict(meta, status_code=status_code, **body))
+
+
+def _parse_batch_call(index: int, call: Any) -> Tuple[Dict[str, Any], str, Dict[str, Any], Optional[bytes]]:
+    """Return `(meta, name, params, error_item)` for one batch entry."""
+    meta: Dict[str, Any] = {"index": index}
+    if not isinstance(call, dict) or not isinstance(call.get("name"), str):
+        return meta, "", {}, _batch_error(meta, 400, "each call needs a string 'name'", "invalid_params")
+    call_d = cast(Dict[str, Any], call)
+    meta["name"] = call_d["name"]
+    if "id" in call_d:
+        meta["id"] = call_d["id"]
+    params = call_d.get("params") or {}
+    if not isinstance(params, dict):
+        return meta, "", {}, _batch_error(meta, 400, "'params' must be an object", "invalid_params")
+    return meta, cast(str, call_d["name"]), cast(Dict[str, Any], params), None
+
+
+async def _run_call_item(
+    server_module: Any,
+    profiler: Optional[ProfilingInstrumentationStrategy],
+    meta: Dict[str, Any],
+    name: str,
+    params: Dict[str, Any],
+) -> Tuple[bytes, bool]:
+    """Run one call and return `(item, ok)`: its body prefixed with `meta`."""
+    try:
+        func = _resolve_tool(server_module, name)
+    except HTTPException as e:
+        return _batch_error(meta, e.status_code, str(e.detail), "not_found"), False
+
+    try:
+        result = await _invoke_tool(func, name, params, profiler)
+    except Exception as e:
+        logger.exception("Error calling tool %s", name)
+        status_code, body = _error_body(name, params, e)
+        return _dumps(dict(meta, status_code=status_code, **body)), False
+    return _merge_json_object(dict(meta, status_code=200), _ok_body(name, params, result)), True
+
+
+BatchRunner = Callable[[int, Any], Awaitable[Tuple[bytes, bool]]]
+
+
+async def _run_batch_sequential(calls: List[Any], run_one: BatchRunner, stop_on_error: bool) -> List[bytes]:
+    items: List[bytes] = []
+    failed = False
+    for index, call in enumerate(calls):
+        if failed:
+            # 424 Failed Dependency: an earlier step of the plan failed
+            meta = _parse_batch_call(index, call)[0]
+            items.append(_dumps(dict(meta, status="skipped", status_code=424)))
+            continue
+        item, ok = await run_one(index, call)
+        items.append(item)
+        failed = stop_on_error and not ok
+    return items
+
+
+async def _run_batch_parallel(calls: List[Any], run_one: BatchRunner, concurrency: int) -> List[bytes]:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _bounded(index: int, call: Any) -> bytes:
+        async with sem:
+            item, _ok = await run_one(index, call)
+            return item
+
+    return list(await asyncio.gather(*(_bounded(i, c) for i, c in enumerate(calls))))
+
+
+def make_batch_tools(
+    server_module: Any,
+    profiler: Optional[ProfilingInstrumentationStrategy] = None,
+    *,
+    max_concurrency: Optional[int] = None,
+    max_items: Optional[int] = None,
+):
+    """Build `POST /tools:batch`: run several tool calls in one request.
+
+    Body: ``[{"name", "params", "id"?}, ...]`` or
+    ``{"calls": [...], "mode": "parallel"|"sequential", "max_concurrency": int,
+    "stop_on_error": bool}``.
+
+    ``parallel`` (default) runs calls concurrently, bounded by
+    `max_concurrency` (``BLENDER_MCP_BATCH_CONCURRENCY``, default 8; a
+    request may only lower it). ``sequential`` runs them one at a time in
+    request order, as bpy-touching steps usually need; with
+    ``stop_on_error`` the remaining calls are reported as ``skipped``.
+
+    The response always has status 200 and one entry per call, in request
+    order: the single-call body plus ``index``, ``name``, ``id`` and the
+    ``status_code`` that `POST /tools/{name}` would have returned.
+
+    Downloads started by batch calls run in the ``batch`` priority class of
+    the download scheduler, behind interactive calls.
+    """
+    limit = max_concurrency or _env_int("BLENDER_MCP_BATCH_CONCURRENCY", 8)
+    item_limit = max_items or _env_int("BLENDER_MCP_BATCH_MAX_ITEMS", 100)
+
+    async def _run_one(index: int, call: Any) -> Tuple[bytes, bool]:
+        meta, name, params, error_item = _parse_batch_call(index, call)
+        if error_item is not None:
+            return error_item, False
+        # Batch imports yield the link to interactive calls
+        with download_scheduler.download_priority("batch"):
+            return await _run_call_item(server_module, profiler, meta, name, params)
+
+    async def batch_tools(request: Request) -> Response:
         try:
             raw = await request.json()
         except Exception:
-            raw = {}
+            raise HTTPException(status_code=400, detail="Body must be valid JSON")
+        calls, mode, requested, stop_on_error = _parse_batch(raw, item_limit)
 
-        # Normalize to a mapping for type checkers
-        if isinstance(raw, dict):
-            body = cast(Dict[str, Any], raw)
+        if mode == "sequential":
+            items = await _run_batch_sequential(calls, _run_one, stop_on_error)
         else:
-            body = {}
+            items = await _run_batch_parallel(calls, _run_one, min(limit, requested or limit))
 
-        params = cast(Dict[str, Any], body.get("params") or {})
+        body = b'{"status":"ok","results":[' + b",".join(items) + b"]}"
+        return Response(content=body, media_type="application/json")
 
-        server = server_module
-        func = getattr(server, name, None)
-        if func is None or not callable(func):
-            raise HTTPException(status_code=404, detail=f"Tool '{name}' not found")
+    return batch_tools
 
-        try:
-            if asyncio.iscoroutinefunction(func):
-                result = await func(None, **params)
-            else:
-                loop = asyncio.get_running_loop()
-                result = await loop.run_in_executor(None, lambda: func(None, **params))
 
-            encoded = jsonable_encoder(result)
-            try:
-                result_payload: Dict[str, Any] = {"status": "ok", "result": encoded}
-                logging_utils.log_action(
-                    "asgi",
-                    "call_tool",
-                    {"tool": name, "params": params},
-                    result_payload,
-                )
-            except Exception:
-                logger.exception("Failed to emit audit log for successful tool call")
+def _parse_ws_frame(text: str) -> Tuple[Dict[str, Any], str, Dict[str, Any], Optional[bytes]]:
+    """Return `(meta, tool, params, error_frame)` for one `{id, tool, params}` frame."""
+    try:
+        frame = json.loads(text)
+    except ValueError:
+        return {"id": None}, "", {}, _batch_error({"id": None}, 400, "frame must be a JSON object", "invalid_params")
+    if not isinstance(frame, dict):
+        return {"id": None}, "", {}, _batch_error({"id": None}, 400, "frame must be a JSON object", "invalid_params")
+    frame_d = cast(Dict[str, Any], frame)
+    meta: Dict[str, Any] = {"id": frame_d.get("id")}
+    tool = frame_d.get("tool")
+    params = frame_d.get("params") or {}
+    if not isinstance(tool, str) or not tool:
+        return meta, "", {}, _batch_error(meta, 400, "frame needs a string 'tool'", "invalid_params")
+    if not isinstance(params, dict):
+        return meta, "", {}, _batch_error(meta, 400, "'params' must be an object", "invalid_params")
+    return meta, tool, cast(Dict[str, Any], params), None
+
+
+async def _receive_frame(websocket: WebSocket) -> Optional[str]:
+    """Return the next text (or UTF-8 binary) frame, or None once the client left."""
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        return None
+    text = message.get("text")
+    if text is None:
+        text = (message.get("bytes") or b"").decode("utf-8", "replace")
+    return text
+
+
+def make_ws_session(
+    server_module: Any,
+    profiler: Optional[ProfilingInstrumentationStrategy] = None,
+    *,
+    max_concurrency: Optional[int] = None,
+):
+    """Build the `/ws` endpoint: multiplexed tool calls over one WebSocket.
+
+    Clients send text frames ``{"id": ..., "tool": str, "params": {...}}``.
+    Each call runs as soon as it arrives and its reply, the single-call
+    body plus ``id`` and ``status_code``, is sent as soon as it completes,
+    so replies may arrive out of order. At most `max_concurrency`
+    (``BLENDER_MCP_WS_CONCURRENCY``, default 8) calls run per connection;
+    further frames are not read until a slot frees up.
+    """
+    limit = max_concurrency or _env_int("BLENDER_MCP_WS_CONCURRENCY", 8)
 
-            return {"status": "ok", "result": encoded}
-        except Exception as e:
-            logger.exception("Error calling tool %s", name)
+    async def ws_session(websocket: WebSocket) -> None:
+        await websocket.accept()
+        sem = asyncio.Semaphore(limit)
+        send_lock = asyncio.Lock()
+        pending: set["asyncio.Task[None]"] = set()
 
-            status_code, payload = _map_exception_to_http(e)
-            # Normalize payload to a concrete typed variable for the editor
-            payload_typed: Dict[str, Any] = payload
-            # Build an explicit error body so the editor can infer concrete types
-            body = {
-                "status": "error",
-                "message": str(payload_typed.get("message", "")),
-                "error_code": str(payload_typed.get("error_code", "internal_error")),
-            }
+        async def _reply(item: bytes) -> None:
+            async with send_lock:
+                await websocket.send_text(item.decode("utf-8"))
 
+        async def _handle(meta: Dict[str, Any], tool: str, params: Dict[str, Any]) -> None:
             try:
-                logging_utils.log_action(
-                    "asgi",
-                    "call_tool_error",
-                    {"tool": name, "params": params},
-                    body,
-                )
+                item, _ok = await _run_call_item(server_module, profiler, meta, tool, params)
+                await _reply(item)
             except Exception:
-                logger.exception("Failed to emit audit log for tool error")
+                # Connection closed while replying: nothing left to notify
+                logger.debug("Failed to send /ws reply for %s", tool, exc_info=True)
+            finally:
+                sem.release()
 
-            return JSONResponse(status_code=status_code, content=jsonable_encoder(body))
+        try:
+            while True:
+                text = await _receive_frame(websocket)
+                if text is None:
+                    break
+                meta, tool, params, error_frame = _parse_ws_frame(text)
+                if error_frame is not None:
+                    await _reply(error_frame)
+                    continue
+                await sem.acquire()
+                task = asyncio.ensure_future(_handle(meta, tool, params))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            for task in pending:
+                task.cancel()
 
-    return call_tool
-def create_app(server_module: Optional[object] = None) -> FastAPI:
+    return ws_session
+
+
+def make_executor_stats():
+    def executor_stats() -> Dict[str, Any]:
+        """Per-tool queue-wait / run-time metrics of the sync tool executors."""
+        return {"status": "ok", "executors": tool_executors.get_tool_executors().stats()}
+
+    return executor_stats
+
+
+def make_fleet_stats():
+    def fleet_stats() -> Dict[str, Any]:
+        """Load, latency and health of each Blender instance of the fleet."""
+        current = fleet.get_fleet()
+        if current is None:
+            return {"status": "ok", "enabled": False}
+        return {"status": "ok", "enabled": True, "fleet": current.stats()}
+
+    return fleet_stats
+
+
+def make_http_stats():
+    def http_stats() -> Dict[str, Any]:
+        """Per-host requests and connection reuse of the shared HTTP session."""
+        return {"status": "ok", "http": http.stats()}
+
+    return http_stats
+
+
+def make_download_stats():
+    def download_stats() -> Dict[str, Any]:
+        """Queue depth, wait times and throughput per download priority class."""
+        return {"status": "ok", "downloads": download_scheduler.get_scheduler().stats()}
+
+    return download_stats
+
+
+def make_asset_cache_stats():
+    def asset_cache_stats() -> Dict[str, Any]:
+        """Size, hit/miss/revalidation counters of the persistent asset cache."""
+        from .asset_cache import get_asset_cache
+
+        cache = get_asset_cache()
+        if cache is None:
+            return {"status": "ok", "enabled": False}
+        return {"status": "ok", "enabled": True, "cache": cache.stats()}
+
+    return asset_cache_stats
+
+
+def make_workspace_stats():
+    def workspace_stats() -> Dict[str, Any]:
+        """Disk usage of the download workspace, per provider, and GC counters."""
+        from .workspace import get_workspace
+
+        return {"status": "ok", "workspace": get_workspace().stats()}
+
+    return workspace_stats
+
+
+class SessionKeyMiddleware:
+    """Bind the ``X-Blender-Session`` header to the fleet affinity key.
+
+    Commands issued while serving the request (including sync tools on
+    executor threads, which run in a copy of the context) then stick to
+    the Blender instance that served the session before.
+    """
+
+    header = b"x-blender-session"
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        key = next((v.decode("latin-1") for k, v in scope.get("headers", ()) if k == self.header), None)
+        with fleet.session(key):
+            await self.app(scope, receive, send)
+
+
+def make_profile_endpoints(app: FastAPI, profiler: ProfilingInstrumentationStrategy) -> None:
+    """Register the on-demand profiling endpoints under `/debug/profile`.
+
+    - `GET /debug/profile`: profiler status
+    - `POST /debug/profile`: enable with `{"handler": str, "sample_rate": float}`
+    - `DELETE /debug/profile`: disable (`?reset=true` also drops collected stats)
+    - `GET /debug/profile/report`: flat top-N text report (`?top=30&sort=cumulative`)
+    - `GET /debug/profile/pstats`: download aggregated stats as a `.pstats` file
+
+    Enabling and disabling answer 403 unless ``BLENDER_MCP_DEBUG_PROFILE=1``.
+    Since Python 3.12 a profiled call also records every other thread
+    running meanwhile (other tool calls included): profile on a quiet
+    server, or read the reports with that in mind.
+    """
+    _register_profile_control(app, profiler)
+    _register_profile_export(app, profiler)
+
+
+def _profile_control_denied() -> JSONResponse:
+    status_code, payload = _map_exception_to_http(
+        PolicyDeniedError("profiling control is disabled; set BLENDER_MCP_DEBUG_PROFILE=1 to allow it")
+    )
+    return JSONResponse(status_code=status_code, content={"status": "error", **payload})
+
+
+def _register_profile_control(app: FastAPI, profiler: ProfilingInstrumentationStrategy) -> None:
+    def profile_status() -> Dict[str, Any]:
+        return {"status": "ok", "profile": profiler.status()}
+
+    async def profile_enable(request: Request) -> Any:
+        if not _profile_control_allowed():
+            return _profile_control_denied()
+        try:
+            raw = await request.json()
+        except Exception:
+            raw = {}
+        body = cast(Dict[str, Any], raw) if isinstance(raw, dict) else {}
+        try:
+            profiler.enable(body.get("handler", ""), float(body.get("sample_rate", 1.0)))
+        except (TypeError, ValueError) as e:
+            status_code, payload = _map_exception_to_http(InvalidParamsError(str(e)))
+            return JSONResponse(status_code=status_code, content={"status": "error", **payload})
+        return {"status": "ok", "profile": profiler.status()}
+
+    def profile_disable(reset: bool = False) -> Any:
+        if not _profile_control_allowed():
+            return _profile_control_denied()
+        profiler.disable()
+        if reset:
+            profiler.reset()
+        return {"status": "ok", "profile": profiler.status()}
+
+    app.get("/debug/profile")(profile_status)
+    app.post("/debug/profile")(profile_enable)
+    app.delete("/debug/profile")(profile_disable)
+
+
+def _register_profile_export(app: FastAPI, profiler: ProfilingInstrumentationStrategy) -> None:
+    def profile_report(top: int = 30, sort: str = "cumulative") -> Response:
+        try:
+            return PlainTextResponse(profiler.report(top_n=top, sort=sort))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except LookupError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+
+    def profile_pstats() -> Response:
+        try:
+            data = profiler.export_pstats()
+        except LookupError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        return Response(
+            content=data,
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": 'attachment; filename="blender_mcp.pstats"'},
+        )
+
+    app.get("/debug/profile/report")(profile_report)
+    app.get("/debug/profile/pstats")(profile_pstats)
+
+
+def create_app(
+    server_module: Optional[object] = None,
+    *,
+    profiler: Optional[ProfilingInstrumentationStrategy] = None,
+    health_prober: Optional[HealthProber] = None,
+) -> FastAPI:
     """Factory to create a FastAPI app bound to a specific `server_module`.
 
     This makes the adapter test-friendly: tests can pass a fake server module
     (with `main`, `get_blender_connection`, etc.) and isolate the MCP thread per-app.
+
+    `profiler` may be shared with a `Dispatcher` (as its instrumentation
+    strategy) so `/debug/profile` reports both dispatcher and tool calls.
+    `health_prober` replaces the default background `HealthProber`.
     """
     server_module = server_module or srv
+    profiler = profiler or ProfilingInstrumentationStrategy()
+    tool_catalog = ToolCatalog(server_module)
+    health_prober = health_prober or HealthProber()
 
     # Note: MCP runner is started via a background thread created by
     # _ensure_mcp_thread(app, server_module). We intentionally avoid an
@@ -252,23 +922,50 @@ def create_app(server_module: Optional[object] = None) -> FastAPI:
         # start the mcp thread if needed (helper extracted to reduce complexity)
         _ensure_mcp_thread(app, server_module)
 
+        # Build the /tools catalog up front so the first client does not pay for it
+        try:
+            tool_catalog.get()
+        except Exception:
+            logger.exception("Failed to precompute tool catalog")
+
+        health_prober.start()
+        # Catalog and asset metadata are fetched in the background, bounded in time
+        try:
+            polyhaven_warmup.start_warm_up()
+        except Exception:
+            logger.exception("Failed to start PolyHaven warm-up")
         try:
             yield
         finally:
+            await health_prober.stop()
             # shutdown helper handles graceful stop and join
             _shutdown_mcp_thread(app)
 
     app = FastAPI(title="BlenderMCP ASGI adapter", lifespan=_lifespan)
+    app.add_middleware(SessionKeyMiddleware)
     # Provide sane defaults so code (and tests) can access `app.state.server_module`
     # even if the lifespan/startup hasn't executed yet (TestClient behavior varies
     # by version and context manager usage).
     app.state.server_module = server_module
     app.state.mcp_thread = None
+    app.state.profiler = profiler
+    app.state.tool_catalog = tool_catalog
+    app.state.health_prober = health_prober
 
     # Register routes using small factory functions so create_app stays small
-    app.get("/health")(make_health(server_module))
-    app.get("/tools")(make_list_tools(server_module))
-    app.post("/tools/{name}")(make_call_tool(server_module))
+    app.get("/health")(make_health(health_prober))
+    app.get("/tools")(make_list_tools(server_module, tool_catalog))
+    app.post("/tools/{name}")(make_call_tool(server_module, profiler))
+    app.post("/tools/{name}/stream")(make_stream_tool(server_module, profiler))
+    app.post("/tools:batch")(make_batch_tools(server_module, profiler))
+    app.websocket("/ws")(make_ws_session(server_module, profiler))
+    app.get("/debug/executors")(make_executor_stats())
+    app.get("/debug/fleet")(make_fleet_stats())
+    app.get("/debug/cache")(make_asset_cache_stats())
+    app.get("/debug/http")(make_http_stats())
+    app.get("/debug/downloads")(make_download_stats())
+    app.get("/debug/workspace")(make_workspace_stats())
+    make_profile_endpoints(app, profiler)
 
     return app
 
@@ -0,0 +1,593 @@
+"""Persistent, content-addressed cache for downloaded assets.
+
+PolyHaven, Sketchfab and Hyper3D downloads used to land in a fresh temp
+directory every time, even for an asset fetched minutes earlier. The
+cache keeps them on disk:
+
+- entries are keyed by URL (or an explicit key such as
+  ``sketchfab:<uid>`` when the URL is a short-lived signed link) and
+  remember the ``ETag`` / ``Last-Modified`` of what was stored
+- bodies are stored once per content hash under ``blobs/``; identical
+  files reached through different URLs share storage
+- archives are extracted once into ``extracted/<hash>/`` and that
+  directory is handed to every later caller (treat it as read-only)
+- an entry younger than ``max_age`` is served without any request; older
+  ones are revalidated with ``If-None-Match`` / ``If-Modified-Since``
+  (``304`` keeps the entry), and served stale if the upstream is down
+- least-recently-used entries are evicted once blobs plus extracted
+  trees exceed the byte budget
+
+Concurrent requests for the same key are coalesced, so a burst of calls
+downloads the asset once. Several processes (the MCP server and the
+Blender addon) may share one cache root: the index is merged with what
+the others saved, under a lock file, before every write, and an entry
+whose blob another process evicted is treated as a miss.
+
+Configuration (environment):
+
+- ``BLENDER_MCP_ASSET_CACHE``: ``0`` disables the cache
+- ``BLENDER_MCP_ASSET_CACHE_DIR``: cache root (``~/.cache/blender-mcp/assets``)
+- ``BLENDER_MCP_ASSET_CACHE_BYTES``: byte budget (10 GiB)
+- ``BLENDER_MCP_ASSET_CACHE_MAX_AGE``: seconds an entry is served without
+  revalidation (300)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Sequence, Set
+from urllib.parse import urlparse
+
+import requests
+from requests.exceptions import RequestException
+
+from . import circuit_breaker, downloaders, http
+from .dispatchers.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 10 << 30
+DEFAULT_MAX_AGE = 300.0
+
+
+def _hash_file(path: str, algorithms: Sequence[str]) -> Dict[str, str]:
+    hashers = {name: hashlib.new(name) for name in algorithms}
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(downloaders.CHUNK_SIZE), b""):
+            for hasher in hashers.values():
+                hasher.update(block)
+    return {name: h.hexdigest() for name, h in hashers.items()}
+
+
+def _normalize(checksums: Optional[Mapping[str, str]]) -> Dict[str, str]:
+    return {name.lower(): value.lower() for name, value in (checksums or {}).items() if value}
+
+
+@dataclasses.dataclass(frozen=True)
+class _Request:
+    url: str
+    headers: Optional[Mapping[str, Any]]
+    timeout: Optional[float]
+    session: Optional[requests.sessions.Session]
+    expected_size: Optional[int]
+    checksums: Dict[str, str]
+
+
+@contextlib.contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Exclusive advisory lock on `path` shared with other processes."""
+    with open(path, "a+b") as fh:
+        if os.name == "nt":
+            import msvcrt
+
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)  # type: ignore[attr-defined]
+            try:
+                yield
+            finally:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)  # type: ignore[attr-defined]
+        else:
+            import fcntl
+
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def _tree_size(path: str) -> int:
+    total = 0
+    for dirpath, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
+
+
+def _link_tree(src: str, dest: str) -> None:
+    """Hard-link (else copy) every file under `src` into `dest`."""
+    for dirpath, _, files in os.walk(src):
+        target = os.path.normpath(os.path.join(dest, os.path.relpath(dirpath, src)))
+        os.makedirs(target, exist_ok=True)
+        for name in files:
+            try:
+                os.link(os.path.join(dirpath, name), os.path.join(target, name))
+            except OSError:
+                shutil.copyfile(os.path.join(dirpath, name), os.path.join(target, name))
+
+
+def _suffix_for(url: str) -> str:
+    name = os.path.basename(urlparse(url).path)
+    # Keep double extensions such as ".gltf.zip" so tools recognise the format
+    dot = name.find(".")
+    return name[dot:] if 0 < dot and len(name) - dot <= 16 else ""
+
+
+class AssetCache:
+    """Disk cache of downloaded assets with conditional revalidation."""
+
+    def __init__(
+        self,
+        root: str,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = DEFAULT_MAX_AGE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._flight = SingleFlight()
+        for sub in ("blobs", "extracted", "tmp"):
+            os.makedirs(os.path.join(self.root, sub), exist_ok=True)
+        self._index_path = os.path.join(self.root, "index.json")
+        # Keys dropped here since the last save: not taken back from disk
+        self._removed: Set[str] = set()
+        self._index_locks = 0
+        self._entries: Dict[str, Dict[str, Any]] = self._load_index()
+        self.counters = {"hits": 0, "misses": 0, "revalidated": 0, "stale": 0, "evictions": 0, "hashed": 0}
+
+    # --- index ---
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self._index_path, encoding="utf-8") as fh:
+                entries = json.load(fh).get("entries", {})
+        except (OSError, ValueError):
+            return {}
+        # Drop entries whose blob vanished (manual cleanup, crash mid-eviction)
+        return {k: e for k, e in entries.items() if os.path.exists(self._blob_path(e["blob"]))}
+
+    @contextlib.contextmanager
+    def _index_locked(self) -> Iterator[None]:
+        """Hold the thread lock and the cross-process index lock (re-entrant)."""
+        with self._lock:
+            if self._index_locks:
+                self._index_locks += 1
+                try:
+                    yield
+                finally:
+                    self._index_locks -= 1
+                return
+            with _file_lock(self._index_path + ".lock"):
+                self._index_locks = 1
+                try:
+                    yield
+                finally:
+                    self._index_locks = 0
+
+    def _merge_index(self) -> None:
+        """Take in entries other processes saved; caller holds `_index_locked`."""
+        for key, theirs in self._load_index().items():
+            if key in self._removed:
+                continue
+            mine = self._entries.get(key)
+            if mine is None or theirs.get("last_access", 0) > mine.get("last_access", 0):
+                self._entries[key] = theirs
+
+    def _save_index(self) -> None:
+        with self._index_locked():
+            self._merge_index()
+            tmp = f"{self._index_path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump({"version": 1, "entries": self._entries}, fh)
+            os.replace(tmp, self._index_path)
+            self._removed.clear()
+
+    def _blob_path(self, blob: str) -> str:
+        return os.path.join(self.root, "blobs", blob[:2], blob)
+
+    def _extracted_path(self, blob: str) -> str:
+        return os.path.join(self.root, "extracted", blob.split(".", 1)[0])
+
+    # --- lookups ---
+    def _fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        return entry is not None and self._clock() - entry["validated_at"] < self.max_age
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Entry for `key`, forgotten if its blob is gone (evicted by another process)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not os.path.exists(self._blob_path(entry["blob"])):
+                del self._entries[key]
+                self._removed.add(key)
+                return None
+            return entry
+
+    def _touch(self, key: str, entry: Dict[str, Any], **updates: Any) -> None:
+        with self._lock:
+            entry.update(updates, last_access=self._clock())
+            self._entries[key] = entry
+            self._save_index()
+
+    def peek(self, key: str) -> Optional[str]:
+        """Return the cached file for `key` if fresh, without any request."""
+        with self._lock:
+            entry = self._lookup(key)
+            if not self._fresh(entry):
+                return None
+            assert entry is not None
+            self.counters["hits"] += 1
+            self._touch(key, entry)
+            return self._blob_path(entry["blob"])
+
+    def peek_extracted(self, key: str) -> Optional[str]:
+        """Return the extracted directory for `key` if fresh and already extracted."""
+        with self._lock:
+            entry = self._lookup(key)
+            if not self._fresh(entry) or not entry or not entry.get("extracted_size"):  # type: ignore[union-attr]
+                return None
+            path = self._extracted_path(entry["blob"])
+            if not os.path.isdir(path):
+                return None
+            self.counters["hits"] += 1
+            self._touch(key, entry)
+            return path
+
+    # --- fetching ---
+    def fetch(
+        self,
+        url: str,
+        *,
+        key: Optional[str] = None,
+        headers: Optional[Mapping[str, Any]] = None,
+        timeout: Optional[float] = 120.0,
+        session: Optional[requests.sessions.Session] = None,
+        expected_size: Optional[int] = None,
+        checksums: Optional[Mapping[str, str]] = None,
+    ) -> str:
+        """Return the path of the cached body of `url`, downloading it if needed.
+
+        With `expected_size` / `checksums` (e.g. ``{"md5": ...}``) the body
+        is verified: while streaming for new downloads, and against the
+        digests recorded in the index for cached ones. A digest missing
+        from the index is computed once and recorded; an entry that does
+        not match is downloaded again.
+        """
+        req = _Request(url, headers, timeout, session, expected_size, _normalize(checksums))
+        key = key or url
+        entry, _ = self._flight.do("fetch:" + key, lambda: self._fetch_entry(key, req), name="asset_cache")
+        return self._blob_path(entry["blob"])
+
+    def _fetch_entry(self, key: str, req: "_Request") -> Dict[str, Any]:
+        entry = self._lookup(key)
+        if entry is not None and not self._verify(key, entry, req):
+            logger.warning("asset cache: %s does not match the expected size/checksum, downloading again", key)
+            entry = None
+        if entry is not None and self._fresh(entry):
+            self.counters["hits"] += 1
+            self._touch(key, entry)
+            return entry
+        if entry is not None and (entry.get("etag") or entry.get("last_modified")):
+            reused = self._revalidate_entry(key, entry, req)
+            if reused is not None:
+                return reused
+        self.counters["misses"] += 1
+        return self._download(key, req)
+
+    def _verify(self, key: str, entry: Dict[str, Any], req: "_Request") -> bool:
+        if req.expected_size is not None and entry["size"] != req.expected_size:
+            return False
+        digests = entry.setdefault("digests", {})
+        missing = [name for name in req.checksums if name not in digests]
+        if missing:
+            # Hashed once; later reuses compare against the recorded digest
+            digests.update(_hash_file(self._blob_path(entry["blob"]), missing))
+            self.counters["hashed"] += 1
+            with self._lock:
+                self._save_index()
+        return all(digests[name] == value for name, value in req.checksums.items())
+
+    def _revalidate_entry(self, key: str, entry: Dict[str, Any], req: "_Request") -> Optional[Dict[str, Any]]:
+        try:
+            status = self._revalidate(entry, req)
+        except RequestException as e:
+            logger.warning("asset cache: serving stale %s (revalidation failed: %s)", key, e)
+            self.counters["stale"] += 1
+            self._touch(key, entry)
+            return entry
+        if status == 304:
+            self.counters["revalidated"] += 1
+            self._touch(key, entry, validated_at=self._clock())
+            return entry
+        return None
+
+    def _revalidate(self, entry: Dict[str, Any], req: "_Request") -> int:
+        req_headers = dict(req.headers or {})
+        if entry.get("etag"):
+            req_headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            req_headers["If-Modified-Since"] = entry["last_modified"]
+        getter = (req.session if req.session is not None else http.get_session()).get
+
+        def _probe() -> int:
+            resp = getter(req.url, timeout=req.timeout, headers=req_headers, stream=True)
+            try:
+                if resp.status_code != 304:
+                    resp.raise_for_status()
+                return resp.status_code
+            finally:
+                resp.close()
+
+        breaker = circuit_breaker.breaker_for_url(req.url)
+        return breaker.call(_probe) if breaker is not None else _probe()
+
+    def _download(self, key: str, req: "_Request") -> Dict[str, Any]:
+        suffix = _suffix_for(req.url)
+        # Stable staging name per key: an interrupted download resumes next time.
+        # Processes sharing the root take turns on it through a lock file; one
+        # that waited reuses what the other stored instead of downloading again.
+        staging = os.path.join(self.root, "tmp", hashlib.sha256(key.encode()).hexdigest()[:32] + suffix)
+        with _file_lock(staging + ".lock"):
+            stored = self._stored_elsewhere(key, req)
+            if stored is not None:
+                return stored
+            return self._download_locked(key, req, staging, suffix)
+
+    def _stored_elsewhere(self, key: str, req: "_Request") -> Optional[Dict[str, Any]]:
+        with self._index_locked():
+            self._merge_index()
+        entry = self._lookup(key)
+        if entry is None or not self._fresh(entry) or not self._verify(key, entry, req):
+            return None
+        self._touch(key, entry)
+        return entry
+
+    def _download_locked(self, key: str, req: "_Request", staging: str, suffix: str) -> Dict[str, Any]:
+        # Caller holds the staging lock
+        kwargs: Dict[str, Any] = {"timeout": req.timeout, "headers": req.headers, "digests": ("sha256",)}
+        if req.session is not None:
+            kwargs["session"] = req.session
+        if req.expected_size is not None:
+            kwargs["expected_size"] = req.expected_size
+        if req.checksums:
+            kwargs["checksums"] = req.checksums
+        result = downloaders.download_to_file(req.url, staging, **kwargs)
+        # Content address from the digest computed while streaming
+        blob = result.digests["sha256"] + suffix
+        blob_path = self._blob_path(blob)
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        if os.path.exists(blob_path):
+            os.unlink(staging)  # same content already stored
+        else:
+            os.replace(staging, blob_path)
+        now = self._clock()
+        entry = {
+            "url": req.url,
+            "blob": blob,
+            "size": result.size,
+            "etag": result.etag,
+            "last_modified": result.last_modified,
+            "digests": result.digests,
+            "validated_at": now,
+            "last_access": now,
+            "extracted_size": 0,
+        }
+        with self._index_locked():
+            self._merge_index()
+            old = self._entries.get(key)
+            self._entries[key] = entry
+            if old is not None and old["blob"] != blob:
+                self._drop_blob_if_unused(old["blob"])
+            # Content already extracted for another key: share it
+            shared = next((e for e in self._entries.values() if e["blob"] == blob and e.get("extracted_size")), None)
+            if shared is not None:
+                entry["extracted_size"] = shared["extracted_size"]
+            self._save_index()
+            self.evict(keep=key)
+        return entry
+
+    def extract(
+        self,
+        url: str,
+        *,
+        key: Optional[str] = None,
+        workers: int = 1,
+        dest: Optional[str] = None,
+        **fetch_kwargs: Any,
+    ) -> str:
+        """Return a directory holding the extracted archive at `url`.
+
+        The archive is downloaded (or revalidated and verified) like
+        `fetch`, which takes the remaining keyword arguments, and extracted
+        only the first time its content is seen.
+
+        The shared directory is removed when its archive is evicted. Pass
+        `dest` to get the files hard-linked (else copied) into that
+        directory instead, which outlives eviction; `dest` is returned.
+        """
+        key = key or url
+        blob_path = self.fetch(url, key=key, **fetch_kwargs)
+        blob = os.path.basename(blob_path)
+        target = self._extracted_path(blob)
+
+        def _extract() -> str:
+            if not os.path.isdir(target):
+                staging = os.path.join(self.root, "tmp", "x-" + uuid.uuid4().hex)
+                downloaders.secure_extract_zip_file(blob_path, staging, workers=workers)
+                try:
+                    os.rename(staging, target)
+                except OSError:
+                    # Another process extracted it meanwhile
+                    shutil.rmtree(staging, ignore_errors=True)
+            size = _tree_size(target)
+            with self._index_locked():
+                self._merge_index()
+                for entry in self._entries.values():
+                    if entry["blob"] == blob:
+                        entry["extracted_size"] = size
+                self._save_index()
+                self.evict(keep=key)
+            return target
+
+        path, _ = self._flight.do("extract:" + blob, _extract, name="asset_cache")
+        if dest is None:
+            return path
+        with self._index_locked():
+            # Evictions take the same lock: the tree cannot vanish while linked
+            if os.path.isdir(path):
+                _link_tree(path, dest)
+                return dest
+        # Evicted by another download before it could be linked
+        return self.extract(url, key=key, workers=workers, dest=dest, **fetch_kwargs)
+
+    def materialize(self, url: str, dest: str, *, key: Optional[str] = None, **fetch_kwargs: Any) -> str:
+        """Place the cached body of `url` at `dest` (hard link, else copy).
+
+        Keyword arguments are those of `fetch`.
+        """
+        src = self.fetch(url, key=key, **fetch_kwargs)
+        os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+        if os.path.lexists(dest):
+            os.unlink(dest)
+        try:
+            os.link(src, dest)
+        except OSError:
+            shutil.copyfile(src, dest)
+        return dest
+
+    # --- eviction ---
+    def _drop_blob_if_unused(self, blob: str) -> int:
+        if any(e["blob"] == blob for e in self._entries.values()):
+            return 0
+        freed = 0
+        path = self._blob_path(blob)
+        try:
+            freed += os.path.getsize(path)
+            os.unlink(path)
+        except OSError:
+            pass
+        extracted = self._extracted_path(blob)
+        if os.path.isdir(extracted):
+            freed += _tree_size(extracted)
+            shutil.rmtree(extracted, ignore_errors=True)
+        return freed
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            blobs = {e["blob"]: e["size"] + e.get("extracted_size", 0) for e in self._entries.values()}
+        return sum(blobs.values())
+
+    def evict(self, *, keep: Optional[str] = None) -> int:
+        """Evict least-recently-used entries until under the byte budget."""
+        freed = 0
+        # Merged first, so blobs still referenced by another process are kept
+        with self._index_locked():
+            self._merge_index()
+            total = self.total_bytes()
+            for key in sorted(self._entries, key=lambda k: self._entries[k]["last_access"]):
+                if total <= self.max_bytes:
+                    break
+                if key == keep:
+                    continue
+                entry = self._entries.pop(key)
+                self._removed.add(key)
+                released = self._drop_blob_if_unused(entry["blob"])
+                total -= released
+                freed += released
+                self.counters["evictions"] += 1
+                logger.info("asset cache: evicted %s (%d bytes)", key, released)
+            if freed:
+                self._save_index()
+        return freed
+
+    def clear(self) -> None:
+        with self._index_locked():
+            self._merge_index()
+            blobs = {e["blob"] for e in self._entries.values()}
+            self._removed.update(self._entries)
+            self._entries.clear()
+            for blob in blobs:
+                self._drop_blob_if_unused(blob)
+            self._save_index()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "root": self.root,
+                "entries": len(self._entries),
+                "bytes": self.total_bytes(),
+                "max_bytes": self.max_bytes,
+                "max_age_s": self.max_age,
+                **self.counters,
+            }
+
+
+_default: Optional[AssetCache] = None
+_default_loaded = False
+_default_lock = threading.Lock()
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def get_asset_cache() -> Optional[AssetCache]:
+    """Return the process-wide cache, or None when disabled."""
+    global _default, _default_loaded
+    with _default_lock:
+        if not _default_loaded:
+            _default_loaded = True
+            if os.environ.get("BLENDER_MCP_ASSET_CACHE", "1").lower() in {"0", "false", "no", "off"}:
+                _default = None
+            else:
+                root = os.environ.get("BLENDER_MCP_ASSET_CACHE_DIR") or os.path.join(
+                    os.path.expanduser("~"), ".cache", "blender-mcp", "assets"
+                )
+                try:
+                    _default = AssetCache(
+                        root,
+                        max_bytes=int(_env_number("BLENDER_MCP_ASSET_CACHE_BYTES", DEFAULT_MAX_BYTES)),
+                        max_age=_env_number("BLENDER_MCP_ASSET_CACHE_MAX_AGE", DEFAULT_MAX_AGE),
+                    )
+                except OSError:
+                    logger.warning("asset cache disabled: cannot use %s", root, exc_info=True)
+                    _default = None
+        return _default
+
+
+def reset_asset_cache() -> None:
+    """Forget the shared cache instance (for tests and config reloads)."""
+    global _default, _default_loaded
+    with _default_lock:
+        _default, _default_loaded = None, False
+
+
+__all__ = ["AssetCache", "get_asset_cache", "reset_asset_cache"]
@@ -0,0 +1,371 @@
+"""Per-upstream circuit breakers for external providers.
+
+One `CircuitBreaker` per upstream (``polyhaven``, ``sketchfab``,
+``hyper3d``) is shared by the service layer and `downloaders`, so once an
+upstream is failing every caller fails immediately with `CircuitOpenError`
+instead of waiting out its own timeout and retries.
+
+States follow the usual pattern:
+
+- ``closed``: calls go through; consecutive failures are counted.
+- ``open``: calls are rejected until `recovery_timeout` elapsed.
+- ``half_open``: a limited number of trial calls go through; a success
+  closes the circuit, a failure re-opens it.
+
+State changes are logged and forwarded to listeners registered with
+`add_state_listener`. A listener is either a callable
+``(name, old_state, new_state)`` or an instrumentation strategy exposing
+``on_circuit_state_change(name, old_state, new_state)``.
+
+Thresholds can be tuned with ``BLENDER_MCP_CIRCUIT_FAILURE_THRESHOLD`` and
+``BLENDER_MCP_CIRCUIT_RECOVERY_TIMEOUT`` (seconds).
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+from urllib.parse import urlparse
+
+from requests.exceptions import HTTPError
+
+from .errors import CircuitOpenError, InvalidParamsError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+StateListener = Callable[[str, str, str], None]
+
+# Known upstream hosts; downloads from other hosts are not guarded.
+_HOST_UPSTREAMS: Dict[str, str] = {
+    "api.polyhaven.com": "polyhaven",
+    "dl.polyhaven.org": "polyhaven",
+    "api.sketchfab.com": "sketchfab",
+    "hyperhuman.deemos.com": "hyper3d",
+    "queue.fal.run": "hyper3d",
+}
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    """Return True when `exc` indicates the upstream itself is unhealthy.
+
+    Client errors (HTTP 4xx) and invalid parameters prove the upstream
+    answered, so they do not count against the circuit; neither do failed
+    integrity checks or ignored Range requests, which are detected locally.
+    """
+    from .downloaders import is_local_failure  # downloaders imports this module
+
+    if isinstance(exc, InvalidParamsError) or is_local_failure(exc):
+        # Corrupt payload or a server ignoring Range: local checks, not an outage
+        return False
+    if isinstance(exc, HTTPError):
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+        if status is not None and 400 <= status < 500:
+            return False
+    return True
+
+
+def is_failure_payload(result: Any) -> bool:
+    """Return True when a helper reported an upstream failure in `result`.
+
+    Some helpers return ``{"error": ...}`` or ``{"succeed": False}`` instead
+    of raising. An explicit ``upstream_failure`` flag wins; otherwise the
+    payload counts unless its ``status_code`` shows the upstream answered
+    (below 500), like `is_upstream_failure` does for exceptions.
+    """
+    if not isinstance(result, dict):
+        return False
+    if "upstream_failure" in result:
+        return bool(result["upstream_failure"])
+    if not result.get("error") and result.get("succeed") is not False:
+        return False
+    status = result.get("status_code")
+    return not (isinstance(status, int) and status < 500)
+
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open circuit breaker."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[BaseException], bool] = is_upstream_failure,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self._is_failure = is_failure
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._rejected = 0
+        # Thread-local re-entrancy marker: nested guarded calls for the same
+        # upstream (service -> downloaders) are accounted once by the outer call.
+        self._local = threading.local()
+
+    # --- state ---
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        # Caller holds the lock
+        if self._state == OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._transition(HALF_OPEN)
+
+    def _transition(self, new_state: str) -> None:
+        # Caller holds the lock; listeners are notified after release
+        old = self._state
+        if old == new_state:
+            return
+        self._state = new_state
+        if new_state == OPEN:
+            self._opened_at = self._clock()
+        if new_state != HALF_OPEN:
+            self._half_open_in_flight = 0
+        if new_state == CLOSED:
+            self._failures = 0
+        pending = getattr(self._local, "pending", None)
+        if pending is None:
+            pending = []
+            self._local.pending = pending
+        pending.append((old, new_state))
+
+    def _flush_transitions(self) -> None:
+        pending = getattr(self._local, "pending", None)
+        if not pending:
+            return
+        self._local.pending = []
+        for old, new in pending:
+            log = logger.warning if new == OPEN else logger.info
+            log("circuit %s: %s -> %s", self.name, old, new)
+            _notify_listeners(self.name, old, new)
+
+    # --- call protocol ---
+    def before_call(self) -> None:
+        """Reserve a call slot or raise `CircuitOpenError` if the circuit is open."""
+        try:
+            with self._lock:
+                self._maybe_half_open()
+                if self._state == OPEN:
+                    self._rejected += 1
+                    retry_in = max(0.0, self.recovery_timeout - (self._clock() - self._opened_at))
+                    raise CircuitOpenError(self.name, retry_after=retry_in)
+                if self._state == HALF_OPEN:
+                    if self._half_open_in_flight >= self.half_open_max_calls:
+                        self._rejected += 1
+                        raise CircuitOpenError(self.name, retry_after=0.0)
+                    self._half_open_in_flight += 1
+        finally:
+            self._flush_transitions()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            if self._state == HALF_OPEN:
+                self._transition(CLOSED)
+        self._flush_transitions()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._transition(OPEN)
+            else:
+                self._failures += 1
+                if self._state == CLOSED and self._failures >= self.failure_threshold:
+                    self._transition(OPEN)
+        self._flush_transitions()
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Invoke `fn` under this breaker and record the outcome."""
+        return self.call_checked(fn, None, *args, **kwargs)
+
+    def call_checked(
+        self, fn: Callable[..., T], failed_result: Optional[Callable[[T], bool]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Like `call`, but a result for which `failed_result` is true counts as a failure."""
+        if getattr(self._local, "active", False):
+            return fn(*args, **kwargs)
+        self.before_call()
+        self._local.active = True
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            if isinstance(exc, Exception) and self._is_failure(exc):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        finally:
+            self._local.active = False
+        if failed_result is not None and failed_result(result):
+            self.record_failure()
+        else:
+            self.record_success()
+        return result
+
+    def reset(self) -> None:
+        """Force the breaker back to closed and clear counters."""
+        with self._lock:
+            self._transition(CLOSED)
+            self._rejected = 0
+        self._flush_transitions()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._maybe_half_open()
+            out = {
+                "name": self.name,
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "rejected_calls": self._rejected,
+                "failure_threshold": self.failure_threshold,
+                "recovery_timeout": self.recovery_timeout,
+            }
+        self._flush_transitions()
+        return out
+
+
+# --- shared registry ---
+_registry_lock = threading.Lock()
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_LISTENERS: List[Any] = []
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Return the shared breaker for upstream `name`, creating it on first use."""
+    with _registry_lock:
+        breaker = _BREAKERS.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name,
+                failure_threshold=int(_env_float("BLENDER_MCP_CIRCUIT_FAILURE_THRESHOLD", 5)),
+                recovery_timeout=_env_float("BLENDER_MCP_CIRCUIT_RECOVERY_TIMEOUT", 30.0),
+            )
+            _BREAKERS[name] = breaker
+        return breaker
+
+
+def upstream_for_url(url: str) -> Optional[str]:
+    """Return the upstream name serving `url`, or None for unknown hosts."""
+    try:
+        host = (urlparse(url).hostname or "").lower()
+    except Exception:
+        return None
+    return _HOST_UPSTREAMS.get(host)
+
+
+def breaker_for_url(url: str) -> Optional[CircuitBreaker]:
+    name = upstream_for_url(url)
+    return get_breaker(name) if name else None
+
+
+def register_host(host: str, upstream: str) -> None:
+    """Map an additional host to an upstream breaker."""
+    _HOST_UPSTREAMS[host.lower()] = upstream
+
+
+def is_open(name: str) -> bool:
+    """Return True if upstream `name` currently rejects calls."""
+    return get_breaker(name).state == OPEN
+
+
+def guarded(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator running the wrapped function under breaker `name`."""
+
+    def _decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(fn)
+        def _wrapper(*args: Any, **kwargs: Any) -> T:
+            return get_breaker(name).call(fn, *args, **kwargs)
+
+        return _wrapper
+
+    return _decorator
+
+
+def add_state_listener(listener: Any) -> None:
+    """Register a callable or an instrumentation strategy for state changes."""
+    with _registry_lock:
+        if listener not in _LISTENERS:
+            _LISTENERS.append(listener)
+
+
+def remove_state_listener(listener: Any) -> None:
+    with _registry_lock:
+        if listener in _LISTENERS:
+            _LISTENERS.remove(listener)
+
+
+def _notify_listeners(name: str, old: str, new: str) -> None:
+    with _registry_lock:
+        listeners = list(_LISTENERS)
+    for listener in listeners:
+        hook = getattr(listener, "on_circuit_state_change", listener)
+        try:
+            hook(name, old, new)
+        except Exception:
+            logger.debug("circuit state listener failed", exc_info=True)
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """Return stats for every breaker created so far."""
+    with _registry_lock:
+        breakers = list(_BREAKERS.values())
+    return {b.name: b.stats() for b in breakers}
+
+
+def reset_breakers() -> None:
+    """Drop all breakers and listeners (for tests)."""
+    with _registry_lock:
+        _BREAKERS.clear()
+        _LISTENERS.clear()
+
+
+__all__ = [
+    "CLOSED",
+    "OPEN",
+    "HALF_OPEN",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "add_state_listener",
+    "breaker_for_url",
+    "get_breaker",
+    "guarded",
+    "is_open",
+    "is_failure_payload",
+    "is_upstream_failure",
+    "register_host",
+    "remove_state_listener",
+    "reset_breakers",
+    "snapshot",
+    "upstream_for_url",
+]
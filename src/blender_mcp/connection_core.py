@@ -107,8 +107,18 @@ class BlenderConnection:
 _blender_connection: Optional[BlenderConnection] = None
 
 
-def get_blender_connection() -> BlenderConnection:
+def get_blender_connection() -> Any:
+    """Return the shared Blender connection.
+
+    With ``BLENDER_MCP_FLEET`` configured, returns a `FleetConnection`
+    routing each command across the fleet instead.
+    """
     global _blender_connection
+    from .services.connection.fleet import get_fleet
+
+    fleet = get_fleet()
+    if fleet is not None:
+        return fleet.connection()
     if _blender_connection is not None:
         return _blender_connection
     conn = BlenderConnection()
@@ -125,6 +135,12 @@ async def server_lifespan(server: "Any") -> AsyncIterator[Dict[str, Any]]:
             get_blender_connection()
         except Exception:
             logger.debug("Blender not reachable at startup; continuing without Blender")
+        try:
+            from .services.polyhaven_warmup import start_warm_up
+
+            start_warm_up()
+        except Exception:
+            logger.exception("Failed to start PolyHaven warm-up")
         yield {}
     finally:
         global _blender_connection
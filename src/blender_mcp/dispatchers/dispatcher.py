@@ -32,6 +32,7 @@ from .strategies import (
 )
 from .strategies.instrumentation import InstrumentationStrategy  # type: ignore
 from .registry import HandlerRegistry
+from .singleflight import COALESCE_ATTR, SingleFlight, coalesce_flag, make_key
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +54,8 @@ class Dispatcher(AbstractDispatcher):
         handler_resolution_strategy: Optional[HandlerResolutionStrategy] = None,
         policy_strategy: Optional[PolicyStrategy] = None,
         instrumentation_strategy: Optional[InstrumentationStrategy] = None,
+        single_flight: Optional[SingleFlight] = None,
+        coalesce_by_default: bool = False,
     ) -> None:
         """Create a Dispatcher.
 
@@ -60,6 +63,12 @@ class Dispatcher(AbstractDispatcher):
         (or context-manager compatible object). If provided, it's used by
         `dispatch_with_timeout` to create executors, allowing callers to
         inject test doubles or alternative executors.
+
+        single_flight / coalesce_by_default: identical concurrent `dispatch`
+        calls (same name and canonical params) for handlers that opted in
+        share one execution. Handlers opt in/out via `register(...,
+        coalesce=...)` or the `singleflight.coalescable` marker; otherwise
+        `coalesce_by_default` applies.
         """
         self._registry = HandlerRegistry()
         self._executor_factory = executor_factory
@@ -71,6 +80,10 @@ class Dispatcher(AbstractDispatcher):
         self._policy_strategy = policy_strategy or DefaultPolicyStrategy()
         # optional instrumentation hook (no-op if None)
         self._instrumentation = instrumentation_strategy
+        # single-flight coalescing of identical in-flight calls
+        self._single_flight = single_flight or SingleFlight()
+        self._coalesce_by_default = coalesce_by_default
+        self._coalesce: Dict[str, bool] = {}
 
     # --- Policy injection helpers ---
     def set_policy_check(self, policy_check: Optional[PolicyChecker]) -> None:
@@ -85,19 +98,29 @@ class Dispatcher(AbstractDispatcher):
         """Return the current instance-level PolicyChecker (or None)."""
         return self._policy_check
 
-    def register(self, name: str, fn: Handler, *, overwrite: bool = False) -> None:
+    def register(
+        self, name: str, fn: Handler, *, overwrite: bool = False, coalesce: Optional[bool] = None
+    ) -> None:
         """Register a handler by name.
 
         By default `overwrite=False` and attempting to register an already
         existing name will raise ValueError (audit-friendly). Set
         `overwrite=True` to replace existing handlers.
+
+        `coalesce=True/False` opts the handler in/out of single-flight
+        coalescing; None defers to the handler's marker or the default.
         """
         self._registry.register(name, fn, overwrite=overwrite)
+        if coalesce is None:
+            self._coalesce.pop(name, None)
+        else:
+            self._coalesce[name] = coalesce
         logger.debug("registered handler %s (overwrite=%s)", name, overwrite)
 
     def unregister(self, name: str) -> None:
         """Remove a handler if present (no-op if missing)."""
         self._registry.unregister(name)
+        self._coalesce.pop(name, None)
         logger.debug("unregistered handler %s", name)
 
     def list_handlers(self) -> List[str]:
@@ -126,6 +149,10 @@ class Dispatcher(AbstractDispatcher):
             def _wrapped(params: Dict[str, Any]) -> Any:
                 return self._invoke_service(service, params)
 
+            # keep the service's coalescing marker visible on the wrapper
+            flag = coalesce_flag(service)
+            if flag is not None:
+                setattr(_wrapped, COALESCE_ATTR, flag)
             logger.debug("resolved service fallback for %s", name)
             return _wrapped
         return None
@@ -161,7 +188,8 @@ class Dispatcher(AbstractDispatcher):
     def dispatch(self, name: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """Call the handler named `name` with `params` and return its result.
 
-        If the handler is not found, returns None.
+        If the handler is not found, returns None. For handlers opted in to
+        coalescing, concurrent identical calls share a single execution.
         """
         # delegate handler resolution to strategy (preserves existing logic)
         fn = self._handler_resolution_strategy.resolve(self, name)
@@ -169,6 +197,37 @@ class Dispatcher(AbstractDispatcher):
             logger.debug("no handler for %s", name)
             return None
         logger.debug("dispatching %s with params=%s", name, params)
+        key = make_key(name, params) if self._should_coalesce(name, fn) else None
+        if key is None:
+            return self._run_handler(name, fn, params)
+        result, shared = self._single_flight.do(key, lambda: self._run_handler(name, fn, params), name=name)
+        if shared:
+            logger.debug("coalesced %s onto an in-flight call", name)
+            self._instrument_coalesced(name, params)
+        return result
+
+    def _should_coalesce(self, name: str, fn: Handler) -> bool:
+        explicit = self._coalesce.get(name)
+        if explicit is not None:
+            return explicit
+        flag = coalesce_flag(fn)
+        return self._coalesce_by_default if flag is None else flag
+
+    def _instrument_coalesced(self, name: str, params: Optional[Dict[str, Any]]) -> None:
+        # Optional hook: strategies may implement `on_dispatch_coalesced`
+        hook = getattr(self._instrumentation, "on_dispatch_coalesced", None)
+        if hook is None:
+            return
+        try:
+            hook(name, params or {})
+        except Exception:
+            pass
+
+    def coalescing_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return per-handler counts of executed and coalesced calls."""
+        return self._single_flight.stats()
+
+    def _run_handler(self, name: str, fn: Handler, params: Optional[Dict[str, Any]]) -> Any:
         start_ts = self._instrument_start(name, params)
         try:
             result = fn(params or {})
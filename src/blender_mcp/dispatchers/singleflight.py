@@ -0,0 +1,109 @@
+"""Single-flight coalescing of identical in-flight calls.
+
+While a call for a given key is running, identical calls (same command
+name and canonical params) wait on the leader's future and receive the
+same result (or exception) instead of repeating network or Blender work.
+
+Handlers opt in either at registration time
+(`Dispatcher.register(..., coalesce=True)`) or declaratively with the
+`coalescable` decorator, which services can use without importing the
+dispatcher. Only read-only calls (searches, listings) should: waiters of
+a side-effecting call would share its outputs (e.g. one download
+directory) and miss its context-local progress events.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+COALESCE_ATTR = "__blender_mcp_coalesce__"
+
+
+def coalescable(enabled: bool = True) -> Callable[[T], T]:
+    """Mark a handler/service as safe (or unsafe) to coalesce.
+
+    Only idempotent, read-only or content-addressed operations should opt
+    in: every waiter receives the very same result object.
+    """
+
+    def _mark(fn: T) -> T:
+        setattr(fn, COALESCE_ATTR, enabled)
+        return fn
+
+    return _mark
+
+
+def coalesce_flag(fn: Any) -> Optional[bool]:
+    """Return the declarative opt-in/opt-out of `fn`, or None if unset."""
+    flag = getattr(fn, COALESCE_ATTR, None)
+    return flag if isinstance(flag, bool) else None
+
+
+def make_key(name: str, params: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Build a canonical key for `name` + `params`.
+
+    Params are serialized with sorted keys so ``{"a": 1, "b": 2}`` and
+    ``{"b": 2, "a": 1}`` coalesce. Returns None when params cannot be
+    serialized, in which case the call is not coalesced.
+    """
+    try:
+        canonical = json.dumps(params or {}, sort_keys=True, separators=(",", ":"), default=repr)
+    except (TypeError, ValueError):
+        return None
+    return f"{name}:{canonical}"
+
+
+class SingleFlight:
+    """Thread-safe registry of in-flight calls keyed by canonical key."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, "Future[Any]"] = {}
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+    def do(self, key: str, fn: Callable[[], T], *, name: Optional[str] = None) -> Tuple[T, bool]:
+        """Run `fn` once per concurrent `key` and return `(result, shared)`.
+
+        `shared` is True for callers that waited on another caller's run.
+        Exceptions raised by the leader are re-raised in every waiter.
+        """
+        label = name or key
+        with self._lock:
+            fut = self._inflight.get(key)
+            leader = fut is None
+            if fut is None:
+                fut = Future()
+                self._inflight[key] = fut
+            counts = self._counts.setdefault(label, {"executed": 0, "coalesced": 0})
+            counts["executed" if leader else "coalesced"] += 1
+
+        if not leader:
+            return fut.result(), True
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            fut.set_exception(exc)
+            raise
+        else:
+            fut.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._inflight)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return per-name counts of executed and coalesced calls."""
+        with self._lock:
+            return {k: dict(v) for k, v in self._counts.items()}
+
+
+__all__ = ["SingleFlight", "coalescable", "coalesce_flag", "make_key", "COALESCE_ATTR"]
@@ -1,6 +1,7 @@
 from .handler_resolution import DefaultHandlerResolutionStrategy, HandlerResolutionStrategy
 from .instrumentation import InstrumentationStrategy, NoOpInstrumentationStrategy
 from .policy import DefaultPolicyStrategy, PolicyStrategy
+from .profiling import ProfilingInstrumentationStrategy
 
 __all__ = [
     "HandlerResolutionStrategy",
@@ -9,4 +10,5 @@ __all__ = [
     "DefaultPolicyStrategy",
     "InstrumentationStrategy",
     "NoOpInstrumentationStrategy",
+    "ProfilingInstrumentationStrategy",
 ]
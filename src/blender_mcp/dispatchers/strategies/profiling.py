@@ -0,0 +1,206 @@
+"""On-demand profiling instrumentation strategy.
+
+`ProfilingInstrumentationStrategy` implements the `InstrumentationStrategy`
+hooks so it can be injected into `Dispatcher`. Profiling is disabled by
+default and can be switched on at runtime for one handler name and a
+sampling rate; sampled calls run under `cProfile` and their stats are
+aggregated into a single `pstats.Stats` that can be exported as a
+`.pstats` blob or rendered as a flat top-N text report.
+
+Only one call is profiled at a time: since Python 3.12 `cProfile` relies
+on `sys.monitoring`, which allows a single active profiler per process.
+Sampled calls that arrive while another call is being profiled run
+unprofiled and are counted as `skipped`. For the same reason the profile
+of a call also records every other thread running meanwhile, so reports
+are only clean on an otherwise idle process.
+"""
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import marshal
+import pstats
+import random
+import threading
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Sort keys accepted by `report`; mirrors the common pstats keys.
+_SORT_KEYS = {"cumulative", "tottime", "calls", "ncalls", "time", "name"}
+
+
+class ProfilingInstrumentationStrategy:
+    """Instrumentation strategy that profiles a chosen handler on demand.
+
+    The dispatcher calls `on_dispatch_start` and `on_dispatch_success` /
+    `on_dispatch_error` from the thread running the handler, so the active
+    profiler is tracked per thread. Callers that do not go through the
+    dispatcher (e.g. the ASGI adapter) can use `profile_call` instead.
+    """
+
+    def __init__(self, *, rng: Optional[Callable[[], float]] = None) -> None:
+        self._lock = threading.Lock()
+        # Process-wide guard: only one cProfile may be enabled at a time.
+        self._active_guard = threading.Lock()
+        self._local = threading.local()
+        self._rng = rng or random.random
+        self._handler: Optional[str] = None
+        self._sample_rate = 1.0
+        self._stats: Optional[pstats.Stats] = None
+        self._sampled = 0
+        self._skipped = 0
+
+    # --- runtime control ---
+    def enable(self, handler: str, sample_rate: float = 1.0) -> None:
+        """Start profiling calls to `handler` with the given sampling rate.
+
+        `handler` may be ``"*"`` to profile every handler. Previously
+        aggregated stats are kept so successive windows accumulate; call
+        `reset` to start from scratch.
+        """
+        if not isinstance(handler, str) or not handler:
+            raise ValueError("handler must be a non-empty string")
+        if not 0.0 < float(sample_rate) <= 1.0:
+            raise ValueError("sample_rate must be in (0, 1]")
+        with self._lock:
+            self._handler = handler
+            self._sample_rate = float(sample_rate)
+        logger.info("profiling enabled for %s (sample_rate=%s)", handler, sample_rate)
+
+    def disable(self) -> None:
+        """Stop sampling new calls; aggregated stats are kept."""
+        with self._lock:
+            self._handler = None
+        logger.info("profiling disabled")
+
+    def reset(self) -> None:
+        """Drop aggregated stats and counters."""
+        with self._lock:
+            self._stats = None
+            self._sampled = 0
+            self._skipped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._handler is not None
+
+    def status(self) -> Dict[str, Any]:
+        """Return a JSON-serializable summary of the profiler state."""
+        with self._lock:
+            return {
+                "enabled": self._handler is not None,
+                "handler": self._handler,
+                "sample_rate": self._sample_rate,
+                "sampled_calls": self._sampled,
+                "skipped_calls": self._skipped,
+                "has_stats": self._stats is not None,
+            }
+
+    # --- sampling ---
+    def _should_sample(self, name: str) -> bool:
+        handler = self._handler
+        if handler is None or (handler != "*" and handler != name):
+            return False
+        return self._sample_rate >= 1.0 or self._rng() < self._sample_rate
+
+    def _start(self, name: str) -> Optional[cProfile.Profile]:
+        if not self._should_sample(name):
+            return None
+        if not self._active_guard.acquire(blocking=False):
+            with self._lock:
+                self._skipped += 1
+            return None
+        prof = cProfile.Profile()
+        try:
+            prof.enable()
+        except Exception:
+            # Another profiler (e.g. a debugger) already owns the hook
+            self._active_guard.release()
+            with self._lock:
+                self._skipped += 1
+            logger.debug("could not enable cProfile for %s", name, exc_info=True)
+            return None
+        return prof
+
+    def _stop(self, prof: cProfile.Profile) -> None:
+        try:
+            prof.disable()
+        finally:
+            self._active_guard.release()
+        with self._lock:
+            if self._stats is None:
+                self._stats = pstats.Stats(prof)
+            else:
+                self._stats.add(prof)
+            self._sampled += 1
+
+    def profile_call(self, name: str, fn: Callable[[], T]) -> T:
+        """Run `fn()` and profile it if `name` is currently sampled."""
+        prof = self._start(name)
+        if prof is None:
+            return fn()
+        try:
+            return fn()
+        finally:
+            self._stop(prof)
+
+    # --- InstrumentationStrategy hooks ---
+    def _stack(self) -> List[Optional[cProfile.Profile]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def on_dispatch_start(self, name: str, params: dict[str, Any]) -> None:
+        self._stack().append(self._start(name))
+
+    def _finish(self) -> None:
+        stack = self._stack()
+        if not stack:
+            return
+        prof = stack.pop()
+        if prof is not None:
+            self._stop(prof)
+
+    def on_dispatch_success(self, name: str, result: Any, elapsed_s: float) -> None:
+        self._finish()
+
+    def on_dispatch_error(self, name: str, error: Exception, elapsed_s: float) -> None:
+        self._finish()
+
+    def on_adapter_invoke(self, adapter_name: str, cmd_type: str, params: dict[str, Any]) -> None:
+        return None
+
+    # --- export ---
+    def export_pstats(self) -> bytes:
+        """Return aggregated stats in the binary `.pstats` format.
+
+        The output can be loaded with ``pstats.Stats(path)`` or tools such
+        as snakeviz. Raises LookupError when nothing was profiled yet.
+        """
+        with self._lock:
+            if self._stats is None:
+                raise LookupError("no profiling data collected")
+            # Same serialization as pstats.Stats.dump_stats, without a file
+            return marshal.dumps(self._stats.stats)  # type: ignore[attr-defined]
+
+    def report(self, top_n: int = 30, sort: str = "cumulative") -> str:
+        """Return a flat text report of the `top_n` entries sorted by `sort`."""
+        if sort not in _SORT_KEYS:
+            raise ValueError(f"sort must be one of: {', '.join(sorted(_SORT_KEYS))}")
+        with self._lock:
+            if self._stats is None:
+                raise LookupError("no profiling data collected")
+            buf = io.StringIO()
+            stats = pstats.Stats(stream=buf)
+            stats.add(self._stats)
+            stats.sort_stats(sort).print_stats(max(1, int(top_n)))
+            return buf.getvalue()
+
+
+__all__ = ["ProfilingInstrumentationStrategy"]
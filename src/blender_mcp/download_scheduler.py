@@ -0,0 +1,248 @@
+"""Priority classes, concurrency slots and a bandwidth cap for downloads.
+
+Interactive downloads (a user waiting for a texture) used to compete on
+equal terms with batch imports and bulk prefetches for the same link.
+Every download attempt now goes through the process-wide scheduler:
+
+- the priority comes from the surrounding `download_priority` block:
+  ``interactive`` (the default), ``batch`` or ``bulk``
+- each attempt holds a slot for its transfer (released during retry
+  backoff); a class never runs more than its own limit and all classes
+  together never more than ``max_active``
+- when a slot frees up, queued interactive attempts get it before batch
+  ones, and batch before bulk, whatever the arrival order (FIFO within a
+  class)
+- bytes pass through a shared token bucket when a global rate is set;
+  while a higher class is waiting for tokens, lower classes hold back, so
+  interactive transfers get the bandwidth first
+- queue depth, wait times, bytes and recent throughput per class are kept
+  (`stats`, served at ``/debug/downloads``)
+
+Configuration (environment):
+
+- ``BLENDER_MCP_DOWNLOAD_SLOTS``: concurrent attempts over all classes (8)
+- ``BLENDER_MCP_DOWNLOAD_SLOTS_INTERACTIVE`` / ``_BATCH`` / ``_BULK``:
+  per-class limits (8 / 4 / 2)
+- ``BLENDER_MCP_DOWNLOAD_RATE``: global cap in bytes per second, ``0``
+  for none (0)
+"""
+
+from __future__ import annotations
+
+import collections
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, Iterator, List, Mapping, Optional, Tuple
+
+PRIORITIES = ("interactive", "batch", "bulk")
+DEFAULT_LIMITS = {"interactive": 8, "batch": 4, "bulk": 2}
+DEFAULT_MAX_ACTIVE = 8
+THROUGHPUT_WINDOW = 10.0
+
+_priority: ContextVar[str] = ContextVar("blender_mcp_download_priority", default="interactive")
+
+
+@contextmanager
+def download_priority(name: str) -> Iterator[None]:
+    """Run downloads started in this context with priority class `name`."""
+    if name not in PRIORITIES:
+        raise ValueError(f"unknown download priority {name!r}; expected one of {', '.join(PRIORITIES)}")
+    token = _priority.set(name)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str:
+    return _priority.get()
+
+
+class _ClassStats:
+    def __init__(self) -> None:
+        self.active = 0
+        self.queued = 0
+        self.completed = 0
+        self.bytes = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.recent: Deque[Tuple[float, int]] = collections.deque()
+
+    def snapshot(self, now: float, limit: int) -> Dict[str, Any]:
+        while self.recent and now - self.recent[0][0] > THROUGHPUT_WINDOW:
+            self.recent.popleft()
+        admitted = self.completed + self.active
+        return {
+            "limit": limit,
+            "active": self.active,
+            "queued": self.queued,
+            "completed": self.completed,
+            "bytes": self.bytes,
+            "bytes_per_s": round(sum(n for _, n in self.recent) / THROUGHPUT_WINDOW),
+            "wait_avg_s": round(self.wait_total / admitted, 4) if admitted else 0.0,
+            "wait_max_s": round(self.wait_max, 4),
+        }
+
+
+class DownloadScheduler:
+    """Admission by priority class plus a shared token bucket on bytes."""
+
+    def __init__(
+        self,
+        *,
+        limits: Optional[Mapping[str, int]] = None,
+        max_active: int = DEFAULT_MAX_ACTIVE,
+        rate: float = 0.0,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.limits = {p: max(1, int((limits or DEFAULT_LIMITS).get(p, DEFAULT_LIMITS[p]))) for p in PRIORITIES}
+        self.max_active = max(1, max_active)
+        self.rate = max(0.0, rate)
+        self.burst = burst if burst is not None else self.rate
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._queue: List[Tuple[int, int, str]] = []  # (rank, seq, class)
+        self._seq = itertools.count()
+        self._active = 0
+        self._tokens = self.burst
+        self._refilled = clock()
+        self._token_waiters = dict.fromkeys(PRIORITIES, 0)
+        self._stats = {p: _ClassStats() for p in PRIORITIES}
+
+    # --- slots ---
+    def _grantable(self) -> Optional[Tuple[int, int, str]]:
+        """Best queued ticket whose class has room, if the global cap allows."""
+        if self._active >= self.max_active:
+            return None
+        for ticket in sorted(self._queue):
+            if self._stats[ticket[2]].active < self.limits[ticket[2]]:
+                return ticket
+        return None
+
+    @contextmanager
+    def slot(self, priority: Optional[str] = None) -> Iterator[None]:
+        """Hold a transfer slot of class `priority` (default: the context's)."""
+        name = priority or current_priority()
+        stats = self._stats[name]
+        ticket = (PRIORITIES.index(name), next(self._seq), name)
+        queued_at = self._clock()
+        with self._cond:
+            self._queue.append(ticket)
+            stats.queued += 1
+            try:
+                while self._grantable() != ticket:
+                    self._cond.wait()
+            finally:
+                self._queue.remove(ticket)
+                stats.queued -= 1
+            self._active += 1
+            stats.active += 1
+            waited = self._clock() - queued_at
+            stats.wait_total += waited
+            stats.wait_max = max(stats.wait_max, waited)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                stats.active -= 1
+                stats.completed += 1
+                self._cond.notify_all()
+
+    # --- bandwidth ---
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+
+    def _outranked(self, name: str) -> bool:
+        return any(self._token_waiters[p] for p in PRIORITIES[: PRIORITIES.index(name)])
+
+    def consume(self, nbytes: int, priority: Optional[str] = None) -> None:
+        """Account `nbytes` received, blocking while over the global rate.
+
+        A chunk may overdraw the bucket (chunks can exceed the burst); the
+        debt is paid by the next callers' waits.
+        """
+        name = priority or current_priority()
+        with self._cond:
+            if self.rate > 0:
+                self._token_waiters[name] += 1
+                try:
+                    while True:
+                        self._refill(self._clock())
+                        if self._tokens > 0 and not self._outranked(name):
+                            break
+                        deficit = -self._tokens if self._tokens <= 0 else 0.0
+                        self._cond.wait(timeout=max(deficit / self.rate, 0.005))
+                finally:
+                    self._token_waiters[name] -= 1
+                self._tokens -= nbytes
+                self._cond.notify_all()
+            stats = self._stats[name]
+            stats.bytes += nbytes
+            now = self._clock()
+            stats.recent.append((now, nbytes))
+            while now - stats.recent[0][0] > THROUGHPUT_WINDOW:
+                stats.recent.popleft()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            now = self._clock()
+            classes = {p: self._stats[p].snapshot(now, self.limits[p]) for p in PRIORITIES}
+            return {
+                "max_active": self.max_active,
+                "active": self._active,
+                "queued": len(self._queue),
+                "rate_limit": self.rate or None,
+                "bytes_per_s": sum(c["bytes_per_s"] for c in classes.values()),
+                "classes": classes,
+            }
+
+
+_default: Optional[DownloadScheduler] = None
+_default_lock = threading.Lock()
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def get_scheduler() -> DownloadScheduler:
+    """Return the process-wide scheduler, configured from the environment."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            limits = {
+                p: int(_env_number(f"BLENDER_MCP_DOWNLOAD_SLOTS_{p.upper()}", DEFAULT_LIMITS[p])) for p in PRIORITIES
+            }
+            _default = DownloadScheduler(
+                limits=limits,
+                max_active=int(_env_number("BLENDER_MCP_DOWNLOAD_SLOTS", DEFAULT_MAX_ACTIVE)),
+                rate=_env_number("BLENDER_MCP_DOWNLOAD_RATE", 0.0),
+            )
+        return _default
+
+
+def reset_scheduler() -> None:
+    """Forget the shared scheduler (for tests and config reloads)."""
+    global _default
+    with _default_lock:
+        _default = None
+
+
+__all__ = [
+    "PRIORITIES",
+    "DownloadScheduler",
+    "current_priority",
+    "download_priority",
+    "get_scheduler",
+    "reset_scheduler",
+]
@@ -2,22 +2,165 @@
 
 These helpers are intentionally small and raise on HTTP errors so callers
 can handle/report them. They make it easier to mock network calls in tests.
+
+`download_bytes` holds the whole body in memory and suits small payloads
+(JSON, thumbnails). Assets should use the streaming helpers
+(`download_to_file`, `download_to_tempfile`, `download_to_spooled`), which
+write ``iter_content`` chunks straight to disk with bounded memory.
 """
 
 from __future__ import annotations
 
+import dataclasses
+import hashlib
 import io
+import json
 import logging
 import os
+import tempfile
+import threading
 import time
 import zipfile
-from typing import Any, Mapping, Optional
+from dataclasses import dataclass
+from time import perf_counter as _perf_counter
+from typing import IO, Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, TypeVar, Union
 
 import requests
 from requests.exceptions import HTTPError, RequestException
 
+from . import circuit_breaker, download_scheduler, http, progress, workspace
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Bytes per `iter_content` chunk: large enough to keep syscalls cheap,
+# small enough to keep memory flat whatever the asset size.
+CHUNK_SIZE = 1 << 20
+# Minimum seconds between two "downloading" progress events
+PROGRESS_INTERVAL = 0.5
+# Spooled downloads stay in memory up to this size, then roll to disk
+SPOOL_MAX_MEMORY = 8 << 20
+
+# Zip extraction limits (zip bomb protection)
+ZIP_MAX_TOTAL_SIZE = 16 << 30
+ZIP_MAX_MEMBERS = 20000
+ZIP_MAX_RATIO = 200.0
+# Small entries (text, JSON) legitimately compress very well: the ratio
+# check only applies from this declared size on
+ZIP_RATIO_MIN_SIZE = 1 << 20
+# Segmented downloads only kick in from this size (see `download_to_file`)
+SEGMENT_MIN_SIZE = 32 << 20
+# Entries at least this large are extracted in parallel when workers > 1
+ZIP_PARALLEL_MIN_SIZE = 8 << 20
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    """Outcome of a streamed download."""
+
+    path: Optional[str]
+    size: int
+    elapsed: float
+    # Bytes already on disk when the successful attempt started (Range resume)
+    resumed_from: int = 0
+    # Validators of the downloaded representation, for conditional requests
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # Hex digests computed while streaming, by algorithm name
+    digests: Dict[str, str] = dataclasses.field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """Average bytes per second transferred by the successful attempt."""
+        transferred = self.size - self.resumed_from
+        return transferred / self.elapsed if self.elapsed > 0 else float(transferred)
+
+
+class IntegrityError(RequestException):
+    """The body does not match the expected size or checksum.
+
+    A `RequestException`, so downloads retry it like a network error;
+    the retry starts over instead of resuming the bad bytes.
+    """
+
+
+class _StreamCheck:
+    """Incremental digests and expected-length checks for one download."""
+
+    def __init__(
+        self,
+        url: str,
+        expected_size: Optional[int] = None,
+        checksums: Optional[Mapping[str, str]] = None,
+        digests: Sequence[str] = (),
+    ) -> None:
+        self.url = url
+        self.expected_size = expected_size
+        self.checksums = {name.lower(): value.lower() for name, value in (checksums or {}).items() if value}
+        self.algorithms = sorted(set(self.checksums) | {d.lower() for d in digests})
+        self._hashers: Optional[Dict[str, Any]] = None
+        self.covered = 0
+
+    def reset(self) -> None:
+        self._hashers = {name: hashlib.new(name) for name in self.algorithms}
+        self.covered = 0
+
+    def update(self, chunk: bytes) -> None:
+        if self._hashers is None:
+            self.reset()
+        for hasher in self._hashers.values():  # type: ignore[union-attr]
+            hasher.update(chunk)
+        self.covered += len(chunk)
+
+    def catch_up(self, out: IO[bytes], upto: int, chunk_size: int = CHUNK_SIZE) -> None:
+        """Hash the first `upto` bytes of `out` (resumed from an earlier run)."""
+        if self._hashers is not None and self.covered == upto:
+            return
+        self.reset()
+        if not self.algorithms:
+            self.covered = upto
+            return
+        position = out.tell()
+        out.seek(0)
+        remaining = upto
+        while remaining > 0:
+            block = out.read(min(chunk_size, remaining))
+            if not block:
+                break
+            self.update(block)
+            remaining -= len(block)
+        out.seek(position)
+
+    def check_declared(self, total: Optional[int]) -> None:
+        """Reject a response announcing a different length before reading it."""
+        if self.expected_size is not None and total is not None and total != self.expected_size:
+            raise IntegrityError(f"{self.url}: server announced {total} bytes, expected {self.expected_size}")
+
+    def check_growth(self, received: int) -> None:
+        if self.expected_size is not None and received > self.expected_size:
+            raise IntegrityError(f"{self.url}: body exceeds the expected {self.expected_size} bytes")
+
+    def finish(self, size: int) -> Dict[str, str]:
+        """Check the final length and checksums; return the hex digests."""
+        if self.expected_size is not None and size != self.expected_size:
+            raise IntegrityError(f"{self.url}: got {size} bytes, expected {self.expected_size}")
+        if self._hashers is None:
+            self.reset()
+        digests = {name: h.hexdigest() for name, h in self._hashers.items()}  # type: ignore[union-attr]
+        for name, expected in self.checksums.items():
+            if digests[name] != expected:
+                raise IntegrityError(f"{self.url}: {name} mismatch ({digests[name]} != {expected})")
+        return digests
+
+
+def _is_client_error(exc: HTTPError) -> bool:
+    try:
+        status = exc.response.status_code  # type: ignore[union-attr]
+    except Exception:
+        return False
+    return status is not None and 400 <= status < 500
+
 
 def download_bytes(
     url: str,
@@ -35,27 +178,47 @@ def download_bytes(
     control retry behaviour; sleeps between retries using exponential
     backoff: backoff_factor * (2 ** attempt).
 
+    Requests to known upstream hosts go through the shared circuit breaker
+    for that upstream: every attempt is recorded, and once the circuit is
+    open `CircuitOpenError` is raised immediately instead of retrying.
+
     Raises the underlying exception on final failure.
     """
+
+    def _attempt() -> bytes:
+        sess = session if session is not None else http.get_session()
+        resp = sess.get(url, timeout=timeout, headers=headers)
+        # raise_for_status will raise HTTPError for 4xx/5xx
+        resp.raise_for_status()
+        content = resp.content
+        download_scheduler.get_scheduler().consume(len(content))
+        return content
+
+    data = _with_retries(url, _attempt, max_retries=max_retries, backoff_factor=backoff_factor)
+    progress.report_progress("downloaded", done=len(data), total=len(data), url=url)
+    return data
+
+
+def _with_retries(url: str, attempt_fn: Callable[[], T], *, max_retries: int, backoff_factor: float) -> T:
+    """Run `attempt_fn` with the retry, backoff and circuit breaker policy.
+
+    Shared by the in-memory and streaming downloads so both behave the
+    same: network errors and 5xx are retried, 4xx are raised at once.
+    Each attempt runs in a slot of the download scheduler (see
+    `download_scheduler`); backoff sleeps do not hold one.
+    """
+    breaker = circuit_breaker.breaker_for_url(url)
+    scheduler = download_scheduler.get_scheduler()
     attempt = 0
     last_exc: Exception | None = None
     while attempt <= max_retries:
+        progress.report_progress("download", attempt=attempt + 1, url=url)
         try:
-            if session is not None:
-                resp = session.get(url, timeout=timeout, headers=headers)
-            else:
-                resp = requests.get(url, timeout=timeout, headers=headers)
-            # raise_for_status will raise HTTPError for 4xx/5xx
-            resp.raise_for_status()
-            return resp.content
+            with scheduler.slot():
+                return breaker.call(attempt_fn) if breaker is not None else attempt_fn()
         except HTTPError as he:
-            status = None
-            try:
-                status = he.response.status_code  # type: ignore[attr-defined]
-            except Exception:
-                status = None
             # Do not retry on client errors (4xx)
-            if status is not None and 400 <= status < 500:
+            if _is_client_error(he):
                 raise
             last_exc = he
         except RequestException as re:
@@ -70,8 +233,9 @@ def download_bytes(
 
         # Sleep with exponential backoff before retrying
         sleep_for = backoff_factor * (2**attempt)
+        progress.report_progress("retry", attempt=attempt + 1, delay=sleep_for, message=str(last_exc))
         logger.debug(
-            "download_bytes: attempt %s failed, sleeping %s seconds before retry (%s)",
+            "download: attempt %s failed, sleeping %s seconds before retry (%s)",
             attempt,
             sleep_for,
             last_exc,
@@ -87,6 +251,636 @@ def download_bytes(
     raise RuntimeError("download failed")
 
 
+def _content_length(resp: Any) -> Optional[int]:
+    try:
+        value = int(resp.headers.get("Content-Length"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return value if value >= 0 else None
+
+
+def _content_range(resp: Any) -> Tuple[Optional[int], Optional[int]]:
+    """Return (start, complete length) from a ``Content-Range`` header."""
+    try:
+        unit, _, spec = str(resp.headers.get("Content-Range") or "").partition(" ")
+        span, _, length = spec.partition("/")
+        start = int(span.partition("-")[0]) if unit == "bytes" and span != "*" else None
+        return start, int(length) if length.isdigit() else None
+    except (AttributeError, ValueError):
+        return None, None
+
+
+class _PartialDownload:
+    """Resume state of a download: bytes on disk plus the server validators.
+
+    For path destinations it is persisted next to the ``.part`` file as
+    ``<dest>.part.json`` so a later call (or process) can continue with a
+    ``Range`` request instead of starting over.
+    """
+
+    SAVE_EVERY = 8 << 20
+
+    def __init__(self, url: str, meta_path: Optional[str] = None) -> None:
+        self.url = url
+        self.meta_path = meta_path
+        self.received = 0
+        self.total: Optional[int] = None
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.accept_ranges = False
+        self._saved_at = 0
+
+    @classmethod
+    def load(cls, url: str, part_path: str) -> "_PartialDownload":
+        state = cls(url, part_path + ".json")
+        try:
+            with open(state.meta_path, encoding="utf-8") as fh:  # type: ignore[arg-type]
+                meta = json.load(fh)
+            on_disk = os.path.getsize(part_path)
+        except (OSError, ValueError):
+            return state
+        if meta.get("url") != url:
+            return state
+        state.total = meta.get("total")
+        state.etag = meta.get("etag")
+        state.last_modified = meta.get("last_modified")
+        state.accept_ranges = bool(meta.get("accept_ranges"))
+        # The file is authoritative: metadata may lag behind the last write
+        state.received = on_disk
+        return state
+
+    def resumable(self) -> bool:
+        return self.accept_ranges and 0 < self.received and (self.total is None or self.received <= self.total)
+
+    def restart(self, resp: Any) -> None:
+        """Reset for a full (``200``) response and record its validators."""
+        headers = getattr(resp, "headers", None) or {}
+        self.received = 0
+        self.total = _content_length(resp)
+        self.etag = headers.get("ETag")
+        self.last_modified = headers.get("Last-Modified")
+        self.accept_ranges = str(headers.get("Accept-Ranges", "")).lower() == "bytes"
+        self._saved_at = 0
+
+    def advance(self, n: int) -> None:
+        self.received += n
+        if self.meta_path is not None and self.received - self._saved_at >= self.SAVE_EVERY:
+            self.save()
+
+    def save(self) -> None:
+        if self.meta_path is None:
+            return
+        meta = {
+            "url": self.url,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "accept_ranges": self.accept_ranges,
+            "total": self.total,
+            "received": self.received,
+        }
+        tmp = self.meta_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(meta, fh)
+            os.replace(tmp, self.meta_path)
+            self._saved_at = self.received
+        except OSError:
+            logger.debug("could not persist resume state %s", self.meta_path, exc_info=True)
+
+    def discard(self) -> None:
+        if self.meta_path is not None:
+            try:
+                os.unlink(self.meta_path)
+            except OSError:
+                pass
+
+
+def _stream_response(
+    url: str, resp: Any, out: IO[bytes], chunk_size: int, state: _PartialDownload, check: _StreamCheck
+) -> int:
+    """Append the body of `resp` to `out` chunk by chunk; return its size."""
+    expected = _content_length(resp)
+    check.check_declared(state.total)
+    written = 0
+    scheduler = download_scheduler.get_scheduler()
+    started = last_report = _perf_counter()
+    for chunk in resp.iter_content(chunk_size=chunk_size):
+        if not chunk:
+            continue
+        scheduler.consume(len(chunk))
+        # Abort as soon as the body overruns, before writing the excess
+        check.check_growth(state.received + len(chunk))
+        out.write(chunk)
+        check.update(chunk)
+        written += len(chunk)
+        state.advance(len(chunk))
+        now = _perf_counter()
+        if now - last_report >= PROGRESS_INTERVAL:
+            last_report = now
+            rate = written / (now - started) if now > started else 0.0
+            progress.report_progress(
+                "downloading", done=state.received, total=state.total, url=url, bytes_per_s=round(rate)
+            )
+    if expected is not None and written < expected:
+        # A connection cut mid-body: retry (and resume) like any other network error
+        raise requests.exceptions.ChunkedEncodingError(f"incomplete body: {written} of {expected} bytes")
+    return written
+
+
+def _range_headers(headers: Optional[Mapping[str, Any]], state: _PartialDownload) -> Optional[Mapping[str, Any]]:
+    if not state.resumable():
+        return headers
+    out = dict(headers or {})
+    out["Range"] = f"bytes={state.received}-"
+    # If-Range: the server sends the whole (new) file if it changed meanwhile
+    validator = state.etag or state.last_modified
+    if validator:
+        out["If-Range"] = validator
+    return out
+
+
+def _open_response(
+    getter: Callable[..., Any], url: str, timeout: Optional[float], headers: Any, state: _PartialDownload
+) -> Tuple[Any, Optional[int]]:
+    """Issue the (possibly ranged) GET.
+
+    Returns the response and the offset to write its body at, or None when
+    the file was already complete on disk.
+    """
+    req_headers = _range_headers(headers, state)
+    resp = getter(url, timeout=timeout, headers=req_headers, stream=True)
+    if req_headers is headers:
+        resp.raise_for_status()
+        state.restart(resp)
+        return resp, 0
+    if resp.status_code == 416 and state.total is not None and state.received == state.total:
+        return resp, None  # everything was already on disk
+    resp.raise_for_status()
+    start, total = _content_range(resp)
+    if resp.status_code == 206 and start == state.received:
+        state.total = total if total is not None else state.total
+        progress.report_progress("resume", done=state.received, total=state.total, url=url)
+        logger.info("resuming %s at byte %d", url, state.received)
+        return resp, state.received
+    # 200 (no range support, or the file changed): start over
+    state.restart(resp)
+    return resp, 0
+
+
+def download_to_file(
+    url: str,
+    dest: Union[str, IO[bytes]],
+    timeout: Optional[float] = 120.0,
+    headers: Optional[Mapping[str, Any]] = None,
+    *,
+    max_retries: int = 3,
+    backoff_factor: float = 0.5,
+    session: Optional[requests.sessions.Session] = None,
+    chunk_size: int = CHUNK_SIZE,
+    resume: bool = True,
+    segments: Optional[int] = None,
+    segment_min_size: Optional[int] = None,
+    expected_size: Optional[int] = None,
+    checksums: Optional[Mapping[str, str]] = None,
+    digests: Sequence[str] = (),
+) -> DownloadResult:
+    """Stream a URL to `dest` with bounded memory and return its stats.
+
+    `dest` is a path or a seekable binary file object. A path is written
+    through a ``.part`` sibling renamed into place on success, so readers
+    never see a truncated file. Retry, backoff and circuit breaker
+    semantics are those of `download_bytes`. The throughput of the
+    successful attempt is logged and reported in the final ``downloaded``
+    progress event.
+
+    With `resume`, a retry continues where the failed attempt stopped
+    using a ``Range`` request (guarded by ``If-Range``) when the server
+    advertised ``Accept-Ranges: bytes`` and answers ``206``; any other
+    answer restarts from zero. For paths, the ``.part`` file and its
+    ``.part.json`` resume state are kept after a network failure, so the
+    next call for the same destination and URL resumes too. Client
+    errors (4xx) discard them.
+
+    With `segments` > 1 (default ``BLENDER_MCP_DOWNLOAD_SEGMENTS``, 1) and
+    a path `dest`, files of at least `segment_min_size` bytes (default
+    ``BLENDER_MCP_SEGMENT_MIN_SIZE``, 32 MiB) on range-capable servers are
+    fetched as that many concurrent byte ranges over one pooled session
+    and assembled in place with ``os.pwrite``. Anything else, including
+    a pending ``.part`` to resume, uses the single stream.
+
+    Integrity is checked while streaming: `checksums` (e.g.
+    ``{"md5": "..."}``) and any extra `digests` algorithms are hashed
+    chunk by chunk, and an `expected_size` is enforced as bytes arrive, so
+    a response announcing another length or overrunning it is aborted at
+    once. Mismatches raise `IntegrityError`, which is retried from scratch.
+    The hex digests are returned in `DownloadResult.digests`.
+    """
+    getter = (session if session is not None else http.get_session()).get
+    check = _StreamCheck(url, expected_size, checksums, digests)
+
+    def _attempt(out: IO[bytes], state: _PartialDownload) -> DownloadResult:
+        if not resume:
+            state.received = 0
+        started = _perf_counter()
+        resp, offset = _open_response(getter, url, timeout, headers, state)
+        try:
+            # Resumed bytes from an earlier process are hashed from disk once
+            check.catch_up(out, state.received if offset is None else offset)
+            if offset is not None:
+                out.seek(offset)
+                out.truncate()
+                _stream_response(url, resp, out, chunk_size, state, check)
+            out.flush()
+            found = check.finish(state.received)
+        except IntegrityError:
+            # The bytes on disk cannot be trusted: the retry starts over
+            state.received = 0
+            state.accept_ranges = False
+            raise
+        finally:
+            close = getattr(resp, "close", None)
+            if close is not None:
+                close()
+        resumed_from = state.received if offset is None else offset
+        return DownloadResult(
+            path=None,
+            size=state.received,
+            elapsed=_perf_counter() - started,
+            resumed_from=resumed_from,
+            etag=state.etag,
+            last_modified=state.last_modified,
+            digests=found,
+        )
+
+    result: Optional[DownloadResult] = None
+    if not isinstance(dest, (str, os.PathLike)):
+        state = _PartialDownload(url)
+        result = _with_retries(
+            url, lambda: _attempt(dest, state), max_retries=max_retries, backoff_factor=backoff_factor
+        )
+    else:
+        path = os.fspath(dest)
+        n_segments, min_size = _segment_settings(segments, segment_min_size)
+        if n_segments > 1 and not os.path.exists(path + ".part"):
+            result = _download_segmented(
+                session,
+                url,
+                path,
+                n_segments,
+                min_size,
+                timeout=timeout,
+                headers=headers,
+                chunk_size=chunk_size,
+                max_retries=max_retries,
+                backoff_factor=backoff_factor,
+                check=check,
+            )
+        if result is None:
+            result = _download_to_path(url, path, _attempt, resume, max_retries, backoff_factor)
+    assert result is not None
+
+    progress.report_progress(
+        "downloaded", done=result.size, total=result.size, url=url, bytes_per_s=round(result.throughput)
+    )
+    logger.info(
+        "downloaded %s: %d bytes (%d resumed) in %.2fs (%.1f MB/s)",
+        url,
+        result.size,
+        result.resumed_from,
+        result.elapsed,
+        result.throughput / 1e6,
+    )
+    return result
+
+
+class _RangesNotHonoured(Exception):
+    """A segment request was answered without the expected ``206``."""
+
+
+def is_local_failure(exc: BaseException) -> bool:
+    """True when a download failed a check made here, not in the upstream.
+
+    Integrity mismatches and servers ignoring ``Range`` say nothing about
+    the upstream's health (see `circuit_breaker.is_upstream_failure`).
+    """
+    return isinstance(exc, (IntegrityError, _RangesNotHonoured))
+
+
+def _segment_settings(segments: Optional[int], min_size: Optional[int]) -> Tuple[int, int]:
+    def _env(name: str, default: int) -> int:
+        try:
+            return max(1, int(os.environ.get(name, default)))
+        except ValueError:
+            return default
+
+    n = segments if segments is not None else _env("BLENDER_MCP_DOWNLOAD_SEGMENTS", 1)
+    size = min_size if min_size is not None else _env("BLENDER_MCP_SEGMENT_MIN_SIZE", SEGMENT_MIN_SIZE)
+    return max(1, n), size
+
+
+def _split_ranges(total: int, segments: int) -> List[Tuple[int, int]]:
+    """Split ``[0, total)`` into at most `segments` inclusive byte ranges."""
+    segments = max(1, min(segments, total))
+    step = -(-total // segments)
+    return [(start, min(start + step, total) - 1) for start in range(0, total, step)]
+
+
+def _pwrite_all(fd: int, data: bytes, offset: int, lock: threading.Lock) -> None:
+    if hasattr(os, "pwrite"):
+        view = memoryview(data)
+        while view:
+            n = os.pwrite(fd, view, offset)
+            view = view[n:]
+            offset += n
+        return
+    # No positional writes (Windows): serialize seek + write
+    with lock:
+        os.lseek(fd, offset, os.SEEK_SET)
+        os.write(fd, data)
+
+
+def _probe_ranges(getter: Callable[..., Any], url: str, timeout: Optional[float], headers: Any):
+    """Return (total size, ETag, Last-Modified) when `url` serves byte ranges, else None."""
+    probe_headers = dict(headers or {})
+    probe_headers["Range"] = "bytes=0-0"
+    resp = getter(url, timeout=timeout, headers=probe_headers, stream=True)
+    try:
+        resp.raise_for_status()
+        start, total = _content_range(resp)
+        if resp.status_code != 206 or start != 0 or total is None:
+            return None
+        resp_headers = getattr(resp, "headers", None) or {}
+        return total, resp_headers.get("ETag"), resp_headers.get("Last-Modified")
+    finally:
+        close = getattr(resp, "close", None)
+        if close is not None:
+            close()
+
+
+class _SegmentedDownload:
+    """Fetch byte ranges of one file concurrently into a preallocated file."""
+
+    def __init__(
+        self,
+        getter: Callable[..., Any],
+        url: str,
+        fd: int,
+        total: int,
+        validator: Optional[str],
+        *,
+        timeout: Optional[float],
+        headers: Optional[Mapping[str, Any]],
+        chunk_size: int,
+        max_retries: int,
+        backoff_factor: float,
+    ) -> None:
+        self.getter = getter
+        self.url = url
+        self.fd = fd
+        self.total = total
+        self.validator = validator
+        self.timeout = timeout
+        self.headers = headers
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.abort = threading.Event()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self.done = 0
+        self._started = self._last_report = _perf_counter()
+
+    def _advance(self, n: int) -> None:
+        with self._lock:
+            self.done += n
+            now = _perf_counter()
+            if now - self._last_report < PROGRESS_INTERVAL:
+                return
+            self._last_report = now
+            done = self.done
+        rate = done / (now - self._started) if now > self._started else 0.0
+        progress.report_progress("downloading", done=done, total=self.total, url=self.url, bytes_per_s=round(rate))
+
+    def fetch(self, start: int, end: int) -> None:
+        """Download ``[start, end]``; retries continue from the last byte written."""
+        pos = [start]
+        scheduler = download_scheduler.get_scheduler()
+
+        def _attempt() -> None:
+            req_headers = dict(self.headers or {})
+            req_headers["Range"] = f"bytes={pos[0]}-{end}"
+            if self.validator:
+                req_headers["If-Range"] = self.validator
+            resp = self.getter(self.url, timeout=self.timeout, headers=req_headers, stream=True)
+            try:
+                resp.raise_for_status()
+                if resp.status_code != 206 or _content_range(resp)[0] != pos[0]:
+                    # Typically the file changed (If-Range mismatch): start over
+                    raise _RangesNotHonoured(f"server ignored Range for {self.url}")
+                for chunk in resp.iter_content(chunk_size=self.chunk_size):
+                    if self.abort.is_set():
+                        raise _RangesNotHonoured("segmented download aborted")
+                    if not chunk:
+                        continue
+                    chunk = chunk[: end + 1 - pos[0]]
+                    scheduler.consume(len(chunk))
+                    _pwrite_all(self.fd, chunk, pos[0], self._write_lock)
+                    pos[0] += len(chunk)
+                    self._advance(len(chunk))
+                    if pos[0] > end:
+                        break
+            finally:
+                close = getattr(resp, "close", None)
+                if close is not None:
+                    close()
+            if pos[0] <= end:
+                raise requests.exceptions.ChunkedEncodingError(f"incomplete segment: {pos[0] - start} bytes")
+
+        _with_retries(self.url, _attempt, max_retries=self.max_retries, backoff_factor=self.backoff_factor)
+
+    def run(self, ranges: List[Tuple[int, int]]) -> None:
+        import contextvars
+        from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+
+        with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="blender-mcp-segment") as pool:
+            # Segments inherit the caller's context (progress reporter, download priority)
+            futures = [pool.submit(contextvars.copy_context().run, self.fetch, start, end) for start, end in ranges]
+            try:
+                done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            except BaseException:
+                self.abort.set()
+                raise
+            for fut in done:
+                exc = fut.exception()
+                if exc is not None:
+                    # Stop the other segments at their next chunk
+                    self.abort.set()
+                    raise exc
+
+
+def _download_segmented(
+    session: Optional[requests.sessions.Session],
+    url: str,
+    path: str,
+    segments: int,
+    min_size: int,
+    *,
+    timeout: Optional[float],
+    headers: Optional[Mapping[str, Any]],
+    chunk_size: int,
+    max_retries: int,
+    backoff_factor: float,
+    check: _StreamCheck,
+) -> Optional[DownloadResult]:
+    """Download `url` to `path` as `segments` concurrent byte ranges.
+
+    Returns None, having written nothing, when the server does not serve
+    ranges, the file is smaller than `min_size` or the ranges stop being
+    honoured midway (the file changed): the caller then falls back to a
+    single stream. Segments arrive out of order, so checksums are computed
+    from the assembled file; a mismatch also falls back.
+    """
+    own_session = session is None
+    if session is None:
+        # Pooled like the shared session, but sized to keep every segment alive
+        session = http.make_session(pool_size=segments, pool_hosts=1)
+    try:
+        try:
+            probe = _probe_ranges(session.get, url, timeout, headers)
+        except HTTPError as he:
+            if _is_client_error(he):
+                raise
+            return None
+        except RequestException:
+            return None
+        if probe is None or probe[0] < min_size:
+            return None
+        total, etag, last_modified = probe
+        if check.expected_size is not None and total != check.expected_size:
+            return None  # the single stream retries and reports the mismatch
+        validator = etag or last_modified
+        ranges = _split_ranges(total, segments)
+        part = path + ".part"
+        started = _perf_counter()
+        fd = os.open(part, os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            os.ftruncate(fd, total)
+            job = _SegmentedDownload(
+                session.get,
+                url,
+                fd,
+                total,
+                validator,
+                timeout=timeout,
+                headers=headers,
+                chunk_size=chunk_size,
+                max_retries=max_retries,
+                backoff_factor=backoff_factor,
+            )
+            job.run(ranges)
+            found = _verify_assembled(part, total, check)
+        except BaseException as e:
+            os.close(fd)
+            os.unlink(part)
+            if is_local_failure(e):
+                logger.info("segmented download of %s fell back to a single stream: %s", url, e)
+                return None
+            raise
+        os.close(fd)
+        os.replace(part, path)
+        logger.debug("downloaded %s in %d segments", url, len(ranges))
+        return DownloadResult(
+            path=path,
+            size=total,
+            elapsed=_perf_counter() - started,
+            etag=etag,
+            last_modified=last_modified,
+            digests=found,
+        )
+    finally:
+        if own_session:
+            session.close()
+
+
+def _verify_assembled(part: str, total: int, check: _StreamCheck) -> Dict[str, str]:
+    check.reset()
+    if check.algorithms:
+        with open(part, "rb") as fh:
+            check.catch_up(fh, total)
+    else:
+        check.covered = total
+    return check.finish(total)
+
+
+def _download_to_path(
+    url: str,
+    path: str,
+    attempt: Callable[[IO[bytes], _PartialDownload], DownloadResult],
+    resume: bool,
+    max_retries: int,
+    backoff_factor: float,
+) -> DownloadResult:
+    part = path + ".part"
+    state = _PartialDownload.load(url, part) if resume else _PartialDownload(url, part + ".json")
+    try:
+        with open(part, "r+b" if state.received else "wb") as fh:
+            result = _with_retries(
+                url, lambda: attempt(fh, state), max_retries=max_retries, backoff_factor=backoff_factor
+            )
+        os.replace(part, path)
+    except HTTPError as he:
+        if _is_client_error(he):
+            _discard_partial(part, state)
+        else:
+            state.save()
+        raise
+    except Exception:
+        if resume and state.received:
+            state.save()  # keep what we have for the next call
+        else:
+            _discard_partial(part, state)
+        raise
+    except BaseException:
+        _discard_partial(part, state)
+        raise
+    state.discard()
+    return dataclasses.replace(result, path=path)
+
+
+def _discard_partial(part: str, state: _PartialDownload) -> None:
+    try:
+        os.unlink(part)
+    except OSError:
+        pass
+    state.discard()
+
+
+def download_to_spooled(
+    url: str,
+    timeout: Optional[float] = 120.0,
+    headers: Optional[Mapping[str, Any]] = None,
+    *,
+    max_memory: int = SPOOL_MAX_MEMORY,
+    session: Optional[requests.sessions.Session] = None,
+    **kwargs: Any,
+) -> "tempfile.SpooledTemporaryFile[bytes]":
+    """Stream a URL into a spooled temp file, rewound and ready to read.
+
+    Small bodies stay in memory; anything above `max_memory` rolls over to
+    an anonymous temp file. The caller closes the returned file.
+    """
+    spool: "tempfile.SpooledTemporaryFile[bytes]" = tempfile.SpooledTemporaryFile(
+        max_size=max_memory, prefix="blender_mcp_dl_"
+    )
+    try:
+        download_to_file(url, spool, timeout=timeout, headers=headers, session=session, **kwargs)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
 def secure_extract_zip_bytes(zip_bytes: bytes, target_dir: str | None = None) -> str:
     """Extract zip bytes safely.
 
@@ -94,53 +888,155 @@ def secure_extract_zip_bytes(zip_bytes: bytes, target_dir: str | None = None) ->
     `target_dir` is None, a temporary directory is created, extraction is
     performed there and the path to that directory is returned.
 
-    Raises ValueError on suspicious zip entries (path traversal).
+    Raises ValueError on suspicious zip entries (path traversal, zip bombs).
+    Prefer `secure_extract_zip_file` for downloaded assets: it does not need
+    the archive in memory.
     """
-    # Lazy import to keep this module import-friendly in tests
-    import tempfile
+    return secure_extract_zip_file(io.BytesIO(zip_bytes), target_dir)
+
+
+class _ZipBudget:
+    """Running total of decompressed bytes, shared by extraction threads."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def consume(self, n: int) -> None:
+        with self._lock:
+            self.used += n
+            if self.used > self.limit:
+                raise ValueError(f"Zip expands beyond {self.limit} bytes")
+
+
+def _zip_member_path(root: str, info: zipfile.ZipInfo) -> str:
+    """Return where `info` extracts under `root`, rejecting traversal."""
+    name = info.filename.replace("\\", "/")
+    parts = [p for p in name.split("/") if p not in ("", ".")]
+    if ".." in parts:
+        raise ValueError("Zip contains directory traversal sequence")
+    dest = os.path.abspath(os.path.join(root, *parts)) if parts else root
+    if os.path.isabs(name) or os.path.commonpath([root, dest]) != root:
+        raise ValueError("Zip contains path traversal entries")
+    return dest
+
+
+def _check_zip_plan(infos: list[zipfile.ZipInfo], max_total_size: int, max_ratio: float, max_members: int) -> None:
+    """Reject zip bombs from the central directory, before reading any data.
+
+    Reads are bounded by the declared sizes (`ZipExtFile` never returns
+    more than `file_size`), so these checks hold for the actual output.
+    """
+    if len(infos) > max_members:
+        raise ValueError(f"Zip has too many entries ({len(infos)} > {max_members})")
+    total = 0
+    for info in infos:
+        total += info.file_size
+        if total > max_total_size:
+            raise ValueError(f"Zip expands beyond {max_total_size} bytes")
+        if info.file_size >= ZIP_RATIO_MIN_SIZE and info.file_size > max_ratio * max(info.compress_size, 1):
+            raise ValueError(f"Zip entry {info.filename!r} has a suspicious compression ratio")
+
+
+def _extract_zip_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo, dest: str, budget: _ZipBudget) -> None:
+    if info.is_dir():
+        os.makedirs(dest, exist_ok=True)
+        return
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    with zf.open(info) as src, open(dest, "wb") as out:
+        while True:
+            chunk = src.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            budget.consume(len(chunk))
+            out.write(chunk)
 
-    created_temp = False
+
+def _extract_zip_members_parallel(
+    source: str, members: list[tuple[zipfile.ZipInfo, str]], budget: _ZipBudget, workers: int
+) -> None:
+    # One ZipFile per task: each member gets its own file handle and
+    # decompressor, so threads never contend on a shared read position.
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _one(item: tuple[zipfile.ZipInfo, str]) -> None:
+        with zipfile.ZipFile(source) as zf:
+            _extract_zip_member(zf, item[0], item[1], budget)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="blender-mcp-unzip") as pool:
+        for _ in pool.map(_one, members):
+            pass
+
+
+def secure_extract_zip_file(
+    source: Union[str, "os.PathLike[str]", IO[bytes]],
+    target_dir: str | None = None,
+    *,
+    max_total_size: int = ZIP_MAX_TOTAL_SIZE,
+    max_ratio: float = ZIP_MAX_RATIO,
+    max_members: int = ZIP_MAX_MEMBERS,
+    workers: int = 1,
+) -> str:
+    """Safely extract a zip archive from a path or seekable file (or mmap).
+
+    Every entry is validated from the central directory first (path
+    traversal, entry count, total size and per-entry compression ratio),
+    so traversal entries and zip bombs are rejected before anything is
+    written. The archive data is then read once, member by member, in
+    bounded chunks: memory stays constant whatever the archive size. The
+    decompressed total is also tracked while writing.
+
+    With `workers` > 1 and a path `source`, members of at least
+    `ZIP_PARALLEL_MIN_SIZE` bytes are extracted concurrently.
+
+    Returns the target directory (a new workspace dir when `target_dir` is
+    None, removed again on failure). Raises ValueError on unsafe archives.
+    """
+    ws = None
     if target_dir is None:
-        target_dir = tempfile.mkdtemp(prefix="blender_mcp_zip_")
-        created_temp = True
-
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zip_ref:
-        for file_info in zip_ref.infolist():
-            file_path = file_info.filename
-
-            # Normalize and compute absolute paths
-            target_path = os.path.join(target_dir, os.path.normpath(file_path))
-            abs_temp_dir = os.path.abspath(target_dir)
-            abs_target_path = os.path.abspath(target_path)
-
-            if not abs_target_path.startswith(abs_temp_dir):
-                # If we created the temp dir for this extraction, attempt cleanup
-                if created_temp:
-                    try:
-                        import shutil
-
-                        shutil.rmtree(target_dir)
-                    except Exception:
-                        pass
-                raise ValueError("Zip contains path traversal entries")
-
-            # Also reject explicit '..' segments
-            if ".." in file_path.split(os.path.sep):
-                if created_temp:
-                    try:
-                        import shutil
-
-                        shutil.rmtree(target_dir)
-                    except Exception:
-                        pass
-                raise ValueError("Zip contains directory traversal sequence")
-
-        # If all checks pass, extract
-        zip_ref.extractall(target_dir)
+        ws = workspace.get_workspace()
+        target_dir = ws.mkdtemp(prefix="blender_mcp_zip_")
+    root = os.path.abspath(target_dir)
+    parallel_source = os.fspath(source) if isinstance(source, (str, os.PathLike)) and workers > 1 else None
+
+    try:
+        with zipfile.ZipFile(source) as zf:
+            infos = zf.infolist()
+            plan = [(info, _zip_member_path(root, info)) for info in infos]
+            _check_zip_plan(infos, max_total_size, max_ratio, max_members)
 
+            progress.report_progress("extract", total=len(infos))
+            budget = _ZipBudget(max_total_size)
+            large = []
+            for info, dest in plan:
+                if parallel_source is not None and info.file_size >= ZIP_PARALLEL_MIN_SIZE:
+                    large.append((info, dest))
+                else:
+                    _extract_zip_member(zf, info, dest, budget)
+        if large:
+            assert parallel_source is not None
+            _extract_zip_members_parallel(parallel_source, large, budget, workers)
+    except BaseException:
+        if ws is not None:
+            ws.discard(target_dir)
+        raise
+
+    if ws is not None:
+        ws.hand_off(target_dir)
     return target_dir
 
 
+def _integrity_kwargs(expected_size: Optional[int], checksums: Optional[Mapping[str, str]]) -> Dict[str, Any]:
+    # Only forward what is set, so simple stand-ins for the helpers keep working
+    out: Dict[str, Any] = {}
+    if expected_size is not None:
+        out["expected_size"] = expected_size
+    if checksums:
+        out["checksums"] = checksums
+    return out
+
+
 def download_to_tempfile(
     url: str,
     prefix: str = "",
@@ -148,32 +1044,140 @@ def download_to_tempfile(
     timeout: Optional[float] = 120.0,
     headers: Optional[Mapping[str, Any]] = None,
     session: Optional[requests.sessions.Session] = None,
+    *,
+    expected_size: Optional[int] = None,
+    checksums: Optional[Mapping[str, str]] = None,
 ) -> str:
-    """Download a URL and write it to a NamedTemporaryFile, returning the path.
+    """Stream a URL into a new workspace file and return its path.
 
-    This uses download_bytes (which raises on HTTP errors) and is a small
-    convenience wrapper so callers don't duplicate tempfile management.
+    This uses download_to_file (which raises on HTTP errors) and is a small
+    convenience wrapper so callers don't duplicate tempfile management. The
+    file stays held for the caller until it calls `Workspace.release` or
+    deletes the file (see `workspace`).
     """
-    import os
-    import tempfile
-
-    # Forward optional session to download_bytes for connection reuse/testability.
-    if session is None:
-        data = download_bytes(url, timeout=timeout, headers=headers)
-    else:
-        data = download_bytes(url, timeout=timeout, headers=headers, session=session)
-    tf = tempfile.NamedTemporaryFile(delete=False, prefix=prefix, suffix=suffix)
+    ws = workspace.get_workspace()
+    path = ws.mkstemp(prefix=prefix, suffix=suffix)
     try:
-        tf.write(data)
-        tf.close()
-        return tf.name
+        # Forward optional session for connection reuse/testability.
+        extra = _integrity_kwargs(expected_size, checksums)
+        if session is not None:
+            extra["session"] = session
+        download_to_file(url, path, timeout=timeout, headers=headers, **extra)
     except Exception:
+        ws.discard(path)
+        raise
+    ws.hand_off(path)
+    return path
+
+
+def download_and_extract_zip(
+    url: str,
+    timeout: Optional[float] = 120.0,
+    headers: Optional[Mapping[str, Any]] = None,
+    *,
+    session: Optional[requests.sessions.Session] = None,
+    workers: Optional[int] = None,
+    key: Optional[str] = None,
+    expected_size: Optional[int] = None,
+    checksums: Optional[Mapping[str, str]] = None,
+) -> str:
+    """Stream a zip to a temp file, extract it safely and return the directory.
+
+    The archive never sits in memory: peak RSS stays small and constant
+    instead of roughly twice the archive size. The temp zip is removed
+    afterwards. `workers` defaults to ``BLENDER_MCP_UNZIP_WORKERS`` (4).
+    `expected_size` / `checksums` are verified while the archive streams
+    (see `download_to_file`), so a truncated zip never reaches extraction.
+
+    With the asset cache enabled the archive is kept and extracted once;
+    each caller gets its own workspace directory of hard links to the
+    extracted files (modify them by replacing, not in place), which
+    outlives eviction from the cache. `key` identifies the asset when
+    `url` is not stable.
+    """
+    if workers is None:
         try:
-            tf.close()
-        except Exception:
-            pass
+            workers = max(1, int(os.environ.get("BLENDER_MCP_UNZIP_WORKERS", 4)))
+        except ValueError:
+            workers = 4
+    from .asset_cache import get_asset_cache
+
+    cache = get_asset_cache()
+    if cache is not None:
+        ws = workspace.get_workspace()
+        target_dir = ws.mkdtemp(prefix="blender_mcp_zip_")
         try:
-            os.unlink(tf.name)
-        except Exception:
-            pass
+            cache.extract(
+                url,
+                key=key,
+                headers=headers,
+                timeout=timeout,
+                session=session,
+                workers=workers,
+                dest=target_dir,
+                expected_size=expected_size,
+                checksums=checksums,
+            )
+        except BaseException:
+            ws.discard(target_dir)
+            raise
+        ws.hand_off(target_dir)
+        return target_dir
+    extra = _integrity_kwargs(expected_size, checksums)
+    if session is not None:
+        extra["session"] = session
+    zip_path = download_to_tempfile(
+        url, prefix="blender_mcp_", suffix=".zip", timeout=timeout, headers=headers, **extra
+    )
+    try:
+        return secure_extract_zip_file(zip_path, workers=workers)
+    finally:
+        workspace.get_workspace().discard(zip_path)
+
+
+def fetch_cached_file(
+    url: str,
+    *,
+    key: Optional[str] = None,
+    prefix: str = "blender_mcp_",
+    suffix: str = "",
+    timeout: Optional[float] = 120.0,
+    headers: Optional[Mapping[str, Any]] = None,
+    session: Optional[requests.sessions.Session] = None,
+    expected_size: Optional[int] = None,
+    checksums: Optional[Mapping[str, str]] = None,
+) -> str:
+    """Return a private temp file holding the body of `url`.
+
+    Served from the asset cache when enabled (hard-linked, so callers may
+    delete it freely), otherwise downloaded with `download_to_tempfile`.
+    """
+    from .asset_cache import get_asset_cache
+
+    cache = get_asset_cache()
+    if cache is None:
+        kwargs: Dict[str, Any] = {"prefix": prefix, "suffix": suffix, "timeout": timeout}
+        kwargs.update(_integrity_kwargs(expected_size, checksums))
+        if headers is not None:
+            kwargs["headers"] = headers
+        if session is not None:
+            kwargs["session"] = session
+        return download_to_tempfile(url, **kwargs)
+    ws = workspace.get_workspace()
+    path = ws.mkstemp(prefix=prefix, suffix=suffix)
+    try:
+        cache.materialize(
+            url,
+            path,
+            key=key,
+            headers=headers,
+            timeout=timeout,
+            session=session,
+            expected_size=expected_size,
+            checksums=checksums,
+        )
+    except BaseException:
+        ws.discard(path)
         raise
+    ws.hand_off(path)
+    return path
@@ -40,6 +40,31 @@ class ExternalServiceError(BlenderMCPError):
     """Raised when an external dependency fails (network, remote API, etc.)."""
 
 
+class CircuitOpenError(ExternalServiceError):
+    """Raised without calling an upstream whose circuit breaker is open.
+
+    `upstream` names the provider and `retry_after` is the number of
+    seconds before the breaker lets a trial call through.
+    """
+
+    def __init__(self, upstream: str, *, retry_after: float = 0.0) -> None:
+        super().__init__(f"{upstream} is unavailable (circuit open, retry in {retry_after:.0f}s)")
+        self.upstream = upstream
+        self.retry_after = retry_after
+
+
+class ServiceBusyError(BlenderMCPError):
+    """Raised when a tool's queue is full and the call is rejected up front.
+
+    `retry_after` is a hint (seconds) for when capacity is likely available.
+    """
+
+    def __init__(self, name: str, *, retry_after: float = 1.0) -> None:
+        super().__init__(f"'{name}' is busy (queue full), retry in {retry_after:.0f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
 class HandlerError(BlenderMCPError):
     """Wrapper for exceptions raised by handlers.
 
@@ -73,6 +98,7 @@ ErrorCode = Literal[
     "not_found",
     "invalid_params",
     "timeout",
+    "busy",
     "handler_error",
     "external_error",
     "internal_error",
@@ -93,6 +119,8 @@ def error_code_for_exception(exc: BlenderMCPError) -> ErrorCode:
         return "policy_denied"
     if isinstance(exc, ExecutionTimeoutError):
         return "timeout"
+    if isinstance(exc, ServiceBusyError):
+        return "busy"
     if isinstance(exc, HandlerError):
         return "handler_error"
     if isinstance(exc, ExternalServiceError):
@@ -107,6 +135,8 @@ __all__ = [
     "PolicyDeniedError",
     "ExecutionTimeoutError",
     "ExternalServiceError",
+    "CircuitOpenError",
+    "ServiceBusyError",
     "HandlerError",
     "SuccessResult",
     "ErrorResult",
@@ -78,26 +78,45 @@ def _extract_first_json_from_string(s: str) -> Optional[ToolCommand]:
     return None
 
 
+# Last `/tools` summary and its ETag, revalidated with If-None-Match
+_TOOL_CATALOG_CACHE: dict[str, tuple[str, str]] = {}
+
+
+def _summarize_tools(payload: Any) -> str:
+    tools: list[str] = []
+    for t in payload.get("tools", []):
+        name = t.get("name") or t.get("tool") or str(t)
+        sig = t.get("signature", "")
+        doc = t.get("doc", "")
+        line = name + (f"{sig}" if sig else "")
+        if doc:
+            line += f": {doc[:80]}"
+        tools.append(line)
+    return "\n".join(tools[:40])
+
+
 def get_local_tool_catalog() -> str:
     """Get a short textual summary of available tools from the running MCP server
     or by scanning the local `src/blender_mcp/server.py` as a fallback.
+
+    The server answers `304 Not Modified` when the catalog did not change
+    since the last call, in which case the cached summary is reused.
     """
     MCP_BASE = os.environ.get("MCP_BASE", "http://127.0.0.1:8000")
     tools: list[str] = []
     try:
         url = f"{MCP_BASE}/tools"
-        resp = get_session().get(url, timeout=3)
+        cached = _TOOL_CATALOG_CACHE.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        resp = get_session().get(url, timeout=3, headers=headers)
+        if resp.status_code == 304 and cached:
+            return cached[1]
         if resp.ok:
-            j = resp.json()
-            for t in j.get("tools", []):
-                name = t.get("name") or t.get("tool") or str(t)
-                sig = t.get("signature", "")
-                doc = t.get("doc", "")
-                line = name + (f"{sig}" if sig else "")
-                if doc:
-                    line += f": {doc[:80]}"
-                tools.append(line)
-            return "\n".join(tools[:40])
+            summary = _summarize_tools(resp.json())
+            etag = resp.headers.get("ETag")
+            if etag:
+                _TOOL_CATALOG_CACHE[url] = (etag, summary)
+            return summary
     except Exception:
         pass
 
@@ -0,0 +1,270 @@
+"""Background health prober with a cached, non-blocking snapshot.
+
+`/health` used to connect to Blender inside the request, so an
+unreachable Blender stalled every liveness probe for the whole connect
+timeout. `HealthProber` runs the checks periodically in the background
+(Blender ``ping`` over a short-lived connection, plus the external
+providers) and `/health` only reads the last known state, reporting its
+age and the measured latency.
+
+Checks are plain callables returning a small details dict and raising on
+failure; each runs on a worker thread under a timeout.
+
+Configuration (environment):
+
+- ``BLENDER_MCP_HEALTH_INTERVAL``: seconds between Blender pings (15)
+- ``BLENDER_MCP_HEALTH_PROVIDER_INTERVAL``: seconds between provider probes (60)
+- ``BLENDER_MCP_HEALTH_TIMEOUT``: per-check timeout in seconds (3)
+- ``BLENDER_MCP_HEALTH_PROVIDERS``: set to ``0`` to skip provider probes
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from . import circuit_breaker
+
+logger = logging.getLogger(__name__)
+
+Check = Callable[[], Dict[str, Any]]
+
+OK = "ok"
+ERROR = "error"
+UNKNOWN = "unknown"
+SKIPPED = "skipped"
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def make_blender_ping(host: Optional[str] = None, port: Optional[int] = None, timeout: float = 3.0) -> Check:
+    """Return a check sending ``ping`` to Blender over a fresh connection.
+
+    A dedicated short-lived connection keeps the probe from interleaving
+    with tool traffic on the shared connection and bounds it by `timeout`.
+    Any well-formed reply proves Blender is alive and its command loop
+    responsive, even from an addon that does not implement ``ping``.
+    """
+    from .services.connection.network_core import NetworkCore
+
+    host = host or os.getenv("BLENDER_HOST") or "localhost"
+    port = port or int(os.getenv("BLENDER_PORT", 9876))
+
+    def blender_ping() -> Dict[str, Any]:
+        # Connect here (quietly, bounded by `timeout`) and hand the socket to
+        # NetworkCore for framing; NetworkCore.connect logs a traceback on
+        # every failure, which would flood logs while Blender is down.
+        deadline = time.monotonic() + timeout
+        sock = socket.create_connection((host, port), timeout=timeout)
+        # The reply wait gets what is left, so a hung Blender frees the worker thread
+        remaining = max(0.05, deadline - time.monotonic())
+        core = NetworkCore(host, port, socket_factory=lambda: sock, response_timeout=remaining)
+        core.sock = sock
+        try:
+            reply = core.send_command("ping", {"msg": "health"})
+        finally:
+            core.disconnect()
+        if not isinstance(reply, dict):
+            raise ConnectionError("Malformed ping reply from Blender")
+        return {"endpoint": f"{host}:{port}", "reply_status": reply.get("status")}
+
+    return blender_ping
+
+
+def _default_blender_check(timeout: float) -> Check:
+    from .services.connection.fleet import get_fleet
+
+    fleet = get_fleet()
+    if fleet is not None:
+        # Pings idle fleet members; fails only when none is reachable
+        return fleet.probe
+    return make_blender_ping(timeout=timeout)
+
+
+def _polyhaven_check() -> Dict[str, Any]:
+    from .services.polyhaven_status import get_polyhaven_status_service
+
+    result = get_polyhaven_status_service().get("result", {})
+    if not result.get("enabled"):
+        raise ConnectionError(result.get("message", "PolyHaven probe failed"))
+    return {"message": result.get("message")}
+
+
+def _sketchfab_check() -> Dict[str, Any]:
+    api_key = os.environ.get("SKETCHFAB_API_KEY")
+    if not api_key:
+        return {"status": SKIPPED, "message": "No Sketchfab API key configured"}
+    from .services.sketchfab import get_sketchfab_status
+
+    status = get_sketchfab_status(api_key)
+    if not status.get("enabled"):
+        raise ConnectionError(status.get("message", "Sketchfab probe failed"))
+    return {"message": status.get("message")}
+
+
+def _hyper3d_check() -> Dict[str, Any]:
+    # Rodin has no cheap unauthenticated endpoint: report the breaker state,
+    # which reflects the outcome of real calls.
+    state = circuit_breaker.get_breaker("hyper3d").state
+    if state == circuit_breaker.OPEN:
+        raise ConnectionError("Hyper3D circuit is open")
+    return {"circuit": state}
+
+
+def default_provider_checks() -> Dict[str, Check]:
+    return {"polyhaven": _polyhaven_check, "sketchfab": _sketchfab_check, "hyper3d": _hyper3d_check}
+
+
+class HealthProber:
+    """Run health checks in the background and cache their last outcome."""
+
+    def __init__(
+        self,
+        checks: Optional[Dict[str, Check]] = None,
+        provider_checks: Optional[Dict[str, Check]] = None,
+        *,
+        interval: Optional[float] = None,
+        provider_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.timeout = timeout if timeout is not None else _env_float("BLENDER_MCP_HEALTH_TIMEOUT", 3.0)
+        self.interval = interval if interval is not None else _env_float("BLENDER_MCP_HEALTH_INTERVAL", 15.0)
+        self.provider_interval = (
+            provider_interval
+            if provider_interval is not None
+            else _env_float("BLENDER_MCP_HEALTH_PROVIDER_INTERVAL", 60.0)
+        )
+        if checks is None:
+            checks = {"blender": _default_blender_check(self.timeout)}
+        if provider_checks is None:
+            enabled = os.environ.get("BLENDER_MCP_HEALTH_PROVIDERS", "1").lower() not in {"0", "false", "no"}
+            provider_checks = default_provider_checks() if enabled else {}
+        self._checks = dict(checks)
+        self._provider_checks = dict(provider_checks)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._kick: Optional["asyncio.Task[None]"] = None
+        self._last_provider_probe: Optional[float] = None
+
+    # --- probing ---
+    async def _run_check(self, name: str, check: Check) -> None:
+        started = time.perf_counter()
+        try:
+            details = await asyncio.wait_for(asyncio.to_thread(check), timeout=self.timeout)
+            status = str(details.pop("status", OK)) if isinstance(details, dict) else OK
+            entry: Dict[str, Any] = {"status": status, "details": details if isinstance(details, dict) else {}}
+        except asyncio.TimeoutError:
+            entry = {"status": ERROR, "error": f"timed out after {self.timeout:g}s"}
+        except Exception as e:
+            entry = {"status": ERROR, "error": str(e) or type(e).__name__}
+        entry["latency_ms"] = round((time.perf_counter() - started) * 1000.0, 2)
+        entry["checked_at"] = self._clock()
+        entry["wall_time"] = time.time()
+        with self._lock:
+            previous = self._results.get(name)
+            self._results[name] = entry
+        if previous is not None and previous["status"] != entry["status"]:
+            logger.info("health %s: %s -> %s", name, previous["status"], entry["status"])
+
+    async def probe_once(self, *, providers: Optional[bool] = None) -> None:
+        """Run the Blender checks, plus provider checks when due (or forced)."""
+        now = self._clock()
+        if providers is None:
+            providers = self._last_provider_probe is None or now - self._last_provider_probe >= self.provider_interval
+        checks = dict(self._checks)
+        if providers:
+            checks.update(self._provider_checks)
+            self._last_provider_probe = now
+        await asyncio.gather(*(self._run_check(name, fn) for name, fn in checks.items()))
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.probe_once()
+            except Exception:
+                logger.exception("health probe failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start the background loop on the running event loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def kick(self) -> None:
+        """Schedule one background probe unless a loop or probe is already active.
+
+        Lets `/health` populate the cache when the lifespan (and hence the
+        periodic loop) did not run, without waiting for the result.
+        """
+        if self.running or (self._kick is not None and not self._kick.done()):
+            return
+        self._kick = asyncio.get_running_loop().create_task(self.probe_once())
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    # --- snapshot ---
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the cached state; never blocks on a probe.
+
+        ``status`` is ``ok`` when every check passed, ``degraded`` when only
+        providers failed, ``error`` when Blender is unreachable and
+        ``unknown`` before the first probe completed.
+        """
+        now = self._clock()
+        with self._lock:
+            results = {name: dict(entry) for name, entry in self._results.items()}
+        checks: Dict[str, Any] = {}
+        for name in list(self._checks) + list(self._provider_checks):
+            entry = results.get(name)
+            if entry is None:
+                checks[name] = {"status": UNKNOWN}
+                continue
+            entry["age_s"] = round(now - entry.pop("checked_at"), 3)
+            checks[name] = entry
+
+        core = [checks[name]["status"] for name in self._checks]
+        providers = [checks[name]["status"] for name in self._provider_checks]
+        if any(s == ERROR for s in core):
+            status = ERROR
+        elif any(s == UNKNOWN for s in core):
+            status = UNKNOWN
+        elif any(s == ERROR for s in providers):
+            status = "degraded"
+        else:
+            status = OK
+
+        out: Dict[str, Any] = {"status": status, "checks": checks}
+        blender = checks.get("blender")
+        if blender is not None:
+            out["blender"] = {OK: "connected", ERROR: "disconnected"}.get(blender["status"], UNKNOWN)
+            if "age_s" in blender:
+                out["age_s"] = blender["age_s"]
+                out["latency_ms"] = blender["latency_ms"]
+        return out
+
+
+__all__ = ["HealthProber", "default_provider_checks", "make_blender_ping"]
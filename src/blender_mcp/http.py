@@ -1,39 +1,205 @@
-"""Small HTTP session factory for shared configuration.
+"""Shared, pooled HTTP client for every outbound call.
 
 Provides a single place to configure request sessions (headers, retries,
 proxies, timeouts). Services should accept an optional `session` parameter
 and use `get_session()` when None.
+
+Calling ``requests.get`` directly builds a throw-away session per call,
+so every request paid a fresh TCP (and TLS) handshake. The shared session
+instead keeps connections alive:
+
+- one connection pool per host, each holding up to ``pool_size``
+  keep-alive connections (thread-safe, so worker pools can share it)
+- transport-level retries for connection failures only (the request never
+  reached the server, so any method is safe to retry); HTTP errors and
+  interrupted bodies are left to the callers' own retry logic
+- a default ``(connect, read)`` timeout for calls that pass none, so a
+  stalled upstream can no longer hang a tool forever
+- per-host counters of requests and newly opened connections, from which
+  the reuse ratio is derived (`stats`, served at ``/debug/http``)
+
+Configuration (environment):
+
+- ``BLENDER_MCP_HTTP_POOL_SIZE``: keep-alive connections per host (16)
+- ``BLENDER_MCP_HTTP_POOL_HOSTS``: hosts whose pool is kept (16)
+- ``BLENDER_MCP_HTTP_RETRIES``: connection retries per request (2)
+- ``BLENDER_MCP_HTTP_CONNECT_TIMEOUT`` / ``BLENDER_MCP_HTTP_READ_TIMEOUT``:
+  default timeouts in seconds (5 / 60)
 """
 
 from __future__ import annotations
 
-from typing import Optional
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple, Type, Union
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.util.retry import Retry
+
+Timeout = Union[float, Tuple[float, float]]
+
+_global_session: Optional["PooledSession"] = None
+_session_lock = threading.Lock()
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class _HostMetrics:
+    """Requests sent and connections opened, per ``host:port``."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict[str, int]] = {}
+
+    def _bump(self, host: str, field: str) -> None:
+        with self._lock:
+            counters = self._hosts.setdefault(host, {"requests": 0, "connections": 0})
+            counters[field] += 1
+
+    def record_request(self, host: str) -> None:
+        self._bump(host, "requests")
+
+    def record_connection(self, host: str) -> None:
+        self._bump(host, "connections")
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            hosts: Dict[str, Dict[str, Any]] = {host: dict(c) for host, c in self._hosts.items()}
+        for counters in hosts.values():
+            reused = max(0, counters["requests"] - counters["connections"])
+            counters["reused"] = reused
+            counters["reuse_ratio"] = round(reused / counters["requests"], 3) if counters["requests"] else 0.0
+        return hosts
 
-_global_session: Optional[requests.Session] = None
+
+def _counting_pool_class(base: Type[HTTPConnectionPool], metrics: _HostMetrics) -> type:
+    def _new_conn(self: Any) -> Any:
+        metrics.record_connection(f"{self.host}:{self.port}")
+        return base._new_conn(self)
+
+    return type(base.__name__, (base,), {"_new_conn": _new_conn})
+
+
+class PooledAdapter(HTTPAdapter):
+    """`HTTPAdapter` whose per-host pools report new connections."""
+
+    def __init__(self, metrics: _HostMetrics, **kwargs: Any) -> None:
+        # init_poolmanager runs from HTTPAdapter.__init__ and needs metrics
+        self.metrics = metrics
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        manager = self.poolmanager
+        manager.pool_classes_by_scheme = {
+            scheme: _counting_pool_class(cls, self.metrics) for scheme, cls in manager.pool_classes_by_scheme.items()
+        }
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[Optional[float], Optional[float]]] = None,
+        verify: Union[bool, str] = True,
+        cert: Union[None, str, Tuple[str, str]] = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        parts = urlsplit(request.url or "")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.metrics.record_request(f"{parts.hostname}:{port}")
+        return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+
+class PooledSession(requests.Session):
+    """`requests.Session` applying a default timeout and exposing pool metrics."""
+
+    def __init__(self, *, timeout: Timeout, metrics: Optional[_HostMetrics] = None) -> None:
+        super().__init__()
+        self.default_timeout = timeout
+        self.metrics = metrics or _HostMetrics()
+
+    def request(self, method: Union[str, bytes], url: Union[str, bytes], *args: Any, **kwargs: Any) -> Any:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.default_timeout
+        if isinstance(method, bytes):
+            method = method.decode("ascii")
+        return super().request(method, url, *args, **kwargs)
+
+
+def make_session(
+    *,
+    pool_size: Optional[int] = None,
+    pool_hosts: Optional[int] = None,
+    retries: Optional[int] = None,
+    timeout: Optional[Timeout] = None,
+) -> PooledSession:
+    """Build a pooled session; unset arguments come from the environment."""
+    if pool_size is None:
+        pool_size = int(_env_number("BLENDER_MCP_HTTP_POOL_SIZE", 16))
+    if pool_hosts is None:
+        pool_hosts = int(_env_number("BLENDER_MCP_HTTP_POOL_HOSTS", 16))
+    if retries is None:
+        retries = int(_env_number("BLENDER_MCP_HTTP_RETRIES", 2))
+    if timeout is None:
+        timeout = (
+            _env_number("BLENDER_MCP_HTTP_CONNECT_TIMEOUT", 5.0),
+            _env_number("BLENDER_MCP_HTTP_READ_TIMEOUT", 60.0),
+        )
+    session = PooledSession(timeout=timeout)
+    # Connection errors only: reads, statuses and redirects are not retried here
+    retry = Retry(total=retries, connect=retries, read=False, status=0, other=0, backoff_factor=0.2)
+    adapter = PooledAdapter(
+        session.metrics, pool_connections=max(1, pool_hosts), pool_maxsize=max(1, pool_size), max_retries=retry
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # sensible defaults
+    session.headers.update({"User-Agent": "blender-mcp"})
+    return session
 
 
 def get_session() -> requests.Session:
     """Return a shared requests.Session instance, creating it on first use."""
     global _global_session
-    if _global_session is None:
-        s = requests.Session()
-        # sensible defaults
-        s.headers.update({"User-Agent": "blender-mcp"})
-        _global_session = s
-    return _global_session
+    with _session_lock:
+        if _global_session is None:
+            _global_session = make_session()
+        return _global_session
 
 
 def reset_session() -> None:
     """Reset the global session (for tests)."""
     global _global_session
-    if _global_session is not None:
+    with _session_lock:
+        old, _global_session = _global_session, None
+    if old is not None:
         try:
-            _global_session.close()
+            old.close()
         except Exception:
             pass
-    _global_session = None
 
 
-__all__ = ["get_session", "reset_session"]
+def stats() -> Dict[str, Any]:
+    """Per-host request/connection counters of the shared session."""
+    with _session_lock:
+        session = _global_session
+    if session is None:
+        return {"hosts": {}}
+    adapter = session.get_adapter("https://")
+    return {
+        "hosts": session.metrics.snapshot(),
+        "pool_size": getattr(adapter, "_pool_maxsize", None),
+        "pool_hosts": getattr(adapter, "_pool_connections", None),
+        "timeout": session.default_timeout,
+    }
+
+
+__all__ = ["PooledAdapter", "PooledSession", "get_session", "make_session", "reset_session", "stats"]
@@ -11,11 +11,11 @@ compatibilité transitoire et sera retiré dans un cycle futur.
 from __future__ import annotations
 
 import json
-import tempfile
 import warnings as _warnings
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.exceptions import RequestException
 
 _warnings.warn(
     "blender_mcp.hyper3d est déprécié; utiliser blender_mcp.services.hyper3d.",
@@ -23,7 +23,10 @@ _warnings.warn(
     stacklevel=2,
 )
 
-from . import downloaders  # type: ignore
+from . import circuit_breaker, downloaders  # type: ignore
+from .errors import CircuitOpenError
+from .http import get_session
+from .workspace import get_workspace, using_provider
 
 
 def create_rodin_job_main_site(
@@ -44,11 +47,8 @@ def create_rodin_job_main_site(
         files.append(("bbox_condition", (None, json.dumps(bbox_condition))))
 
     headers = {"Authorization": f"Bearer {api_key}"}
-    if session is None:
-        # preserve backward-compatibility for tests that monkeypatch `requests.post`
-        resp = requests.post("https://hyperhuman.deemos.com/api/v2/rodin", headers=headers, files=files)
-    else:
-        resp = session.post("https://hyperhuman.deemos.com/api/v2/rodin", headers=headers, files=files)
+    sess = session if session is not None else get_session()
+    resp = sess.post("https://hyperhuman.deemos.com/api/v2/rodin", headers=headers, files=files)
     return resp.json()
 
 
@@ -68,28 +68,20 @@ def create_rodin_job_fal_ai(
         req_data["bbox_condition"] = bbox_condition
 
     headers = {"Authorization": f"Key {api_key}", "Content-Type": "application/json"}
-    if session is None:
-        resp = requests.post("https://queue.fal.run/fal-ai/hyper3d/rodin", headers=headers, json=req_data)
-    else:
-        resp = session.post("https://queue.fal.run/fal-ai/hyper3d/rodin", headers=headers, json=req_data)
+    sess = session if session is not None else get_session()
+    resp = sess.post("https://queue.fal.run/fal-ai/hyper3d/rodin", headers=headers, json=req_data)
     return resp.json()
 
 
 def poll_rodin_job_status_main_site(
     api_key: str, subscription_key: str, session: Optional[requests.sessions.Session] = None
 ) -> Dict[str, Any]:
-    if session is None:
-        resp = requests.post(
-            "https://hyperhuman.deemos.com/api/v2/status",
-            headers={"Authorization": f"Bearer {api_key}"},
-            json={"subscription_key": subscription_key},
-        )
-    else:
-        resp = session.post(
-            "https://hyperhuman.deemos.com/api/v2/status",
-            headers={"Authorization": f"Bearer {api_key}"},
-            json={"subscription_key": subscription_key},
-        )
+    sess = session if session is not None else get_session()
+    resp = sess.post(
+        "https://hyperhuman.deemos.com/api/v2/status",
+        headers={"Authorization": f"Bearer {api_key}"},
+        json={"subscription_key": subscription_key},
+    )
     data = resp.json()
     return {"status_list": [i["status"] for i in data.get("jobs", [])]}
 
@@ -97,34 +89,23 @@ def poll_rodin_job_status_main_site(
 def poll_rodin_job_status_fal_ai(
     api_key: str, request_id: str, session: Optional[requests.sessions.Session] = None
 ) -> Dict[str, Any]:
-    if session is None:
-        resp = requests.get(
-            f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}/status",
-            headers={"Authorization": f"KEY {api_key}"},
-        )
-    else:
-        resp = session.get(
-            f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}/status",
-            headers={"Authorization": f"KEY {api_key}"},
-        )
+    sess = session if session is not None else get_session()
+    resp = sess.get(
+        f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}/status",
+        headers={"Authorization": f"KEY {api_key}"},
+    )
     return resp.json()
 
 
 def import_generated_asset_main_site(
     api_key: str, task_uuid: str, name: str, session: Optional[requests.sessions.Session] = None
 ) -> Dict[str, Any]:
-    if session is None:
-        resp = requests.post(
-            "https://hyperhuman.deemos.com/api/v2/download",
-            headers={"Authorization": f"Bearer {api_key}"},
-            json={"task_uuid": task_uuid},
-        )
-    else:
-        resp = session.post(
-            "https://hyperhuman.deemos.com/api/v2/download",
-            headers={"Authorization": f"Bearer {api_key}"},
-            json={"task_uuid": task_uuid},
-        )
+    sess = session if session is not None else get_session()
+    resp = sess.post(
+        "https://hyperhuman.deemos.com/api/v2/download",
+        headers={"Authorization": f"Bearer {api_key}"},
+        json={"task_uuid": task_uuid},
+    )
     data_ = resp.json()
 
     temp_file_path: Optional[str] = None
@@ -132,33 +113,33 @@ def import_generated_asset_main_site(
         if i.get("name", "").endswith(".glb"):
             url = i.get("url")
             try:
-                # Prefer centralized downloader but only forward the `session`
-                # argument when the caller provided one. This keeps tests that
-                # monkeypatch `download_bytes` without a `session` kw working.
-                if session is None:
-                    content = downloaders.download_bytes(url, timeout=120)
-                else:
-                    content = downloaders.download_bytes(url, timeout=120, session=session)
-                tf = tempfile.NamedTemporaryFile(delete=False, prefix=task_uuid, suffix=".glb")
-                tf.write(content)
-                tf.close()
-                temp_file_path = tf.name
+                # Prefer the centralized streaming downloader (bounded memory,
+                # retries, served from the asset cache when enabled).
+                with using_provider("hyper3d"):
+                    temp_file_path = downloaders.fetch_cached_file(
+                        url, key=f"hyper3d:{task_uuid}", prefix=task_uuid, suffix=".glb", timeout=120, session=session
+                    )
+            except (RequestException, CircuitOpenError):
+                # Already retried and checked (IntegrityError is a RequestException)
+                raise
             except Exception:
-                # Fallback to streaming requests
-                if session is None:
-                    r = requests.get(url, stream=True)
-                else:
-                    r = session.get(url, stream=True)
+                # The helper itself failed: stream with a plain request
+                r = sess.get(url, stream=True, timeout=120)
                 r.raise_for_status()
-                tf = tempfile.NamedTemporaryFile(delete=False, prefix=task_uuid, suffix=".glb")
-                for chunk in r.iter_content(chunk_size=8192):
-                    tf.write(chunk)
-                tf.close()
-                temp_file_path = tf.name
+                ws = get_workspace()
+                temp_file_path = ws.mkstemp(prefix=task_uuid, suffix=".glb", provider="hyper3d")
+                try:
+                    with open(temp_file_path, "wb") as tf:
+                        for chunk in r.iter_content(chunk_size=8192):
+                            tf.write(chunk)
+                except BaseException:
+                    ws.discard(temp_file_path)
+                    raise
+                ws.hand_off(temp_file_path)
             break
 
     if not temp_file_path:
-        return {"succeed": False, "error": "No glb found in download list"}
+        return {"succeed": False, "error": "No glb found in download list", "status_code": resp.status_code}
 
     # Return minimal result; importing into Blender is the addon's responsibility
     return {"succeed": True, "temp_file": temp_file_path, "name": name}
@@ -167,27 +148,20 @@ def import_generated_asset_main_site(
 def import_generated_asset_fal_ai(
     api_key: str, request_id: str, name: str, session: Optional[requests.sessions.Session] = None
 ) -> Dict[str, Any]:
-    if session is None:
-        url = f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}"
-        headers = {"Authorization": f"Key {api_key}"}
-        resp = requests.get(url, headers=headers)
-    else:
-        url = f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}"
-        headers = {"Authorization": f"Key {api_key}"}
-        resp = session.get(url, headers=headers)
+    url = f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}"
+    headers = {"Authorization": f"Key {api_key}"}
+    sess = session if session is not None else get_session()
+    resp = sess.get(url, headers=headers)
     data_ = resp.json()
     url = data_.get("model_mesh", {}).get("url")
     if not url:
-        return {"succeed": False, "error": "No model URL in response"}
+        return {"succeed": False, "error": "No model URL in response", "status_code": resp.status_code}
 
     try:
-        if session is None:
-            content = downloaders.download_bytes(url, timeout=120)
-        else:
-            content = downloaders.download_bytes(url, timeout=120, session=session)
-        tf = tempfile.NamedTemporaryFile(delete=False, prefix=request_id, suffix=".glb")
-        tf.write(content)
-        tf.close()
-        return {"succeed": True, "temp_file": tf.name, "name": name}
+        with using_provider("hyper3d"):
+            temp_file = downloaders.fetch_cached_file(
+                url, key=f"hyper3d:{request_id}", prefix=request_id, suffix=".glb", timeout=120, session=session
+            )
+        return {"succeed": True, "temp_file": temp_file, "name": name}
     except Exception as e:
-        return {"succeed": False, "error": str(e)}
+        return {"succeed": False, "error": str(e), "upstream_failure": circuit_breaker.is_upstream_failure(e)}
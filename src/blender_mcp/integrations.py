@@ -8,6 +8,7 @@ from urllib.parse import urlparse
 
 from mcp.server.fastmcp import Context
 
+from .errors import CircuitOpenError
 from .tools import get_blender_connection, mcp
 
 # Local logger (avoid importing server at module-import time)
@@ -19,10 +20,10 @@ from .services import sketchfab as services_sketchfab
 from .services.hyper3d import prepare_rodin_payload
 from .services.polyhaven import (
     download_asset,
-    fetch_categories,
+    find_assets,
     format_categories_output,
     format_search_assets,
-    search_assets_network,
+    list_categories,
 )
 
 
@@ -52,11 +53,14 @@ def get_polyhaven_categories(ctx: Context[Any, Any, Any], asset_type: str = "hdr
     try:
         # Prefer server-side fetch; fallback to asking Blender addon when needed
         try:
-            result = fetch_categories(asset_type=asset_type)
+            result = list_categories(asset_type=asset_type)
             if "error" in result:
                 raise Exception(result["error"])
             categories = result.get("categories", {})
             return format_categories_output(categories, asset_type)
+        except CircuitOpenError as e:
+            # The addon would hit the same upstream: fail fast instead of waiting
+            return f"Error getting Polyhaven categories: {e}"
         except Exception:
             blender = get_blender_connection()
             if not _polyhaven_enabled:
@@ -78,14 +82,16 @@ def search_polyhaven_assets(
     categories: Optional[str] = None,
 ) -> str:
     try:
-        # Try server-side search first
+        # Try the local catalog / server-side search first
         try:
-            result = search_assets_network(asset_type=asset_type, categories=categories)
+            result = find_assets(asset_type=asset_type, categories=categories)
             if not result:
                 return "Error: Received no response from PolyHaven"
             if "error" in result:
                 return f"Error: {result['error']}"
             return format_search_assets(result, categories)
+        except CircuitOpenError as e:
+            return f"Error searching Polyhaven assets: {e}"
         except Exception:
             blender = get_blender_connection()
             result = blender.send_command(
@@ -114,10 +120,17 @@ def download_polyhaven_asset(
     asset_type: str,
     resolution: str = "1k",
     file_format: Optional[str] = None,
+    maps: Optional[List[str]] = None,
 ) -> str:
+    """
+    Download a Polyhaven asset. For textures, maps (e.g. ["color", "roughness", "normal",
+    "displacement", "arm"]) downloads only those maps instead of the whole archive
+    """
     try:
         # Try server-side helper first
-        net_res = _server_download_asset(asset_id, asset_type, resolution, file_format)
+        net_res = _server_download_asset(asset_id, asset_type, resolution, file_format, maps)
+        if net_res and net_res.get("maps"):
+            return f"Downloaded maps {', '.join(net_res['maps'])} to temp dir: {net_res['temp_dir']}"
         if net_res and net_res.get("temp_dir"):
             return f"Downloaded asset to temp dir: {net_res['temp_dir']}"
 
@@ -129,6 +142,8 @@ def download_polyhaven_asset(
             return f"Error: {result['error']}"
 
         return _format_addon_download_result(result, asset_type)
+    except CircuitOpenError as e:
+        return f"Error downloading Polyhaven asset: {e}"
     except Exception as e:
         logger.error(f"Error downloading Polyhaven asset: {str(e)}")
         return f"Error downloading Polyhaven asset: {str(e)}"
@@ -139,14 +154,19 @@ def _server_download_asset(
     asset_type: str,
     resolution: str,
     file_format: Optional[str],
+    maps: Optional[List[str]] = None,
 ) -> Optional[Dict[str, Any]]:
     try:
+        extra: Dict[str, Any] = {"maps": maps} if maps else {}
         return download_asset(
             asset_id=asset_id,
             asset_type=asset_type,
             resolution=resolution,
             file_format=file_format,
+            **extra,
         )
+    except CircuitOpenError:
+        raise
     except Exception:
         return None
 
@@ -188,10 +208,24 @@ def _format_addon_download_result(result: Dict[str, Any], asset_type: str) -> st
 
 
 @mcp.tool()
-def set_texture(ctx: Context[Any, Any, Any], object_name: str, texture_id: str) -> str:
+def set_texture(
+    ctx: Context[Any, Any, Any],
+    object_name: str,
+    texture_id: str,
+    progressive: bool = False,
+    resolution: str = "4k",
+) -> str:
+    """
+    Apply a downloaded Polyhaven texture to an object. With progressive, the 1k maps are
+    downloaded and applied at once and the given resolution replaces them in the background
+    (see get_texture_upgrade_status)
+    """
     try:
         blender = get_blender_connection()
-        result = blender.send_command("set_texture", {"object_name": object_name, "texture_id": texture_id})
+        params: Dict[str, Any] = {"object_name": object_name, "texture_id": texture_id}
+        if progressive:
+            params.update(progressive=True, resolution=resolution)
+        result = blender.send_command("set_texture", params)
         if "error" in result:
             return f"Error: {result['error']}"
         if result.get("success"):
@@ -215,6 +249,8 @@ def set_texture(ctx: Context[Any, Any, Any], object_name: str, texture_id: str)
                             output += f"    {conn}\n"
             else:
                 output += "No texture nodes found in the material.\n"
+            if result.get("upgrade"):
+                output += "\n" + _format_texture_upgrade(result["upgrade"])
             return output
         return f"Failed to apply texture: {result.get('message', 'Unknown error')}"
     except Exception as e:
@@ -222,6 +258,37 @@ def set_texture(ctx: Context[Any, Any, Any], object_name: str, texture_id: str)
         return f"Error applying texture: {str(e)}"
 
 
+def _format_texture_upgrade(upgrade: Dict[str, Any]) -> str:
+    line = f"{upgrade.get('texture_id')}: {upgrade.get('resolution')} upgrade {upgrade.get('state')}"
+    if upgrade.get("already_running"):
+        line += " (already in progress)"
+    if upgrade.get("error"):
+        line += f" - {upgrade['error']}"
+    return line + f" after {upgrade.get('elapsed_s', 0)}s"
+
+
+@mcp.tool()
+def get_texture_upgrade_status(ctx: Context[Any, Any, Any], texture_id: Optional[str] = None) -> str:
+    """
+    Report the background resolution upgrades started by set_texture with progressive
+    """
+    try:
+        blender = get_blender_connection()
+        result = blender.send_command("get_texture_upgrade_status", {"texture_id": texture_id} if texture_id else {})
+        if "error" in result:
+            return f"Error: {result['error']}"
+        if texture_id:
+            upgrade = result.get("upgrade")
+            return _format_texture_upgrade(upgrade) if upgrade else f"No upgrade started for {texture_id}"
+        upgrades = result.get("upgrades") or {}
+        if not upgrades:
+            return "No texture upgrades started"
+        return "\n".join(_format_texture_upgrade(u) for u in upgrades.values())
+    except Exception as e:
+        logger.error(f"Error getting texture upgrade status: {str(e)}")
+        return f"Error getting texture upgrade status: {str(e)}"
+
+
 @mcp.tool()
 def get_polyhaven_status(ctx: Context[Any, Any, Any]) -> str:
     try:
@@ -1,13 +1,19 @@
 """Small MCP HTTP client wrapper used by the bridge.
 
-Provides a single function `call_mcp_tool` that POSTs to the MCP server and
-returns parsed JSON. Keeps a single place to add auth, retries, timeouts.
+Provides `call_mcp_tool` that POSTs to the MCP server and returns parsed
+JSON, and `MCPWebSocketClient` for long-running callers that multiplex
+many calls over the `/ws` session. Keeps a single place to add auth,
+retries, timeouts.
 """
 
 from __future__ import annotations
 
+import itertools
+import json
 import os
-from typing import Any, Optional
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
 
 import requests
 
@@ -25,3 +31,121 @@ def call_mcp_tool(tool: str, params: dict[str, Any] | None, session: Optional[re
     resp = sess.post(f"{MCP_BASE}/tools/{tool}", json={"params": params}, timeout=60)
     resp.raise_for_status()
     return resp.json()
+
+
+class MCPToolError(Exception):
+    """Error reply to a tool call made over the `/ws` session."""
+
+    def __init__(self, message: str, *, status_code: int = 500, error_code: str = "internal_error") -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.error_code = error_code
+
+
+def _default_ws_connect(url: str) -> Any:
+    try:
+        from websockets.sync.client import connect  # optional dependency (websockets >= 11)
+    except ImportError as e:  # pragma: no cover - depends on the environment
+        raise ImportError("MCPWebSocketClient requires the 'websockets' package (>= 11)") from e
+    return connect(url)
+
+
+class MCPWebSocketClient:
+    """Multiplexed tool calls over the server's `/ws` endpoint.
+
+    One connection carries many concurrent calls: `submit` sends a frame
+    and returns a `Future`; a reader thread resolves futures by `id` as
+    replies arrive, in any order. `call` is the blocking shorthand and
+    returns the same body as `call_mcp_tool`.
+
+    `connect` may be injected (tests, custom transports): it receives the
+    URL and returns an object with `send(str)`, `recv() -> str|bytes` and
+    `close()`.
+    """
+
+    def __init__(self, url: Optional[str] = None, *, connect: Optional[Callable[[str], Any]] = None) -> None:
+        if url is None:
+            base = os.environ.get("MCP_BASE", "http://127.0.0.1:8000")
+            url = base.replace("https://", "wss://", 1).replace("http://", "ws://", 1).rstrip("/") + "/ws"
+        self.url = url
+        self._conn = (connect or _default_ws_connect)(url)
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._pending: dict[str, Future[Any]] = {}
+        self._ids = itertools.count(1)
+        self._closed = False
+        self._reader = threading.Thread(target=self._read_loop, name="mcp-ws-reader", daemon=True)
+        self._reader.start()
+
+    def submit(self, tool: str, params: dict[str, Any] | None = None) -> "Future[Any]":
+        """Send a call and return a Future resolved with the reply body."""
+        fut: Future[Any] = Future()
+        call_id = str(next(self._ids))
+        with self._lock:
+            if self._closed:
+                raise ConnectionError("MCP WebSocket session is closed")
+            self._pending[call_id] = fut
+        frame = json.dumps({"id": call_id, "tool": tool, "params": params or {}})
+        try:
+            with self._send_lock:
+                self._conn.send(frame)
+        except Exception:
+            with self._lock:
+                self._pending.pop(call_id, None)
+            raise
+        return fut
+
+    def call(self, tool: str, params: dict[str, Any] | None = None, timeout: Optional[float] = 60) -> Any:
+        """Call a tool and wait for its reply; raises `MCPToolError` on error replies."""
+        return self.submit(tool, params).result(timeout=timeout)
+
+    def _read_loop(self) -> None:
+        error: BaseException = ConnectionError("MCP WebSocket session closed")
+        try:
+            while True:
+                self._dispatch(self._conn.recv())
+        except Exception as e:
+            if not self._closed:
+                error = e
+        self._fail_pending(error)
+
+    def _dispatch(self, raw: Any) -> None:
+        reply = json.loads(raw)
+        with self._lock:
+            fut = self._pending.pop(str(reply.pop("id", None)), None)
+        if fut is None:
+            return
+        status_code = reply.pop("status_code", 200)
+        if reply.get("status") == "error":
+            fut.set_exception(
+                MCPToolError(
+                    str(reply.get("message", "")),
+                    status_code=int(status_code),
+                    error_code=str(reply.get("error_code", "internal_error")),
+                )
+            )
+        else:
+            fut.set_result(reply)
+
+    def _fail_pending(self, error: BaseException) -> None:
+        with self._lock:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_exception(error)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        try:
+            self._conn.close()
+        finally:
+            self._reader.join(timeout=5)
+            self._fail_pending(ConnectionError("MCP WebSocket session closed"))
+
+    def __enter__(self) -> "MCPWebSocketClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,90 @@
+"""Progress reporting for long-running tools.
+
+Services and helpers call `report_progress` / `report_partial` at
+meaningful steps (download attempts, bytes received, extraction, polling).
+These are no-ops unless a caller installed a reporter with `reporting`,
+as the ASGI `POST /tools/{name}/stream` endpoint does, so existing call
+sites and signatures are unchanged.
+
+The reporter lives in a `ContextVar`: it follows the call into
+`asyncio` tasks automatically and into executor threads when the work is
+submitted with `contextvars.copy_context().run`.
+"""
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+ProgressEvent = Dict[str, Any]
+ProgressCallback = Callable[[ProgressEvent], None]
+
+_reporter: ContextVar[Optional[ProgressCallback]] = ContextVar("blender_mcp_progress", default=None)
+
+
+@contextmanager
+def reporting(callback: ProgressCallback) -> Iterator[None]:
+    """Install `callback` as the progress reporter for the current context."""
+    token = _reporter.set(callback)
+    try:
+        yield
+    finally:
+        _reporter.reset(token)
+
+
+def is_reporting() -> bool:
+    """Return True when someone is listening (lets callers skip costly payloads)."""
+    return _reporter.get() is not None
+
+
+def _emit(event: ProgressEvent) -> None:
+    callback = _reporter.get()
+    if callback is None:
+        return
+    try:
+        callback(event)
+    except Exception:
+        # A broken listener must never fail the tool itself
+        logger.debug("progress callback failed", exc_info=True)
+
+
+def report_progress(
+    stage: str,
+    *,
+    done: Optional[float] = None,
+    total: Optional[float] = None,
+    message: Optional[str] = None,
+    **extra: Any,
+) -> None:
+    """Report that the current operation reached `stage`.
+
+    `done` / `total` describe measurable progress (bytes, steps...) when
+    known; `extra` carries small JSON-serializable details.
+    """
+    event: ProgressEvent = {"type": "progress", "stage": stage}
+    if done is not None:
+        event["done"] = done
+    if total is not None:
+        event["total"] = total
+    if message is not None:
+        event["message"] = message
+    event.update(extra)
+    _emit(event)
+
+
+def report_partial(data: Any) -> None:
+    """Report an intermediate result the client can act on before completion."""
+    _emit({"type": "partial", "data": data})
+
+
+__all__ = [
+    "ProgressCallback",
+    "ProgressEvent",
+    "is_reporting",
+    "report_partial",
+    "report_progress",
+    "reporting",
+]
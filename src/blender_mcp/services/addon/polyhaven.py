@@ -41,6 +41,29 @@ def get_polyhaven_categories(asset_type: str, session: Optional[requests.Session
         return {"error": str(e)}
 
 
+def _fetch_assets(params: Dict[str, Any], session: Optional[requests.Session]) -> Dict[str, Any]:
+    try:
+        from blender_mcp.polyhaven import search_assets  # type: ignore
+
+        return search_assets(params, timeout=10)
+    except Exception:
+        try:
+            import urllib.parse
+
+            from blender_mcp.downloaders import download_bytes  # type: ignore
+
+            qs = urllib.parse.urlencode(params, doseq=True)
+            full_url = "https://api.polyhaven.com/assets" + ("?" + qs if qs else "")
+            data = download_bytes(full_url, timeout=10, headers=REQ_HEADERS)
+            return json.loads(data.decode("utf-8"))
+        except Exception:
+            getter = session.get if session is not None else get_session().get
+            response = getter("https://api.polyhaven.com/assets", params=params, headers=REQ_HEADERS)
+            if response.status_code == 200:
+                return response.json()
+            return {"error": f"API request failed with status code {response.status_code}"}
+
+
 def search_polyhaven_assets(
     asset_type=None, categories=None, session: Optional[requests.Session] = None
 ) -> Dict[str, Any]:
@@ -54,27 +77,17 @@ def search_polyhaven_assets(
         if categories:
             params["categories"] = categories
 
-        try:
-            from blender_mcp.polyhaven import search_assets  # type: ignore
+        # A local catalog snapshot answers without downloading the whole catalog
+        from ..polyhaven_catalog import get_catalog
 
-            assets = search_assets(params, timeout=10)
-        except Exception:
-            try:
-                import urllib.parse
+        catalog = get_catalog()
+        found = catalog.search(asset_type or "all", categories, per_page=20) if catalog is not None else None
+        if found is not None:
+            return found
 
-                from blender_mcp.downloaders import download_bytes  # type: ignore
-
-                qs = urllib.parse.urlencode(params, doseq=True)
-                full_url = "https://api.polyhaven.com/assets" + ("?" + qs if qs else "")
-                data = download_bytes(full_url, timeout=10, headers=REQ_HEADERS)
-                assets = json.loads(data.decode("utf-8"))
-            except Exception:
-                getter = session.get if session is not None else get_session().get
-                response = getter("https://api.polyhaven.com/assets", params=params, headers=REQ_HEADERS)
-                if response.status_code == 200:
-                    assets = response.json()
-                else:
-                    return {"error": f"API request failed with status code {response.status_code}"}
+        assets = _fetch_assets(params, session)
+        if "error" in assets and isinstance(assets["error"], str):
+            return assets
 
         limited_assets = {}
         for i, (key, value) in enumerate(assets.items()):
@@ -94,6 +107,16 @@ def search_polyhaven_assets(
 def download_polyhaven_asset(
     asset_id, asset_type, resolution="1k", file_format=None, session: Optional[requests.Session] = None
 ) -> Dict[str, Any]:
+    from ..polyhaven_catalog import get_catalog
+
+    catalog = get_catalog()
+    if catalog is not None:
+        catalog.record_request(asset_id, asset_type)
+        # Metadata warmed up at startup (or fetched recently) skips the network
+        try:
+            return {"files_data": catalog.files(asset_id)}
+        except Exception:
+            pass
     try:
         from blender_mcp.polyhaven import fetch_files_data  # type: ignore
 
@@ -3,10 +3,19 @@
 from __future__ import annotations
 
 import traceback
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
-def set_texture(object_name: str, texture_id: str) -> Dict[str, Any]:
+def set_texture(
+    object_name: str, texture_id: str, progressive: bool = False, resolution: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build a material from the `texture_id` images and return its name.
+
+    With `progressive`, the texture's ``1k`` maps are downloaded and
+    applied first, and `resolution` (default ``4k``) is loaded in the
+    background (see `services.texture_upgrades`); the response carries the
+    upgrade status under ``upgrade``.
+    """
     try:
         import bpy
 
@@ -17,6 +26,9 @@ def set_texture(object_name: str, texture_id: str) -> Dict[str, Any]:
         if not hasattr(obj, "data") or not hasattr(obj.data, "materials"):
             return {"error": f"Object {object_name} cannot accept materials"}
 
+        if progressive:
+            return _set_texture_progressive(object_name, texture_id, resolution or "4k")
+
         texture_images = _collect_texture_images(texture_id)
 
         if not texture_images:
@@ -65,6 +77,63 @@ def _collect_texture_images(texture_id: str) -> Dict[str, Any]:
     return texture_images
 
 
+def _set_texture_progressive(object_name: str, texture_id: str, resolution: str) -> Dict[str, Any]:
+    import bpy
+
+    from blender_mcp.texture_helpers import load_and_configure_image
+
+    from ..polyhaven import download_asset
+    from ..polyhaven_files import MATERIAL_MAPS
+    from ..texture_upgrades import PREVIEW_RESOLUTION, get_texture_upgrades
+
+    preview = download_asset(
+        asset_id=texture_id, asset_type="textures", resolution=PREVIEW_RESOLUTION, maps=MATERIAL_MAPS
+    )
+    if preview.get("error"):
+        return {"error": f"Failed to download {texture_id}: {preview['error']}"}
+    paths: Dict[str, str] = preview["maps"]
+    images = {
+        name: load_and_configure_image(path, name, name=f"{texture_id}_{name}", loader=bpy.data.images.load)
+        for name, path in paths.items()
+    }
+    mat_name = _try_create_material({k: img.name for k, img in images.items()}, texture_id, object_name)
+    if not mat_name:
+        return {"error": f"Could not create a material for {texture_id}"}
+
+    upgrade = None
+    if resolution != PREVIEW_RESOLUTION:
+        upgrade = get_texture_upgrades().start(texture_id, mat_name, resolution, maps=list(paths))
+    return {"success": True, "material": mat_name, "maps": list(paths), "upgrade": upgrade}
+
+
+def swap_texture_images(material_name: str, paths: Dict[str, str]) -> None:
+    """Point the texture nodes of `material_name` at the files in `paths`.
+
+    Must run on Blender's main thread. Nodes are those created from
+    `build_material_spec`; replaced images left without users are removed
+    and their names reused.
+    """
+    import bpy
+
+    from blender_mcp.texture_helpers import load_and_configure_image
+
+    from ..texture_upgrades import image_swaps
+
+    mat = bpy.data.materials.get(material_name)
+    if mat is None or not mat.node_tree:
+        raise RuntimeError(f"Material not found: {material_name}")
+    for node_id, (map_name, path) in image_swaps(paths).items():
+        node = mat.node_tree.nodes.get(node_id)
+        if node is None:
+            continue
+        old = node.image
+        node.image = load_and_configure_image(path, map_name, loader=bpy.data.images.load)
+        if old is not None and old.users == 0:
+            name = old.name
+            bpy.data.images.remove(old)
+            node.image.name = name
+
+
 def _try_create_material(images_map_names: dict, texture_id: str, object_name: str) -> str | None:
     try:
         from blender_mcp.materials import create_material_in_blender  # type: ignore
@@ -74,4 +143,4 @@ def _try_create_material(images_map_names: dict, texture_id: str, object_name: s
         return None
 
 
-__all__ = ["set_texture", "_collect_texture_images", "_try_create_material"]
+__all__ = ["set_texture", "swap_texture_images", "_collect_texture_images", "_try_create_material"]
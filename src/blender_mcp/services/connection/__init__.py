@@ -6,6 +6,7 @@ modules improves SOLID structure while keeping a stable public API.
 """
 
 from .facade import BlenderConnection
+from .fleet import BlenderFleet, FleetConnection, get_fleet
 from .framing import LengthPrefixedReassembler
 from .network import BlenderConnectionNetwork
 from .reassembler import ChunkedJSONReassembler
@@ -26,5 +27,8 @@ __all__ = [
     "SocketBlenderConnection",
     "BlenderConnectionNetwork",
     "BlenderConnection",
+    "BlenderFleet",
+    "FleetConnection",
     "get_blender_connection",
+    "get_fleet",
 ]
@@ -0,0 +1,367 @@
+"""Route Blender commands across a fleet of Blender instances.
+
+A Blender process executes one command at a time, which caps throughput
+at a single instance. `BlenderFleet` spreads commands over several
+endpoints (``host:port`` or ``unix:/path/to.sock``), each served by its
+own `NetworkCore`:
+
+- least-loaded routing: the endpoint with the lowest expected wait,
+  ``(in_flight + 1) * latency EWMA``, gets the command
+- sticky affinity: commands carrying a session/scene key go to the
+  endpoint that served that key before, so stateful edits land on the
+  same scene; the key is re-bound only when that endpoint is down
+- health tracking: consecutive connection failures take an endpoint out
+  of rotation for ``recheck_after`` seconds; `probe` pings idle endpoints
+  to bring them back early
+
+A command is only retried on another endpoint when it could not be sent
+(connection refused); once sent it is never replayed, as Blender commands
+are not idempotent.
+
+Configuration (environment):
+
+- ``BLENDER_MCP_FLEET``: comma-separated endpoints, e.g.
+  ``localhost:9876,localhost:9877,unix:/tmp/blender.sock``. Unset keeps the
+  single-connection behaviour.
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set
+
+from .network_core import NetworkCore
+
+logger = logging.getLogger(__name__)
+
+_session_key: ContextVar[Optional[str]] = ContextVar("blender_mcp_fleet_session", default=None)
+
+
+@contextmanager
+def session(key: Optional[str]) -> Iterator[None]:
+    """Route the Blender commands issued in this context with affinity `key`."""
+    token = _session_key.set(key or None)
+    try:
+        yield
+    finally:
+        _session_key.reset(token)
+
+
+def current_session() -> Optional[str]:
+    return _session_key.get()
+
+
+class EndpointDownError(ConnectionError):
+    """The endpoint could not be reached; the command was not sent."""
+
+
+def _default_core_factory(endpoint: "FleetEndpoint") -> NetworkCore:
+    if endpoint.unix_path is not None:
+        return NetworkCore(unix_path=endpoint.unix_path)
+    return NetworkCore(endpoint.host, endpoint.port)
+
+
+class FleetEndpoint:
+    """One Blender instance: connection, load and health bookkeeping."""
+
+    def __init__(self, address: str, *, core_factory: Optional[Callable[["FleetEndpoint"], Any]] = None) -> None:
+        self.address = address.strip()
+        self.unix_path: Optional[str] = None
+        self.host = "localhost"
+        self.port = 9876
+        if self.address.startswith("unix:"):
+            self.unix_path = self.address[len("unix:"):]
+        else:
+            host, sep, port = self.address.rpartition(":")
+            if not sep or not host or not port.isdigit():
+                raise ValueError(f"invalid Blender endpoint {address!r} (expected host:port or unix:/path)")
+            self.host, self.port = host, int(port)
+        self._core_factory = core_factory or _default_core_factory
+        self._core: Optional[Any] = None
+        # Blender runs one command at a time: never interleave on a connection
+        self._io_lock = threading.Lock()
+        # Bookkeeping below is guarded by the fleet lock
+        self.in_flight = 0
+        self.ewma_ms: Optional[float] = None
+        self.healthy = True
+        self.failures = 0
+        self.down_since: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.requests = 0
+        self.errors = 0
+
+    def send(self, command_type: str, params: Optional[Dict[str, Any]]) -> Any:
+        with self._io_lock:
+            return self._send_locked(command_type, params)
+
+    def _send_locked(self, command_type: str, params: Optional[Dict[str, Any]]) -> Any:
+        # Caller holds the I/O lock
+        if self._core is None:
+            self._core = self._core_factory(self)
+        if not self._core.connect():
+            self._drop()
+            raise EndpointDownError(f"Blender endpoint {self.address} is unreachable")
+        try:
+            return self._core.send_command(command_type, params)
+        except Exception:
+            self._drop()
+            raise
+
+    def try_ping(self) -> Optional[bool]:
+        """Ping if idle; None when a command currently holds the connection."""
+        if not self._io_lock.acquire(blocking=False):
+            return None
+        # Keep the lock for the ping: a command arriving meanwhile waits for it
+        try:
+            reply = self._send_locked("ping", {"msg": "health"})
+        except Exception:
+            return False
+        finally:
+            self._io_lock.release()
+        return isinstance(reply, dict)
+
+    def _drop(self) -> None:
+        core, self._core = self._core, None
+        if core is not None:
+            try:
+                core.disconnect()
+            except Exception:
+                logger.debug("error while dropping connection to %s", self.address, exc_info=True)
+
+    def close(self) -> None:
+        with self._io_lock:
+            self._drop()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "healthy": self.healthy,
+            "in_flight": self.in_flight,
+            "latency_ewma_ms": None if self.ewma_ms is None else round(self.ewma_ms, 3),
+            "requests": self.requests,
+            "errors": self.errors,
+            "consecutive_failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+
+class BlenderFleet:
+    """Least-loaded, session-sticky router over `FleetEndpoint` instances."""
+
+    def __init__(
+        self,
+        addresses: Sequence[str],
+        *,
+        core_factory: Optional[Callable[[FleetEndpoint], Any]] = None,
+        ewma_alpha: float = 0.2,
+        unhealthy_after: int = 2,
+        recheck_after: float = 5.0,
+        max_sessions: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not addresses:
+            raise ValueError("a Blender fleet needs at least one endpoint")
+        self.endpoints: List[FleetEndpoint] = [FleetEndpoint(a, core_factory=core_factory) for a in addresses]
+        self.ewma_alpha = ewma_alpha
+        self.unhealthy_after = max(1, unhealthy_after)
+        self.recheck_after = recheck_after
+        self.max_sessions = max_sessions
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._affinity: "collections.OrderedDict[str, FleetEndpoint]" = collections.OrderedDict()
+        self.rebinds = 0
+
+    # --- selection ---
+    def _available(self, ep: FleetEndpoint, now: float) -> bool:
+        return ep.healthy or (ep.down_since is not None and now - ep.down_since >= self.recheck_after)
+
+    def _least_loaded(self, candidates: List[FleetEndpoint]) -> FleetEndpoint:
+        # Endpoints without a latency sample yet score 0 so they get tried
+        return min(candidates, key=lambda ep: ((ep.in_flight + 1) * (ep.ewma_ms or 0.0), ep.in_flight))
+
+    def _acquire(self, key: Optional[str], exclude: Set[str]) -> Optional[FleetEndpoint]:
+        now = self._clock()
+        with self._lock:
+            candidates = [ep for ep in self.endpoints if ep.address not in exclude]
+            if not candidates:
+                return None
+            ep = self._affinity.get(key) if key is not None else None
+            if ep is not None and (ep.address in exclude or not self._available(ep, now)):
+                self.rebinds += 1
+                logger.info("session %r: endpoint %s is down, re-binding", key, ep.address)
+                ep = None
+            if ep is None:
+                # With every endpoint down, still try one rather than fail outright
+                pool = [c for c in candidates if self._available(c, now)] or candidates
+                ep = self._least_loaded(pool)
+            if key is not None:
+                self._affinity[key] = ep
+                self._affinity.move_to_end(key)
+                while len(self._affinity) > self.max_sessions:
+                    self._affinity.popitem(last=False)
+            ep.in_flight += 1
+            ep.requests += 1
+            return ep
+
+    def _release(self, ep: FleetEndpoint, elapsed_ms: Optional[float], error: Optional[BaseException]) -> None:
+        with self._lock:
+            ep.in_flight -= 1
+            if elapsed_ms is not None:
+                a = self.ewma_alpha
+                ep.ewma_ms = elapsed_ms if ep.ewma_ms is None else a * elapsed_ms + (1 - a) * ep.ewma_ms
+            if error is None:
+                self._mark_up(ep)
+                return
+            ep.errors += 1
+            ep.last_error = str(error) or type(error).__name__
+            if isinstance(error, (ConnectionError, OSError)):
+                self._mark_failure(ep)
+
+    def _mark_up(self, ep: FleetEndpoint) -> None:
+        if not ep.healthy:
+            logger.info("Blender endpoint %s is back", ep.address)
+        ep.healthy = True
+        ep.failures = 0
+        ep.down_since = None
+
+    def _mark_failure(self, ep: FleetEndpoint) -> None:
+        ep.failures += 1
+        if ep.failures >= self.unhealthy_after or not ep.healthy:
+            if ep.healthy:
+                logger.warning("Blender endpoint %s marked down: %s", ep.address, ep.last_error)
+            ep.healthy = False
+            ep.down_since = self._clock()
+
+    # --- commands ---
+    def send_command(
+        self, command_type: str, params: Optional[Dict[str, Any]] = None, *, key: Optional[str] = None
+    ) -> Any:
+        """Send a command to the selected endpoint and return Blender's reply.
+
+        `key` defaults to the session installed with `session`.
+        """
+        if key is None:
+            key = _session_key.get()
+        tried: Set[str] = set()
+        while True:
+            ep = self._acquire(key, tried)
+            if ep is None:
+                raise ConnectionError("Could not connect to any Blender instance of the fleet")
+            started = time.perf_counter()
+            try:
+                reply = ep.send(command_type, params)
+            except EndpointDownError as e:
+                # Nothing was sent: safe to fail over to another endpoint
+                self._release(ep, None, e)
+                tried.add(ep.address)
+                continue
+            except Exception as e:
+                self._release(ep, (time.perf_counter() - started) * 1000.0, e)
+                raise
+            self._release(ep, (time.perf_counter() - started) * 1000.0, None)
+            return reply
+
+    def connection(self, key: Optional[str] = None) -> "FleetConnection":
+        return FleetConnection(self, key)
+
+    def probe(self) -> Dict[str, Any]:
+        """Ping idle endpoints and update their health.
+
+        Busy endpoints are reported from their live traffic instead of
+        being queued behind it. Raises `ConnectionError` when no endpoint
+        is healthy, so this doubles as a health check.
+        """
+        for ep in self.endpoints:
+            alive = ep.try_ping()
+            if alive is None:
+                continue
+            with self._lock:
+                if alive:
+                    self._mark_up(ep)
+                else:
+                    ep.last_error = ep.last_error or "ping failed"
+                    self._mark_failure(ep)
+        states = {ep.address: "up" if ep.healthy else "down" for ep in self.endpoints}
+        if not any(ep.healthy for ep in self.endpoints):
+            raise ConnectionError("No Blender instance of the fleet is reachable")
+        return {"endpoints": states}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "endpoints": {ep.address: ep.stats() for ep in self.endpoints},
+                "sessions": len(self._affinity),
+                "rebinds": self.rebinds,
+            }
+
+    def close(self) -> None:
+        for ep in self.endpoints:
+            ep.close()
+
+
+class FleetConnection:
+    """`BlenderConnection`-compatible handle routing through a fleet.
+
+    Returned by `get_blender_connection` when a fleet is configured so the
+    existing tool code (``blender.send_command(...)``) is unchanged.
+    """
+
+    def __init__(self, fleet: BlenderFleet, key: Optional[str] = None) -> None:
+        self.fleet = fleet
+        self.key = key
+
+    def connect(self) -> bool:
+        return True
+
+    def disconnect(self) -> None:
+        pass
+
+    def send_command(self, command_type: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return self.fleet.send_command(command_type, params, key=self.key)
+
+
+def parse_fleet(spec: str) -> List[str]:
+    return [part.strip() for part in spec.split(",") if part.strip()]
+
+
+_fleet: Optional[BlenderFleet] = None
+_fleet_loaded = False
+_fleet_lock = threading.Lock()
+
+
+def get_fleet() -> Optional[BlenderFleet]:
+    """Return the fleet configured by ``BLENDER_MCP_FLEET``, or None."""
+    global _fleet, _fleet_loaded
+    with _fleet_lock:
+        if not _fleet_loaded:
+            addresses = parse_fleet(os.environ.get("BLENDER_MCP_FLEET", ""))
+            _fleet = BlenderFleet(addresses) if addresses else None
+            _fleet_loaded = True
+        return _fleet
+
+
+def reset_fleet() -> None:
+    """Close and forget the shared fleet (for tests and config reloads)."""
+    global _fleet, _fleet_loaded
+    with _fleet_lock:
+        old, _fleet, _fleet_loaded = _fleet, None, False
+    if old is not None:
+        old.close()
+
+
+__all__ = [
+    "BlenderFleet",
+    "EndpointDownError",
+    "FleetConnection",
+    "FleetEndpoint",
+    "current_session",
+    "get_fleet",
+    "parse_fleet",
+    "reset_fleet",
+    "session",
+]
@@ -38,16 +38,26 @@ class NetworkCore:
     sock: Optional[socket.socket]
     _core: Optional[Any]
 
-    def __init__(self, host: str = "localhost", port: int = 9876, *, socket_factory: Optional[Any] = None) -> None:
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 9876,
+        *,
+        socket_factory: Optional[Any] = None,
+        unix_path: Optional[str] = None,
+        response_timeout: float = 15.0,
+    ) -> None:
         self.host = host
         self.port = port
         self.sock = None
         self._core = None
         self._socket_factory = socket_factory  # optional override for raw socket creation
+        self.unix_path = unix_path  # connect to a unix socket instead of host:port
+        self.response_timeout = response_timeout  # seconds `send_command` waits for a reply
 
     def connect(self) -> bool:
-        # If a socket factory is injected, prefer raw socket path (skip core)
-        if self._socket_factory is None and CoreBlenderConnection is not None:
+        # If a socket factory or unix path is given, use the raw socket path (skip core)
+        if self._socket_factory is None and self.unix_path is None and CoreBlenderConnection is not None:
             if self._core is not None:
                 return True
             try:
@@ -70,17 +80,22 @@ class NetworkCore:
         try:
             if self._socket_factory is not None:
                 s = self._socket_factory()
+            elif self.unix_path is not None:
+                s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             else:
                 s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.connect((self.host, self.port))
+            s.connect(self.unix_path if self.unix_path is not None else (self.host, self.port))
             self.sock = s
-            logger.info("Connected to %s:%s", self.host, self.port)
+            logger.info("Connected to %s", self._address())
             return True
         except Exception:
             self.sock = None
-            logger.exception("Failed to connect to %s:%s", self.host, self.port)
+            logger.exception("Failed to connect to %s", self._address())
             return False
 
+    def _address(self) -> str:
+        return f"unix:{self.unix_path}" if self.unix_path is not None else f"{self.host}:{self.port}"
+
     def disconnect(self) -> None:
         if self._core is not None:
             try:
@@ -148,7 +163,7 @@ class NetworkCore:
             assert self.sock is not None
             self.sock.sendall(data)
             # Normalisation: toujours retourner le dict complet tel que reçu.
-            return self.receive_full_response()
+            return self.receive_full_response(timeout=self.response_timeout)
         except Exception:
             self.sock = None
             logger.exception("send_command failed")
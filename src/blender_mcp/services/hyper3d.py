@@ -7,10 +7,19 @@ re-exports the bbox helper so `integrations` can import from services.
 
 from typing import Any, Dict, List, Optional, Sequence
 
+from blender_mcp import circuit_breaker, progress
 from blender_mcp import hyper3d as _h3d
-from blender_mcp.errors import ExternalServiceError, InvalidParamsError
+from blender_mcp.errors import CircuitOpenError, ExternalServiceError, InvalidParamsError
 from blender_mcp.services.utils import process_bbox
 
+# Shared breaker name for Rodin (main site and fal.ai) network calls.
+_UPSTREAM = "hyper3d"
+
+
+def _guarded(fn: Any, *args: Any, **kwargs: Any) -> Any:
+    # Helpers also report upstream errors as payloads; those count as failures too
+    return circuit_breaker.get_breaker(_UPSTREAM).call_checked(fn, circuit_breaker.is_failure_payload, *args, **kwargs)
+
 
 def prepare_rodin_payload(
     text_prompt: Optional[str],
@@ -42,20 +51,24 @@ def generate_hyper3d_model_via_text(params: Optional[Dict[str, Any]] = None) ->
         raise InvalidParamsError("missing or invalid 'text_prompt'")
     try:
         if provider == "fal_ai":
-            job = _h3d.create_rodin_job_fal_ai(
+            job = _guarded(
+                _h3d.create_rodin_job_fal_ai,
                 api_key,
                 text_prompt=text_prompt,
                 images=None,
                 bbox_condition=bbox_condition,
             )
         else:
-            job = _h3d.create_rodin_job_main_site(
+            job = _guarded(
+                _h3d.create_rodin_job_main_site,
                 api_key,
                 text_prompt=text_prompt,
                 images=None,
                 bbox_condition=bbox_condition,
             )
         return {"status": "success", "result": job}
+    except CircuitOpenError:
+        raise
     except Exception as e:
         raise ExternalServiceError(str(e))
 
@@ -77,12 +90,14 @@ def generate_hyper3d_model_via_images(params: Optional[Dict[str, Any]] = None) -
         raise InvalidParamsError("'input_image_urls' must be a non-empty list of strings")
     try:
         if provider == "fal_ai":
-            job = _h3d.create_rodin_job_fal_ai(api_key, images=input_image_urls, bbox_condition=bbox_condition)
+            job = _guarded(
+                _h3d.create_rodin_job_fal_ai, api_key, images=input_image_urls, bbox_condition=bbox_condition
+            )
         else:
             # main_site variant expects file tuples; not supported here
             raise InvalidParamsError("provider 'main_site' requires image file uploads; use 'fal_ai' with URLs")
         return {"status": "success", "result": job}
-    except InvalidParamsError:
+    except (InvalidParamsError, CircuitOpenError):
         raise
     except Exception as e:
         raise ExternalServiceError(str(e))
@@ -99,11 +114,14 @@ def poll_rodin_job_status(params: Optional[Dict[str, Any]] = None) -> Dict[str,
         raise InvalidParamsError("provide either 'subscription_key' (main_site) or 'request_id' (fal_ai)")
     try:
         if isinstance(request_id, str):
-            res = _h3d.poll_rodin_job_status_fal_ai(api_key, request_id)
+            res = _guarded(_h3d.poll_rodin_job_status_fal_ai, api_key, request_id)
         else:
             assert isinstance(subscription_key, str)
-            res = _h3d.poll_rodin_job_status_main_site(api_key, subscription_key)
+            res = _guarded(_h3d.poll_rodin_job_status_main_site, api_key, subscription_key)
+        progress.report_partial(res)
         return {"status": "success", "result": res}
+    except CircuitOpenError:
+        raise
     except Exception as e:
         raise ExternalServiceError(str(e))
 
@@ -120,12 +138,15 @@ def import_generated_asset(params: Optional[Dict[str, Any]] = None) -> Dict[str,
         raise InvalidParamsError("missing or invalid 'name'")
     if not isinstance(task_uuid, str) and not isinstance(request_id, str):
         raise InvalidParamsError("provide either 'task_uuid' (main_site) or 'request_id' (fal_ai)")
+    progress.report_progress("import", name=name)
     try:
         if isinstance(request_id, str):
-            res = _h3d.import_generated_asset_fal_ai(api_key, request_id, name)
+            res = _guarded(_h3d.import_generated_asset_fal_ai, api_key, request_id, name)
         else:
             assert isinstance(task_uuid, str)
-            res = _h3d.import_generated_asset_main_site(api_key, task_uuid, name)
+            res = _guarded(_h3d.import_generated_asset_main_site, api_key, task_uuid, name)
         return {"status": "success", "result": res}
+    except CircuitOpenError:
+        raise
     except Exception as e:
         raise ExternalServiceError(str(e))
@@ -7,9 +7,10 @@ responses to the canonical service schema.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
-from blender_mcp.errors import ExternalServiceError, InvalidParamsError
+from blender_mcp.dispatchers.singleflight import coalescable
+from blender_mcp.errors import CircuitOpenError, ExternalServiceError, InvalidParamsError
 
 from .addon.polyhaven import download_polyhaven_asset as _addon_download_polyhaven_asset
 from .addon.polyhaven import get_polyhaven_categories as _addon_get_polyhaven_categories
@@ -18,6 +19,7 @@ from .addon.polyhaven import search_polyhaven_assets as _addon_search_polyhaven_
 logger = logging.getLogger(__name__)
 
 
+@coalescable()
 def get_polyhaven_categories(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Service: fetch PolyHaven categories with canonical contract.
 
@@ -33,13 +35,16 @@ def get_polyhaven_categories(params: Optional[Dict[str, Any]] = None) -> Dict[st
     if asset_type is not None and not isinstance(asset_type, str):
         raise InvalidParamsError("'asset_type' must be a string if provided")
     try:
-        data = fetch_categories(asset_type=asset_type or "hdris")
+        data = list_categories(asset_type=asset_type or "hdris")
         cats = data.get("categories") or {}
         return {"status": "success", "result": {"categories": cats}}
+    except CircuitOpenError:
+        raise
     except Exception as e:
         raise ExternalServiceError(str(e))
 
 
+@coalescable()
 def search_polyhaven_assets(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Service: search PolyHaven assets with canonical contract.
 
@@ -53,6 +58,9 @@ def search_polyhaven_assets(params: Optional[Dict[str, Any]] = None) -> Dict[str
 
     Returns: {"status":"success","result":{"assets":{...},"total_count":int,"returned_count":int}}
 
+    Served from the local catalog snapshot when available (see
+    `polyhaven_catalog`), otherwise from the network API.
+
     Errors:
     - InvalidParamsError: bad type/value for any param
     - ExternalServiceError: network/API failure
@@ -78,12 +86,14 @@ def search_polyhaven_assets(params: Optional[Dict[str, Any]] = None) -> Dict[str
         raise InvalidParamsError("'per_page' must be an int between 1 and 100")
 
     try:
-        data = search_assets_network(
+        data = find_assets(
             asset_type=asset_type,
             categories=categories,
             page=page,
             per_page=per_page,
         )
+    except CircuitOpenError:
+        raise
     except Exception as e:  # pragma: no cover - defensive boundary
         raise ExternalServiceError(str(e))
 
@@ -166,10 +176,14 @@ def download_polyhaven_asset(params: Optional[Dict[str, Any]] = None) -> Dict[st
       "asset_id": str,  (required)
       "asset_type": "hdris"|"textures"|"models",  (required)
       "resolution": str (optional, default: "1k"),
-      "file_format": str (optional; default depends on type)
+      "file_format": str (optional; default depends on type),
+      "maps": list[str] | str (optional, textures only; e.g. ["color", "normal"]
+              or "color,roughness"): download just these maps instead of the
+              whole archive
     }
 
-    Returns: {"status":"success","result":{"temp_dir": str}}
+    Returns: {"status":"success","result":{"temp_dir": str}}, plus
+    "maps": {map_name: path} when `maps` was given.
 
     Errors:
     - InvalidParamsError: bad/missing params
@@ -189,22 +203,41 @@ def download_polyhaven_asset(params: Optional[Dict[str, Any]] = None) -> Dict[st
         raise InvalidParamsError("'resolution' must be a string if provided")
     if file_format is not None and not isinstance(file_format, str):
         raise InvalidParamsError("'file_format' must be a string if provided")
+    maps = _parse_maps(p.get("maps"))
 
     try:
         res_str: str = resolution or "1k"
+        extra: Dict[str, Any] = {"maps": maps} if maps else {}
         res = download_asset(
             asset_id=asset_id,
             asset_type=asset_type,
             resolution=res_str,
             file_format=file_format,
+            **extra,
         )
+    except CircuitOpenError:
+        raise
     except Exception as e:  # pragma: no cover - defensive
         raise ExternalServiceError(str(e))
 
     if res.get("error"):
         raise ExternalServiceError(str(res.get("error")))
 
-    return {"status": "success", "result": {"temp_dir": res.get("temp_dir")}}
+    result = {"temp_dir": res.get("temp_dir")}
+    if "maps" in res:
+        result["maps"] = res["maps"]
+    return {"status": "success", "result": result}
+
+
+def _parse_maps(value: Any) -> Optional[List[str]]:
+    """Normalize the ``maps`` param (list or comma-separated string)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, (list, tuple)) or not all(isinstance(m, str) for m in value):
+        raise InvalidParamsError("'maps' must be a list of map names or a comma-separated string")
+    return [m.strip().lower() for m in value if m.strip()] or None
 
 
 def search_assets(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -274,6 +307,8 @@ __all__ = [
     "download_asset_message",
     "fetch_categories",
     "search_assets_network",
+    "find_assets",
+    "list_categories",
     "download_asset",
 ]
 
@@ -281,7 +316,10 @@ __all__ = [
 # --- helper functions (network helpers and formatters) ---
 import requests
 
-from blender_mcp import downloaders
+from blender_mcp import circuit_breaker, download_scheduler, downloaders, progress, workspace
+from blender_mcp.http import get_session
+
+from . import polyhaven_catalog, polyhaven_files
 
 
 def format_categories_output(categories: Dict[str, int], asset_type: str) -> str:
@@ -328,6 +366,7 @@ def download_asset_message(result: Dict[str, Any], asset_type: str) -> str:
     return f"Failed to download asset: {result.get('message', 'Unknown error')}"
 
 
+@circuit_breaker.guarded("polyhaven")
 def fetch_categories(
     api_base: str = "https://api.polyhaven.com",
     asset_type: str = "hdris",
@@ -337,20 +376,20 @@ def fetch_categories(
 
     If a `session` is provided, it will be used for the request (useful for
     connection reuse in long-running processes or for test injection). If no
-    session is provided, `requests.get` is used for backward compatibility.
+    session is provided, the shared pooled session from `http.get_session`
+    is used.
     """
     url = f"{api_base}/list"
     params = {"type": asset_type}
-    if session is not None:
-        resp = session.get(url, params=params, timeout=15)
-    else:
-        resp = requests.get(url, params=params, timeout=15)
+    sess = session if session is not None else get_session()
+    resp = sess.get(url, params=params, timeout=15)
     resp.raise_for_status()
     data = resp.json()
     categories = data.get("categories") or {}
     return {"categories": categories}
 
 
+@circuit_breaker.guarded("polyhaven")
 def search_assets_network(
     api_base: str = "https://api.polyhaven.com",
     asset_type: str = "all",
@@ -368,10 +407,8 @@ def search_assets_network(
     params: Dict[str, Any] = {"type": asset_type, "page": page, "per_page": per_page}
     if categories:
         params["categories"] = categories
-    if session is not None:
-        resp = session.get(url, params=params, timeout=20)
-    else:
-        resp = requests.get(url, params=params, timeout=20)
+    sess = session if session is not None else get_session()
+    resp = sess.get(url, params=params, timeout=20)
     resp.raise_for_status()
     try:
         return resp.json()
@@ -379,6 +416,29 @@ def search_assets_network(
         return {"error": f"Invalid JSON from PolyHaven: {e}"}
 
 
+def find_assets(
+    asset_type: str = "all",
+    categories: Optional[str] = None,
+    page: int = 1,
+    per_page: int = 50,
+) -> Dict[str, Any]:
+    """Search the local catalog snapshot, falling back to `search_assets_network`."""
+    catalog = polyhaven_catalog.get_catalog()
+    found = catalog.search(asset_type, categories, page=page, per_page=per_page) if catalog is not None else None
+    if found is not None:
+        return found
+    return search_assets_network(asset_type=asset_type, categories=categories, page=page, per_page=per_page)
+
+
+def list_categories(asset_type: str = "hdris") -> Dict[str, Any]:
+    """Category counts from the local catalog, falling back to `fetch_categories`."""
+    catalog = polyhaven_catalog.get_catalog()
+    counts = catalog.categories(asset_type) if catalog is not None else None
+    if counts is not None:
+        return {"categories": counts}
+    return fetch_categories(asset_type=asset_type)
+
+
 def download_asset(
     download_url: Optional[str] = None,
     asset_id: Optional[str] = None,
@@ -386,19 +446,63 @@ def download_asset(
     resolution: str = "1k",
     file_format: Optional[str] = None,
     session: Optional[requests.sessions.Session] = None,
+    maps: Optional[Sequence[str]] = None,
 ) -> Dict[str, Any]:
+    """Download and extract an asset archive; returns {"temp_dir"} or {"error"}.
+
+    For textures, `maps` (e.g. ``MATERIAL_MAPS`` of `polyhaven_files`)
+    selects individual map files, downloaded in parallel, instead of the
+    archive holding every map in every format; the result then also has
+    ``"maps": {map_name: path}``.
+    """
+    if not download_url and not asset_id:
+        return {"error": "Either download_url or asset_id must be provided"}
+    catalog = polyhaven_catalog.get_catalog()
+    # Bulk downloads are prefetches, not demand: only count the others
+    if asset_id and catalog is not None and download_scheduler.current_priority() != "bulk":
+        catalog.record_request(asset_id, asset_type)
+    if maps and asset_id and asset_type == "textures":
+        return _download_texture_maps(asset_id, resolution, file_format or "jpg", maps, session)
     if not download_url:
-        if not asset_id:
-            return {"error": "Either download_url or asset_id must be provided"}
         fmt = file_format or ("gltf.zip" if asset_type == "models" else "zip")
         download_url = f"https://dl.polyhaven.org/file/ph-assets/{asset_type}/{asset_id}/{resolution}.{fmt}"
 
     try:
-        if session is None:
-            zip_bytes = downloaders.download_bytes(download_url, timeout=120)
-        else:
-            zip_bytes = downloaders.download_bytes(download_url, timeout=120, session=session)
-        temp_dir = downloaders.secure_extract_zip_bytes(zip_bytes)
+        # Stream to disk and extract from the file: the zip never sits in memory
+        with workspace.using_provider("polyhaven"):
+            if session is None:
+                temp_dir = downloaders.download_and_extract_zip(download_url, timeout=120)
+            else:
+                temp_dir = downloaders.download_and_extract_zip(download_url, timeout=120, session=session)
+        progress.report_partial({"temp_dir": temp_dir})
         return {"temp_dir": temp_dir}
+    except CircuitOpenError:
+        # Surface fail-fast rejections so callers can skip slower fallbacks
+        raise
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _download_texture_maps(
+    asset_id: str,
+    resolution: str,
+    file_format: str,
+    maps: Sequence[str],
+    session: Optional[requests.sessions.Session],
+) -> Dict[str, Any]:
+    catalog = polyhaven_catalog.get_catalog()
+    try:
+        # Metadata warmed up or fetched recently comes from the catalog cache
+        if catalog is not None:
+            files_data = catalog.files(asset_id)
+        else:
+            files_data = polyhaven_catalog.fetch_files(asset_id, session=session)
+        temp_dir, paths = polyhaven_files.prepare_texture_maps(
+            files_data, asset_id, resolution, file_format, maps=list(maps), session=session
+        )
+        progress.report_partial({"temp_dir": temp_dir, "maps": paths})
+        return {"temp_dir": temp_dir, "maps": paths}
+    except CircuitOpenError:
+        raise
     except Exception as e:
         return {"error": str(e)}
@@ -0,0 +1,324 @@
+"""Local snapshot of the PolyHaven catalog for offline search.
+
+Every search used to hit the network, and the addon fallback fetched the
+whole ``/assets`` catalog only to keep 20 entries. The catalog is small
+(a few thousand assets), so a snapshot of it is kept instead:
+
+- persisted as JSON (``BLENDER_MCP_POLYHAVEN_CATALOG_PATH``) so a restart
+  serves searches at once
+- indexed in memory by type, by (type, category) and by (type, tag), each
+  list pre-sorted by download count, with category counts per type, so a
+  search is a list intersection plus a slice and never touches the network
+- refreshed on a background thread once older than ``max_age``; searches
+  keep being served from the previous snapshot meanwhile
+- per-asset ``/files`` metadata is cached in memory for ``max_age`` too
+  (`files`), and the assets agents ask for are counted and persisted next
+  to the snapshot (`record_request` / `most_requested`), so the warm-up
+  (see `polyhaven_warmup`) can prefetch them
+
+Until a first snapshot exists `search` / `categories` return None and
+callers use the network API as before.
+
+Configuration (environment):
+
+- ``BLENDER_MCP_POLYHAVEN_CATALOG``: ``0`` disables the catalog
+- ``BLENDER_MCP_POLYHAVEN_CATALOG_PATH``: snapshot file
+  (``~/.cache/blender-mcp/polyhaven-catalog.json``)
+- ``BLENDER_MCP_POLYHAVEN_CATALOG_MAX_AGE``: seconds before a refresh (21600)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from blender_mcp import circuit_breaker
+from blender_mcp.http import get_session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE = 6 * 3600.0
+ASSET_TYPES = ("hdris", "textures", "models")
+FILES_CACHE_SIZE = 1024
+
+Loader = Callable[[], Dict[str, Dict[str, Any]]]
+FilesLoader = Callable[[str], Dict[str, Any]]
+
+
+@circuit_breaker.guarded("polyhaven")
+def fetch_catalog(
+    api_base: str = "https://api.polyhaven.com", session: Optional[requests.sessions.Session] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch every asset (``/assets``) in one request."""
+    sess = session if session is not None else get_session()
+    resp = sess.get(f"{api_base}/assets", timeout=30)
+    resp.raise_for_status()
+    data = resp.json()
+    if not isinstance(data, dict):
+        raise ValueError("unexpected /assets payload")
+    return data
+
+
+@circuit_breaker.guarded("polyhaven")
+def fetch_files(
+    asset_id: str, api_base: str = "https://api.polyhaven.com", session: Optional[requests.sessions.Session] = None
+) -> Dict[str, Any]:
+    """Fetch the ``/files`` metadata (URLs, sizes, md5) of one asset."""
+    sess = session if session is not None else get_session()
+    resp = sess.get(f"{api_base}/files/{asset_id}", timeout=15)
+    resp.raise_for_status()
+    return resp.json()
+
+
+def _write_json(path: str, payload: Any) -> None:
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh)
+        os.replace(tmp, path)
+    except OSError:
+        logger.warning("polyhaven catalog: cannot persist to %s", path, exc_info=True)
+
+
+def _read_json(path: str) -> Any:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+class _Index:
+    """Download-count ordered id lists per type, category and tag."""
+
+    def __init__(self, assets: Dict[str, Dict[str, Any]]) -> None:
+        self.assets = assets
+        ranked = sorted(assets, key=lambda k: (-int(assets[k].get("download_count") or 0), k))
+        self.by_type: Dict[str, List[str]] = {"all": ranked}
+        self.by_category: Dict[Tuple[str, str], List[str]] = {}
+        self.by_tag: Dict[Tuple[str, str], List[str]] = {}
+        for asset_id in ranked:
+            data = assets[asset_id]
+            kind = data.get("type")
+            type_name = ASSET_TYPES[kind] if isinstance(kind, int) and 0 <= kind < len(ASSET_TYPES) else None
+            for scope in ("all", type_name) if type_name else ("all",):
+                if scope != "all":
+                    self.by_type.setdefault(scope, []).append(asset_id)
+                for cat in data.get("categories") or ():
+                    self.by_category.setdefault((scope, cat), []).append(asset_id)
+                for tag in data.get("tags") or ():
+                    self.by_tag.setdefault((scope, tag), []).append(asset_id)
+        self.counts: Dict[str, Dict[str, int]] = {scope: {"all": len(ids)} for scope, ids in self.by_type.items()}
+        for (scope, cat), ids in self.by_category.items():
+            self.counts[scope][cat] = len(ids)
+
+    def select(self, asset_type: str, categories: List[str], tags: List[str]) -> List[str]:
+        lists = [self.by_category.get((asset_type, c), []) for c in categories]
+        lists += [self.by_tag.get((asset_type, t), []) for t in tags]
+        if not lists:
+            return self.by_type.get(asset_type, [])
+        # Walk the shortest list (already ranked) and keep ids present in all others
+        lists.sort(key=len)
+        others = [set(ids) for ids in lists[1:]]
+        return [i for i in lists[0] if all(i in s for s in others)]
+
+
+class PolyHavenCatalog:
+    """Persisted, periodically refreshed PolyHaven catalog with an in-memory index."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_age: float = DEFAULT_MAX_AGE,
+        loader: Loader = fetch_catalog,
+        files_loader: FilesLoader = fetch_files,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.usage_path = os.path.splitext(path)[0] + "-usage.json"
+        self.max_age = max_age
+        self._loader = loader
+        self._files_loader = files_loader
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._index: Optional[_Index] = None
+        self._fetched_at = 0.0
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._files: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._usage: Dict[str, Dict[str, Any]] = _read_json(self.usage_path) or {}
+        self._load()
+
+    def _load(self) -> None:
+        snapshot = _read_json(self.path)
+        try:
+            self._index = _Index(snapshot["assets"])
+            self._fetched_at = float(snapshot["fetched_at"])
+        except (KeyError, TypeError, ValueError):
+            return
+
+    def _save(self, assets: Dict[str, Dict[str, Any]], fetched_at: float) -> None:
+        _write_json(self.path, {"fetched_at": fetched_at, "assets": assets})
+
+    # --- refresh ---
+    def refresh(self) -> None:
+        """Fetch a new snapshot now (blocking), replace the index and persist it."""
+        assets = self._loader()
+        index = _Index(assets)
+        fetched_at = self._clock()
+        with self._lock:
+            self._index, self._fetched_at = index, fetched_at
+        self._save(assets, fetched_at)
+        logger.info("polyhaven catalog: %d assets indexed", len(assets))
+
+    def _refresh_quietly(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logger.warning("polyhaven catalog refresh failed", exc_info=True)
+
+    def refresh_in_background(self) -> bool:
+        """Start a refresh unless one is already running; True if started."""
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return False
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_quietly, name="blender-mcp-polyhaven-catalog", daemon=True
+            )
+            self._refresh_thread.start()
+            return True
+
+    def _current(self) -> Optional[_Index]:
+        """The index to serve from, scheduling a refresh when missing or stale."""
+        with self._lock:
+            index, fetched_at = self._index, self._fetched_at
+        if index is None or self._clock() - fetched_at >= self.max_age:
+            self.refresh_in_background()
+        return index
+
+    # --- queries ---
+    def search(
+        self,
+        asset_type: str = "all",
+        categories: Optional[str] = None,
+        *,
+        tags: Optional[str] = None,
+        page: int = 1,
+        per_page: int = 50,
+    ) -> Optional[Dict[str, Any]]:
+        """One page of assets, most downloaded first; None until a snapshot exists.
+
+        `categories` and `tags` are comma-separated; an asset must match all.
+        """
+        index = self._current()
+        if index is None:
+            return None
+        ids = index.select(asset_type or "all", _split(categories), _split(tags))
+        start = (page - 1) * per_page
+        assets = {i: index.assets[i] for i in ids[start : start + per_page]}
+        return {"assets": assets, "total_count": len(ids), "returned_count": len(assets)}
+
+    def categories(self, asset_type: str = "all") -> Optional[Dict[str, int]]:
+        """Asset count per category (plus ``all``); None until a snapshot exists."""
+        index = self._current()
+        if index is None:
+            return None
+        return dict(index.counts.get(asset_type, {"all": 0}))
+
+    def has_snapshot(self) -> bool:
+        with self._lock:
+            return self._index is not None
+
+    # --- per-asset metadata ---
+    def cached_files(self, asset_id: str) -> Optional[Dict[str, Any]]:
+        """The ``/files`` metadata of `asset_id` if cached and fresh."""
+        with self._lock:
+            hit = self._files.get(asset_id)
+            if hit is None or self._clock() - hit[0] >= self.max_age:
+                return None
+            self._files.move_to_end(asset_id)
+            return hit[1]
+
+    def files(self, asset_id: str) -> Dict[str, Any]:
+        """The ``/files`` metadata of `asset_id`, fetched on a miss."""
+        data = self.cached_files(asset_id)
+        if data is not None:
+            return data
+        data = self._files_loader(asset_id)
+        with self._lock:
+            self._files[asset_id] = (self._clock(), data)
+            self._files.move_to_end(asset_id)
+            while len(self._files) > FILES_CACHE_SIZE:
+                self._files.popitem(last=False)
+        return data
+
+    # --- demand ---
+    def record_request(self, asset_id: str, asset_type: Optional[str] = None) -> None:
+        """Count a request for `asset_id` (made by an agent, not a prefetch)."""
+        with self._lock:
+            entry = self._usage.setdefault(asset_id, {"count": 0})
+            entry["count"] += 1
+            entry["last"] = self._clock()
+            if asset_type:
+                entry["asset_type"] = asset_type
+            usage = {k: dict(v) for k, v in self._usage.items()}
+        _write_json(self.usage_path, usage)
+
+    def most_requested(self, limit: int) -> List[Tuple[str, Dict[str, Any]]]:
+        """The `limit` most requested assets, most recent first on ties."""
+        with self._lock:
+            ranked = sorted(self._usage.items(), key=lambda kv: (-kv[1]["count"], -kv[1].get("last", 0.0)))
+        return [(asset_id, dict(entry)) for asset_id, entry in ranked[:limit]]
+
+    def most_downloaded(self, limit: int) -> List[str]:
+        """Ids of the `limit` most downloaded assets of the snapshot."""
+        with self._lock:
+            index = self._index
+        return index.by_type["all"][:limit] if index is not None else []
+
+
+def _split(value: Optional[str]) -> List[str]:
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+
+_default: Optional[PolyHavenCatalog] = None
+_default_loaded = False
+_default_lock = threading.Lock()
+
+
+def get_catalog() -> Optional[PolyHavenCatalog]:
+    """Return the process-wide catalog, or None when disabled."""
+    global _default, _default_loaded
+    with _default_lock:
+        if not _default_loaded:
+            _default_loaded = True
+            if os.environ.get("BLENDER_MCP_POLYHAVEN_CATALOG", "1").lower() in {"0", "false", "no", "off"}:
+                _default = None
+            else:
+                path = os.environ.get("BLENDER_MCP_POLYHAVEN_CATALOG_PATH") or os.path.join(
+                    os.path.expanduser("~"), ".cache", "blender-mcp", "polyhaven-catalog.json"
+                )
+                try:
+                    max_age = float(os.environ.get("BLENDER_MCP_POLYHAVEN_CATALOG_MAX_AGE", DEFAULT_MAX_AGE))
+                except ValueError:
+                    max_age = DEFAULT_MAX_AGE
+                _default = PolyHavenCatalog(path, max_age=max_age)
+        return _default
+
+
+def reset_catalog() -> None:
+    """Forget the shared catalog (for tests and config reloads)."""
+    global _default, _default_loaded
+    with _default_lock:
+        _default, _default_loaded = None, False
+
+
+__all__ = ["PolyHavenCatalog", "fetch_catalog", "fetch_files", "get_catalog", "reset_catalog"]
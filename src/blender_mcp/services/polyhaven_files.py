@@ -0,0 +1,309 @@
+"""Download the files of a PolyHaven asset: texture maps and model files.
+
+Works on the ``/files`` metadata of an asset (see `polyhaven_catalog`):
+
+- `find_texture_map_files` picks the maps a material uses
+  (`MATERIAL_MAPS`) under PolyHaven's key names (`TEXTURE_MAP_ALIASES`)
+- `prepare_texture_maps` / `prepare_model_files` download those files in
+  parallel over one pooled session into a workspace dir, checking the
+  listed ``md5`` and ``size`` and going through the asset cache when
+  enabled
+
+``blender_mcp.polyhaven`` re-exports these for older callers.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Sequence
+
+import requests
+
+from blender_mcp.http import get_session
+from blender_mcp.workspace import get_workspace
+
+# Material map name -> keys PolyHaven uses for it in ``/files``, preferred first
+TEXTURE_MAP_ALIASES: Dict[str, tuple[str, ...]] = {
+    "color": ("diffuse", "diff", "color", "albedo"),
+    "roughness": ("rough", "roughness"),
+    "normal": ("nor_gl", "normal", "nor", "nor_dx"),
+    "displacement": ("displacement", "disp", "height"),
+    "arm": ("arm",),
+    "ao": ("ao",),
+    "metallic": ("metal", "metallic"),
+}
+# The maps a Principled BSDF material built from a texture actually uses
+MATERIAL_MAPS = ("color", "roughness", "normal", "displacement", "arm")
+
+
+def _texture_file_info(entry: Any, resolution: str, file_format: str) -> Optional[Dict[str, Any]]:
+    # entry is expected to be a dict keyed by resolution, then format
+    if not isinstance(entry, dict):
+        return None
+    res_block = entry.get(resolution)
+    if not isinstance(res_block, dict):
+        return None
+    fmt_block = res_block.get(file_format)
+    if not isinstance(fmt_block, dict) or not fmt_block.get("url"):
+        return None
+    return fmt_block
+
+
+def find_texture_map_urls(files_data: Dict[str, Any], resolution: str, file_format: str) -> Dict[str, str]:
+    """Return a mapping map_type -> download URL for texture maps matching
+    the requested resolution and file_format.
+
+    Returns empty dict if nothing found.
+    """
+    out: Dict[str, str] = {}
+    for map_type, entry in files_data.items():
+        if map_type in ("blend", "gltf"):
+            continue
+        info = _texture_file_info(entry, resolution, file_format)
+        if info is not None:
+            out[map_type] = info["url"]
+    return out
+
+
+def find_texture_map_files(
+    files_data: Dict[str, Any], resolution: str, file_format: str, maps: Sequence[str] = MATERIAL_MAPS
+) -> Dict[str, Dict[str, Any]]:
+    """Return the file_info (url, size, md5) of each of `maps` that exists.
+
+    Map names are the material ones (see `TEXTURE_MAP_ALIASES`), matched
+    case-insensitively against PolyHaven's keys (``Diffuse``, ``nor_gl``...).
+    Missing maps are left out.
+    """
+    by_key = {str(k).lower(): v for k, v in files_data.items()}
+    out: Dict[str, Dict[str, Any]] = {}
+    for name in maps:
+        for key in TEXTURE_MAP_ALIASES.get(name, (name,)):
+            info = _texture_file_info(by_key.get(key), resolution, file_format)
+            if info is not None:
+                out[name] = info
+                break
+    return out
+
+
+def find_model_file_info(files_data: Dict[str, Any], file_format: str, resolution: str) -> Optional[Dict[str, Any]]:
+    """Return the file_info dict for a model in the requested format/resolution,
+    or None if not found.
+    """
+    ff_block = files_data.get(file_format)
+    if not isinstance(ff_block, dict):
+        return None
+    res_block = ff_block.get(resolution)
+    if not isinstance(res_block, dict):
+        return None
+    # Some responses nest again with file_format as key; try to be permissive
+    if file_format in res_block and isinstance(res_block[file_format], dict):
+        return res_block[file_format]
+    # Otherwise assume res_block is directly the file_info
+    return res_block
+
+
+def download_bytes(url: str, *, timeout: int = 30, session: Optional[requests.sessions.Session] = None) -> bytes:
+    """Download bytes from url, raising RuntimeError on non-200.
+
+    Accepts an optional `requests.Session` (or session-like) for testing and
+    connection reuse. Falls back to the shared `get_session()`.
+    """
+    sess = session if session is not None else get_session()
+    resp = sess.get(url, timeout=timeout)
+    if resp.status_code != 200:
+        raise RuntimeError(f"Failed to download URL: {resp.status_code}")
+    return resp.content
+
+
+def _fetch_to(info: Dict[str, Any], dest: str, session: Optional[requests.sessions.Session]) -> None:
+    """Write the file described by `info` to `dest`, checking its md5 and size.
+
+    Goes through the asset cache when enabled (verified while streaming,
+    and not re-hashed on reuse).
+    """
+    import hashlib
+
+    from blender_mcp.asset_cache import get_asset_cache
+    from blender_mcp.downloaders import IntegrityError
+
+    url = info["url"]
+    size = info.get("size") if isinstance(info.get("size"), int) else None
+    md5 = info.get("md5") or None
+    cache = get_asset_cache()
+    if cache is not None:
+        cache.materialize(url, dest, session=session, expected_size=size, checksums={"md5": md5} if md5 else None)
+        return
+    content = download_bytes(url, session=session)
+    if size is not None and len(content) != size:
+        raise IntegrityError(f"{url}: got {len(content)} bytes, expected {size}")
+    if md5 and hashlib.md5(content).hexdigest() != md5.lower():
+        raise IntegrityError(f"{url}: md5 mismatch")
+    with open(dest, "wb") as fh:
+        fh.write(content)
+
+
+def _safe_dest(root: str, rel_path: str) -> str:
+    """Join `rel_path` under `root`, refusing paths that escape it."""
+    import os
+
+    real_root = os.path.realpath(root)
+    dest = os.path.realpath(os.path.join(real_root, rel_path))
+    escapes = os.path.commonpath([real_root, dest]) != real_root or dest == real_root
+    if not rel_path or os.path.isabs(rel_path) or escapes:
+        raise RuntimeError(f"Unsafe file path in file_info: {rel_path!r}")
+    return dest
+
+
+def _model_jobs(file_info: Dict[str, Any], root: str) -> list[tuple[str, Dict[str, Any], str]]:
+    """(name, info, dest) per file to fetch, main file first; validates every path."""
+    main_name = file_info["url"].split("/")[-1]
+    jobs = [(main_name, file_info, _safe_dest(root, main_name))]
+    for rel_path, inc_info in (file_info.get("include") or {}).items():
+        inc_url = inc_info.get("url") if isinstance(inc_info, dict) else None
+        if inc_url:
+            jobs.append((rel_path, inc_info, _safe_dest(root, rel_path)))
+    return jobs
+
+
+def _include_workers() -> int:
+    import os
+
+    try:
+        return max(1, int(os.environ.get("BLENDER_MCP_INCLUDE_WORKERS", 8)))
+    except ValueError:
+        return 8
+
+
+def _fetch_all(
+    jobs: list[tuple[str, Dict[str, Any], str]],
+    sess: requests.sessions.Session,
+    max_workers: Optional[int],
+) -> Dict[str, float]:
+    """Fetch every (name, info, dest) job concurrently; seconds spent per name."""
+    import contextvars
+    import functools
+    import os
+    import time
+    from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+
+    def _one(name: str, info: Dict[str, Any], dest: str) -> tuple[str, float]:
+        started = time.perf_counter()
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        _fetch_to(info, dest, sess)
+        return name, time.perf_counter() - started
+
+    workers = min(max_workers or _include_workers(), len(jobs))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="blender-mcp-include") as pool:
+        # Each task runs in a copy of the caller's context (progress reporting)
+        futures = [
+            pool.submit(functools.partial(contextvars.copy_context().run, _one, name, info, dest))
+            for name, info, dest in jobs
+        ]
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        for fut in pending:
+            fut.cancel()
+        return dict(f.result() for f in futures if f in done)
+
+
+def prepare_model_files(
+    file_info: Dict[str, Any],
+    *,
+    base_temp_dir: Optional[str] = None,
+    session: Optional[requests.sessions.Session] = None,
+    max_workers: Optional[int] = None,
+    timings: Optional[Dict[str, float]] = None,
+) -> tuple[str, str]:
+    """Download main model file and any included files to a temporary dir.
+
+    Returns (temp_dir, main_file_path). Without `base_temp_dir` the files go
+    to a new ``polyhaven`` workspace dir, removed again if a download fails.
+
+    file_info is expected to contain at least a 'url' key and optionally an
+    'include' mapping where keys are relative paths and values contain 'url'.
+
+    The main file and includes are fetched concurrently over one pooled
+    session, at most `max_workers` at a time (``BLENDER_MCP_INCLUDE_WORKERS``,
+    default 8). Paths escaping the temp dir are rejected before any
+    download. The ``md5`` and ``size`` listed for each file are verified.
+    When given, `timings` receives the seconds spent per file (keyed by
+    relative path) plus ``"total"``.
+    """
+    import time
+
+    # Main file
+    main_url = file_info.get("url")
+    if not main_url:
+        raise RuntimeError("No main file URL in file_info")
+
+    ws = None
+    temp_dir = base_temp_dir
+    if not temp_dir:
+        ws = get_workspace()
+        temp_dir = ws.mkdtemp(prefix="blender_mcp_", provider="polyhaven")
+    sess = session if session is not None else get_session()
+
+    started = time.perf_counter()
+    try:
+        # Validate every path before downloading anything
+        jobs = _model_jobs(file_info, temp_dir)
+        main_path = jobs[0][2]
+        per_file = _fetch_all(jobs, sess, max_workers)
+    except BaseException:
+        if ws is not None:
+            ws.discard(temp_dir)
+        raise
+    if ws is not None:
+        ws.hand_off(temp_dir)
+    if timings is not None:
+        timings.update(per_file)
+        timings["total"] = time.perf_counter() - started
+
+    return temp_dir, main_path
+
+
+def prepare_texture_maps(
+    files_data: Dict[str, Any],
+    asset_id: str,
+    resolution: str = "1k",
+    file_format: str = "jpg",
+    *,
+    maps: Sequence[str] = MATERIAL_MAPS,
+    base_temp_dir: Optional[str] = None,
+    session: Optional[requests.sessions.Session] = None,
+    max_workers: Optional[int] = None,
+) -> tuple[str, Dict[str, str]]:
+    """Download only the texture maps a material uses, instead of the archive.
+
+    Returns (temp_dir, {map_name: path}). Files are named
+    ``<asset_id>_<map_name>.<ext>`` so Blender image names follow the
+    ``<texture_id>_<map>`` convention `set_texture` looks for. Maps missing
+    from `files_data` are skipped; none at all raises RuntimeError.
+
+    Downloads run in parallel like `prepare_model_files` (same worker
+    limit, checks and workspace handling).
+    """
+    import os
+
+    found = find_texture_map_files(files_data, resolution, file_format, maps)
+    if not found:
+        raise RuntimeError(f"No {', '.join(maps)} maps at {resolution} {file_format} for {asset_id}")
+
+    ws = None
+    temp_dir = base_temp_dir
+    if not temp_dir:
+        ws = get_workspace()
+        temp_dir = ws.mkdtemp(prefix="blender_mcp_", provider="polyhaven")
+    sess = session if session is not None else get_session()
+
+    try:
+        jobs = []
+        for name, info in found.items():
+            ext = os.path.splitext(info["url"].split("?")[0])[1] or f".{file_format}"
+            jobs.append((name, info, _safe_dest(temp_dir, f"{asset_id}_{name}{ext}")))
+        _fetch_all(jobs, sess, max_workers)
+    except BaseException:
+        if ws is not None:
+            ws.discard(temp_dir)
+        raise
+    if ws is not None:
+        ws.hand_off(temp_dir)
+    return temp_dir, {name: dest for name, _, dest in jobs}
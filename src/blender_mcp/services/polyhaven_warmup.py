@@ -0,0 +1,168 @@
+"""Startup warm-up and learned prefetch for PolyHaven metadata.
+
+The first search, category listing or download after a restart used to
+pay for every PolyHaven round trip. When the server starts, a daemon
+thread now warms the caches up instead:
+
+- the catalog snapshot (see `polyhaven_catalog`) is fetched if missing,
+  which answers category listings for every asset type
+- the ``/files`` metadata of the ``top`` most downloaded assets, plus the
+  ``learned`` assets agents requested most in earlier sessions, is loaded
+  into the catalog's metadata cache by ``workers`` threads
+- the ``1k`` archives of the learned assets are prefetched into the asset
+  cache with the ``bulk`` download priority, so they never compete with
+  interactive downloads (skipped when the asset cache is disabled)
+
+Everything stops once ``budget`` seconds have passed; work not started by
+then is dropped. Failures are logged and never affect startup.
+
+Configuration (environment):
+
+- ``BLENDER_MCP_WARMUP``: ``0`` disables the warm-up
+- ``BLENDER_MCP_WARMUP_TOP``: most downloaded assets to load metadata for (50)
+- ``BLENDER_MCP_WARMUP_LEARNED``: most requested assets to prefetch (20)
+- ``BLENDER_MCP_WARMUP_WORKERS``: concurrent requests (4)
+- ``BLENDER_MCP_WARMUP_BUDGET``: seconds before the warm-up gives up (30)
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from blender_mcp import download_scheduler
+
+from . import polyhaven_catalog
+from .polyhaven_catalog import PolyHavenCatalog
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP = 50
+DEFAULT_LEARNED = 20
+DEFAULT_WORKERS = 4
+DEFAULT_BUDGET = 30.0
+PREFETCH_RESOLUTION = "1k"
+
+
+def _prefetch_archive(asset_id: str, asset_type: str) -> None:
+    from blender_mcp.asset_cache import get_asset_cache
+
+    from .polyhaven import download_asset
+
+    if get_asset_cache() is None:
+        return  # nothing would outlive the download
+    with download_scheduler.download_priority("bulk"):
+        result = download_asset(asset_id=asset_id, asset_type=asset_type, resolution=PREFETCH_RESOLUTION)
+    if result.get("error"):
+        raise RuntimeError(result["error"])
+
+
+def _run_jobs(jobs: List[Callable[[], object]], workers: int, deadline: float) -> Dict[str, int]:
+    """Run `jobs` on `workers` threads until `deadline` (monotonic)."""
+    report = {"done": 0, "failed": 0, "skipped": 0}
+    if not jobs:
+        return report
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="blender-mcp-warmup")
+    futures = [pool.submit(contextvars.copy_context().run, job) for job in jobs]
+    try:
+        for fut in concurrent.futures.as_completed(futures, timeout=max(0.0, deadline - time.monotonic())):
+            if fut.exception() is None:
+                report["done"] += 1
+            else:
+                report["failed"] += 1
+                logger.debug("polyhaven warm-up job failed", exc_info=fut.exception())
+    except concurrent.futures.TimeoutError:
+        pass
+    finally:
+        # Out of budget: drop what has not started; running jobs finish in the background
+        pool.shutdown(wait=False, cancel_futures=True)
+    report["skipped"] = len(jobs) - report["done"] - report["failed"]
+    return report
+
+
+def warm_up(
+    catalog: PolyHavenCatalog,
+    *,
+    top: int = DEFAULT_TOP,
+    learned: int = DEFAULT_LEARNED,
+    workers: int = DEFAULT_WORKERS,
+    budget: float = DEFAULT_BUDGET,
+    prefetch: Callable[[str, str], None] = _prefetch_archive,
+) -> Dict[str, Any]:
+    """Fill the catalog and metadata caches; return what was done."""
+    deadline = time.monotonic() + budget
+    report: Dict[str, Any] = {"catalog": "cached"}
+    if not catalog.has_snapshot():
+        try:
+            catalog.refresh()
+            report["catalog"] = "fetched"
+        except Exception:
+            logger.warning("polyhaven warm-up: catalog unavailable", exc_info=True)
+            report["catalog"] = "failed"
+
+    requested = catalog.most_requested(learned) if learned > 0 else []
+    ids = list(dict.fromkeys([a for a, _ in requested] + catalog.most_downloaded(max(0, top))))
+    files_jobs: List[Callable[[], object]] = [
+        functools.partial(catalog.files, a) for a in ids if catalog.cached_files(a) is None
+    ]
+    report["files"] = _run_jobs(files_jobs, workers, deadline)
+    prefetch_jobs: List[Callable[[], object]] = [
+        functools.partial(prefetch, a, entry.get("asset_type") or "models") for a, entry in requested
+    ]
+    report["prefetch"] = _run_jobs(prefetch_jobs, workers, deadline)
+    report["elapsed_s"] = round(budget - max(0.0, deadline - time.monotonic()), 3)
+    logger.info("polyhaven warm-up: %s", report)
+    return report
+
+
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def start_warm_up() -> Optional[threading.Thread]:
+    """Warm up once per process on a daemon thread; None when disabled."""
+    global _thread
+    if os.environ.get("BLENDER_MCP_WARMUP", "1").lower() in {"0", "false", "no", "off"}:
+        return None
+    catalog = polyhaven_catalog.get_catalog()
+    if catalog is None:
+        return None
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(
+                target=warm_up,
+                args=(catalog,),
+                kwargs={
+                    "top": int(_env_number("BLENDER_MCP_WARMUP_TOP", DEFAULT_TOP)),
+                    "learned": int(_env_number("BLENDER_MCP_WARMUP_LEARNED", DEFAULT_LEARNED)),
+                    "workers": int(_env_number("BLENDER_MCP_WARMUP_WORKERS", DEFAULT_WORKERS)),
+                    "budget": _env_number("BLENDER_MCP_WARMUP_BUDGET", DEFAULT_BUDGET),
+                },
+                name="blender-mcp-polyhaven-warmup",
+                daemon=True,
+            )
+            _thread.start()
+        return _thread
+
+
+def reset_warm_up() -> None:
+    """Allow `start_warm_up` to run again (for tests)."""
+    global _thread
+    with _lock:
+        _thread = None
+
+
+__all__ = ["warm_up", "start_warm_up", "reset_warm_up"]
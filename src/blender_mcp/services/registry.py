@@ -34,13 +34,28 @@ from .polyhaven_status import get_polyhaven_status_service
 
 # --- Nouveau registre générique de services ---
 _SERVICES: dict[str, Any] = {}
+# Compteur incrémenté à chaque modification du registre (catalogues dérivés, ETag)
+_VERSION = 0
 
 def register_service(name: str, fn: Any) -> None:
     """Enregistrer une fonction de service générique.
 
     Overwrite implicite (nous privilégions idempotence pour phase migration).
     """
-    _SERVICES[name] = fn
+    global _VERSION
+    if _SERVICES.get(name) is not fn:
+        _SERVICES[name] = fn
+        _VERSION += 1
+
+def unregister_service(name: str) -> None:
+    """Retirer un service (no-op s'il n'est pas enregistré)."""
+    global _VERSION
+    if _SERVICES.pop(name, None) is not None:
+        _VERSION += 1
+
+def registry_version() -> int:
+    """Version courante du registre; change à chaque (dés)enregistrement."""
+    return _VERSION
 
 def get_service(name: str) -> Any:
     return _SERVICES.get(name)
@@ -67,6 +82,7 @@ register_service("get_sketchfab_status", sketchfab.get_sketchfab_status_service)
 register_service("search_sketchfab_models", sketchfab.search_sketchfab_models)
 register_service("download_sketchfab_model", sketchfab.download_sketchfab_model)
 register_service("set_texture", textures_service.set_texture)
+register_service("get_texture_upgrade_status", textures_service.get_texture_upgrade_status)
 register_service("get_polyhaven_status", get_polyhaven_status_service)
 register_service("get_hyper3d_status", get_hyper3d_status_service)
 register_service("generate_hyper3d_model_via_text", hyper3d_service.generate_hyper3d_model_via_text)
@@ -79,7 +95,7 @@ register_service("asset_creation_strategy", prompts_service.asset_creation_strat
 
 def _get_polyhaven_categories(asset_type: str = "hdris") -> Dict[str, Any]:
     try:
-        return polyhaven.fetch_categories(asset_type=asset_type)
+        return polyhaven.list_categories(asset_type=asset_type)
     except Exception as e:
         return {"error": str(e)}
 
@@ -91,9 +107,7 @@ def _search_polyhaven_assets(
     per_page: int = 50,
 ) -> Dict[str, Any]:
     try:
-        return polyhaven.search_assets_network(
-            asset_type=asset_type, categories=categories, page=page, per_page=per_page
-        )
+        return polyhaven.find_assets(asset_type=asset_type, categories=categories, page=page, per_page=per_page)
     except Exception as e:
         return {"error": str(e)}
 
@@ -174,6 +188,8 @@ __all__ = [
     "register_default_handlers",
     # nouveau registre
     "register_service",
+    "unregister_service",
+    "registry_version",
     "get_service",
     "list_services",
     "has_service",
@@ -8,10 +8,20 @@ Sketchfab API key is available.
 import os
 from typing import Any, Dict, Optional
 
-from blender_mcp.errors import ExternalServiceError, InvalidParamsError
+from blender_mcp.dispatchers.singleflight import coalescable
+from blender_mcp.errors import CircuitOpenError, ExternalServiceError, InvalidParamsError
 
+from .. import circuit_breaker, progress
 from .. import sketchfab as _sketchfab
 
+# Shared breaker name: network calls below fail fast while Sketchfab is down.
+_UPSTREAM = "sketchfab"
+
+
+def _guarded(fn: Any, *args: Any, **kwargs: Any) -> Any:
+    # Helpers also report upstream errors as payloads; those count as failures too
+    return circuit_breaker.get_breaker(_UPSTREAM).call_checked(fn, circuit_breaker.is_failure_payload, *args, **kwargs)
+
 
 def get_sketchfab_status_service(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Service: return Sketchfab status for an API key.
@@ -43,7 +53,8 @@ def search_models(
     count: int = 20,
     downloadable: bool = True,
 ) -> Dict[str, Any]:
-    return _sketchfab.search_models(
+    return _guarded(
+        _sketchfab.search_models,
         api_key,
         query,
         categories=categories,
@@ -53,7 +64,7 @@ def search_models(
 
 
 def download_model(api_key: str, uid: str) -> Dict[str, Any]:
-    return _sketchfab.download_model(api_key, uid)
+    return _guarded(_sketchfab.download_model, api_key, uid)
 
 
 def _resolve_api_key(p: Dict[str, Any]) -> str:
@@ -65,6 +76,7 @@ def _resolve_api_key(p: Dict[str, Any]) -> str:
     return api_key
 
 
+@coalescable()
 def search_sketchfab_models(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Service: search Sketchfab models (exceptions-first).
 
@@ -88,7 +100,11 @@ def search_sketchfab_models(params: Optional[Dict[str, Any]] = None) -> Dict[str
         raise InvalidParamsError("'downloadable' must be a boolean")
 
     try:
-        data = _sketchfab.search_models(api_key, query, categories=categories, count=count, downloadable=downloadable)
+        data = _guarded(
+            _sketchfab.search_models, api_key, query, categories=categories, count=count, downloadable=downloadable
+        )
+    except CircuitOpenError:
+        raise
     except Exception as e:  # pragma: no cover
         raise ExternalServiceError(str(e))
     if data.get("error"):
@@ -107,8 +123,11 @@ def download_sketchfab_model(params: Optional[Dict[str, Any]] = None) -> Dict[st
     uid = p.get("uid")
     if not isinstance(uid, str) or not uid:
         raise InvalidParamsError("missing or invalid 'uid'")
+    progress.report_progress("download", uid=uid)
     try:
-        data = _sketchfab.download_model(api_key, uid)
+        data = _guarded(_sketchfab.download_model, api_key, uid)
+    except CircuitOpenError:
+        raise
     except Exception as e:  # pragma: no cover
         raise ExternalServiceError(str(e))
     if data.get("error"):
@@ -0,0 +1,201 @@
+"""Background resolution upgrades for progressively loaded textures.
+
+With ``progressive`` set, `set_texture` applies a PolyHaven texture from
+its ``1k`` maps right away (see `services.addon.textures`) and hands the
+higher resolution to this module:
+
+- the maps the material uses are downloaded at the target resolution on a
+  daemon thread, with the ``bulk`` download priority so interactive
+  downloads go first
+- the image of each texture node of the material is then swapped for the
+  new file on Blender's main thread (nodes are found through
+  `materials.spec.build_material_spec`, which named them)
+- one upgrade per texture at a time: asking again while one is in
+  progress returns the running upgrade instead of starting another
+- every upgrade keeps its state (``downloading``, ``swapping``, ``done``
+  or ``failed``), timings and error (`status`, served by the
+  ``get_texture_upgrade_status`` service)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from blender_mcp import download_scheduler
+from blender_mcp.materials.spec import build_material_spec
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_RESOLUTION = "1k"
+SWAP_TIMEOUT = 120.0
+ACTIVE_STATES = ("downloading", "swapping")
+
+Download = Callable[[str, str, str, Sequence[str]], Dict[str, str]]
+Swap = Callable[[str, Dict[str, str]], None]
+
+
+def image_swaps(paths: Dict[str, str]) -> Dict[str, Tuple[str, str]]:
+    """Texture node id -> (map name, path) for a material built from `paths`."""
+    by_path = {path: name for name, path in paths.items()}
+    spec = build_material_spec(dict(paths))
+    return {n["id"]: (by_path[n["image"]], n["image"]) for n in spec["nodes"] if n.get("image") in by_path}
+
+
+def _download_maps(texture_id: str, resolution: str, file_format: str, maps: Sequence[str]) -> Dict[str, str]:
+    from .polyhaven import download_asset
+
+    res = download_asset(
+        asset_id=texture_id, asset_type="textures", resolution=resolution, file_format=file_format, maps=list(maps)
+    )
+    if res.get("error"):
+        raise RuntimeError(res["error"])
+    return res["maps"]
+
+
+def _swap_in_blender(material_name: str, paths: Dict[str, str]) -> None:
+    """Run the swap on Blender's main thread (bpy is not thread-safe) and wait."""
+    import bpy  # type: ignore
+
+    from .addon.textures import swap_texture_images
+
+    done = threading.Event()
+    outcome: Dict[str, BaseException] = {}
+
+    def _on_main() -> None:
+        try:
+            swap_texture_images(material_name, paths)
+        except Exception as e:
+            outcome["error"] = e
+        finally:
+            done.set()
+
+    # The timer returns None, so it runs once
+    bpy.app.timers.register(_on_main, first_interval=0.0)
+    if not done.wait(SWAP_TIMEOUT):
+        raise TimeoutError(f"image swap for {material_name} not run within {SWAP_TIMEOUT:.0f}s")
+    if "error" in outcome:
+        raise outcome["error"]
+
+
+class TextureUpgrades:
+    """One background resolution upgrade per texture, with its status."""
+
+    def __init__(
+        self,
+        *,
+        download: Download = _download_maps,
+        swap: Swap = _swap_in_blender,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._download = download
+        self._swap = swap
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._threads: Dict[str, threading.Thread] = {}
+
+    def start(
+        self,
+        texture_id: str,
+        material_name: str,
+        resolution: str,
+        *,
+        maps: Sequence[str],
+        file_format: str = "jpg",
+    ) -> Dict[str, Any]:
+        """Upgrade `material_name` to `resolution` in the background; its status.
+
+        While an upgrade of `texture_id` is in progress, no new one is
+        started and the running one is returned (``already_running``).
+        """
+        with self._lock:
+            job = self._jobs.get(texture_id)
+            if job is not None and job["state"] in ACTIVE_STATES:
+                return dict(self._view(job), already_running=True)
+            job = {
+                "texture_id": texture_id,
+                "material": material_name,
+                "resolution": resolution,
+                "maps": list(maps),
+                "state": "downloading",
+                "started_at": self._clock(),
+                "finished_at": None,
+                "error": None,
+            }
+            self._jobs[texture_id] = job
+            thread = threading.Thread(
+                target=self._run,
+                args=(job, file_format),
+                name=f"blender-mcp-texture-upgrade-{texture_id}",
+                daemon=True,
+            )
+            self._threads[texture_id] = thread
+            status = self._view(job)
+        thread.start()
+        return status
+
+    def _update(self, job: Dict[str, Any], **changes: Any) -> None:
+        with self._lock:
+            job.update(changes)
+
+    def _run(self, job: Dict[str, Any], file_format: str) -> None:
+        try:
+            with download_scheduler.download_priority("bulk"):
+                paths = self._download(job["texture_id"], job["resolution"], file_format, job["maps"])
+            self._update(job, state="swapping")
+            self._swap(job["material"], paths)
+            self._update(job, state="done", finished_at=self._clock())
+        except Exception as e:
+            logger.warning("texture upgrade of %s failed", job["texture_id"], exc_info=True)
+            self._update(job, state="failed", error=str(e), finished_at=self._clock())
+
+    def wait(self, texture_id: str, timeout: Optional[float] = None) -> None:
+        """Block until the current upgrade of `texture_id` finishes (for tests)."""
+        with self._lock:
+            thread = self._threads.get(texture_id)
+        if thread is not None:
+            thread.join(timeout)
+
+    def status(self, texture_id: Optional[str] = None) -> Dict[str, Any]:
+        """Status of one texture's upgrade ({} if none), or of all of them."""
+        with self._lock:
+            if texture_id is not None:
+                job = self._jobs.get(texture_id)
+                return self._view(job) if job is not None else {}
+            return {tid: self._view(job) for tid, job in self._jobs.items()}
+
+    def _view(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        end = job["finished_at"] if job["finished_at"] is not None else self._clock()
+        return dict(job, elapsed_s=round(end - job["started_at"], 3))
+
+
+_default: Optional[TextureUpgrades] = None
+_default_lock = threading.Lock()
+
+
+def get_texture_upgrades() -> TextureUpgrades:
+    """Return the process-wide upgrade manager."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = TextureUpgrades()
+        return _default
+
+
+def reset_texture_upgrades() -> None:
+    """Forget the shared manager (for tests); running upgrades finish unobserved."""
+    global _default
+    with _default_lock:
+        _default = None
+
+
+__all__ = [
+    "PREVIEW_RESOLUTION",
+    "TextureUpgrades",
+    "get_texture_upgrades",
+    "image_swaps",
+    "reset_texture_upgrades",
+]
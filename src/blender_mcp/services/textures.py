@@ -1,17 +1,19 @@
 """Service-facing wrapper for texture operations.
 
 Exceptions-first canonical service that validates params, delegates to
-`services.addon.textures.set_texture` and normalizes responses.
+`services.addon.textures.set_texture` and normalizes responses. Progressive
+upgrades are reported by `get_texture_upgrade_status`.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from blender_mcp.errors import HandlerError, InvalidParamsError
 
 from .addon.textures import set_texture as _addon_set_texture
+from .texture_upgrades import get_texture_upgrades
 
 logger = logging.getLogger(__name__)
 
@@ -19,21 +21,21 @@ logger = logging.getLogger(__name__)
 def set_texture(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Service wrapper for applying a texture to an object.
 
-    Expects params: {"object_name": str, "texture_id": str}
-    Returns success dict with either {material} or {images}.
+    Expects params: {"object_name": str, "texture_id": str,
+                     "progressive": bool (optional), "resolution": str (optional, "4k")}
+    Returns success dict with either {material} or {images}. With
+    `progressive`, the 1k maps are applied at once, `resolution` follows in
+    the background, and the result also has {maps, upgrade}.
 
     Raises InvalidParamsError for bad input and HandlerError for addon failures.
     """
-    p = params or {}
-    object_name = p.get("object_name")
-    texture_id = p.get("texture_id")
-    if not isinstance(object_name, str) or not object_name:
-        raise InvalidParamsError("missing or invalid 'object_name'")
-    if not isinstance(texture_id, str) or not texture_id:
-        raise InvalidParamsError("missing or invalid 'texture_id'")
+    object_name, texture_id, progressive, resolution = _validate_set_texture(params or {})
 
     try:
-        addon_resp = _addon_set_texture(object_name, texture_id)
+        if progressive:
+            addon_resp = _addon_set_texture(object_name, texture_id, progressive=True, resolution=resolution)
+        else:
+            addon_resp = _addon_set_texture(object_name, texture_id)
     except Exception as e:  # pragma: no cover - defensive boundary
         logger.exception("addon set_texture failed")
         raise HandlerError("set_texture", e)
@@ -42,7 +44,10 @@ def set_texture(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         raise HandlerError("set_texture", Exception(str(addon_resp.get("error"))))
 
     if addon_resp.get("success"):
-        return {"status": "success", "result": {"material": addon_resp.get("material")}}
+        result: Dict[str, Any] = {"material": addon_resp.get("material")}
+        if progressive:
+            result.update(maps=addon_resp.get("maps"), upgrade=addon_resp.get("upgrade"))
+        return {"status": "success", "result": result}
 
     if "images" in addon_resp:
         return {"status": "success", "result": {"images": addon_resp.get("images")}}
@@ -50,4 +55,37 @@ def set_texture(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     raise HandlerError("set_texture", Exception("unexpected addon response"))
 
 
-__all__ = ["set_texture"]
+def _validate_set_texture(p: Dict[str, Any]) -> Tuple[str, str, bool, Optional[str]]:
+    object_name = p.get("object_name")
+    texture_id = p.get("texture_id")
+    progressive = p.get("progressive", False)
+    resolution = p.get("resolution")
+    if not isinstance(object_name, str) or not object_name:
+        raise InvalidParamsError("missing or invalid 'object_name'")
+    if not isinstance(texture_id, str) or not texture_id:
+        raise InvalidParamsError("missing or invalid 'texture_id'")
+    if not isinstance(progressive, bool):
+        raise InvalidParamsError("'progressive' must be a boolean if provided")
+    if resolution is not None and not isinstance(resolution, str):
+        raise InvalidParamsError("'resolution' must be a string if provided")
+    return object_name, texture_id, progressive, resolution
+
+
+def get_texture_upgrade_status(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Service: report progressive texture upgrades.
+
+    Expects params: {"texture_id": str (optional)}
+    Returns {"upgrade": {...}} for one texture ({} if none was started),
+    otherwise {"upgrades": {texture_id: {...}}}.
+    """
+    p = params or {}
+    texture_id = p.get("texture_id")
+    if texture_id is not None and (not isinstance(texture_id, str) or not texture_id):
+        raise InvalidParamsError("'texture_id' must be a non-empty string if provided")
+    upgrades = get_texture_upgrades()
+    if texture_id is not None:
+        return {"status": "success", "result": {"upgrade": upgrades.status(texture_id)}}
+    return {"status": "success", "result": {"upgrades": upgrades.status()}}
+
+
+__all__ = ["set_texture", "get_texture_upgrade_status"]
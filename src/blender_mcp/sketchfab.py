@@ -22,7 +22,10 @@ _warnings.warn(
     stacklevel=2,
 )
 
-from . import downloaders  # type: ignore
+from . import circuit_breaker, downloaders  # type: ignore
+from .asset_cache import get_asset_cache
+from .http import get_session
+from .workspace import using_provider
 
 # Base endpoints can be overridden in tests by passing a session that wraps
 # the desired base URL. Keeping them as module constants makes the helpers
@@ -46,10 +49,8 @@ def get_sketchfab_status(api_key: Optional[str], session: Optional[requests.Sess
 
     headers = {"Authorization": f"Token {api_key}"}
     try:
-        if session is None:
-            resp = requests.get(SKETCHFAB_ME_ENDPOINT, headers=headers, timeout=10)
-        else:
-            resp = session.get(SKETCHFAB_ME_ENDPOINT, headers=headers, timeout=10)
+        sess = session if session is not None else get_session()
+        resp = sess.get(SKETCHFAB_ME_ENDPOINT, headers=headers, timeout=10)
         if resp.status_code == 200:
             data = resp.json()
             username = data.get("username", "Unknown user")
@@ -82,14 +83,12 @@ def search_models(
 
     # requests expects params values to be strings or sequences; coerce to strings to satisfy type checkers
     params_cast = {k: str(v) for k, v in params.items() if v is not None}
-    if session is None:
-        resp = requests.get(SKETCHFAB_SEARCH_ENDPOINT, headers=headers, params=params_cast, timeout=30)
-    else:
-        resp = session.get(SKETCHFAB_SEARCH_ENDPOINT, headers=headers, params=params_cast, timeout=30)
+    sess = session if session is not None else get_session()
+    resp = sess.get(SKETCHFAB_SEARCH_ENDPOINT, headers=headers, params=params_cast, timeout=30)
     if resp.status_code == 401:
-        return {"error": "Authentication failed (401)"}
+        return {"error": "Authentication failed (401)", "status_code": 401}
     if resp.status_code != 200:
-        return {"error": f"API request failed with status code {resp.status_code}"}
+        return {"error": f"API request failed with status code {resp.status_code}", "status_code": resp.status_code}
 
     try:
         data = resp.json()
@@ -99,40 +98,61 @@ def search_models(
     return data
 
 
+def _extract_kwargs(
+    session: Optional[requests.Session], cache_key: Optional[str], size: Optional[int]
+) -> Dict[str, Any]:
+    # Only forward optional arguments when set, so simple stand-ins keep working
+    kwargs: Dict[str, Any] = {"timeout": 60}
+    if session is not None:
+        kwargs["session"] = session
+    if cache_key is not None:
+        kwargs["key"] = cache_key
+    if isinstance(size, int) and size > 0:
+        # Archive size reported by Sketchfab: a truncated zip fails while streaming
+        kwargs["expected_size"] = size
+    return kwargs
+
+
 def download_model(api_key: str, uid: str, session: Optional[requests.Session] = None) -> Dict[str, Any]:
     """Download a model by uid and extract it into a temp dir.
 
     Returns a dict with either 'error' or 'temp_dir' (path to extracted files).
     """
+    # Download links are signed per request: cache the archive under the uid.
+    # The download request below always runs, so Sketchfab checks the key
+    # even when the archive itself is served from the cache.
+    cache = get_asset_cache()
+    cache_key = f"sketchfab:{uid}"
+
     headers = {"Authorization": f"Token {api_key}"}
     download_endpoint = f"https://api.sketchfab.com/v3/models/{uid}/download"
 
-    if session is None:
-        resp = requests.get(download_endpoint, headers=headers, timeout=30)
-    else:
-        resp = session.get(download_endpoint, headers=headers, timeout=30)
+    sess = session if session is not None else get_session()
+    resp = sess.get(download_endpoint, headers=headers, timeout=30)
     if resp.status_code == 401:
-        return {"error": "Authentication failed (401)"}
+        return {"error": "Authentication failed (401)", "status_code": 401}
     if resp.status_code != 200:
-        return {"error": f"Download request failed with status code {resp.status_code}"}
+        code = resp.status_code
+        return {"error": f"Download request failed with status code {code}", "status_code": code}
 
     data = resp.json()
     gltf = data.get("gltf")
     if not gltf or not isinstance(gltf, dict):
-        return {"error": "No gltf download available for this model"}
+        return {"error": "No gltf download available for this model", "status_code": resp.status_code}
 
     download_url = gltf.get("url")
     if not download_url:
-        return {"error": "No download URL found in Sketchfab response"}
+        return {"error": "No download URL found in Sketchfab response", "status_code": resp.status_code}
 
     # Prefer centralized downloader; it may raise on non-200
     try:
-        if session is None:
-            zip_bytes = downloaders.download_bytes(download_url, timeout=60)
-        else:
-            zip_bytes = downloaders.download_bytes(download_url, timeout=60, session=session)
-        temp_dir = downloaders.secure_extract_zip_bytes(zip_bytes)
+        # Stream to disk and extract from the file: the zip never sits in memory
+        with using_provider("sketchfab"):
+            temp_dir = downloaders.download_and_extract_zip(
+                download_url, **_extract_kwargs(session, cache_key if cache is not None else None, gltf.get("size"))
+            )
         return {"temp_dir": temp_dir}
     except Exception as e:
-        # Surface the error to caller for appropriate handling
-        return {"error": str(e)}
+        # Surface the error to caller for appropriate handling; the flag lets
+        # the circuit breaker tell an outage from a local failure
+        return {"error": str(e), "upstream_failure": circuit_breaker.is_upstream_failure(e)}
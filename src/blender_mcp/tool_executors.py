@@ -0,0 +1,345 @@
+"""Dedicated, bounded executors for sync tools.
+
+Sync tools used to share the event loop's default executor, so a burst of
+slow downloads could occupy every worker and starve quick Blender calls
+such as `get_scene_info`. Tools are now split into classes, each with its
+own sized `ThreadPoolExecutor`:
+
+- ``blender-io``: calls that talk to the Blender addon (default class)
+- ``network-io``: provider calls (PolyHaven, Sketchfab, Hyper3D, downloads)
+- ``cpu``: pure-Python computation
+
+Each tool also has a concurrency limit and a bounded wait queue. When the
+queue is full the call is rejected immediately with `ServiceBusyError`
+(mapped to HTTP 503 with a ``Retry-After`` hint) instead of piling up.
+Queue-wait and run time are recorded separately per tool.
+
+Configuration (environment):
+
+- ``BLENDER_MCP_EXECUTOR_BLENDER_IO_WORKERS`` / ``..._NETWORK_IO_WORKERS`` /
+  ``..._CPU_WORKERS``: pool sizes
+- ``BLENDER_MCP_TOOL_QUEUE_SIZE``: default per-tool queue size (64)
+- ``BLENDER_MCP_TOOL_LIMITS``: per-tool overrides, e.g.
+  ``download_polyhaven_asset=2/16,get_scene_info=1`` (concurrency/queue)
+
+Tools can also declare their class with the `tool_class` decorator.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from .errors import ServiceBusyError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+BLENDER_IO = "blender-io"
+NETWORK_IO = "network-io"
+CPU = "cpu"
+TOOL_CLASSES = (BLENDER_IO, NETWORK_IO, CPU)
+
+TOOL_CLASS_ATTR = "__blender_mcp_tool_class__"
+
+# Tool names containing one of these are provider calls unless declared otherwise.
+_NETWORK_HINTS = ("polyhaven", "sketchfab", "hyper3d", "rodin", "download")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _default_workers(tool_cls: str) -> int:
+    defaults = {BLENDER_IO: 4, NETWORK_IO: 16, CPU: min(4, os.cpu_count() or 1)}
+    env = "BLENDER_MCP_EXECUTOR_" + tool_cls.upper().replace("-", "_") + "_WORKERS"
+    return _env_int(env, defaults[tool_cls])
+
+
+def _parse_limits(spec: str) -> Dict[str, Tuple[int, Optional[int]]]:
+    """Parse ``name=concurrency[/queue],...`` into a mapping."""
+    out: Dict[str, Tuple[int, Optional[int]]] = {}
+    for part in spec.split(","):
+        name, sep, value = part.strip().partition("=")
+        if not sep or not name:
+            continue
+        conc, _, queue = value.partition("/")
+        try:
+            out[name.strip()] = (max(1, int(conc)), max(0, int(queue)) if queue else None)
+        except ValueError:
+            logger.warning("ignoring invalid BLENDER_MCP_TOOL_LIMITS entry %r", part)
+    return out
+
+
+def tool_class(cls: str) -> Callable[[T], T]:
+    """Declare the executor class of a tool function."""
+    if cls not in TOOL_CLASSES:
+        raise ValueError(f"tool class must be one of: {', '.join(TOOL_CLASSES)}")
+
+    def _mark(fn: T) -> T:
+        setattr(fn, TOOL_CLASS_ATTR, cls)
+        return fn
+
+    return _mark
+
+
+def classify(name: str, fn: Any = None) -> str:
+    """Return the executor class of tool `name` (declared, then by name)."""
+    declared = getattr(fn, TOOL_CLASS_ATTR, None)
+    if declared in TOOL_CLASSES:
+        return declared
+    lowered = name.lower()
+    if any(hint in lowered for hint in _NETWORK_HINTS):
+        return NETWORK_IO
+    return BLENDER_IO
+
+
+class _Timing:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def as_dict(self) -> Dict[str, float]:
+        avg = self.total / self.count if self.count else 0.0
+        return {"count": self.count, "avg_s": round(avg, 6), "max_s": round(self.max, 6)}
+
+
+class ToolGate:
+    """Per-tool concurrency limit with a bounded FIFO wait queue.
+
+    Waiters are futures of the caller's event loop and are woken with
+    `call_soon_threadsafe`, so the gate works from any loop or thread.
+    """
+
+    def __init__(self, name: str, tool_cls: str, max_concurrency: int, max_queue: int) -> None:
+        self.name = name
+        self.tool_cls = tool_cls
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._running = 0
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = collections.deque()
+        self.queue_wait = _Timing()
+        self.run_time = _Timing()
+        self.rejected = 0
+        self.errors = 0
+
+    def retry_after(self) -> float:
+        """Rough seconds until a slot frees up, from the average run time."""
+        avg = self.run_time.total / self.run_time.count if self.run_time.count else 1.0
+        ahead = len(self._waiters) + 1
+        return float(max(1, math.ceil(avg * ahead / self.max_concurrency)))
+
+    async def acquire(self) -> None:
+        with self._lock:
+            if self._running < self.max_concurrency:
+                self._running += 1
+                return
+            if len(self._waiters) >= self.max_queue:
+                self.rejected += 1
+                raise ServiceBusyError(self.name, retry_after=self.retry_after())
+            loop = asyncio.get_running_loop()
+            entry = (loop, loop.create_future())
+            self._waiters.append(entry)
+        try:
+            await entry[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                queued = entry in self._waiters
+                if queued:
+                    self._waiters.remove(entry)
+            # Woken just before the cancellation landed: give the slot back.
+            # (If the future itself was cancelled, `_wake` passes it on.)
+            if not queued and entry[1].done() and not entry[1].cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            if self._waiters:
+                # Hand the slot over directly: `_running` stays unchanged
+                loop, fut = self._waiters.popleft()
+                loop.call_soon_threadsafe(self._wake, fut)
+                return
+            self._running -= 1
+
+    def _wake(self, fut: "asyncio.Future[None]") -> None:
+        if fut.done():
+            # Waiter was cancelled after the hand-over: pass the slot on
+            self.release()
+        else:
+            fut.set_result(None)
+
+    def record(self, queue_wait: Optional[float], run_time: Optional[float], failed: bool) -> None:
+        with self._lock:
+            if queue_wait is not None:
+                self.queue_wait.add(queue_wait)
+            if run_time is not None:
+                self.run_time.add(run_time)
+            if failed:
+                self.errors += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "class": self.tool_cls,
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": len(self._waiters),
+                "rejected": self.rejected,
+                "errors": self.errors,
+                "queue_wait": self.queue_wait.as_dict(),
+                "run": self.run_time.as_dict(),
+            }
+
+
+class ToolExecutors:
+    """Executors per tool class plus per-tool gates and metrics."""
+
+    def __init__(
+        self,
+        workers: Optional[Dict[str, int]] = None,
+        *,
+        default_queue: Optional[int] = None,
+        limits: Optional[Dict[str, Tuple[int, Optional[int]]]] = None,
+    ) -> None:
+        workers = workers or {}
+        self._workers = {cls: workers.get(cls) or _default_workers(cls) for cls in TOOL_CLASSES}
+        if default_queue is None:
+            default_queue = _env_int("BLENDER_MCP_TOOL_QUEUE_SIZE", 64)
+        if limits is None:
+            limits = _parse_limits(os.environ.get("BLENDER_MCP_TOOL_LIMITS", ""))
+        self._default_queue = default_queue
+        self._limits = dict(limits)
+        self._lock = threading.Lock()
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._gates: Dict[str, ToolGate] = {}
+
+    def executor(self, tool_cls: str) -> ThreadPoolExecutor:
+        with self._lock:
+            ex = self._executors.get(tool_cls)
+            if ex is None:
+                ex = ThreadPoolExecutor(
+                    max_workers=self._workers[tool_cls], thread_name_prefix=f"blender-mcp-{tool_cls}"
+                )
+                self._executors[tool_cls] = ex
+            return ex
+
+    def gate(self, name: str, fn: Any = None) -> ToolGate:
+        with self._lock:
+            gate = self._gates.get(name)
+            if gate is None:
+                tool_cls = classify(name, fn)
+                conc, queue = self._limits.get(name, (None, None))
+                gate = ToolGate(
+                    name,
+                    tool_cls,
+                    max_concurrency=conc or self._workers[tool_cls],
+                    max_queue=self._default_queue if queue is None else queue,
+                )
+                self._gates[name] = gate
+            return gate
+
+    def set_limit(self, name: str, max_concurrency: int, max_queue: Optional[int] = None) -> None:
+        """Override the limits of `name` (applies to its next gate creation)."""
+        with self._lock:
+            self._limits[name] = (max(1, max_concurrency), max_queue)
+            self._gates.pop(name, None)
+
+    async def run(self, name: str, fn: Callable[[], T], *, tool: Any = None) -> T:
+        """Run `fn` on the executor of tool `name`, honouring its gate.
+
+        Raises `ServiceBusyError` without running `fn` when the queue is full.
+        The gate slot is held until `fn` actually finishes, even if the
+        awaiting caller is cancelled meanwhile.
+        """
+        gate = self.gate(name, tool)
+        enqueued = time.perf_counter()
+        await gate.acquire()
+        started: list[float] = []
+
+        def _timed() -> T:
+            started.append(time.perf_counter())
+            return fn()
+
+        def _done(cf: "Future[T]") -> None:
+            finished = time.perf_counter()
+            gate.release()
+            failed = not cf.cancelled() and cf.exception() is not None
+            gate.record(started[0] - enqueued if started else None, finished - started[0] if started else None, failed)
+
+        try:
+            cf = self.executor(gate.tool_cls).submit(_timed)
+        except BaseException:
+            gate.release()
+            raise
+        cf.add_done_callback(_done)
+        return await asyncio.wrap_future(cf)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            gates = list(self._gates.values())
+            workers = dict(self._workers)
+        return {"workers": workers, "tools": {g.name: g.stats() for g in gates}}
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            executors, self._executors = self._executors, {}
+        for ex in executors.values():
+            ex.shutdown(wait=wait)
+
+
+_default: Optional[ToolExecutors] = None
+_default_lock = threading.Lock()
+
+
+def get_tool_executors() -> ToolExecutors:
+    """Return the process-wide `ToolExecutors`, creating it on first use."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = ToolExecutors()
+        return _default
+
+
+def reset_tool_executors() -> None:
+    """Drop the shared instance (for tests and config reloads)."""
+    global _default
+    with _default_lock:
+        old, _default = _default, None
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+__all__ = [
+    "BLENDER_IO",
+    "CPU",
+    "NETWORK_IO",
+    "TOOL_CLASSES",
+    "ToolExecutors",
+    "ToolGate",
+    "classify",
+    "get_tool_executors",
+    "reset_tool_executors",
+    "tool_class",
+]
@@ -0,0 +1,411 @@
+"""Managed scratch space for downloads and extractions.
+
+Temp directories and files created for downloaded assets (extracted
+archives, PolyHaven model files, Hyper3D meshes...) used to be left in
+``/tmp`` forever, so long-running servers filled the disk within days.
+Every such path is now created through the process-wide `Workspace`:
+
+- entries live under ``<root>/<provider>/`` so disk usage can be reported
+  per provider (``polyhaven``, ``sketchfab``, ``hyper3d``...); the provider
+  comes from the ``provider`` argument or the surrounding `using_provider`
+  block
+- each entry has a reference count and a last-access time; new entries
+  start held by their creator. A creator that keeps the path to itself
+  releases it once done; one that returns the path (downloads handed to
+  Blender, which keeps loading textures and assets from them) calls
+  `hand_off` instead, and the entry stays held until the consumer calls
+  `release` or deletes the path
+- unheld entries idle for longer than ``max_idle`` are removed, and least
+  recently used ones are removed while the workspace exceeds its byte
+  quota; entries released within the last ``grace`` seconds are kept
+- a background thread collects every ``gc_interval`` seconds, and a
+  release that pushes the workspace over quota collects immediately
+- leftovers of a previous process found under the root are adopted and
+  collected like any other entry; entry names carry the creating
+  process's pid and every process holds a lock file under ``.owners/``
+  while it runs, so entries of another live process sharing the root
+  (the MCP server and the Blender addon) are left alone. Untagged
+  leftovers are adopted once older than ``grace``
+
+Configuration (environment):
+
+- ``BLENDER_MCP_WORKSPACE_DIR``: root (``<tmp>/blender-mcp-workspace``)
+- ``BLENDER_MCP_WORKSPACE_BYTES``: byte quota (20 GiB)
+- ``BLENDER_MCP_WORKSPACE_MAX_IDLE``: seconds before an idle entry is removed (86400)
+- ``BLENDER_MCP_WORKSPACE_GRACE``: seconds a used entry is protected from the quota (300)
+- ``BLENDER_MCP_WORKSPACE_GC_INTERVAL``: seconds between collections, ``0`` disables (300)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 20 << 30
+DEFAULT_MAX_IDLE = 24 * 3600.0
+DEFAULT_GRACE = 300.0
+DEFAULT_GC_INTERVAL = 300.0
+DEFAULT_PROVIDER = "misc"
+OWNERS_DIR = ".owners"
+
+# Entry names are "<prefix>~<pid>~<random><suffix>"
+_OWNER_RE = re.compile(r"~(\d+)~[^~]*$")
+
+_provider: ContextVar[str] = ContextVar("blender_mcp_workspace_provider", default=DEFAULT_PROVIDER)
+
+
+@contextmanager
+def using_provider(name: str) -> Iterator[None]:
+    """Attribute workspace entries created in this context to `name`."""
+    token = _provider.set(name)
+    try:
+        yield
+    finally:
+        _provider.reset(token)
+
+
+def _path_size(path: str) -> int:
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for dirpath, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
+
+
+def _remove(path: str) -> None:
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _try_lock(fh: IO[bytes]) -> bool:
+    """Take an exclusive lock on `fh` without blocking; False if held elsewhere."""
+    try:
+        if os.name == "nt":
+            import msvcrt
+
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)  # type: ignore[attr-defined]
+        else:
+            import fcntl
+
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _owner_alive(root: str, pid: int) -> bool:
+    """True while process `pid` holds its owner lock under `root`."""
+    if pid == os.getpid():
+        return False  # an earlier workspace of this process: adopt
+    path = os.path.join(root, OWNERS_DIR, f"{pid}.lock")
+    if not os.path.exists(path):
+        return False
+    with open(path, "a+b") as fh:
+        alive = not _try_lock(fh)
+    if not alive:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    return alive
+
+
+class Workspace:
+    """Reference-counted temp files and directories under a byte quota."""
+
+    def __init__(
+        self,
+        root: str,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_idle: float = DEFAULT_MAX_IDLE,
+        grace: float = DEFAULT_GRACE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+        self.max_idle = max_idle
+        self.grace = grace
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._gc_thread: Optional[threading.Thread] = None
+        self._gc_stop = threading.Event()
+        self.counters = {"created": 0, "adopted": 0, "removed": 0, "freed_bytes": 0, "collections": 0}
+        os.makedirs(os.path.join(self.root, OWNERS_DIR), exist_ok=True)
+        self._owner_tag = f"~{os.getpid()}~"
+        self._owner_lock = self._hold_owner_lock()
+        self._adopt_leftovers()
+
+    def _hold_owner_lock(self) -> Optional[IO[bytes]]:
+        # Held (file left open) for the life of the process
+        fh = open(os.path.join(self.root, OWNERS_DIR, f"{os.getpid()}.lock"), "a+b")
+        if _try_lock(fh):
+            return fh
+        fh.close()  # another workspace of this process already holds it
+        return None
+
+    def _adoptable(self, name: str, mtime: float, live: Dict[int, bool]) -> bool:
+        match = _OWNER_RE.search(name)
+        if match is None:
+            # Untagged: another process may be writing it right now
+            return self._clock() - mtime >= self.grace
+        pid = int(match.group(1))
+        if pid not in live:
+            live[pid] = _owner_alive(self.root, pid)
+        return not live[pid]
+
+    def _adopt_leftovers(self) -> None:
+        live: Dict[int, bool] = {}
+        for provider in os.listdir(self.root):
+            pdir = os.path.join(self.root, provider)
+            if provider == OWNERS_DIR or not os.path.isdir(pdir):
+                continue
+            for name in os.listdir(pdir):
+                path = os.path.join(pdir, name)
+                try:
+                    mtime = os.path.getmtime(path)
+                except OSError:
+                    continue
+                if not self._adoptable(name, mtime, live):
+                    continue
+                self._entries[path] = self._new_entry(provider, refs=0, at=mtime, size=_path_size(path))
+                self.counters["adopted"] += 1
+
+    @staticmethod
+    def _new_entry(provider: str, *, refs: int, at: float, size: int = 0) -> Dict[str, Any]:
+        return {"provider": provider, "refs": refs, "created": at, "last_access": at, "bytes": size}
+
+    def _provider_dir(self, provider: Optional[str]) -> Tuple[str, str]:
+        name = provider or _provider.get()
+        pdir = os.path.join(self.root, name)
+        os.makedirs(pdir, exist_ok=True)
+        return name, pdir
+
+    def _register(self, name: str, path: str) -> str:
+        with self._lock:
+            self._entries[path] = self._new_entry(name, refs=1, at=self._clock())
+            self.counters["created"] += 1
+        return path
+
+    # --- creation ---
+    def mkdtemp(self, prefix: str = "blender_mcp_", *, provider: Optional[str] = None) -> str:
+        """Create a directory, held by the caller until `release`."""
+        name, pdir = self._provider_dir(provider)
+        return self._register(name, tempfile.mkdtemp(prefix=prefix + self._owner_tag, dir=pdir))
+
+    def mkstemp(self, prefix: str = "blender_mcp_", suffix: str = "", *, provider: Optional[str] = None) -> str:
+        """Create an empty file, held by the caller until `release`."""
+        name, pdir = self._provider_dir(provider)
+        fd, path = tempfile.mkstemp(prefix=prefix + self._owner_tag, suffix=suffix, dir=pdir)
+        os.close(fd)
+        return self._register(name, path)
+
+    # --- references ---
+    def acquire(self, path: str) -> bool:
+        """Take a reference on `path`; False when it is not (or no longer) managed."""
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(path))
+            if entry is None:
+                return False
+            entry["refs"] += 1
+            entry["last_access"] = self._clock()
+            return True
+
+    def release(self, path: str) -> None:
+        """Drop a reference and record the entry's current size."""
+        self._settle(path, refs=-1)
+
+    def hand_off(self, path: str) -> None:
+        """Record a written entry whose path is returned to a consumer.
+
+        The creator's reference passes to the consumer: the entry is not
+        collected until the consumer calls `release` or removes the path.
+        """
+        self._settle(path, refs=0)
+
+    def _settle(self, path: str, *, refs: int) -> None:
+        path = os.path.abspath(path)
+        try:
+            size = _path_size(path)
+        except OSError:
+            size = 0
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                return
+            entry["refs"] = max(0, entry["refs"] + refs)
+            entry["last_access"] = self._clock()
+            entry["bytes"] = size
+            over_quota = self._total_bytes() > self.max_bytes
+        if over_quota:
+            self.collect()
+
+    @contextmanager
+    def hold(self, path: str) -> Iterator[str]:
+        """Keep `path` from being collected for the duration of the block."""
+        held = self.acquire(path)
+        try:
+            yield path
+        finally:
+            if held:
+                self.release(path)
+
+    def discard(self, path: str) -> None:
+        """Remove `path` now, whoever holds it (failed or consumed downloads)."""
+        path = os.path.abspath(path)
+        with self._lock:
+            self._entries.pop(path, None)
+        _remove(path)
+
+    # --- collection ---
+    def _total_bytes(self) -> int:
+        return sum(e["bytes"] for e in self._entries.values())
+
+    def _collectable(self, now: float) -> Tuple[List[str], List[str]]:
+        idle, quota = [], []
+        total = 0
+        for path in list(self._entries):
+            entry = self._entries[path]
+            if not os.path.exists(path):
+                # Removed by its consumer
+                del self._entries[path]
+                continue
+            if entry["refs"] == 0:
+                entry["bytes"] = _path_size(path)
+            total += entry["bytes"]
+        for path, entry in sorted(self._entries.items(), key=lambda item: item[1]["last_access"]):
+            if entry["refs"] > 0:
+                continue
+            age = now - entry["last_access"]
+            if age >= self.max_idle:
+                idle.append(path)
+            elif total > self.max_bytes and age >= self.grace:
+                quota.append(path)
+            else:
+                continue
+            total -= entry["bytes"]
+        return idle, quota
+
+    def collect(self) -> int:
+        """Remove idle entries, then LRU ones while over quota; return bytes freed."""
+        with self._lock:
+            idle, quota = self._collectable(self._clock())
+            removed = [(path, self._entries.pop(path)) for path in idle + quota]
+            self.counters["collections"] += 1
+        freed = 0
+        for path, entry in removed:
+            _remove(path)
+            freed += entry["bytes"]
+            logger.info("workspace: removed %s (%s, %d bytes)", path, entry["provider"], entry["bytes"])
+        with self._lock:
+            self.counters["removed"] += len(removed)
+            self.counters["freed_bytes"] += freed
+            if self._total_bytes() > self.max_bytes:
+                logger.warning("workspace over quota: remaining entries are in use or within the grace period")
+        return freed
+
+    def _gc_loop(self, interval: float) -> None:
+        while not self._gc_stop.wait(interval):
+            try:
+                self.collect()
+            except Exception:
+                logger.exception("workspace collection failed")
+
+    def start_gc(self, interval: float = DEFAULT_GC_INTERVAL) -> None:
+        """Collect every `interval` seconds on a daemon thread."""
+        if interval <= 0 or (self._gc_thread is not None and self._gc_thread.is_alive()):
+            return
+        self._gc_stop.clear()
+        self._gc_thread = threading.Thread(
+            target=self._gc_loop, args=(interval,), name="blender-mcp-workspace-gc", daemon=True
+        )
+        self._gc_thread.start()
+
+    def stop_gc(self) -> None:
+        self._gc_stop.set()
+        thread, self._gc_thread = self._gc_thread, None
+        if thread is not None:
+            thread.join(timeout=2.0)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            providers: Dict[str, Dict[str, int]] = {}
+            for entry in self._entries.values():
+                usage = providers.setdefault(entry["provider"], {"entries": 0, "bytes": 0, "held": 0})
+                usage["entries"] += 1
+                usage["bytes"] += entry["bytes"]
+                usage["held"] += 1 if entry["refs"] else 0
+            return {
+                "root": self.root,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes(),
+                "max_bytes": self.max_bytes,
+                "max_idle_s": self.max_idle,
+                "grace_s": self.grace,
+                "gc_running": self._gc_thread is not None and self._gc_thread.is_alive(),
+                "providers": providers,
+                **self.counters,
+            }
+
+
+_default: Optional[Workspace] = None
+_default_lock = threading.Lock()
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def get_workspace() -> Workspace:
+    """Return the process-wide workspace, starting its collector on first use."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            root = os.environ.get("BLENDER_MCP_WORKSPACE_DIR") or os.path.join(
+                tempfile.gettempdir(), "blender-mcp-workspace"
+            )
+            _default = Workspace(
+                root,
+                max_bytes=int(_env_number("BLENDER_MCP_WORKSPACE_BYTES", DEFAULT_MAX_BYTES)),
+                max_idle=_env_number("BLENDER_MCP_WORKSPACE_MAX_IDLE", DEFAULT_MAX_IDLE),
+                grace=_env_number("BLENDER_MCP_WORKSPACE_GRACE", DEFAULT_GRACE),
+            )
+            _default.start_gc(_env_number("BLENDER_MCP_WORKSPACE_GC_INTERVAL", DEFAULT_GC_INTERVAL))
+        return _default
+
+
+def reset_workspace() -> None:
+    """Stop the collector and forget the shared workspace (files are kept)."""
+    global _default
+    with _default_lock:
+        old, _default = _default, None
+    if old is not None:
+        old.stop_gc()
+
+
+__all__ = ["Workspace", "get_workspace", "reset_workspace", "using_provider"]
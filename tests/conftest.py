@@ -1,5 +1,8 @@
 import os
 import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 
 def _add_repo_root_to_path():
@@ -12,3 +15,186 @@ def _add_repo_root_to_path():
 
 
 _add_repo_root_to_path()
+
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _reset_circuit_breakers():
+    """Circuit breakers are process-wide; isolate tests from each other."""
+    from blender_mcp import circuit_breaker
+
+    circuit_breaker.reset_breakers()
+    yield
+    circuit_breaker.reset_breakers()
+
+
+@pytest.fixture(autouse=True)
+def _disable_asset_cache(monkeypatch):
+    """Keep tests off the user's persistent asset cache unless they opt in."""
+    from blender_mcp import asset_cache
+
+    monkeypatch.setenv("BLENDER_MCP_ASSET_CACHE", "0")
+    asset_cache.reset_asset_cache()
+    yield
+    asset_cache.reset_asset_cache()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_http_session():
+    """Give each test its own pooled session (and connection counters)."""
+    from blender_mcp import http
+
+    http.reset_session()
+    yield
+    http.reset_session()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_workspace(tmp_path, monkeypatch):
+    """Keep downloads in a per-test workspace, without a background collector."""
+    from blender_mcp import workspace
+
+    monkeypatch.setenv("BLENDER_MCP_WORKSPACE_DIR", str(tmp_path / "workspace"))
+    monkeypatch.setenv("BLENDER_MCP_WORKSPACE_GC_INTERVAL", "0")
+    workspace.reset_workspace()
+    yield
+    workspace.reset_workspace()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_download_scheduler():
+    """Per-test download slots and throughput counters."""
+    from blender_mcp import download_scheduler
+
+    download_scheduler.reset_scheduler()
+    yield
+    download_scheduler.reset_scheduler()
+
+
+@pytest.fixture(autouse=True)
+def _disable_polyhaven_catalog(monkeypatch):
+    """Searches go to the (mocked) network unless a test opts into the catalog."""
+    from blender_mcp.services import polyhaven_catalog, polyhaven_warmup
+
+    monkeypatch.setenv("BLENDER_MCP_POLYHAVEN_CATALOG", "0")
+    monkeypatch.setenv("BLENDER_MCP_WARMUP", "0")
+    polyhaven_catalog.reset_catalog()
+    polyhaven_warmup.reset_warm_up()
+    yield
+    polyhaven_catalog.reset_catalog()
+    polyhaven_warmup.reset_warm_up()
+
+
+class FakeClock:
+    """Settable clock: tests move ``now`` by hand instead of sleeping."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_clock():
+    """A `FakeClock` to pass as the ``clock`` of breakers, caches and probes."""
+    return FakeClock()
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    """Serves ``server.state["files"]`` ({path: (body, etag)}) like a CDN would.
+
+    Answers conditional requests (``If-None-Match``) with 304 and, when
+    ``state["ranges"]`` is set, byte ranges (honouring ``If-Range``) with
+    206. ``state["truncate"]`` cuts that many responses mid-body,
+    ``state["no_length"]`` drops Content-Length and ``state["delays"]``
+    ({path: seconds}) slows paths down. Every GET is logged in
+    ``state["requests"]`` as (path, If-None-Match) and its Range header in
+    ``state["ranges_seen"]``.
+    """
+
+    def setup(self):
+        super().setup()
+        if self.server.keep_alive:
+            self.protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        state = self.server.state
+        path = self.path.split("?")[0]
+        state["requests"].append((self.path, self.headers.get("If-None-Match")))
+        state["ranges_seen"].append(self.headers.get("Range"))
+        time.sleep(state["delays"].get(path, 0))
+        if path not in state["files"]:
+            self.send_error(404)
+            return
+        body, etag = state["files"][path]
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        rng = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if state["ranges"] and rng and (if_range is None or if_range == etag):
+            first, _, last = rng.split("=")[1].partition("-")
+            start, end = int(first), int(last) if last else len(body) - 1
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+            body = body[start : end + 1]
+        else:
+            self.send_response(200)
+        if state["ranges"]:
+            self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        if state["no_length"]:
+            # The body then ends when the connection does
+            self.close_connection = True
+        else:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if state["truncate"] > 0 and len(body) > 1:
+            # Cut the connection mid-body, as a flaky link would
+            state["truncate"] -= 1
+            self.wfile.write(body[: len(body) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+class RangeServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # HTTP/1.0 by default: a stopped server then takes no request over an old connection
+    keep_alive = False
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _RangeHandler)
+        self.state = {
+            "files": {},
+            "requests": [],
+            "ranges_seen": [],
+            "ranges": False,
+            "truncate": 0,
+            "no_length": False,
+            "delays": {},
+        }
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+@pytest.fixture
+def range_server():
+    """A local `RangeServer` on a free port; tests fill ``state["files"]``."""
+    httpd = RangeServer()
+    t = threading.Thread(target=httpd.serve_forever, daemon=True)
+    t.start()
+    try:
+        yield httpd
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
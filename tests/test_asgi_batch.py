@@ -0,0 +1,104 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+import threading
+import time
+import types
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from blender_mcp import asgi
+from blender_mcp.errors import InvalidParamsError
+
+
+def _server():
+    mod = types.ModuleType("fake_batch_server")
+    state = {"active": 0, "peak": 0, "order": []}
+    lock = threading.Lock()
+
+    def slow_tool(ctx, tag="x", delay=0.05):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(delay)
+        with lock:
+            state["active"] -= 1
+            state["order"].append(tag)
+        return {"tag": tag}
+
+    def bad_tool(ctx):
+        raise InvalidParamsError("bad input")
+
+    mod.slow_tool = slow_tool
+    mod.bad_tool = bad_tool
+    mod.state = state
+    return mod
+
+
+def test_batch_runs_concurrently_with_per_item_status():
+    srv = _server()
+    client = TestClient(asgi.create_app(srv))
+    calls = [{"name": "slow_tool", "params": {"tag": str(i)}, "id": f"c{i}"} for i in range(4)]
+    calls += [{"name": "bad_tool"}, {"name": "missing_tool"}, {"params": {}}]
+
+    resp = client.post("/tools:batch", json=calls)
+
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [r["index"] for r in results] == list(range(7))
+    assert results[0] == {
+        "index": 0,
+        "name": "slow_tool",
+        "id": "c0",
+        "status_code": 200,
+        "status": "ok",
+        "result": {"tag": "0"},
+    }
+    assert [r["status_code"] for r in results[4:]] == [400, 404, 400]
+    assert results[4]["error_code"] == "invalid_params"
+    assert results[5]["error_code"] == "not_found"
+    assert srv.state["peak"] > 1
+
+
+def test_batch_concurrency_is_bounded():
+    srv = _server()
+    app = FastAPI()
+    app.post("/tools:batch")(asgi.make_batch_tools(srv, max_concurrency=2))
+    client = TestClient(app)
+
+    resp = client.post("/tools:batch", json={"calls": [{"name": "slow_tool"}] * 6, "max_concurrency": 5})
+
+    assert resp.status_code == 200
+    assert srv.state["peak"] <= 2
+
+
+def test_batch_sequential_keeps_order_and_stops_on_error():
+    srv = _server()
+    client = TestClient(asgi.create_app(srv))
+    calls = [
+        {"name": "slow_tool", "params": {"tag": "a", "delay": 0.03}},
+        {"name": "slow_tool", "params": {"tag": "b", "delay": 0.0}},
+        {"name": "bad_tool"},
+        {"name": "slow_tool", "params": {"tag": "c"}},
+    ]
+
+    resp = client.post("/tools:batch", json={"calls": calls, "mode": "sequential", "stop_on_error": True})
+
+    results = resp.json()["results"]
+    assert srv.state["order"] == ["a", "b"]
+    assert srv.state["peak"] == 1
+    assert [r["status"] for r in results] == ["ok", "ok", "error", "skipped"]
+    assert results[3]["status_code"] == 424
+
+
+def test_batch_rejects_bad_bodies():
+    app = FastAPI()
+    app.post("/tools:batch")(asgi.make_batch_tools(_server(), max_items=2))
+    client = TestClient(app)
+
+    assert client.post("/tools:batch", json={"nope": 1}).status_code == 400
+    assert client.post("/tools:batch", json={"calls": [], "mode": "random"}).status_code == 400
+    assert client.post("/tools:batch", json={"calls": [], "max_concurrency": 0}).status_code == 400
+    assert client.post("/tools:batch", json=[{"name": "slow_tool"}] * 3).status_code == 413
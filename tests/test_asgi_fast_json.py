@@ -0,0 +1,89 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+import datetime
+import importlib
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from blender_mcp import asgi
+from blender_mcp.errors import InvalidParamsError
+
+client = TestClient(asgi.app)
+
+
+@pytest.fixture
+def tmp_tool(monkeypatch):
+    srv = importlib.import_module("blender_mcp.server")
+
+    def _register(name, func):
+        monkeypatch.setattr(srv, name, func, raising=False)
+
+    return _register
+
+
+@pytest.fixture
+def audit(monkeypatch):
+    calls = []
+
+    def fake_log_action(source, action, params=None, result=None):
+        calls.append((source, action, params, result))
+
+    monkeypatch.setattr("blender_mcp.logging_utils.log_action", fake_log_action)
+    return calls
+
+
+def test_native_result_matches_legacy_encoding():
+    result = {"name": "Scene", "objects": [{"name": "Cube", "loc": [0.0, 1.5, -2]}], "note": "héllo", "n": None}
+    legacy = JSONResponse(content={"status": "ok", "result": jsonable_encoder(result)}).body
+    assert asgi._ok_response("t", {}, result).body == legacy
+
+
+def test_non_native_result_falls_back_to_jsonable_encoder(tmp_tool):
+    stamp = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    tmp_tool("fast_json_dt_tool", lambda ctx, **p: {"when": stamp, "tags": {"a"}})
+
+    resp = client.post("/tools/fast_json_dt_tool", json={"params": {}})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    assert resp.json() == {"status": "ok", "result": {"when": "2024-01-02T03:04:05", "tags": ["a"]}}
+
+
+def test_audit_records_summary_not_payload(tmp_tool, audit):
+    big = "x" * 100_000
+    tmp_tool("fast_json_big_tool", lambda ctx, **p: {"image": big, "format": "png"})
+
+    resp = client.post("/tools/fast_json_big_tool", json={"params": {"q": 1}})
+
+    assert resp.status_code == 200
+    assert resp.json()["result"]["image"] == big
+    source, action, params, result = audit[-1]
+    assert (source, action) == ("asgi", "call_tool")
+    assert params == {"tool": "fast_json_big_tool", "params": {"q": 1}}
+    summary = result["result_summary"]
+    assert "result" not in result
+    assert summary["type"] == "dict"
+    assert summary["keys"] == ["image", "format"]
+    assert summary["bytes"] == len(resp.content)
+
+
+def test_summary_for_sequences_and_scalars():
+    assert asgi._summarize_result([1, 2, 3], 7) == {"type": "list", "bytes": 7, "length": 3}
+    assert asgi._summarize_result(42, 2) == {"type": "int", "bytes": 2}
+
+
+def test_errors_still_mapped(tmp_tool, audit):
+    def bad(ctx, **p):
+        raise InvalidParamsError("nope")
+
+    tmp_tool("fast_json_bad_tool", bad)
+
+    resp = client.post("/tools/fast_json_bad_tool", json={"params": {}})
+
+    assert resp.status_code == 400
+    assert resp.json()["status"] == "error"
+    assert audit[-1][1] == "call_tool_error"
@@ -0,0 +1,101 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+import json
+import time
+import types
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from blender_mcp import asgi, progress
+from blender_mcp.errors import ExternalServiceError
+
+
+def _parse_sse(text: str):
+    events = []
+    for block in text.strip().split("\n\n"):
+        lines = block.split("\n")
+        if lines[0].startswith(":"):
+            events.append(("comment", lines[0]))
+            continue
+        event = lines[0].removeprefix("event: ")
+        data = json.loads(lines[1].removeprefix("data: "))
+        events.append((event, data))
+    return events
+
+
+def _server(**tools):
+    mod = types.ModuleType("fake_stream_server")
+    for name, fn in tools.items():
+        setattr(mod, name, fn)
+    return mod
+
+
+def test_stream_emits_progress_partial_then_result():
+    def download_tool(ctx, asset_id="rock"):
+        progress.report_progress("download", done=10, total=20)
+        progress.report_partial({"temp_dir": "/tmp/x"})
+        return {"asset": asset_id}
+
+    client = TestClient(asgi.create_app(_server(download_tool=download_tool)))
+    resp = client.post("/tools/download_tool/stream", json={"params": {"asset_id": "tree"}})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert _parse_sse(resp.text) == [
+        ("progress", {"stage": "download", "done": 10, "total": 20}),
+        ("partial", {"data": {"temp_dir": "/tmp/x"}}),
+        ("result", {"status": "ok", "result": {"asset": "tree"}}),
+    ]
+
+
+def test_stream_async_tool_and_error_event():
+    async def failing_tool(ctx):
+        progress.report_progress("poll", message="queued")
+        raise ExternalServiceError("upstream down")
+
+    client = TestClient(asgi.create_app(_server(failing_tool=failing_tool)))
+    events = _parse_sse(client.post("/tools/failing_tool/stream", json={}).text)
+
+    assert events[0] == ("progress", {"stage": "poll", "message": "queued"})
+    kind, body = events[-1]
+    assert kind == "error"
+    assert body == {
+        "status": "error",
+        "message": "upstream down",
+        "error_code": "external_error",
+        "status_code": 502,
+    }
+
+
+def test_stream_unknown_tool_is_404():
+    client = TestClient(asgi.create_app(_server()))
+    assert client.post("/tools/missing/stream", json={}).status_code == 404
+
+
+def test_stream_sends_keepalive_while_idle():
+    def slow_tool(ctx):
+        time.sleep(0.2)
+        return "done"
+
+    app = FastAPI()
+    app.post("/tools/{name}/stream")(asgi.make_stream_tool(_server(slow_tool=slow_tool), heartbeat=0.02))
+    events = _parse_sse(TestClient(app).post("/tools/slow_tool/stream", json={}).text)
+
+    assert ("comment", ": keepalive") in events
+    assert events[-1] == ("result", {"status": "ok", "result": "done"})
+
+
+def test_progress_is_noop_without_reporter():
+    assert progress.is_reporting() is False
+    progress.report_progress("download", done=1)
+    progress.report_partial({"x": 1})
+
+    seen = []
+    with progress.reporting(seen.append):
+        assert progress.is_reporting() is True
+        progress.report_progress("extract", total=3)
+    assert seen == [{"type": "progress", "stage": "extract", "total": 3}]
+    assert progress.is_reporting() is False
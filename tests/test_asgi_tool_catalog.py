@@ -0,0 +1,105 @@
+import types
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient
+
+from blender_mcp import asgi, gemini_client
+from blender_mcp.services import registry
+
+
+def _fake_server_module():
+    mod = types.ModuleType("fake_catalog_server")
+
+    def scene_tool(ctx, name: str = "Scene"):
+        """Describe the scene."""
+        return {"name": name}
+
+    scene_tool.__module__ = mod.__name__
+    mod.scene_tool = scene_tool
+    return mod
+
+
+def test_catalog_is_built_once_and_served_with_etag():
+    mod = _fake_server_module()
+    app = asgi.create_app(mod)
+    client = TestClient(app)
+    catalog = app.state.tool_catalog
+
+    first = client.get("/tools")
+    second = client.get("/tools")
+
+    assert first.status_code == 200
+    assert first.json()["tools"][0]["name"] == "scene_tool"
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.content == second.content
+    assert catalog.builds == 1
+
+
+def test_if_none_match_returns_304():
+    client = TestClient(asgi.create_app(_fake_server_module()))
+    etag = client.get("/tools").headers["etag"]
+
+    resp = client.get("/tools", headers={"If-None-Match": f'"other", W/{etag}'})
+
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+    assert client.get("/tools", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_catalog_rebuilds_when_registry_version_changes(monkeypatch):
+    monkeypatch.setenv("BLENDER_MCP_EXPOSE_REGISTRY_TOOLS", "1")
+    app = asgi.create_app(_fake_server_module())
+    client = TestClient(app)
+    etag = client.get("/tools").headers["etag"]
+
+    before = registry.registry_version()
+    registry.register_service("tmp_catalog_service", lambda: None)
+    try:
+        assert registry.registry_version() == before + 1
+        resp = client.get("/tools", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+        names = [t["name"] for t in resp.json()["tools"]]
+        assert "tmp_catalog_service" in names
+    finally:
+        registry.unregister_service("tmp_catalog_service")
+    assert app.state.tool_catalog.builds == 2
+
+
+def test_gemini_client_revalidates_catalog(monkeypatch):
+    calls = []
+
+    class Resp:
+        def __init__(self, status, payload=None, etag=None):
+            self.status_code = status
+            self.ok = status < 400
+            self._payload = payload
+            self.headers = {"ETag": etag} if etag else {}
+
+        def json(self):
+            return self._payload
+
+    responses = iter(
+        [
+            Resp(200, {"tools": [{"name": "scene_tool", "signature": "(ctx)", "doc": "Describe"}]}, '"v1"'),
+            Resp(304, etag='"v1"'),
+        ]
+    )
+
+    class Session:
+        def get(self, url, timeout=None, headers=None):
+            calls.append(headers)
+            return next(responses)
+
+    monkeypatch.setattr(gemini_client, "get_session", lambda: Session())
+    monkeypatch.setattr(gemini_client, "_TOOL_CATALOG_CACHE", {})
+
+    first = gemini_client.get_local_tool_catalog()
+    second = gemini_client.get_local_tool_catalog()
+
+    assert first == second == "scene_tool(ctx): Describe"
+    assert calls == [None, {"If-None-Match": '"v1"'}]
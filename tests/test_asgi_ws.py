@@ -0,0 +1,132 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+import json
+import threading
+import types
+
+from fastapi.testclient import TestClient
+
+from blender_mcp import asgi, mcp_client
+from blender_mcp.errors import InvalidParamsError
+
+
+def _server():
+    mod = types.ModuleType("fake_ws_server")
+    release = threading.Event()
+
+    def slow_tool(ctx):
+        release.wait(5)
+        return "slow"
+
+    def fast_tool(ctx, value=0):
+        release.set()
+        return {"value": value}
+
+    def bad_tool(ctx):
+        raise InvalidParamsError("bad input")
+
+    mod.slow_tool = slow_tool
+    mod.fast_tool = fast_tool
+    mod.bad_tool = bad_tool
+    return mod
+
+
+def test_ws_replies_out_of_order():
+    client = TestClient(asgi.create_app(_server()))
+    with client.websocket_connect("/ws") as ws:
+        ws.send_text(json.dumps({"id": 1, "tool": "slow_tool"}))
+        ws.send_text(json.dumps({"id": 2, "tool": "fast_tool", "params": {"value": 7}}))
+        first = ws.receive_json()
+        second = ws.receive_json()
+
+    assert first == {"id": 2, "status_code": 200, "status": "ok", "result": {"value": 7}}
+    assert second == {"id": 1, "status_code": 200, "status": "ok", "result": "slow"}
+
+
+def test_ws_maps_errors_per_frame():
+    client = TestClient(asgi.create_app(_server()))
+    with client.websocket_connect("/ws") as ws:
+        ws.send_text(json.dumps({"id": "a", "tool": "bad_tool"}))
+        bad = ws.receive_json()
+        ws.send_text(json.dumps({"id": "b", "tool": "missing"}))
+        missing = ws.receive_json()
+        ws.send_text("not json")
+        garbage = ws.receive_json()
+        ws.send_text(json.dumps({"id": "c", "params": {}}))
+        no_tool = ws.receive_json()
+
+    assert (bad["id"], bad["status_code"], bad["error_code"]) == ("a", 400, "invalid_params")
+    assert (missing["id"], missing["status_code"], missing["error_code"]) == ("b", 404, "not_found")
+    assert (garbage["id"], garbage["status_code"]) == (None, 400)
+    assert (no_tool["id"], no_tool["status_code"]) == ("c", 400)
+
+
+class _TestClientTransport:
+    """Adapts starlette's WebSocketTestSession to the client transport API."""
+
+    def __init__(self, session):
+        self._cm = session
+        self._ws = session.__enter__()
+
+    def send(self, text):
+        self._ws.send_text(text)
+
+    def recv(self):
+        msg = self._ws.receive()
+        if msg["type"] == "websocket.close":
+            raise ConnectionError("closed")
+        return msg.get("text") or msg.get("bytes")
+
+    def close(self):
+        self._cm.__exit__(None, None, None)
+
+
+def test_mcp_websocket_client_multiplexes_calls():
+    client = TestClient(asgi.create_app(_server()))
+    ws_client = mcp_client.MCPWebSocketClient(
+        "ws://testserver/ws", connect=lambda url: _TestClientTransport(client.websocket_connect("/ws"))
+    )
+    try:
+        slow = ws_client.submit("slow_tool")
+        fast = ws_client.submit("fast_tool", {"value": 3})
+        assert fast.result(timeout=5) == {"status": "ok", "result": {"value": 3}}
+        assert slow.result(timeout=5) == {"status": "ok", "result": "slow"}
+
+        with pytest.raises(mcp_client.MCPToolError) as exc:
+            ws_client.call("bad_tool", timeout=5)
+        assert exc.value.status_code == 400
+        assert exc.value.error_code == "invalid_params"
+    finally:
+        ws_client.close()
+
+    with pytest.raises(ConnectionError):
+        ws_client.submit("fast_tool")
+
+
+def test_mcp_websocket_client_fails_pending_on_disconnect():
+    class DeadTransport:
+        def __init__(self):
+            self.sent = []
+            self.gone = threading.Event()
+
+        def send(self, text):
+            self.sent.append(json.loads(text))
+
+        def recv(self):
+            self.gone.wait(5)
+            raise ConnectionError("connection reset")
+
+        def close(self):
+            self.gone.set()
+
+    transport = DeadTransport()
+    ws_client = mcp_client.MCPWebSocketClient("ws://x/ws", connect=lambda url: transport)
+    fut = ws_client.submit("fast_tool", {"value": 1})
+    assert transport.sent == [{"id": "1", "tool": "fast_tool", "params": {"value": 1}}]
+
+    transport.gone.set()
+    with pytest.raises(ConnectionError, match="reset"):
+        fut.result(timeout=5)
+    ws_client.close()
@@ -0,0 +1,205 @@
+"""Persistent asset cache against a local HTTP server."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from blender_mcp import asset_cache, downloaders
+from blender_mcp.asset_cache import AssetCache
+
+
+def _zip_bytes(files):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in files.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def server(range_server):
+    range_server.state["files"].update(
+        {
+            "/a.zip": (_zip_bytes({"model.gltf": b"{}", "tex/a.png": b"png" * 100}), '"a1"'),
+            "/b.bin": (os.urandom(4096), '"b1"'),
+            "/c.bin": (os.urandom(4096), '"c1"'),
+        }
+    )
+    return range_server
+
+
+def test_fresh_entry_served_without_request(server, tmp_path, fake_clock):
+    cache = AssetCache(str(tmp_path), max_age=60, clock=fake_clock)
+    first = cache.fetch(server.url("/b.bin"))
+    second = cache.fetch(server.url("/b.bin"))
+
+    assert first == second
+    with open(first, "rb") as fh:
+        assert fh.read() == server.state["files"]["/b.bin"][0]
+    assert len(server.state["requests"]) == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_stale_entry_revalidated_with_etag(server, tmp_path, fake_clock):
+    cache = AssetCache(str(tmp_path), max_age=60, clock=fake_clock)
+    url = server.url("/b.bin")
+    path = cache.fetch(url)
+    fake_clock.now += 120
+
+    assert cache.fetch(url) == path
+    assert server.state["requests"][-1] == ("/b.bin", '"b1"')
+    assert cache.stats()["revalidated"] == 1
+
+    # Changed upstream: the 200 replaces the stored body
+    server.state["files"]["/b.bin"] = (b"new body", '"b2"')
+    fake_clock.now += 120
+    with open(cache.fetch(url), "rb") as fh:
+        assert fh.read() == b"new body"
+    assert not os.path.exists(path)
+
+
+def test_index_survives_restart(server, tmp_path):
+    url = server.url("/b.bin")
+    path = AssetCache(str(tmp_path)).fetch(url)
+    assert AssetCache(str(tmp_path)).peek(url) == path
+    assert len(server.state["requests"]) == 1
+
+
+def test_concurrent_fetches_download_once(server, tmp_path):
+    cache = AssetCache(str(tmp_path))
+    url = server.url("/b.bin")
+    with ThreadPoolExecutor(8) as pool:
+        paths = set(pool.map(lambda _: cache.fetch(url), range(8)))
+    assert len(paths) == 1
+    assert len(server.state["requests"]) == 1
+
+
+def test_identical_content_stored_once(server, tmp_path):
+    server.state["files"]["/copy.bin"] = server.state["files"]["/b.bin"]
+    cache = AssetCache(str(tmp_path))
+    assert cache.fetch(server.url("/b.bin")) == cache.fetch(server.url("/copy.bin"))
+    assert cache.stats()["entries"] == 2
+    assert cache.total_bytes() == 4096
+
+
+def test_extract_once_and_reuse_by_key(server, tmp_path):
+    cache = AssetCache(str(tmp_path))
+    first = cache.extract(server.url("/a.zip?sig=1"), key="sketchfab:u1")
+    with open(os.path.join(first, "tex", "a.png"), "rb") as fh:
+        assert fh.read() == b"png" * 100
+
+    assert cache.peek_extracted("sketchfab:u1") == first
+    assert cache.extract(server.url("/a.zip?sig=2"), key="sketchfab:u1") == first
+    assert len(server.state["requests"]) == 1
+
+
+def test_lru_eviction_keeps_recent_entries(server, tmp_path, fake_clock):
+    cache = AssetCache(str(tmp_path), max_bytes=10_000, clock=fake_clock)
+    b, c = server.url("/b.bin"), server.url("/c.bin")
+    b_path = cache.fetch(b)
+    fake_clock.now += 1
+    cache.fetch(c)
+    assert os.path.exists(b_path)
+
+    fake_clock.now += 1
+    server.state["files"]["/d.bin"] = (os.urandom(4096), '"d1"')
+    cache.fetch(b)  # touch b: c is now least recently used
+    fake_clock.now += 1
+    cache.fetch(server.url("/d.bin"))
+
+    assert cache.peek(c) is None
+    assert cache.peek(b) == b_path
+    assert cache.stats()["evictions"] == 1
+    assert cache.total_bytes() <= 10_000
+
+
+def test_stale_copy_served_when_upstream_down(server, tmp_path, fake_clock):
+    cache = AssetCache(str(tmp_path), max_age=1, clock=fake_clock)
+    url = server.url("/b.bin")
+    path = cache.fetch(url)
+    server.shutdown()
+    server.server_close()
+    fake_clock.now += 10
+
+    assert cache.fetch(url, timeout=2) == path
+    assert cache.stats()["stale"] == 1
+
+
+def test_download_helpers_use_shared_cache(server, tmp_path, monkeypatch):
+    monkeypatch.setenv("BLENDER_MCP_ASSET_CACHE", "1")
+    monkeypatch.setenv("BLENDER_MCP_ASSET_CACHE_DIR", str(tmp_path / "cache"))
+    asset_cache.reset_asset_cache()
+
+    first = downloaders.download_and_extract_zip(server.url("/a.zip"))
+    second = downloaders.download_and_extract_zip(server.url("/a.zip"))
+    # Extracted once; each caller gets its own links, which outlive eviction
+    assert second != first
+    asset_cache.get_asset_cache().clear()
+    with open(os.path.join(first, "tex", "a.png"), "rb") as fh:
+        assert fh.read() == b"png" * 100
+
+    tmp = downloaders.fetch_cached_file(server.url("/b.bin"), suffix=".bin")
+    os.unlink(tmp)  # callers own the returned file
+    assert asset_cache.get_asset_cache().peek(server.url("/b.bin"))
+    assert len(server.state["requests"]) == 2
+
+
+def test_checksums_verified_once_per_entry(server, tmp_path):
+    body = server.state["files"]["/b.bin"][0]
+    md5 = hashlib.md5(body).hexdigest()
+    cache = AssetCache(str(tmp_path))
+    url = server.url("/b.bin")
+
+    # Verified while streaming: nothing hashed afterwards
+    cache.fetch(url, expected_size=len(body), checksums={"md5": md5})
+    cache.fetch(url, checksums={"md5": md5})
+    assert cache.stats()["hashed"] == 0
+
+    # An entry stored without checksums is hashed once, then trusted
+    other = server.url("/c.bin")
+    c_md5 = hashlib.md5(server.state["files"]["/c.bin"][0]).hexdigest()
+    cache.fetch(other)
+    cache.fetch(other, checksums={"md5": c_md5})
+    cache.fetch(other, checksums={"md5": c_md5})
+    assert cache.stats()["hashed"] == 1
+    assert len(server.state["requests"]) == 2
+
+
+def test_entry_not_matching_expected_size_is_downloaded_again(server, tmp_path):
+    cache = AssetCache(str(tmp_path))
+    url = server.url("/b.bin")
+    cache.fetch(url)
+    server.state["files"]["/b.bin"] = (b"x" * 10, '"b2"')
+
+    with open(cache.fetch(url, expected_size=10), "rb") as fh:
+        assert fh.read() == b"x" * 10
+    assert len(server.state["requests"]) == 2
+
+
+def test_processes_sharing_a_root_keep_each_others_entries(server, tmp_path):
+    # Two instances on one root stand for the server and the addon process
+    server_side, addon_side = AssetCache(str(tmp_path)), AssetCache(str(tmp_path))
+    b_path = server_side.fetch(server.url("/b.bin"))
+    addon_side.fetch(server.url("/c.bin"))
+
+    restarted = AssetCache(str(tmp_path))
+    assert restarted.peek(server.url("/b.bin")) == b_path
+    assert restarted.peek(server.url("/c.bin")) is not None
+
+    # Fetched meanwhile by the other process: reused, not downloaded twice
+    late = AssetCache(str(tmp_path))
+    server_side.fetch(server.url("/a.zip"))
+    assert late.fetch(server.url("/a.zip")) == server_side.peek(server.url("/a.zip"))
+    assert len(server.state["requests"]) == 3
+
+    # Blob evicted by the other process: a miss, downloaded again
+    os.unlink(b_path)
+    assert addon_side.peek(server.url("/b.bin")) is None
+    assert server_side.fetch(server.url("/b.bin")) == b_path and os.path.exists(b_path)
+    assert len(server.state["requests"]) == 4
@@ -0,0 +1,200 @@
+import pytest
+import requests
+
+from blender_mcp import circuit_breaker, downloaders
+from blender_mcp.errors import CircuitOpenError, ExternalServiceError
+from blender_mcp.http import get_session
+
+
+def _fail():
+    raise requests.exceptions.ConnectionError("down")
+
+
+def test_breaker_opens_after_threshold_and_recovers(fake_clock):
+    b = circuit_breaker.CircuitBreaker("x", failure_threshold=2, recovery_timeout=10, clock=fake_clock)
+
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            b.call(_fail)
+    assert b.state == circuit_breaker.OPEN
+
+    calls = {"n": 0}
+
+    def ok():
+        calls["n"] += 1
+        return "ok"
+
+    with pytest.raises(CircuitOpenError) as ei:
+        b.call(ok)
+    assert calls["n"] == 0
+    assert ei.value.upstream == "x"
+    assert isinstance(ei.value, ExternalServiceError)
+
+    fake_clock.now += 10.0
+    assert b.state == circuit_breaker.HALF_OPEN
+    assert b.call(ok) == "ok"
+    assert b.state == circuit_breaker.CLOSED
+    assert b.stats()["rejected_calls"] == 1
+
+
+def test_half_open_failure_reopens(fake_clock):
+    b = circuit_breaker.CircuitBreaker("x", failure_threshold=1, recovery_timeout=5, clock=fake_clock)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        b.call(_fail)
+    fake_clock.now += 5.0
+    with pytest.raises(requests.exceptions.ConnectionError):
+        b.call(_fail)
+    assert b.state == circuit_breaker.OPEN
+
+
+def test_client_errors_do_not_trip():
+    b = circuit_breaker.CircuitBreaker("x", failure_threshold=1)
+
+    class Resp:
+        status_code = 404
+
+    def not_found():
+        e = requests.exceptions.HTTPError("404")
+        e.response = Resp()
+        raise e
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        b.call(not_found)
+    assert b.state == circuit_breaker.CLOSED
+
+
+def test_nested_calls_are_counted_once():
+    b = circuit_breaker.CircuitBreaker("x", failure_threshold=2)
+
+    def outer():
+        return b.call(_fail)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        b.call(outer)
+    assert b.stats()["consecutive_failures"] == 1
+
+
+def test_state_changes_reach_listeners_and_instrumentation():
+    events = []
+
+    class Instrumentation:
+        def on_circuit_state_change(self, name, old, new):
+            events.append(("inst", name, old, new))
+
+    circuit_breaker.add_state_listener(lambda n, o, s: events.append(("fn", n, o, s)))
+    circuit_breaker.add_state_listener(Instrumentation())
+    b = circuit_breaker.get_breaker("polyhaven")
+    for _ in range(b.failure_threshold):
+        b.record_failure()
+
+    assert ("fn", "polyhaven", "closed", "open") in events
+    assert ("inst", "polyhaven", "closed", "open") in events
+    assert circuit_breaker.snapshot()["polyhaven"]["state"] == "open"
+
+
+def test_url_mapping():
+    assert circuit_breaker.upstream_for_url("https://dl.polyhaven.org/file/x.zip") == "polyhaven"
+    assert circuit_breaker.upstream_for_url("https://queue.fal.run/fal-ai/hyper3d/rodin") == "hyper3d"
+    assert circuit_breaker.breaker_for_url("http://example.com/a") is None
+
+
+def test_download_bytes_fails_fast_when_open(monkeypatch):
+    calls = {"n": 0}
+
+    def fake_get(url, timeout=None, headers=None):
+        calls["n"] += 1
+        raise requests.exceptions.Timeout()
+
+    monkeypatch.setattr(downloaders, "time", type("T", (), {"sleep": lambda *_: None}))
+    monkeypatch.setattr(get_session(), "get", fake_get)
+
+    url = "https://dl.polyhaven.org/file/ph-assets/textures/x/1k.zip"
+    # threshold 5: the first download (4 attempts) does not open the circuit yet
+    with pytest.raises(requests.exceptions.Timeout):
+        downloaders.download_bytes(url, max_retries=3)
+    assert calls["n"] == 4
+    # the second download opens it on its first attempt and stops retrying
+    with pytest.raises(CircuitOpenError):
+        downloaders.download_bytes(url, max_retries=3)
+    assert calls["n"] == 5
+    with pytest.raises(CircuitOpenError):
+        downloaders.download_bytes(url, max_retries=3)
+    assert calls["n"] == 5
+
+
+def test_services_surface_circuit_open(monkeypatch):
+    from blender_mcp.services import hyper3d, polyhaven
+
+    circuit_breaker.get_breaker("polyhaven").reset()
+    for _ in range(5):
+        circuit_breaker.get_breaker("polyhaven").record_failure()
+    with pytest.raises(CircuitOpenError):
+        polyhaven.get_polyhaven_categories({"asset_type": "hdris"})
+    with pytest.raises(CircuitOpenError):
+        polyhaven.download_asset(asset_id="a", asset_type="textures")
+
+    called = {"n": 0}
+    monkeypatch.setattr(hyper3d._h3d, "poll_rodin_job_status_fal_ai", lambda *a: called.update(n=1))
+    for _ in range(5):
+        circuit_breaker.get_breaker("hyper3d").record_failure()
+    with pytest.raises(CircuitOpenError):
+        hyper3d.poll_rodin_job_status({"api_key": "k", "request_id": "r"})
+    assert called["n"] == 0
+
+
+def test_sketchfab_5xx_payloads_trip_the_breaker(monkeypatch):
+    from blender_mcp.services import sketchfab
+
+    class Resp:
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+    codes = [401, 503, 503, 503, 503, 503]
+    calls = {"n": 0}
+
+    def fake_get(url, headers=None, params=None, timeout=None):
+        calls["n"] += 1
+        return Resp(codes.pop(0))
+
+    monkeypatch.setattr(get_session(), "get", fake_get)
+    params = {"api_key": "k", "query": "chair"}
+    for _ in range(6):
+        with pytest.raises(ExternalServiceError):
+            sketchfab.search_sketchfab_models(params)
+    # The 401 proves Sketchfab answered; the five 503s open the circuit
+    assert circuit_breaker.get_breaker("sketchfab").state == circuit_breaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        sketchfab.search_sketchfab_models(params)
+    assert calls["n"] == 6
+
+
+def test_failure_payloads_and_local_errors():
+    assert circuit_breaker.is_failure_payload({"succeed": False, "error": "boom"})
+    assert circuit_breaker.is_failure_payload({"error": "bad gateway", "status_code": 502})
+    assert not circuit_breaker.is_failure_payload({"error": "no gltf", "status_code": 200})
+    assert not circuit_breaker.is_failure_payload({"error": "bad zip", "upstream_failure": False})
+    assert not circuit_breaker.is_failure_payload({"results": []})
+    assert not circuit_breaker.is_upstream_failure(downloaders.IntegrityError("sha256 mismatch"))
+    assert not circuit_breaker.is_upstream_failure(downloaders._RangesNotHonoured("ignored Range"))
+    assert downloaders.is_local_failure(downloaders.IntegrityError("size mismatch"))
+    assert not downloaders.is_local_failure(requests.exceptions.ConnectionError("down"))
+
+
+def test_open_circuit_maps_to_503_with_retry_after():
+    pytest.importorskip("fastapi")
+    import types
+
+    from fastapi.testclient import TestClient
+
+    from blender_mcp import asgi
+
+    def search_sketchfab_models(ctx):
+        raise CircuitOpenError("sketchfab", retry_after=12.2)
+
+    mod = types.ModuleType("fake_breaker_server")
+    mod.search_sketchfab_models = search_sketchfab_models
+    resp = TestClient(asgi.create_app(mod)).post("/tools/search_sketchfab_models", json={})
+
+    assert resp.status_code == 503
+    assert resp.json()["error_code"] == "circuit_open"
+    assert resp.headers["retry-after"] == "13"
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import marshal
+from typing import Any
+
+import pytest
+
+from blender_mcp.dispatchers.dispatcher import Dispatcher
+from blender_mcp.dispatchers.strategies import ProfilingInstrumentationStrategy
+
+
+def _busy(p: dict[str, Any]) -> dict[str, Any]:
+    return {"total": sum(i * i for i in range(int(p.get("n", 1000))))}
+
+
+def test_profiling_disabled_by_default():
+    prof = ProfilingInstrumentationStrategy()
+    d = Dispatcher(instrumentation_strategy=prof)
+    d.register("busy", _busy)
+    d.dispatch("busy", {"n": 10})
+
+    assert prof.status()["enabled"] is False
+    assert prof.status()["sampled_calls"] == 0
+    with pytest.raises(LookupError):
+        prof.export_pstats()
+
+
+def test_profiling_only_targets_chosen_handler():
+    prof = ProfilingInstrumentationStrategy()
+    d = Dispatcher(instrumentation_strategy=prof)
+    d.register("busy", _busy)
+    d.register("other", lambda p: {"ok": True})
+    prof.enable("busy")
+
+    d.dispatch("other", {})
+    d.dispatch("busy", {"n": 2000})
+    d.dispatch("busy", {"n": 2000})
+
+    assert prof.status()["sampled_calls"] == 2
+    report = prof.report(top_n=5)
+    assert "_busy" in report
+    # .pstats export is the marshal format read by pstats.Stats(path)
+    stats = marshal.loads(prof.export_pstats())
+    assert any(key[2] == "_busy" for key in stats)
+
+
+def test_profiling_sample_rate_uses_rng():
+    draws = iter([0.9, 0.1, 0.6])
+    prof = ProfilingInstrumentationStrategy(rng=lambda: next(draws))
+    d = Dispatcher(instrumentation_strategy=prof)
+    d.register("busy", _busy)
+    prof.enable("busy", sample_rate=0.5)
+
+    for _ in range(3):
+        d.dispatch("busy", {"n": 10})
+
+    assert prof.status()["sampled_calls"] == 1
+
+
+def test_profiling_error_path_and_reset():
+    prof = ProfilingInstrumentationStrategy()
+    d = Dispatcher(instrumentation_strategy=prof)
+
+    def boom(_p: dict[str, Any]) -> None:
+        raise RuntimeError("boom")
+
+    d.register("boom", boom)
+    prof.enable("*")
+    with pytest.raises(Exception):
+        d.dispatch("boom", {})
+    assert prof.status()["sampled_calls"] == 1
+
+    prof.disable()
+    prof.reset()
+    assert prof.status() == {
+        "enabled": False,
+        "handler": None,
+        "sample_rate": 1.0,
+        "sampled_calls": 0,
+        "skipped_calls": 0,
+        "has_stats": False,
+    }
+
+
+def test_profiling_rejects_bad_config():
+    prof = ProfilingInstrumentationStrategy()
+    with pytest.raises(ValueError):
+        prof.enable("", 1.0)
+    with pytest.raises(ValueError):
+        prof.enable("busy", 0.0)
+    prof.enable("busy")
+    prof.profile_call("busy", lambda: _busy({"n": 10}))
+    with pytest.raises(ValueError):
+        prof.report(sort="bogus")
+
+
+def test_profile_endpoints_roundtrip(monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from blender_mcp import asgi
+
+    class FakeServer:
+        __name__ = "fake_server"
+
+        @staticmethod
+        def busy_tool(ctx, **params):
+            return _busy(params)
+
+    app = asgi.create_app(FakeServer)
+    client = TestClient(app)
+
+    # Switching profiling on is opt-in
+    denied = client.post("/debug/profile", json={"handler": "busy_tool"})
+    assert denied.status_code == 403 and denied.json()["error_code"] == "policy_denied"
+    assert client.delete("/debug/profile").status_code == 403
+    monkeypatch.setenv("BLENDER_MCP_DEBUG_PROFILE", "1")
+
+    assert client.get("/debug/profile/pstats").status_code == 404
+    assert client.post("/debug/profile", json={"handler": "busy_tool", "sample_rate": 2}).status_code == 400
+
+    resp = client.post("/debug/profile", json={"handler": "busy_tool"})
+    assert resp.status_code == 200
+    assert resp.json()["profile"]["enabled"] is True
+
+    assert client.post("/tools/busy_tool", json={"params": {"n": 5000}}).status_code == 200
+    assert client.get("/debug/profile").json()["profile"]["sampled_calls"] == 1
+
+    report = client.get("/debug/profile/report", params={"top": 5})
+    assert report.status_code == 200
+    assert "function calls" in report.text
+
+    dump = client.get("/debug/profile/pstats")
+    assert dump.status_code == 200
+    assert "attachment" in dump.headers["content-disposition"]
+    assert marshal.loads(dump.content)
+
+    off = client.delete("/debug/profile", params={"reset": True})
+    assert off.json()["profile"]["has_stats"] is False
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from blender_mcp.dispatchers.dispatcher import Dispatcher, HandlerError
+from blender_mcp.dispatchers.singleflight import SingleFlight, coalescable, make_key
+
+
+def _blocking_handler(calls: dict[str, int], release: threading.Event):
+    def handler(p: dict[str, Any]) -> dict[str, Any]:
+        calls["n"] += 1
+        release.wait(timeout=5)
+        return {"asset": p.get("asset_type")}
+
+    return handler
+
+
+def _run_concurrently(d: Dispatcher, name: str, params_list: list[dict[str, Any]], release: threading.Event):
+    with ThreadPoolExecutor(max_workers=len(params_list)) as ex:
+        futs = [ex.submit(d.dispatch, name, p) for p in params_list]
+        # wait until the leader is running and followers are parked on it
+        for _ in range(200):
+            if sum(d.coalescing_stats().get(name, {}).values()) == len(params_list):
+                break
+            time.sleep(0.01)
+        release.set()
+        return [f.result(timeout=5) for f in futs]
+
+
+def test_make_key_is_canonical():
+    assert make_key("s", {"a": 1, "b": [1, 2]}) == make_key("s", {"b": [1, 2], "a": 1})
+    assert make_key("s", {"a": 1}) != make_key("t", {"a": 1})
+    assert make_key("s", None) == make_key("s", {})
+
+
+def test_identical_calls_share_one_execution():
+    calls = {"n": 0}
+    release = threading.Event()
+    d = Dispatcher()
+    d.register("search", _blocking_handler(calls, release), coalesce=True)
+
+    results = _run_concurrently(d, "search", [{"asset_type": "textures"}] * 4, release)
+
+    assert calls["n"] == 1
+    assert all(r == {"asset": "textures"} for r in results)
+    assert d.coalescing_stats()["search"] == {"executed": 1, "coalesced": 3}
+
+
+def test_different_params_do_not_coalesce():
+    calls = {"n": 0}
+    d = Dispatcher()
+    d.register("search", lambda p: calls.update(n=calls["n"] + 1) or p, coalesce=True)
+    d.dispatch("search", {"asset_type": "hdris"})
+    d.dispatch("search", {"asset_type": "models"})
+    assert calls["n"] == 2
+
+
+def test_opt_in_via_marker_and_opt_out_via_register():
+    @coalescable()
+    def marked(p: dict[str, Any]) -> Any:
+        return p
+
+    d = Dispatcher()
+    d.register("marked", marked)
+    d.register("marked_off", marked, coalesce=False)
+    d.register("plain", lambda p: p)
+
+    assert d._should_coalesce("marked", marked) is True
+    assert d._should_coalesce("marked_off", marked) is False
+    assert d._should_coalesce("plain", lambda p: p) is False
+    assert Dispatcher(coalesce_by_default=True)._should_coalesce("plain", lambda p: p) is True
+
+
+def test_leader_error_propagates_to_followers():
+    sf = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def boom():
+        started.set()
+        release.wait(timeout=5)
+        raise RuntimeError("upstream down")
+
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        leader = ex.submit(sf.do, "k", boom)
+        started.wait(timeout=5)
+        follower = ex.submit(sf.do, "k", lambda: "never")
+        for _ in range(200):
+            if sf.stats().get("k", {}).get("coalesced"):
+                break
+            time.sleep(0.01)
+        release.set()
+        with pytest.raises(RuntimeError):
+            leader.result(timeout=5)
+        with pytest.raises(RuntimeError):
+            follower.result(timeout=5)
+    assert sf.in_flight() == 0
+
+
+def test_coalesced_calls_reported_to_instrumentation():
+    events: list[str] = []
+
+    class Inst:
+        def on_dispatch_start(self, name, params):
+            events.append("start")
+
+        def on_dispatch_success(self, name, result, elapsed_s):
+            events.append("success")
+
+        def on_dispatch_error(self, name, error, elapsed_s):
+            events.append("error")
+
+        def on_adapter_invoke(self, adapter_name, cmd_type, params):
+            pass
+
+        def on_dispatch_coalesced(self, name, params):
+            events.append("coalesced")
+
+    calls = {"n": 0}
+    release = threading.Event()
+    d = Dispatcher(instrumentation_strategy=Inst())
+    d.register("dl", _blocking_handler(calls, release), coalesce=True)
+    _run_concurrently(d, "dl", [{"asset_type": "models"}] * 3, release)
+
+    assert events.count("start") == 1
+    assert events.count("success") == 1
+    assert events.count("coalesced") == 2
+
+
+def test_service_fallback_keeps_marker(monkeypatch):
+    from blender_mcp.services import registry
+
+    @coalescable()
+    def svc(params):
+        return {"status": "success", "result": params}
+
+    monkeypatch.setitem(registry._SERVICES, "tmp_coalesced_service", svc)
+    d = Dispatcher()
+    fn = d._resolve_handler_or_service("tmp_coalesced_service")
+    assert fn is not None and d._should_coalesce("tmp_coalesced_service", fn)
+    assert d.dispatch("tmp_coalesced_service", {"x": 1})["result"] == {"x": 1}
+
+
+def test_handler_errors_still_wrapped_when_coalescing():
+    d = Dispatcher()
+
+    def bad(_p):
+        raise ValueError("bad")
+
+    d.register("bad", bad, coalesce=True)
+    with pytest.raises(HandlerError):
+        d.dispatch("bad", {})
+
+
+def test_only_read_only_services_coalesce():
+    from blender_mcp.dispatchers.singleflight import coalesce_flag
+    from blender_mcp.services import polyhaven, sketchfab
+
+    assert coalesce_flag(polyhaven.search_polyhaven_assets) is True
+    assert coalesce_flag(sketchfab.search_sketchfab_models) is True
+    # Downloads return per-call directories and report progress to their caller
+    assert coalesce_flag(polyhaven.download_polyhaven_asset) is None
+    assert coalesce_flag(sketchfab.download_sketchfab_model) is None
@@ -8,6 +8,7 @@ import zipfile
 import pytest
 
 from blender_mcp import downloaders
+from blender_mcp.http import get_session
 
 
 class DummyResp:
@@ -28,7 +29,7 @@ def test_download_bytes_success(monkeypatch):
         called["ok"] = True
         return DummyResp(b"ok")
 
-    monkeypatch.setattr(downloaders.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
 
     data = downloaders.download_bytes("https://example.com/foo", timeout=5)
     assert data == b"ok"
@@ -39,7 +40,7 @@ def test_download_bytes_raises_on_error(monkeypatch):
     def fake_get(url, timeout=None, headers=None):
         return DummyResp(b"", status=404)
 
-    monkeypatch.setattr(downloaders.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
 
     with pytest.raises(RuntimeError):
         downloaders.download_bytes("https://example.com/missing")
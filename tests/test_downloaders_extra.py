@@ -13,12 +13,13 @@ from blender_mcp import downloaders
 
 
 def test_download_to_tempfile_happy_path(monkeypatch, tmp_path):
-    # Monkeypatch download_bytes used by download_to_tempfile
-    def fake_download_bytes(url, timeout=None, headers=None):
+    # Monkeypatch download_to_file used by download_to_tempfile
+    def fake_download_to_file(url, dest, timeout=None, headers=None):
         assert url == "https://example.com/data.bin"
-        return b"HELLO"
+        with open(dest, "wb") as fh:
+            fh.write(b"HELLO")
 
-    monkeypatch.setattr(downloaders, "download_bytes", fake_download_bytes)
+    monkeypatch.setattr(downloaders, "download_to_file", fake_download_to_file)
 
     out = downloaders.download_to_tempfile("https://example.com/data.bin", prefix="p_", suffix=".bin")
     assert os.path.exists(out)
@@ -29,10 +30,15 @@ def test_download_to_tempfile_happy_path(monkeypatch, tmp_path):
 
 
 def test_download_to_tempfile_propagates_errors(monkeypatch):
-    def fake_download_bytes(url, timeout=None, headers=None):
+    created = []
+
+    def fake_download_to_file(url, dest, timeout=None, headers=None):
+        created.append(dest)
         raise RuntimeError("network fail")
 
-    monkeypatch.setattr(downloaders, "download_bytes", fake_download_bytes)
+    monkeypatch.setattr(downloaders, "download_to_file", fake_download_to_file)
 
     with pytest.raises(RuntimeError):
         downloaders.download_to_tempfile("https://example.com/broken")
+    # The placeholder temp file is removed on failure
+    assert created and not os.path.exists(created[0])
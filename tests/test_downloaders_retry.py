@@ -2,6 +2,7 @@ import pytest
 import requests
 
 from blender_mcp import downloaders
+from blender_mcp.http import get_session
 
 
 def test_download_bytes_retries_success(monkeypatch):
@@ -23,7 +24,7 @@ def test_download_bytes_retries_success(monkeypatch):
 
     # Patch sleep to avoid test delay, and requests.get to simulate timeouts
     monkeypatch.setattr(downloaders, "time", type("T", (), {"sleep": lambda *_: None}))
-    monkeypatch.setattr(downloaders.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
 
     res = downloaders.download_bytes("http://example.com/a.bin", max_retries=4, backoff_factor=0.01)
     assert res == b"OK"
@@ -70,7 +71,7 @@ def test_download_bytes_no_retry_on_4xx(monkeypatch):
         calls["n"] += 1
         return Resp404()
 
-    monkeypatch.setattr(downloaders.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
     # Patch sleep to avoid delay if retry attempted
     monkeypatch.setattr(downloaders, "time", type("T", (), {"sleep": lambda *_: None}))
 
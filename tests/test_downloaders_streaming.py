@@ -0,0 +1,285 @@
+"""Streaming downloads against a local HTTP server."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+import pytest
+
+from blender_mcp import downloaders, progress
+
+PAYLOAD = os.urandom(3 * 1024 * 1024 + 17)
+
+
+@pytest.fixture
+def server(range_server):
+    range_server.state["files"]["/asset.zip"] = (PAYLOAD, '"v1"')
+    return range_server
+
+
+def test_download_to_file_streams_to_path(server, tmp_path):
+    dest = tmp_path / "asset.zip"
+    events = []
+    with progress.reporting(events.append):
+        result = downloaders.download_to_file(server.url("/asset.zip"), str(dest), chunk_size=64 * 1024)
+
+    assert dest.read_bytes() == PAYLOAD
+    assert not (tmp_path / "asset.zip.part").exists()
+    assert result.path == str(dest)
+    assert result.size == len(PAYLOAD)
+    assert result.throughput > 0
+    final = events[-1]
+    assert final["stage"] == "downloaded" and final["done"] == len(PAYLOAD) and "bytes_per_s" in final
+
+
+def test_truncated_body_is_retried(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloaders.time, "sleep", lambda *_: None)
+    server.state["truncate"] = 1
+    dest = tmp_path / "asset.zip"
+
+    result = downloaders.download_to_file(server.url("/asset.zip"), str(dest), max_retries=2)
+
+    assert len(server.state["requests"]) == 2
+    assert result.size == len(PAYLOAD)
+    assert dest.read_bytes() == PAYLOAD
+
+
+def test_client_error_leaves_no_partial_file(server, tmp_path):
+    dest = tmp_path / "missing.zip"
+    with pytest.raises(downloaders.HTTPError):
+        downloaders.download_to_file(server.url("/missing"), str(dest), max_retries=3)
+    assert len(server.state["requests"]) == 1
+    assert os.listdir(tmp_path) == []
+
+
+def test_download_to_spooled_rolls_over_to_disk(server):
+    spool = downloaders.download_to_spooled(server.url("/asset.zip"), max_memory=1024 * 1024)
+    try:
+        assert spool._rolled  # larger than max_memory: backed by a real file
+        assert spool.read() == PAYLOAD
+    finally:
+        spool.close()
+
+
+def test_download_to_tempfile_streams(server):
+    path = downloaders.download_to_tempfile(server.url("/asset.zip"), prefix="p_", suffix=".zip")
+    try:
+        assert os.path.basename(path).startswith("p_") and path.endswith(".zip")
+        with open(path, "rb") as fh:
+            assert fh.read() == PAYLOAD
+    finally:
+        os.unlink(path)
+
+
+def test_streaming_memory_stays_bounded(server, tmp_path):
+    import tracemalloc
+
+    tracemalloc.start()
+    try:
+        downloaders.download_to_file(server.url("/asset.zip"), str(tmp_path / "a.zip"), chunk_size=64 * 1024)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < len(PAYLOAD) // 2
+
+
+def test_retry_resumes_with_range_request(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloaders.time, "sleep", lambda *_: None)
+    server.state.update(ranges=True, truncate=1)
+    dest = tmp_path / "asset.zip"
+
+    result = downloaders.download_to_file(server.url("/asset.zip"), str(dest), max_retries=2)
+
+    first, second = server.state["ranges_seen"]
+    assert first is None
+    assert 0 < result.resumed_from <= len(PAYLOAD) // 2
+    assert second == f"bytes={result.resumed_from}-"
+    assert dest.read_bytes() == PAYLOAD
+    assert not (tmp_path / "asset.zip.part.json").exists()
+
+
+def test_without_range_support_retry_restarts(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloaders.time, "sleep", lambda *_: None)
+    server.state["truncate"] = 1
+    dest = tmp_path / "asset.zip"
+
+    result = downloaders.download_to_file(server.url("/asset.zip"), str(dest), max_retries=2)
+
+    assert server.state["ranges_seen"] == [None, None]
+    assert result.resumed_from == 0
+    assert dest.read_bytes() == PAYLOAD
+
+
+def test_partial_file_persists_across_calls(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloaders.time, "sleep", lambda *_: None)
+    server.state.update(ranges=True, truncate=1)
+    dest = tmp_path / "asset.zip"
+
+    with pytest.raises(downloaders.RequestException):
+        downloaders.download_to_file(server.url("/asset.zip"), str(dest), max_retries=0)
+    received = (tmp_path / "asset.zip.part").stat().st_size
+    assert 0 < received <= len(PAYLOAD) // 2
+    meta = json.loads((tmp_path / "asset.zip.part.json").read_text())
+    assert meta["url"] == server.url("/asset.zip") and meta["etag"] == '"v1"' and meta["accept_ranges"] is True
+
+    # A later call (e.g. after a restart) picks up where the first stopped
+    result = downloaders.download_to_file(server.url("/asset.zip"), str(dest), max_retries=0)
+    assert result.resumed_from == received
+    assert dest.read_bytes() == PAYLOAD
+    assert sorted(os.listdir(tmp_path)) == ["asset.zip"]
+
+
+def test_changed_file_is_downloaded_again_in_full(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloaders.time, "sleep", lambda *_: None)
+    server.state.update(ranges=True, truncate=1)
+    dest = tmp_path / "asset.zip"
+    with pytest.raises(downloaders.RequestException):
+        downloaders.download_to_file(server.url("/asset.zip"), str(dest), max_retries=0)
+    received = (tmp_path / "asset.zip.part").stat().st_size
+
+    # The ETag no longer matches If-Range: the server answers 200 with the full body
+    server.state["files"]["/asset.zip"] = (PAYLOAD, '"v2"')
+    result = downloaders.download_to_file(server.url("/asset.zip"), str(dest), max_retries=0)
+    assert server.state["ranges_seen"][-1] == f"bytes={received}-"
+    assert result.resumed_from == 0
+    assert dest.read_bytes() == PAYLOAD
+
+
+def test_split_ranges_covers_file_exactly():
+    assert downloaders._split_ranges(10, 3) == [(0, 3), (4, 7), (8, 9)]
+    assert downloaders._split_ranges(2, 8) == [(0, 0), (1, 1)]
+    ranges = downloaders._split_ranges(len(PAYLOAD), 7)
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(PAYLOAD) - 1
+    assert all(b[0] == a[1] + 1 for a, b in zip(ranges, ranges[1:]))
+
+
+def test_segmented_download_assembles_ranges(server, tmp_path):
+    server.state["ranges"] = True
+    dest = tmp_path / "asset.zip"
+
+    result = downloaders.download_to_file(
+        server.url("/asset.zip"), str(dest), segments=4, segment_min_size=1, chunk_size=64 * 1024
+    )
+
+    assert dest.read_bytes() == PAYLOAD
+    assert result.size == len(PAYLOAD)
+    seen = server.state["ranges_seen"]
+    assert seen[0] == "bytes=0-0"
+    assert sorted(seen[1:]) == sorted(f"bytes={a}-{b}" for a, b in downloaders._split_ranges(len(PAYLOAD), 4))
+    assert os.listdir(tmp_path) == ["asset.zip"]
+
+
+def test_segment_failure_resumes_within_segment(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloaders.time, "sleep", lambda *_: None)
+    server.state.update(ranges=True, truncate=1)
+    dest = tmp_path / "asset.zip"
+
+    # The probe is a 1-byte range (never truncated): the first segment request is cut short
+    downloaders.download_to_file(
+        server.url("/asset.zip"), str(dest), segments=2, segment_min_size=1, chunk_size=64 * 1024
+    )
+
+    assert dest.read_bytes() == PAYLOAD
+    assert len(server.state["requests"]) == 1 + 2 + 1
+
+
+def test_segmented_falls_back_without_range_support(server, tmp_path):
+    dest = tmp_path / "asset.zip"
+    downloaders.download_to_file(server.url("/asset.zip"), str(dest), segments=4, segment_min_size=1)
+    assert dest.read_bytes() == PAYLOAD
+    # Probe answered 200: one single-stream download follows
+    assert server.state["ranges_seen"] == ["bytes=0-0", None]
+
+
+def test_small_files_are_not_segmented(server, tmp_path):
+    server.state["ranges"] = True
+    downloaders.download_to_file(
+        server.url("/asset.zip"), str(tmp_path / "a.zip"), segments=4, segment_min_size=1 << 30
+    )
+    assert server.state["ranges_seen"] == ["bytes=0-0", None]
+
+
+MD5 = hashlib.md5(PAYLOAD).hexdigest()
+
+
+def test_checksums_computed_while_streaming(server, tmp_path):
+    result = downloaders.download_to_file(
+        server.url("/asset.zip"),
+        str(tmp_path / "a.zip"),
+        expected_size=len(PAYLOAD),
+        checksums={"md5": MD5},
+        digests=["sha256"],
+    )
+    assert result.digests == {"md5": MD5, "sha256": hashlib.sha256(PAYLOAD).hexdigest()}
+
+
+def test_announced_size_mismatch_aborts_before_body(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloaders.time, "sleep", lambda *_: None)
+    with pytest.raises(downloaders.IntegrityError, match="announced"):
+        downloaders.download_to_file(
+            server.url("/asset.zip"), str(tmp_path / "a.zip"), expected_size=1000, max_retries=1
+        )
+    assert len(server.state["requests"]) == 2
+    assert os.listdir(tmp_path) == []
+
+
+def test_overrunning_stream_is_cut_at_expected_size(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloaders.time, "sleep", lambda *_: None)
+    server.state["no_length"] = True
+    dest = tmp_path / "a.zip"
+    events = []
+    with progress.reporting(events.append), pytest.raises(downloaders.IntegrityError, match="exceeds"):
+        downloaders.download_to_file(
+            server.url("/asset.zip"), str(dest), expected_size=100_000, chunk_size=64 * 1024, max_retries=1
+        )
+    assert len(server.state["requests"]) == 2
+    assert [e["stage"] for e in events].count("retry") == 1
+    assert os.listdir(tmp_path) == []
+
+
+def test_checksum_mismatch_retries_from_scratch(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloaders.time, "sleep", lambda *_: None)
+    server.state["ranges"] = True
+    with pytest.raises(downloaders.IntegrityError, match="md5 mismatch"):
+        downloaders.download_to_file(
+            server.url("/asset.zip"), str(tmp_path / "a.zip"), checksums={"md5": "0" * 32}, max_retries=1
+        )
+    # No Range on the retry: the bad bytes are not resumed
+    assert server.state["ranges_seen"] == [None, None]
+    assert os.listdir(tmp_path) == []
+
+
+def test_resumed_download_hashes_bytes_already_on_disk(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloaders.time, "sleep", lambda *_: None)
+    server.state.update(ranges=True, truncate=1)
+    dest = tmp_path / "asset.zip"
+    with pytest.raises(downloaders.RequestException):
+        downloaders.download_to_file(server.url("/asset.zip"), str(dest), max_retries=0, checksums={"md5": MD5})
+
+    result = downloaders.download_to_file(server.url("/asset.zip"), str(dest), max_retries=0, checksums={"md5": MD5})
+    assert result.resumed_from > 0
+    assert result.digests["md5"] == MD5
+
+
+def test_segmented_download_verifies_assembled_file(server, tmp_path, monkeypatch):
+    server.state["ranges"] = True
+    result = downloaders.download_to_file(
+        server.url("/asset.zip"), str(tmp_path / "a.zip"), segments=4, segment_min_size=1, checksums={"md5": MD5}
+    )
+    assert result.digests["md5"] == MD5
+    assert len(server.state["ranges_seen"]) == 5
+
+    # A mismatch falls back to the single stream, which retries and reports it
+    monkeypatch.setattr(downloaders.time, "sleep", lambda *_: None)
+    with pytest.raises(downloaders.IntegrityError):
+        downloaders.download_to_file(
+            server.url("/asset.zip"),
+            str(tmp_path / "b.zip"),
+            segments=4,
+            segment_min_size=1,
+            checksums={"md5": "0" * 32},
+            max_retries=0,
+        )
+    assert server.state["ranges_seen"][-1] is None
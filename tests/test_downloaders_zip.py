@@ -0,0 +1,144 @@
+"""Disk-backed secure zip extraction."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import shutil
+import zipfile
+
+import pytest
+
+from blender_mcp import downloaders
+
+
+def _make_zip(path, members, compression=zipfile.ZIP_DEFLATED):
+    with zipfile.ZipFile(path, "w", compression=compression) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return str(path)
+
+
+def _tree(root):
+    out = {}
+    for dirpath, _, files in os.walk(root):
+        for f in files:
+            full = os.path.join(dirpath, f)
+            with open(full, "rb") as fh:
+                out[os.path.relpath(full, root).replace(os.sep, "/")] = fh.read()
+    return out
+
+
+MEMBERS = {
+    "textures/diff.png": os.urandom(200_000),
+    "textures/nor.png": os.urandom(150_000),
+    "model.gltf": b'{"asset": {}}',
+}
+
+
+def test_extract_from_path_and_mmap(tmp_path):
+    src = _make_zip(tmp_path / "a.zip", MEMBERS)
+
+    out = downloaders.secure_extract_zip_file(src, str(tmp_path / "from_path"))
+    assert _tree(out) == MEMBERS
+
+    with open(src, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        out = downloaders.secure_extract_zip_file(mm, str(tmp_path / "from_mmap"))
+    assert _tree(out) == MEMBERS
+
+
+def test_traversal_rejected_before_anything_is_written(tmp_path):
+    src = _make_zip(tmp_path / "evil.zip", {"ok.txt": b"fine", "../escape.txt": b"bad"})
+    target = tmp_path / "out"
+    target.mkdir()
+    with pytest.raises(ValueError):
+        downloaders.secure_extract_zip_file(src, str(target))
+    assert os.listdir(target) == []
+    assert not (tmp_path / "escape.txt").exists()
+
+    src = _make_zip(tmp_path / "abs.zip", {"/etc/evil.txt": b"bad"})
+    with pytest.raises(ValueError):
+        downloaders.secure_extract_zip_file(src, str(target))
+
+
+def test_sibling_prefix_directory_is_not_inside_target(tmp_path):
+    # "<target>x/..." shares the string prefix of the target but is outside it
+    root = os.path.abspath(str(tmp_path / "out"))
+    assert downloaders._zip_member_path(root, zipfile.ZipInfo("a/b.txt")) == os.path.join(root, "a", "b.txt")
+    with pytest.raises(ValueError):
+        downloaders._zip_member_path(root, zipfile.ZipInfo(root + "x/a.txt"))
+
+
+def test_zip_bomb_rejected_early(tmp_path, monkeypatch):
+    bomb = _make_zip(tmp_path / "bomb.zip", {"zeros.bin": b"\0" * (4 << 20)})
+    created = []
+    real_mkdtemp = downloaders.tempfile.mkdtemp
+
+    def tracking_mkdtemp(**kwargs):
+        created.append(real_mkdtemp(**kwargs))
+        return created[-1]
+
+    monkeypatch.setattr(downloaders.tempfile, "mkdtemp", tracking_mkdtemp)
+    with pytest.raises(ValueError, match="compression ratio"):
+        downloaders.secure_extract_zip_file(bomb)
+    # The temp dir created for the extraction is removed again
+    assert created and not os.path.exists(created[0])
+
+    with pytest.raises(ValueError, match="expands beyond"):
+        downloaders.secure_extract_zip_file(
+            _make_zip(tmp_path / "big.zip", MEMBERS), str(tmp_path / "o"), max_total_size=100_000
+        )
+    with pytest.raises(ValueError, match="too many entries"):
+        downloaders.secure_extract_zip_file(
+            _make_zip(tmp_path / "many.zip", MEMBERS), str(tmp_path / "o"), max_members=2
+        )
+
+
+def test_parallel_extraction_of_large_members(tmp_path, monkeypatch):
+    monkeypatch.setattr(downloaders, "ZIP_PARALLEL_MIN_SIZE", 100_000)
+    src = _make_zip(tmp_path / "a.zip", MEMBERS)
+    out = downloaders.secure_extract_zip_file(src, str(tmp_path / "p"), workers=3)
+    assert _tree(out) == MEMBERS
+
+
+def test_extract_bytes_still_supported(tmp_path):
+    src = _make_zip(tmp_path / "a.zip", MEMBERS)
+    with open(src, "rb") as fh:
+        out = downloaders.secure_extract_zip_bytes(fh.read())
+    try:
+        assert _tree(out) == MEMBERS
+    finally:
+        shutil.rmtree(out)
+
+
+def test_download_and_extract_removes_the_zip(tmp_path, monkeypatch):
+    src = _make_zip(tmp_path / "a.zip", MEMBERS)
+    downloaded = []
+
+    def fake_download_to_tempfile(url, prefix="", suffix="", timeout=None, headers=None):
+        path = str(tmp_path / f"dl{suffix}")
+        shutil.copy(src, path)
+        downloaded.append(path)
+        return path
+
+    monkeypatch.setattr(downloaders, "download_to_tempfile", fake_download_to_tempfile)
+    out = downloaders.download_and_extract_zip("https://dl.polyhaven.org/x.zip", workers=2)
+    try:
+        assert _tree(out) == MEMBERS
+        assert not os.path.exists(downloaded[0])
+    finally:
+        shutil.rmtree(out)
+
+
+def test_extraction_memory_is_bounded(tmp_path):
+    import tracemalloc
+
+    payload = {f"m{i}.bin": os.urandom(2 << 20) for i in range(3)}
+    src = _make_zip(tmp_path / "big.zip", payload, compression=zipfile.ZIP_STORED)
+    tracemalloc.start()
+    try:
+        downloaders.secure_extract_zip_file(src, str(tmp_path / "out"))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 4 << 20
@@ -0,0 +1,207 @@
+import json
+import os
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from blender_mcp.services.connection import fleet as fleet_mod
+from blender_mcp.services.connection.fleet import BlenderFleet, FleetEndpoint
+from blender_mcp.services.connection.network_core import NetworkCore
+
+
+class FakeCore:
+    """Stands in for NetworkCore; records which endpoint served each command."""
+
+    def __init__(self, endpoint, log, down):
+        self.endpoint = endpoint
+        self.log = log
+        self.down = down
+
+    def connect(self):
+        return self.endpoint.address not in self.down
+
+    def disconnect(self):
+        pass
+
+    def send_command(self, command_type, params=None):
+        self.log.append((self.endpoint.address, command_type))
+        return {"status": "success", "result": {"served_by": self.endpoint.address}}
+
+
+def make_fleet(addresses, **kwargs):
+    log, down = [], set()
+    fl = BlenderFleet(addresses, core_factory=lambda ep: FakeCore(ep, log, down), **kwargs)
+    return fl, log, down
+
+
+def served_by(reply):
+    return reply["result"]["served_by"]
+
+
+def test_endpoint_parsing():
+    ep = FleetEndpoint("10.0.0.2:9877")
+    assert (ep.host, ep.port, ep.unix_path) == ("10.0.0.2", 9877, None)
+    assert FleetEndpoint("unix:/tmp/b.sock").unix_path == "/tmp/b.sock"
+    with pytest.raises(ValueError):
+        FleetEndpoint("localhost")
+    assert fleet_mod.parse_fleet(" a:1, ,b:2 ") == ["a:1", "b:2"]
+
+
+def test_least_loaded_prefers_idle_and_faster_endpoints():
+    fl, _, _ = make_fleet(["a:1", "b:2"])
+    a, b = fl.endpoints
+    a.ewma_ms, b.ewma_ms = 50.0, 10.0
+    assert served_by(fl.send_command("get_scene_info")) == "b:2"
+
+    # b is busy with three commands: a's expected wait is now lower
+    a.ewma_ms, b.ewma_ms = 50.0, 10.0
+    b.in_flight = 5
+    assert served_by(fl.send_command("get_scene_info")) == "a:1"
+
+
+def test_sticky_session_keeps_its_endpoint():
+    fl, _, _ = make_fleet(["a:1", "b:2"])
+    first = served_by(fl.send_command("create_object", key="scene-1"))
+    # Make the bound endpoint look more loaded: affinity still wins
+    bound = next(ep for ep in fl.endpoints if ep.address == first)
+    bound.ewma_ms = 1000.0
+    for _ in range(3):
+        assert served_by(fl.send_command("modify_object", key="scene-1")) == first
+
+    with fleet_mod.session("scene-1"):
+        assert served_by(fl.connection().send_command("modify_object")) == first
+
+
+def test_unreachable_endpoint_fails_over_and_rebinds():
+    clock = [0.0]
+    fl, log, down = make_fleet(["a:1", "b:2"], unhealthy_after=1, recheck_after=5.0, clock=lambda: clock[0])
+    assert served_by(fl.send_command("create_object", key="s")) == "a:1"
+
+    down.add("a:1")
+    assert served_by(fl.send_command("modify_object", key="s")) == "b:2"
+    assert fl.rebinds == 1
+    stats = fl.stats()["endpoints"]
+    assert stats["a:1"]["healthy"] is False
+    assert stats["a:1"]["errors"] == 1
+    # The failed attempt never reached Blender
+    assert log == [("a:1", "create_object"), ("b:2", "modify_object")]
+
+    # Session now sticks to b even after a recovers
+    down.clear()
+    clock[0] = 10.0
+    assert served_by(fl.send_command("modify_object", key="s")) == "b:2"
+
+
+def test_all_endpoints_down_raises_connection_error():
+    fl, _, down = make_fleet(["a:1", "b:2"])
+    down.update({"a:1", "b:2"})
+    with pytest.raises(ConnectionError):
+        fl.send_command("get_scene_info")
+
+
+def test_errors_after_send_are_not_retried():
+    class Boom(FakeCore):
+        def send_command(self, command_type, params=None):
+            self.log.append((self.endpoint.address, command_type))
+            raise ConnectionResetError("reset by peer")
+
+    log = []
+    fl = BlenderFleet(["a:1", "b:2"], core_factory=lambda ep: Boom(ep, log, set()))
+    with pytest.raises(ConnectionResetError):
+        fl.send_command("execute_code")
+    assert len(log) == 1
+
+
+def test_probe_restores_endpoint_and_reports_down_fleet():
+    fl, _, down = make_fleet(["a:1", "b:2"], unhealthy_after=1)
+    down.add("a:1")
+    fl.send_command("get_scene_info")
+    assert fl.probe() == {"endpoints": {"a:1": "down", "b:2": "up"}}
+
+    down.clear()
+    assert fl.probe() == {"endpoints": {"a:1": "up", "b:2": "up"}}
+
+    down.update({"a:1", "b:2"})
+    with pytest.raises(ConnectionError):
+        fl.probe()
+
+
+def test_ping_keeps_the_connection_to_itself():
+    class LockCheckingCore(FakeCore):
+        def send_command(self, command_type, params=None):
+            # A command racing the ping would interleave on the socket
+            assert self.endpoint._io_lock.locked()
+            return super().send_command(command_type, params)
+
+    log = []
+    ep = FleetEndpoint("a:1", core_factory=lambda e: LockCheckingCore(e, log, set()))
+    assert ep.try_ping() is True
+    assert not ep._io_lock.locked()
+
+    with ep._io_lock:
+        assert ep.try_ping() is None
+    assert log == [("a:1", "ping")]
+
+
+def test_get_blender_connection_routes_through_configured_fleet(monkeypatch):
+    from blender_mcp import connection_core
+
+    monkeypatch.setenv("BLENDER_MCP_FLEET", "localhost:1,localhost:2")
+    fleet_mod.reset_fleet()
+    try:
+        conn = connection_core.get_blender_connection()
+        assert isinstance(conn, fleet_mod.FleetConnection)
+        assert [ep.address for ep in conn.fleet.endpoints] == ["localhost:1", "localhost:2"]
+    finally:
+        monkeypatch.delenv("BLENDER_MCP_FLEET")
+        fleet_mod.reset_fleet()
+    assert fleet_mod.get_fleet() is None
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="unix sockets unavailable")
+def test_network_core_unix_socket():
+    path = os.path.join(tempfile.mkdtemp(), "blender.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+
+    def serve():
+        conn, _ = server.accept()
+        with conn:
+            cmd = json.loads(conn.recv(4096).decode().strip())
+            conn.sendall(json.dumps({"status": "success", "result": cmd["type"]}).encode())
+
+    t = threading.Thread(target=serve, daemon=True)
+    t.start()
+    core = NetworkCore(unix_path=path)
+    try:
+        assert core.send_command("ping") == {"status": "success", "result": "ping"}
+    finally:
+        core.disconnect()
+        t.join(2)
+        server.close()
+
+
+def test_asgi_session_header_sets_affinity_key():
+    pytest.importorskip("fastapi")
+    import types
+
+    from fastapi.testclient import TestClient
+
+    from blender_mcp import asgi
+    from blender_mcp.health import HealthProber
+
+    mod = types.ModuleType("fake_server")
+
+    def whoami(ctx):
+        return {"session": fleet_mod.current_session()}
+
+    mod.whoami = whoami
+    app = asgi.create_app(mod, health_prober=HealthProber({}, {}))
+    client = TestClient(app)
+    resp = client.post("/tools/whoami", json={}, headers={"X-Blender-Session": "scene-42"})
+    assert resp.json()["result"] == {"session": "scene-42"}
+    assert client.post("/tools/whoami", json={}).json()["result"] == {"session": None}
+    assert client.get("/debug/fleet").json() == {"status": "ok", "enabled": False}
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from blender_mcp import circuit_breaker
+from blender_mcp.health import HealthProber, make_blender_ping
+
+
+def test_snapshot_unknown_before_first_probe():
+    prober = HealthProber({"blender": lambda: {}}, {})
+    snap = prober.snapshot()
+    assert snap["status"] == "unknown"
+    assert snap["blender"] == "unknown"
+    assert snap["checks"]["blender"] == {"status": "unknown"}
+
+
+def test_probe_caches_state_age_and_latency(fake_clock):
+    prober = HealthProber(
+        {"blender": lambda: {"endpoint": "x"}},
+        {"polyhaven": lambda: {"message": "ok"}},
+        clock=fake_clock,
+    )
+    asyncio.run(prober.probe_once())
+    fake_clock.now += 4.0
+
+    snap = prober.snapshot()
+    assert snap["status"] == "ok"
+    assert snap["blender"] == "connected"
+    assert snap["age_s"] == 4.0
+    assert snap["latency_ms"] >= 0
+    assert snap["checks"]["blender"]["details"] == {"endpoint": "x"}
+    assert snap["checks"]["polyhaven"]["status"] == "ok"
+
+
+def test_provider_failure_degrades_and_blender_failure_errors():
+    def down():
+        raise ConnectionError("refused")
+
+    prober = HealthProber({"blender": lambda: {}}, {"polyhaven": down})
+    asyncio.run(prober.probe_once())
+    assert prober.snapshot()["status"] == "degraded"
+
+    prober = HealthProber({"blender": down}, {})
+    asyncio.run(prober.probe_once())
+    snap = prober.snapshot()
+    assert snap["status"] == "error"
+    assert snap["blender"] == "disconnected"
+    assert snap["checks"]["blender"]["error"] == "refused"
+
+
+def test_slow_check_times_out():
+    prober = HealthProber({"blender": lambda: time.sleep(1) or {}}, {}, timeout=0.05)
+    asyncio.run(prober.probe_once())
+    assert "timed out" in prober.snapshot()["checks"]["blender"]["error"]
+
+
+def test_providers_probed_on_their_own_interval(fake_clock):
+    calls = {"provider": 0}
+
+    def provider():
+        calls["provider"] += 1
+        return {}
+
+    prober = HealthProber({"blender": lambda: {}}, {"p": provider}, provider_interval=60, clock=fake_clock)
+
+    async def scenario():
+        await prober.probe_once()
+        fake_clock.now += 15
+        await prober.probe_once()
+        fake_clock.now += 60
+        await prober.probe_once()
+
+    asyncio.run(scenario())
+    assert calls["provider"] == 2
+
+
+def test_hyper3d_check_follows_circuit_state():
+    from blender_mcp.health import default_provider_checks
+
+    check = default_provider_checks()["hyper3d"]
+    assert check() == {"circuit": "closed"}
+    breaker = circuit_breaker.get_breaker("hyper3d")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    with pytest.raises(ConnectionError):
+        check()
+
+
+def test_blender_ping_over_socket():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    port = server.getsockname()[1]
+    received = {}
+
+    def serve():
+        conn, _ = server.accept()
+        with conn:
+            received["cmd"] = json.loads(conn.recv(4096).decode().strip())
+            conn.sendall(json.dumps({"status": "ok", "result": {"ping": "pong"}}).encode())
+
+    t = threading.Thread(target=serve, daemon=True)
+    t.start()
+    try:
+        details = make_blender_ping("127.0.0.1", port, timeout=2)()
+    finally:
+        t.join(2)
+        server.close()
+
+    assert received["cmd"] == {"type": "ping", "params": {"msg": "health"}}
+    assert details == {"endpoint": f"127.0.0.1:{port}", "reply_status": "ok"}
+
+
+def test_blender_ping_bounded_by_timeout_when_blender_hangs():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    port = server.getsockname()[1]
+    try:
+        started = time.monotonic()
+        with pytest.raises(socket.timeout):
+            make_blender_ping("127.0.0.1", port, timeout=0.3)()
+        # Not NetworkCore's 15s default reply timeout
+        assert time.monotonic() - started < 2
+    finally:
+        server.close()
+
+
+def test_health_endpoint_returns_cached_state_without_blocking():
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from blender_mcp import asgi
+
+    release = threading.Event()
+
+    def slow_blender():
+        release.wait(5)
+        return {}
+
+    prober = HealthProber({"blender": slow_blender}, {}, timeout=10)
+    with TestClient(asgi.create_app(health_prober=prober)) as client:
+        started = time.perf_counter()
+        first = client.get("/health").json()
+        assert time.perf_counter() - started < 1.0
+        assert first["status"] == "unknown"
+
+        release.set()
+        for _ in range(200):
+            if client.get("/health").json()["status"] == "ok":
+                break
+            time.sleep(0.01)
+        assert client.get("/health").json()["blender"] == "connected"
+    assert not prober.running
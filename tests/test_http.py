@@ -0,0 +1,81 @@
+"""Pooled HTTP session against a local keep-alive server."""
+
+from __future__ import annotations
+
+import socket
+import threading
+
+import pytest
+import requests
+
+from blender_mcp import http
+
+
+@pytest.fixture
+def server(range_server):
+    range_server.keep_alive = True
+    range_server.state["files"].update({"/": (b"ok", '"ok"'), "/slow": (b"ok", '"ok"')})
+    range_server.state["delays"]["/slow"] = 1.0
+    return range_server
+
+
+def test_shared_session_reuses_connections(server):
+    session = http.get_session()
+    assert http.get_session() is session
+    for _ in range(5):
+        assert session.get(server.url("/")).content == b"ok"
+
+    host = f"127.0.0.1:{server.server_address[1]}"
+    counters = http.stats()["hosts"][host]
+    assert counters == {"requests": 5, "connections": 1, "reused": 4, "reuse_ratio": 0.8}
+
+
+def test_pool_keeps_connections_after_a_burst(server):
+    session = http.make_session(pool_size=2)
+    host = f"127.0.0.1:{server.server_address[1]}"
+    threads = [threading.Thread(target=lambda: session.get(server.url("/"))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    after_burst = session.metrics.snapshot()[host]
+    assert after_burst["requests"] == 8
+
+    # Sequential follow-ups are served by the connections kept in the pool
+    for _ in range(4):
+        session.get(server.url("/"))
+    assert session.metrics.snapshot()[host]["connections"] == after_burst["connections"]
+
+
+def test_default_timeout_applies_when_none_given(server):
+    session = http.make_session(timeout=(1.0, 0.2))
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        session.get(server.url("/slow"))
+    # An explicit timeout still wins
+    assert session.get(server.url("/slow"), timeout=5).content == b"ok"
+
+
+def test_connection_failures_retried_at_transport_level():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()  # nothing listens here: connections are refused
+
+    session = http.make_session(retries=2)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get(f"http://127.0.0.1:{port}/")
+    # first attempt + 2 retries, each opening a connection
+    assert session.metrics.snapshot()[f"127.0.0.1:{port}"]["connections"] == 3
+
+
+def test_stats_empty_before_first_use():
+    assert http.stats() == {"hosts": {}}
+
+
+def test_env_configures_pool(monkeypatch):
+    monkeypatch.setenv("BLENDER_MCP_HTTP_POOL_SIZE", "4")
+    monkeypatch.setenv("BLENDER_MCP_HTTP_READ_TIMEOUT", "7")
+    http.get_session()
+    out = http.stats()
+    assert out["pool_size"] == 4
+    assert out["timeout"] == (5.0, 7.0)
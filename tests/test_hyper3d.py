@@ -7,6 +7,7 @@ if SRC_PATH not in sys.path:
     sys.path.insert(0, SRC_PATH)
 
 import blender_mcp.hyper3d as hyper3d
+from blender_mcp.http import get_session
 
 
 class DummyResp:
@@ -22,7 +23,7 @@ def test_create_rodin_job_main_site(monkeypatch):
     def fake_post(url, headers=None, files=None):
         return DummyResp(200, {"job": "ok"})
 
-    monkeypatch.setattr(hyper3d.requests, "post", fake_post)
+    monkeypatch.setattr(get_session(), "post", fake_post)
     res = hyper3d.create_rodin_job_main_site(api_key="k", text_prompt="hi")
     assert res.get("job") == "ok"
 
@@ -31,7 +32,7 @@ def test_poll_status_main_site(monkeypatch):
     def fake_post(url, headers=None, json=None):
         return DummyResp(200, {"jobs": [{"status": "done"}, {"status": "queued"}]})
 
-    monkeypatch.setattr(hyper3d.requests, "post", fake_post)
+    monkeypatch.setattr(get_session(), "post", fake_post)
     res = hyper3d.poll_rodin_job_status_main_site(api_key="k", subscription_key="s")
     assert res["status_list"] == ["done", "queued"]
 
@@ -41,15 +42,17 @@ def test_import_generated_asset_main_site(monkeypatch, tmp_path):  # noqa: C901
     def fake_post(url, headers=None, json=None):
         return DummyResp(200, {"list": [{"name": "asset.glb", "url": "https://example.com/asset.glb"}]})
 
-    monkeypatch.setattr(hyper3d.requests, "post", fake_post)
+    monkeypatch.setattr(get_session(), "post", fake_post)
 
     called = {}
 
-    def fake_download_bytes(url, timeout=30):
+    def fake_download_to_tempfile(url, prefix="", suffix="", timeout=30):
         called["url"] = url
-        return b"GLB"
+        path = tmp_path / f"{prefix}{suffix}"
+        path.write_bytes(b"GLB")
+        return str(path)
 
-    monkeypatch.setattr(hyper3d.downloaders, "download_bytes", fake_download_bytes)
+    monkeypatch.setattr(hyper3d.downloaders, "download_to_tempfile", fake_download_to_tempfile)
 
     res = hyper3d.import_generated_asset_main_site(api_key="k", task_uuid="t1", name="n")
     assert res.get("succeed") is True
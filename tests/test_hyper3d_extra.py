@@ -1,12 +1,15 @@
 import os
 import sys
 
+import pytest
+
 TEST_ROOT = os.path.dirname(__file__)
 SRC_PATH = os.path.abspath(os.path.join(TEST_ROOT, "..", "src"))
 if SRC_PATH not in sys.path:
     sys.path.insert(0, SRC_PATH)
 
 import blender_mcp.hyper3d as hyper3d
+from blender_mcp.http import get_session
 
 
 class DummyResp:
@@ -23,13 +26,13 @@ def test_import_generated_asset_main_site_streaming_fallback(monkeypatch, tmp_pa
     def fake_post(url, headers=None, json=None):
         return DummyResp(200, {"list": [{"name": "asset.glb", "url": "https://example.com/asset.glb"}]})
 
-    monkeypatch.setattr(hyper3d.requests, "post", fake_post)
+    monkeypatch.setattr(get_session(), "post", fake_post)
 
-    # Make downloaders.download_bytes raise so the code falls back to streaming
-    def fake_download_bytes(url, timeout=30):
+    # Make downloaders.download_to_tempfile raise so the code falls back to streaming
+    def fake_download_to_tempfile(url, prefix="", suffix="", timeout=30):
         raise RuntimeError("download helper not available")
 
-    monkeypatch.setattr(hyper3d.downloaders, "download_bytes", fake_download_bytes)
+    monkeypatch.setattr(hyper3d.downloaders, "download_to_tempfile", fake_download_to_tempfile)
 
     # Fake requests.get streaming response
     class StreamResp:
@@ -48,28 +51,48 @@ def test_import_generated_asset_main_site_streaming_fallback(monkeypatch, tmp_pa
     def fake_get(url, stream=None, headers=None, timeout=None):
         return StreamResp(b"GLB-DATA")
 
-    monkeypatch.setattr(hyper3d.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
 
     res = hyper3d.import_generated_asset_main_site(api_key="k", task_uuid="t1", name="n")
     assert res.get("succeed") is True
     assert os.path.exists(res.get("temp_file"))
 
 
+def test_import_generated_asset_main_site_no_fallback_after_failed_check(monkeypatch):
+    def fake_post(url, headers=None, json=None):
+        return DummyResp(200, {"list": [{"name": "asset.glb", "url": "https://example.com/asset.glb"}]})
+
+    def corrupt(url, **kwargs):
+        raise hyper3d.downloaders.IntegrityError("size mismatch")
+
+    def fake_get(url, stream=None, headers=None, timeout=None):
+        raise AssertionError("unchecked fallback download")
+
+    monkeypatch.setattr(get_session(), "post", fake_post)
+    monkeypatch.setattr(get_session(), "get", fake_get)
+    monkeypatch.setattr(hyper3d.downloaders, "fetch_cached_file", corrupt)
+
+    with pytest.raises(hyper3d.downloaders.IntegrityError):
+        hyper3d.import_generated_asset_main_site(api_key="k", task_uuid="t1", name="n")
+
+
 def test_import_generated_asset_fal_ai_prefers_downloaders(monkeypatch, tmp_path):
     # Respond with a model_mesh url
     def fake_get_meta(url, headers=None):
         return DummyResp(200, {"model_mesh": {"url": "https://example.com/m.glb"}})
 
-    monkeypatch.setattr(hyper3d.requests, "get", fake_get_meta)
+    monkeypatch.setattr(get_session(), "get", fake_get_meta)
 
     called = {}
 
-    def fake_download_bytes(url, timeout=30):
+    def fake_download_to_tempfile(url, prefix="", suffix="", timeout=30):
         called["url"] = url
-        # write a glb file bytes
-        return b"GLB"
+        # write a glb file
+        path = tmp_path / f"{prefix}{suffix}"
+        path.write_bytes(b"GLB")
+        return str(path)
 
-    monkeypatch.setattr(hyper3d.downloaders, "download_bytes", fake_download_bytes)
+    monkeypatch.setattr(hyper3d.downloaders, "download_to_tempfile", fake_download_to_tempfile)
 
     res = hyper3d.import_generated_asset_fal_ai(api_key="k", request_id="r1", name="nm")
     assert res.get("succeed") is True
@@ -82,7 +105,7 @@ def test_poll_rodin_job_status_fal_ai_fallback(monkeypatch):
     def fake_poll(url, headers=None):
         return DummyResp(200, {"status": "done"})
 
-    monkeypatch.setattr(hyper3d.requests, "get", fake_poll)
+    monkeypatch.setattr(get_session(), "get", fake_poll)
 
     res = hyper3d.poll_rodin_job_status_fal_ai(api_key="k", request_id="rid")
     assert isinstance(res, dict)
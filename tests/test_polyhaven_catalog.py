@@ -0,0 +1,100 @@
+"""Offline PolyHaven catalog: index, pagination, persistence and refresh."""
+
+from __future__ import annotations
+
+import pytest
+
+from blender_mcp.services import polyhaven as svc_polyhaven
+from blender_mcp.services import polyhaven_catalog
+from blender_mcp.services.polyhaven_catalog import PolyHavenCatalog
+
+ASSETS = {
+    "sky": {"name": "Sky", "type": 0, "categories": ["outdoor", "skies"], "tags": ["sun"], "download_count": 50},
+    "studio": {"name": "Studio", "type": 0, "categories": ["indoor", "studio"], "tags": [], "download_count": 80},
+    "bark": {"name": "Bark", "type": 1, "categories": ["wood", "natural"], "tags": ["tree"], "download_count": 30},
+    "plank": {"name": "Plank", "type": 1, "categories": ["wood", "man made"], "tags": [], "download_count": 90},
+    "chair": {"name": "Chair", "type": 2, "categories": ["furniture", "wood"], "tags": [], "download_count": 10},
+}
+
+
+def _loaded(tmp_path, clock, loader=None):
+    calls = []
+
+    def load():
+        calls.append(1)
+        return dict(ASSETS)
+
+    catalog = PolyHavenCatalog(str(tmp_path / "catalog.json"), loader=loader or load, clock=clock)
+    catalog.refresh()
+    return catalog, calls
+
+
+def test_search_ranked_by_downloads_and_paginated(tmp_path, fake_clock):
+    catalog, _ = _loaded(tmp_path, fake_clock)
+
+    first = catalog.search("all", per_page=2)
+    assert list(first["assets"]) == ["plank", "studio"]
+    assert (first["total_count"], first["returned_count"]) == (5, 2)
+    assert list(catalog.search("all", page=3, per_page=2)["assets"]) == ["chair"]
+    assert catalog.search("all", page=4, per_page=2)["assets"] == {}
+
+    assert list(catalog.search("textures")["assets"]) == ["plank", "bark"]
+    assert list(catalog.search("all", "wood")["assets"]) == ["plank", "bark", "chair"]
+    # Several categories (and tags) must all match
+    assert list(catalog.search("textures", "wood, natural")["assets"]) == ["bark"]
+    assert list(catalog.search("all", tags="tree")["assets"]) == ["bark"]
+    assert catalog.search("models", "skies")["total_count"] == 0
+
+
+def test_category_counts_per_type(tmp_path, fake_clock):
+    catalog, _ = _loaded(tmp_path, fake_clock)
+    assert catalog.categories("hdris") == {"all": 2, "outdoor": 1, "skies": 1, "indoor": 1, "studio": 1}
+    assert catalog.categories("all")["wood"] == 3
+    assert catalog.categories("models") == {"all": 1, "furniture": 1, "wood": 1}
+
+
+def test_snapshot_persisted_and_reloaded(tmp_path, fake_clock):
+    _loaded(tmp_path, fake_clock)
+
+    def offline():
+        raise AssertionError("no network expected")
+
+    restarted = PolyHavenCatalog(str(tmp_path / "catalog.json"), loader=offline, clock=fake_clock)
+    assert restarted.search("hdris")["total_count"] == 2
+
+
+def test_stale_snapshot_served_while_refreshing(tmp_path, fake_clock):
+    catalog, calls = _loaded(tmp_path, fake_clock)
+    catalog.max_age = 60
+    fake_clock.now += 120
+
+    # Served from the old snapshot; the refresh runs in the background
+    assert catalog.search("all")["total_count"] == 5
+    catalog._refresh_thread.join(5)
+    assert len(calls) == 2
+
+
+def test_no_snapshot_returns_none_and_starts_refresh(tmp_path):
+    catalog = PolyHavenCatalog(str(tmp_path / "catalog.json"), loader=lambda: dict(ASSETS))
+    assert catalog.search("all") is None
+    catalog._refresh_thread.join(5)
+    assert catalog.search("all")["total_count"] == 5
+
+
+def test_service_uses_catalog_without_network(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLENDER_MCP_POLYHAVEN_CATALOG", "1")
+    monkeypatch.setenv("BLENDER_MCP_POLYHAVEN_CATALOG_PATH", str(tmp_path / "catalog.json"))
+    polyhaven_catalog.reset_catalog()
+    monkeypatch.setattr(polyhaven_catalog.get_catalog(), "_loader", lambda: dict(ASSETS))
+    polyhaven_catalog.get_catalog().refresh()
+
+    def no_network(**kwargs):
+        pytest.fail("network search used")
+
+    monkeypatch.setattr(svc_polyhaven, "search_assets_network", no_network)
+    monkeypatch.setattr(svc_polyhaven, "fetch_categories", no_network)
+
+    res = svc_polyhaven.search_polyhaven_assets({"asset_type": "textures", "categories": "wood", "per_page": 1})
+    assert res["result"] == {"assets": {"plank": ASSETS["plank"]}, "total_count": 2, "returned_count": 1}
+    cats = svc_polyhaven.get_polyhaven_categories({"asset_type": "models"})
+    assert cats["result"]["categories"] == {"all": 1, "furniture": 1, "wood": 1}
@@ -20,6 +20,44 @@ def test_polyhaven_download_success(monkeypatch, tmp_path):
     assert res.get("result", {}).get("temp_dir").endswith("extracted")
 
 
+def test_polyhaven_download_selected_maps(monkeypatch, tmp_path):
+    seen = {}
+
+    def fake_download(**kwargs):
+        seen.update(kwargs)
+        return {"temp_dir": str(tmp_path), "maps": {"color": str(tmp_path / "bark_color.jpg")}}
+
+    monkeypatch.setattr(svc_polyhaven, "download_asset", fake_download)
+    res = svc_polyhaven.download_polyhaven_asset(
+        {"asset_id": "bark", "asset_type": "textures", "maps": "Color, normal"}
+    )
+    assert seen["maps"] == ["color", "normal"]
+    assert res["result"]["maps"] == {"color": str(tmp_path / "bark_color.jpg")}
+
+
+def test_download_asset_fetches_texture_maps_not_archive(monkeypatch, tmp_path):
+    import sys
+    import warnings
+
+    files_data = {"Diffuse": {"1k": {"jpg": {"url": "https://a/Diffuse_1k.jpg"}}}}
+    monkeypatch.setattr(svc_polyhaven.polyhaven_catalog, "fetch_files", lambda asset_id, session=None: files_data)
+    monkeypatch.setattr(svc_polyhaven.polyhaven_files, "download_bytes", lambda url, timeout=None, session=None: b"jpg")
+    # The deprecated façade must not be imported (and warn) on this path
+    monkeypatch.delitem(sys.modules, "blender_mcp.polyhaven", raising=False)
+
+    def no_archive(*args, **kwargs):
+        pytest.fail("archive downloaded")
+
+    monkeypatch.setattr(svc_polyhaven.downloaders, "download_and_extract_zip", no_archive)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        res = svc_polyhaven.download_asset(asset_id="bark", asset_type="textures", maps=["color", "roughness"])
+    assert "blender_mcp.polyhaven" not in sys.modules
+    assert list(res["maps"]) == ["color"]
+    with open(res["maps"]["color"], "rb") as fh:
+        assert fh.read() == b"jpg"
+
+
 ess_cases = [
     ({}, "asset_id"),
     ({"asset_id": 123, "asset_type": "hdris"}, "asset_id"),
@@ -27,6 +65,7 @@ ess_cases = [
     ({"asset_id": "a1", "asset_type": "foo"}, "asset_type"),
     ({"asset_id": "a1", "asset_type": "hdris", "resolution": 10}, "resolution"),
     ({"asset_id": "a1", "asset_type": "hdris", "file_format": 10}, "file_format"),
+    ({"asset_id": "a1", "asset_type": "textures", "maps": [1]}, "maps"),
 ]
 
 
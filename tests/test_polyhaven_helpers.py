@@ -8,6 +8,8 @@ if SRC_PATH not in sys.path:
     sys.path.insert(0, SRC_PATH)
 
 import blender_mcp.polyhaven as poly
+from blender_mcp.http import get_session
+from blender_mcp.services import polyhaven_files
 
 
 class DummyResponse:
@@ -34,7 +36,7 @@ def test_fetch_files_data_success(monkeypatch):
         called["url"] = url
         return DummyResponse(200, {"color": {"1k": {"jpg": {"url": "https://example.com/c.jpg"}}}})
 
-    monkeypatch.setattr(poly.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
     data = poly.fetch_files_data("asset123")
     assert "color" in data
     assert called["url"].endswith("/files/asset123")
@@ -52,6 +54,20 @@ def test_find_texture_map_urls():
     assert "gltf" not in res
 
 
+def test_find_texture_map_files_resolves_polyhaven_keys():
+    def block(name):
+        return {"1k": {"jpg": {"url": f"https://a/{name}_1k.jpg", "size": 3}, "exr": {"url": "https://a/x.exr"}}}
+
+    files_data = {k: block(k) for k in ("Diffuse", "Rough", "nor_dx", "nor_gl", "AO", "arm")}
+    files_data["blend"] = {"1k": {"blend": {"url": "https://a/t.blend"}}}
+
+    res = poly.find_texture_map_files(files_data, "1k", "jpg")
+    assert set(res) == {"color", "roughness", "normal", "arm"}  # no displacement map
+    assert res["normal"]["url"].endswith("nor_gl_1k.jpg")  # OpenGL normals for Blender
+    assert res["color"]["size"] == 3
+    assert set(poly.find_texture_map_files(files_data, "1k", "jpg", ["ao"])) == {"ao"}
+
+
 def test_find_model_file_info():
     files_data = {"gltf": {"1k": {"gltf": {"url": "https://a/model.gltf", "include": {}}}}}
     fi = poly.find_model_file_info(files_data, "gltf", "1k")
@@ -63,7 +79,7 @@ def test_download_bytes(monkeypatch):
     def fake_get(url, timeout=None):
         return DummyResponse(200, b"abc")
 
-    monkeypatch.setattr(poly.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
     b = poly.download_bytes("https://example.com/a.bin")
     assert b == b"abc"
 
@@ -75,11 +91,11 @@ def test_prepare_model_files(monkeypatch, tmp_path):
         "include": {"textures/tex.png": {"url": "https://example.com/models/textures/tex.png"}},
     }
 
-    def fake_download(url, timeout=None):
+    def fake_download(url, timeout=None, session=None):
         # Return deterministic bytes depending on url
         return b"MAIN" if url.endswith("main.gltf") else b"INC"
 
-    monkeypatch.setattr(poly, "download_bytes", fake_download)
+    monkeypatch.setattr(polyhaven_files, "download_bytes", fake_download)
 
     temp_dir, main_path = poly.prepare_model_files(file_info, base_temp_dir=str(tmp_path))
     assert main_path.startswith(str(tmp_path))
@@ -95,6 +111,86 @@ def test_prepare_model_files(monkeypatch, tmp_path):
         assert fh.read() == b"INC"
 
 
+def test_prepare_model_files_fetches_includes_concurrently(monkeypatch, tmp_path):
+    import threading
+    import time
+
+    file_info = {
+        "url": "https://example.com/models/main.gltf",
+        "include": {f"textures/t{i}.png": {"url": f"https://example.com/t{i}.png"} for i in range(6)},
+    }
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+    sessions = set()
+
+    def slow_download(url, timeout=None, session=None):
+        sessions.add(id(session))
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return url.encode()
+
+    monkeypatch.setattr(polyhaven_files, "download_bytes", slow_download)
+    timings = {}
+    poly.prepare_model_files(file_info, base_temp_dir=str(tmp_path), max_workers=3, timings=timings)
+
+    assert active["peak"] == 3
+    assert len(sessions) == 1
+    assert (tmp_path / "textures" / "t5.png").read_bytes() == b"https://example.com/t5.png"
+    assert set(timings) == {"main.gltf", "total"} | {f"textures/t{i}.png" for i in range(6)}
+    # 7 files of 50 ms, 3 at a time
+    assert timings["total"] < 7 * 0.05
+
+
+def test_prepare_texture_maps_fetches_only_requested_maps(monkeypatch, tmp_path):
+    import pytest
+
+    files_data = {
+        k: {"1k": {"jpg": {"url": f"https://a/{k}_1k.jpg"}}} for k in ("Diffuse", "Rough", "nor_gl", "AO", "Metal")
+    }
+    fetched = []
+
+    def fake_download(url, timeout=None, session=None):
+        fetched.append(url)
+        return url.encode()
+
+    monkeypatch.setattr(polyhaven_files, "download_bytes", fake_download)
+    temp_dir, paths = poly.prepare_texture_maps(
+        files_data, "bark", maps=["color", "normal", "displacement"], base_temp_dir=str(tmp_path)
+    )
+
+    assert temp_dir == str(tmp_path)
+    assert sorted(fetched) == ["https://a/Diffuse_1k.jpg", "https://a/nor_gl_1k.jpg"]
+    assert paths == {"color": str(tmp_path / "bark_color.jpg"), "normal": str(tmp_path / "bark_normal.jpg")}
+    assert (tmp_path / "bark_normal.jpg").read_bytes() == b"https://a/nor_gl_1k.jpg"
+
+    with pytest.raises(RuntimeError):
+        poly.prepare_texture_maps(files_data, "bark", "4k", base_temp_dir=str(tmp_path))
+
+
+def test_prepare_model_files_rejects_traversal_before_download(monkeypatch, tmp_path):
+    import pytest
+
+    calls = []
+
+    def record(url, timeout=None, session=None):
+        calls.append(url)
+        return b""
+
+    monkeypatch.setattr(polyhaven_files, "download_bytes", record)
+    file_info = {
+        "url": "https://example.com/models/main.gltf",
+        "include": {"../../escape.bin": {"url": "https://example.com/evil"}},
+    }
+    with pytest.raises(RuntimeError, match="Unsafe"):
+        poly.prepare_model_files(file_info, base_temp_dir=str(tmp_path / "dl"))
+    assert calls == []
+    assert not (tmp_path / "escape.bin").exists()
+
+
 def test_fetch_categories(monkeypatch):
     called = {}
 
@@ -102,7 +198,7 @@ def test_fetch_categories(monkeypatch):
         called["url"] = url
         return DummyResponse(200, {"hdris": 10, "textures": 20})
 
-    monkeypatch.setattr(poly.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
     cats = poly.fetch_categories("hdris")
     assert isinstance(cats, dict)
     assert called["url"].endswith("/categories/hdris")
@@ -116,7 +212,7 @@ def test_search_assets(monkeypatch):
         called["params"] = params
         return DummyResponse(200, {"asset1": {"name": "A"}, "asset2": {"name": "B"}})
 
-    monkeypatch.setattr(poly.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
     res = poly.search_assets({"type": "hdris", "categories": "sky"})
     assert "asset1" in res
     assert called["params"]["type"] == "hdris"
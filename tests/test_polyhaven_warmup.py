@@ -0,0 +1,107 @@
+"""Startup warm-up: catalog, files metadata and learned prefetches."""
+
+from __future__ import annotations
+
+import threading
+
+from blender_mcp import download_scheduler
+from blender_mcp.services import polyhaven as svc_polyhaven
+from blender_mcp.services import polyhaven_catalog, polyhaven_warmup
+from blender_mcp.services.polyhaven_catalog import PolyHavenCatalog
+from blender_mcp.services.polyhaven_warmup import warm_up
+
+ASSETS = {
+    "sky": {"name": "Sky", "type": 0, "categories": ["skies"], "download_count": 50},
+    "plank": {"name": "Plank", "type": 1, "categories": ["wood"], "download_count": 90},
+    "chair": {"name": "Chair", "type": 2, "categories": ["wood"], "download_count": 10},
+}
+
+
+def _catalog(tmp_path, files_calls):
+    def files(asset_id):
+        files_calls.append(asset_id)
+        return {"blend": {"1k": {"url": f"https://example.com/{asset_id}.blend"}}}
+
+    return PolyHavenCatalog(str(tmp_path / "catalog.json"), loader=lambda: dict(ASSETS), files_loader=files)
+
+
+def test_warm_up_fetches_catalog_and_metadata(tmp_path):
+    files_calls = []
+    catalog = _catalog(tmp_path, files_calls)
+
+    report = warm_up(catalog, top=2, learned=0, prefetch=lambda a, t: None)
+
+    assert report["catalog"] == "fetched"
+    assert sorted(files_calls) == ["plank", "sky"]
+    assert report["files"] == {"done": 2, "failed": 0, "skipped": 0}
+    assert catalog.categories("models") == {"all": 1, "wood": 1}
+    # Served from the metadata cache from now on
+    catalog.files("plank")
+    assert len(files_calls) == 2
+
+
+def test_learned_assets_prefetched_and_persisted(tmp_path):
+    catalog = _catalog(tmp_path, [])
+    catalog.record_request("chair", "models")
+    catalog.record_request("chair", "models")
+    catalog.record_request("sky", "hdris")
+
+    # Demand survives a restart
+    restarted = _catalog(tmp_path, [])
+    assert [a for a, _ in restarted.most_requested(5)] == ["chair", "sky"]
+
+    prefetched = []
+    report = warm_up(restarted, top=0, learned=1, prefetch=lambda a, t: prefetched.append((a, t)))
+    assert prefetched == [("chair", "models")]
+    assert report["prefetch"]["done"] == 1
+    assert restarted.cached_files("chair") is not None
+
+
+def test_budget_drops_pending_work(tmp_path):
+    release = threading.Event()
+
+    def slow_files(asset_id):
+        release.wait(5)
+        return {}
+
+    catalog = PolyHavenCatalog(str(tmp_path / "catalog.json"), loader=lambda: dict(ASSETS), files_loader=slow_files)
+    try:
+        report = warm_up(catalog, top=3, learned=0, workers=1, budget=0.1)
+    finally:
+        release.set()
+    assert report["files"]["done"] == 0
+    assert report["files"]["skipped"] == 3
+
+
+def test_prefetches_are_not_counted_as_demand(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLENDER_MCP_POLYHAVEN_CATALOG", "1")
+    monkeypatch.setenv("BLENDER_MCP_POLYHAVEN_CATALOG_PATH", str(tmp_path / "catalog.json"))
+    polyhaven_catalog.reset_catalog()
+    monkeypatch.setattr(svc_polyhaven.downloaders, "download_and_extract_zip", lambda url, timeout=None: "/tmp/x")
+
+    svc_polyhaven.download_asset(asset_id="plank", asset_type="textures")
+    with download_scheduler.download_priority("bulk"):
+        svc_polyhaven.download_asset(asset_id="sky", asset_type="hdris")
+
+    requested = polyhaven_catalog.get_catalog().most_requested(5)
+    assert [(a, e["count"], e["asset_type"]) for a, e in requested] == [("plank", 1, "textures")]
+
+
+def test_start_warm_up_runs_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLENDER_MCP_POLYHAVEN_CATALOG", "1")
+    monkeypatch.setenv("BLENDER_MCP_POLYHAVEN_CATALOG_PATH", str(tmp_path / "catalog.json"))
+    monkeypatch.setenv("BLENDER_MCP_WARMUP", "1")
+    polyhaven_catalog.reset_catalog()
+    catalog = polyhaven_catalog.get_catalog()
+    monkeypatch.setattr(catalog, "_loader", lambda: dict(ASSETS))
+    monkeypatch.setattr(catalog, "_files_loader", lambda asset_id: {})
+    monkeypatch.setenv("BLENDER_MCP_WARMUP_LEARNED", "0")
+
+    thread = polyhaven_warmup.start_warm_up()
+    assert polyhaven_warmup.start_warm_up() is thread
+    thread.join(5)
+    assert catalog.search("all")["total_count"] == 3
+
+    monkeypatch.setenv("BLENDER_MCP_WARMUP", "0")
+    polyhaven_warmup.reset_warm_up()
+    assert polyhaven_warmup.start_warm_up() is None
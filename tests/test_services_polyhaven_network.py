@@ -1,6 +1,4 @@
-import io
-import zipfile
-
+from blender_mcp.http import get_session
 from blender_mcp.services import polyhaven
 
 
@@ -22,27 +20,17 @@ def test_fetch_categories_requests(monkeypatch):
         assert "list" in url
         return DummyResp(200, {"categories": {"c1": 5}})
 
-    monkeypatch.setattr(polyhaven.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
     res = polyhaven.fetch_categories(asset_type="textures")
     assert res["categories"]["c1"] == 5
 
 
 def test_download_asset_uses_downloader(monkeypatch, tmp_path):
-    # Create a small zip in memory
-    bio = io.BytesIO()
-    with zipfile.ZipFile(bio, mode="w") as z:
-        z.writestr("file.txt", "hello")
-    zip_bytes = bio.getvalue()
-
-    def fake_download_bytes(url, timeout=60, headers=None):
+    def fake_download_and_extract(url, timeout=60, headers=None):
         assert "polyhaven" in url or url.startswith("http")
-        return zip_bytes
-
-    def fake_extract(zip_b):
         return str(tmp_path)
 
-    monkeypatch.setattr(polyhaven.downloaders, "download_bytes", fake_download_bytes)
-    monkeypatch.setattr(polyhaven.downloaders, "secure_extract_zip_bytes", lambda b: fake_extract(b))
+    monkeypatch.setattr(polyhaven.downloaders, "download_and_extract_zip", fake_download_and_extract)
 
     result = polyhaven.download_asset(download_url="http://example.com/test.zip")
     assert "temp_dir" in result
@@ -60,7 +48,7 @@ def test_search_assets_network_invalid_json(monkeypatch):
     def fake_get(url, params=None, timeout=None):
         return BadJSONResp()
 
-    monkeypatch.setattr(polyhaven.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
     res = polyhaven.search_assets_network(asset_type="all")
     assert isinstance(res, dict)
     assert "error" in res and "Invalid JSON" in res["error"]
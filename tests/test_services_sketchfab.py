@@ -1,7 +1,4 @@
-import io
-import zipfile
-
-from blender_mcp import sketchfab as sk
+from blender_mcp.http import get_session
 from blender_mcp.services import sketchfab as services_sketchfab
 
 
@@ -28,7 +25,7 @@ def test_search_models_with_key(monkeypatch):
         assert "search" in url
         return DummyResp(200, {"results": [{"name": "Model1"}]})
 
-    monkeypatch.setattr(sk.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
     data = services_sketchfab.search_models("apikey", "chair", None, count=5, downloadable=True)
     assert "results" in data
 
@@ -40,18 +37,11 @@ def test_download_model_uses_downloaders(monkeypatch, tmp_path):
             return DummyResp(200, {"gltf": {"url": "http://example.com/model.zip"}})
         return DummyResp(404, {})
 
-    # Create a zip bytes
-    bio = io.BytesIO()
-    with zipfile.ZipFile(bio, mode="w") as z:
-        z.writestr("f.txt", "x")
-    zip_bytes = bio.getvalue()
-
-    monkeypatch.setattr(sk.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
     # Patch downloaders used by the top-level sketchfab module
     from blender_mcp import downloaders
 
-    monkeypatch.setattr(downloaders, "download_bytes", lambda url, timeout=60, headers=None: zip_bytes)
-    monkeypatch.setattr(downloaders, "secure_extract_zip_bytes", lambda b: str(tmp_path))
+    monkeypatch.setattr(downloaders, "download_and_extract_zip", lambda url, timeout=60, headers=None: str(tmp_path))
 
     res = services_sketchfab.download_model("apikey", "uid123")
     assert "temp_dir" in res or "error" not in res
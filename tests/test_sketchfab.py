@@ -7,6 +7,7 @@ if SRC_PATH not in sys.path:
     sys.path.insert(0, SRC_PATH)
 
 import blender_mcp.sketchfab as sketchfab
+from blender_mcp.http import get_session
 
 
 class DummyResp:
@@ -22,7 +23,7 @@ def test_get_sketchfab_status_ok(monkeypatch):
     def fake_get(url, headers=None, timeout=None):
         return DummyResp(200, {"username": "alice"})
 
-    monkeypatch.setattr(sketchfab.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
     res = sketchfab.get_sketchfab_status("token-123")
     assert res["enabled"] is True
     assert "alice" in res["message"]
@@ -32,7 +33,7 @@ def test_search_models_error_auth(monkeypatch):
     def fake_get(url, headers=None, params=None, timeout=None):
         return DummyResp(401, {})
 
-    monkeypatch.setattr(sketchfab.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
     res = sketchfab.search_models(api_key="bad", query="test")
     assert "error" in res
 
@@ -41,33 +42,41 @@ def test_download_model_uses_downloaders(monkeypatch, tmp_path):
     # Provide a fake downloaders implementation
     called = {}
 
-    def fake_download_bytes(url, timeout=30):
+    def fake_download_and_extract(url, timeout=30):
         called["url"] = url
-        # Create a small zip file in memory with a dummy glb
-        import io
-        import zipfile
-
-        buf = io.BytesIO()
-        with zipfile.ZipFile(buf, "w") as zf:
-            zf.writestr("model.glb", b"GLB")
-        return buf.getvalue()
-
-    def fake_extract(zip_bytes):
         d = tmp_path / "extracted"
         d.mkdir()
         p = d / "model.glb"
         p.write_bytes(b"GLB")
         return str(d)
 
-    monkeypatch.setattr(sketchfab.downloaders, "download_bytes", fake_download_bytes)
-    monkeypatch.setattr(sketchfab.downloaders, "secure_extract_zip_bytes", fake_extract)
+    monkeypatch.setattr(sketchfab.downloaders, "download_and_extract_zip", fake_download_and_extract)
 
     # Mock the initial Sketchfab download metadata request
     def fake_get(url, headers=None, timeout=None):
         return DummyResp(200, {"gltf": {"url": "https://example.com/model.zip"}})
 
-    monkeypatch.setattr(sketchfab.requests, "get", fake_get)
+    monkeypatch.setattr(get_session(), "get", fake_get)
 
     res = sketchfab.download_model(api_key="tok", uid="u123")
     assert "temp_dir" in res
     assert called.get("url") is not None
+
+
+def test_download_model_checks_authorization_before_cache(monkeypatch):
+    class CachedModel:
+        def peek_extracted(self, key):
+            return "/cache/extracted/model"
+
+    def fake_get(url, headers=None, timeout=None):
+        return DummyResp(401, {})
+
+    def fake_download_and_extract(url, **kwargs):
+        raise AssertionError("archive served without authorization")
+
+    monkeypatch.setattr(sketchfab, "get_asset_cache", lambda: CachedModel())
+    monkeypatch.setattr(sketchfab.downloaders, "download_and_extract_zip", fake_download_and_extract)
+    monkeypatch.setattr(get_session(), "get", fake_get)
+
+    res = sketchfab.download_model("bad-key", "uid1")
+    assert res == {"error": "Authentication failed (401)", "status_code": 401}
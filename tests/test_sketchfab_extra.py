@@ -7,6 +7,7 @@ if SRC_PATH not in sys.path:
     sys.path.insert(0, SRC_PATH)
 
 import blender_mcp.sketchfab as sketchfab
+from blender_mcp.http import get_session
 
 
 class DummyResp:
@@ -23,13 +24,13 @@ def test_download_model_fallback_returns_error_when_download_fails(monkeypatch):
     def fake_get_meta(url, headers=None, timeout=None):
         return DummyResp(200, {"gltf": {"url": "https://example.com/model.zip"}})
 
-    monkeypatch.setattr(sketchfab.requests, "get", fake_get_meta)
+    monkeypatch.setattr(get_session(), "get", fake_get_meta)
 
-    # Make downloaders.download_bytes raise to simulate helper failure
-    def fake_download_bytes(url, timeout=30):
+    # Make the downloader raise to simulate helper failure
+    def fake_download_and_extract(url, timeout=30):
         raise RuntimeError("no downloader")
 
-    monkeypatch.setattr(sketchfab.downloaders, "download_bytes", fake_download_bytes)
+    monkeypatch.setattr(sketchfab.downloaders, "download_and_extract_zip", fake_download_and_extract)
 
     res = sketchfab.download_model(api_key="tok", uid="u1")
     assert "error" in res
@@ -0,0 +1,147 @@
+"""Progressive textures: background upgrades and image swaps."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import types
+
+from blender_mcp import download_scheduler
+from blender_mcp.services import texture_upgrades
+from blender_mcp.services.addon import textures as addon_textures
+from blender_mcp.services.texture_upgrades import TextureUpgrades, image_swaps
+
+PATHS_4K = {"color": "/ws/wood_color.jpg", "roughness": "/ws/wood_roughness.jpg", "normal": "/ws/wood_normal.jpg"}
+
+
+def test_image_swaps_follow_material_spec_node_ids():
+    swaps = image_swaps(dict(PATHS_4K, arm="/ws/wood_arm.jpg"))
+    assert swaps == {
+        "tex_base_color": ("color", "/ws/wood_color.jpg"),
+        "tex_roughness": ("roughness", "/ws/wood_roughness.jpg"),
+        "tex_normal": ("normal", "/ws/wood_normal.jpg"),
+    }
+
+
+def test_upgrade_runs_once_per_texture_in_background():
+    release = threading.Event()
+    downloads, swaps = [], []
+
+    def download(texture_id, resolution, file_format, maps):
+        downloads.append((texture_id, resolution, download_scheduler.current_priority()))
+        release.wait(5)
+        return PATHS_4K
+
+    upgrades = TextureUpgrades(download=download, swap=lambda mat, paths: swaps.append((mat, paths)))
+    first = upgrades.start("wood", "wood_material_Cube", "4k", maps=["color", "roughness", "normal"])
+    assert first["state"] == "downloading"
+
+    again = upgrades.start("wood", "wood_material_Cube", "4k", maps=["color"])
+    assert again["already_running"] and again["started_at"] == first["started_at"]
+
+    release.set()
+    upgrades.wait("wood", 5)
+    assert downloads == [("wood", "4k", "bulk")]
+    assert swaps == [("wood_material_Cube", PATHS_4K)]
+    status = upgrades.status("wood")
+    assert status["state"] == "done" and status["error"] is None
+    assert list(upgrades.status()) == ["wood"]
+    assert upgrades.status("stone") == {}
+
+
+def test_failed_upgrade_reported_and_can_be_retried():
+    def broken(texture_id, resolution, file_format, maps):
+        raise RuntimeError("no 4k maps")
+
+    upgrades = TextureUpgrades(download=broken, swap=lambda mat, paths: None)
+    upgrades.start("wood", "mat", "4k", maps=["color"])
+    upgrades.wait("wood", 5)
+    status = upgrades.status("wood")
+    assert (status["state"], status["error"]) == ("failed", "no 4k maps")
+
+    upgrades.start("wood", "mat", "8k", maps=["color"])
+    upgrades.wait("wood", 5)
+    assert upgrades.status("wood")["resolution"] == "8k"
+
+
+class _Image:
+    def __init__(self, name, users=0):
+        self.name = name
+        self.users = users
+        self.colorspace_settings = types.SimpleNamespace(name="sRGB")
+        self.packed_file = None
+
+    def pack(self):
+        self.packed_file = object()
+
+
+def _fake_bpy(nodes):
+    removed = []
+    images = types.SimpleNamespace(load=lambda path: _Image(path.rsplit("/", 1)[-1]), remove=removed.append)
+    material = types.SimpleNamespace(node_tree=types.SimpleNamespace(nodes=nodes))
+    timers = types.SimpleNamespace(register=lambda fn, first_interval=0.0: threading.Thread(target=fn).start())
+    bpy = types.ModuleType("bpy")
+    bpy.data = types.SimpleNamespace(materials={"wood_material_Cube": material}, images=images)
+    bpy.app = types.SimpleNamespace(timers=timers)
+    return bpy, removed
+
+
+def test_swap_replaces_node_images_on_main_thread(monkeypatch):
+    old_color = _Image("wood_color")
+    nodes = {
+        "tex_base_color": types.SimpleNamespace(image=old_color),
+        "tex_normal": types.SimpleNamespace(image=_Image("wood_normal", users=2)),
+    }
+    bpy, removed = _fake_bpy(nodes)
+    monkeypatch.setitem(sys.modules, "bpy", bpy)
+
+    texture_upgrades._swap_in_blender("wood_material_Cube", PATHS_4K)
+
+    color = nodes["tex_base_color"].image
+    assert color is not old_color and removed == [old_color]
+    assert color.name == "wood_color"  # name of the replaced image reused
+    assert color.colorspace_settings.name == "sRGB" and color.packed_file is not None
+    normal = nodes["tex_normal"].image
+    assert normal.name == "wood_normal.jpg"  # old image still used elsewhere: kept
+    assert normal.colorspace_settings.name == "Non-Color"
+
+
+def test_swap_errors_reach_the_upgrade(monkeypatch):
+    bpy, _ = _fake_bpy({})
+    bpy.data.materials = {}
+    monkeypatch.setitem(sys.modules, "bpy", bpy)
+    upgrades = TextureUpgrades(download=lambda *a: PATHS_4K)
+    upgrades.start("wood", "missing", "4k", maps=["color"])
+    upgrades.wait("wood", 5)
+    assert "Material not found" in upgrades.status("wood")["error"]
+
+
+def test_progressive_set_texture_applies_1k_then_upgrades(monkeypatch):
+    from blender_mcp.services import polyhaven as svc_polyhaven
+
+    bpy, _ = _fake_bpy({})
+    bpy.data.objects = {"Cube": types.SimpleNamespace(data=types.SimpleNamespace(materials=[]))}
+    monkeypatch.setitem(sys.modules, "bpy", bpy)
+    requested = []
+
+    def fake_download(**kwargs):
+        requested.append((kwargs["resolution"], tuple(kwargs["maps"])))
+        return {"temp_dir": "/ws", "maps": {"color": "/ws/wood_color.jpg", "normal": "/ws/wood_normal.jpg"}}
+
+    monkeypatch.setattr(svc_polyhaven, "download_asset", fake_download)
+    created = {}
+    monkeypatch.setattr(
+        addon_textures, "_try_create_material", lambda names, tex, obj: created.update(names) or f"{tex}_material_{obj}"
+    )
+    upgraded = []
+    upgrades = TextureUpgrades(download=lambda *a: PATHS_4K, swap=lambda mat, paths: upgraded.append(mat))
+    monkeypatch.setattr(texture_upgrades, "_default", upgrades)
+
+    res = addon_textures.set_texture("Cube", "wood", progressive=True, resolution="2k")
+    upgrades.wait("wood", 5)
+
+    assert requested == [("1k", ("color", "roughness", "normal", "displacement", "arm"))]
+    assert res["success"] and res["material"] == "wood_material_Cube"
+    assert created == {"color": "wood_color", "normal": "wood_normal"}
+    assert res["upgrade"]["resolution"] == "2k"
+    assert upgraded == ["wood_material_Cube"]
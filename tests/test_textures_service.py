@@ -46,3 +46,34 @@ def test_set_texture_addon_exception(monkeypatch):
     monkeypatch.setattr(svc_textures, "_addon_set_texture", boom)
     with pytest.raises(HandlerError):
         svc_textures.set_texture({"object_name": "Cube", "texture_id": "wood_01"})
+
+
+def test_set_texture_progressive_reports_upgrade(monkeypatch):
+    seen = {}
+
+    def addon(obj, tex, progressive=False, resolution=None):
+        seen.update(progressive=progressive, resolution=resolution)
+        upgrade = {"texture_id": tex, "resolution": "4k", "state": "downloading"}
+        return {"success": True, "material": "matA", "maps": ["color"], "upgrade": upgrade}
+
+    monkeypatch.setattr(svc_textures, "_addon_set_texture", addon)
+    res = svc_textures.set_texture({"object_name": "Cube", "texture_id": "wood_01", "progressive": True})
+    assert seen == {"progressive": True, "resolution": None}
+    assert res["result"]["upgrade"]["state"] == "downloading"
+    assert res["result"]["maps"] == ["color"]
+    with pytest.raises(InvalidParamsError):
+        svc_textures.set_texture({"object_name": "Cube", "texture_id": "wood_01", "progressive": "yes"})
+
+
+def test_texture_upgrade_status_service(monkeypatch):
+    from blender_mcp.services import texture_upgrades
+
+    upgrades = texture_upgrades.TextureUpgrades(download=lambda *a: {}, swap=lambda mat, paths: None)
+    monkeypatch.setattr(texture_upgrades, "_default", upgrades)
+    upgrades.start("wood_01", "matA", "4k", maps=["color"])
+    upgrades.wait("wood_01", 5)
+
+    one = svc_textures.get_texture_upgrade_status({"texture_id": "wood_01"})
+    assert one["result"]["upgrade"]["state"] == "done"
+    assert list(svc_textures.get_texture_upgrade_status()["result"]["upgrades"]) == ["wood_01"]
+    assert svc_textures.get_texture_upgrade_status({"texture_id": "stone"})["result"]["upgrade"] == {}
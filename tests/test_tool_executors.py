@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import types
+
+import pytest
+
+from blender_mcp import tool_executors
+from blender_mcp.errors import ServiceBusyError
+
+
+@pytest.fixture(autouse=True)
+def _fresh_executors():
+    tool_executors.reset_tool_executors()
+    yield
+    tool_executors.reset_tool_executors()
+
+
+def test_classify_by_declaration_then_name():
+    @tool_executors.tool_class("cpu")
+    def crunch(ctx):
+        return None
+
+    assert tool_executors.classify("crunch", crunch) == "cpu"
+    assert tool_executors.classify("download_polyhaven_asset") == "network-io"
+    assert tool_executors.classify("search_sketchfab_models") == "network-io"
+    assert tool_executors.classify("get_scene_info") == "blender-io"
+    with pytest.raises(ValueError):
+        tool_executors.tool_class("gpu")
+
+
+def test_limits_parsing_and_overrides():
+    assert tool_executors._parse_limits("a=2/5, b=3,bad,c=x") == {"a": (2, 5), "b": (3, None)}
+    ex = tool_executors.ToolExecutors({"blender-io": 3}, default_queue=7, limits={"a": (2, 0)})
+    assert (ex.gate("a").max_concurrency, ex.gate("a").max_queue) == (2, 0)
+    assert (ex.gate("get_scene_info").max_concurrency, ex.gate("get_scene_info").max_queue) == (3, 7)
+    ex.set_limit("get_scene_info", 1, 2)
+    assert ex.gate("get_scene_info").max_concurrency == 1
+    ex.shutdown()
+
+
+def test_gate_bounds_concurrency_and_rejects_when_queue_full():
+    ex = tool_executors.ToolExecutors({"network-io": 8}, limits={"download_x": (2, 1)})
+    release = threading.Event()
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def work():
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        release.wait(5)
+        with lock:
+            active["now"] -= 1
+        return "ok"
+
+    async def scenario():
+        tasks = [asyncio.ensure_future(ex.run("download_x", work)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(ServiceBusyError) as busy:
+            await ex.run("download_x", work)
+        release.set()
+        return busy.value, await asyncio.gather(*tasks)
+
+    busy, results = asyncio.run(scenario())
+
+    assert results == ["ok", "ok", "ok"]
+    assert active["peak"] == 2
+    assert busy.retry_after >= 1
+    stats = ex.stats()["tools"]["download_x"]
+    assert stats["rejected"] == 1
+    assert stats["run"]["count"] == 3
+    assert stats["queue_wait"]["count"] == 3
+    assert (stats["running"], stats["queued"]) == (0, 0)
+    ex.shutdown()
+
+
+def test_cancelled_waiter_does_not_leak_slot():
+    ex = tool_executors.ToolExecutors(limits={"t": (1, 4)})
+    release = threading.Event()
+
+    async def scenario():
+        first = asyncio.ensure_future(ex.run("t", lambda: release.wait(5)))
+        await asyncio.sleep(0.02)
+        waiter = asyncio.ensure_future(ex.run("t", lambda: "never"))
+        await asyncio.sleep(0.02)
+        waiter.cancel()
+        release.set()
+        await first
+        return await ex.run("t", lambda: "after")
+
+    assert asyncio.run(scenario()) == "after"
+    assert ex.gate("t").stats()["running"] == 0
+    ex.shutdown()
+
+
+def test_network_burst_does_not_starve_blender_tools():
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from blender_mcp import asgi
+
+    mod = types.ModuleType("fake_exec_server")
+    release = threading.Event()
+    mod.download_polyhaven_asset = lambda ctx: release.wait(5) and "downloaded"
+    mod.get_scene_info = lambda ctx: {"scene": "ok"}
+
+    tool_executors.get_tool_executors().set_limit("download_polyhaven_asset", 2, 1)
+    client = TestClient(asgi.create_app(mod))
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client.post("/tools/download_polyhaven_asset", json={})))
+        for _ in range(3)
+    ]
+    for t in threads:
+        t.start()
+    try:
+        # Give the burst time to fill both slots and the single queue entry
+        for _ in range(100):
+            stats = tool_executors.get_tool_executors().gate("download_polyhaven_asset").stats()
+            if stats["running"] == 2 and stats["queued"] == 1:
+                break
+            threading.Event().wait(0.01)
+        busy = client.post("/tools/download_polyhaven_asset", json={})
+        scene = client.post("/tools/get_scene_info", json={})
+    finally:
+        release.set()
+        for t in threads:
+            t.join(5)
+
+    assert scene.status_code == 200
+    assert busy.status_code == 503
+    assert busy.json()["error_code"] == "busy"
+    assert int(busy.headers["retry-after"]) >= 1
+    assert [r.status_code for r in results] == [200, 200, 200]
+
+    metrics = client.get("/debug/executors").json()["executors"]["tools"]
+    assert metrics["get_scene_info"]["class"] == "blender-io"
+    assert metrics["download_polyhaven_asset"]["rejected"] == 1
@@ -0,0 +1,164 @@
+"""Workspace quotas, reference counts and garbage collection."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from blender_mcp import downloaders, workspace
+from blender_mcp.workspace import Workspace
+
+
+def _fill(ws, size, provider="polyhaven"):
+    path = ws.mkdtemp(provider=provider)
+    with open(os.path.join(path, "data.bin"), "wb") as fh:
+        fh.write(b"\0" * size)
+    ws.release(path)
+    return path
+
+
+def test_idle_entries_collected_unless_held(tmp_path, fake_clock):
+    ws = Workspace(str(tmp_path), max_idle=60, clock=fake_clock)
+    idle = _fill(ws, 10)
+    held = _fill(ws, 10)
+    ws.acquire(held)
+    fake_clock.now += 120
+
+    assert ws.collect() == 10
+    assert not os.path.exists(idle)
+    assert os.path.exists(held)
+
+    ws.release(held)  # releasing counts as an access
+    fake_clock.now += 120
+    ws.collect()
+    assert not os.path.exists(held)
+    assert ws.stats()["removed"] == 2
+
+
+def test_quota_removes_least_recently_used(tmp_path, fake_clock):
+    ws = Workspace(str(tmp_path), max_bytes=250, grace=5, clock=fake_clock)
+    first = _fill(ws, 100)
+    fake_clock.now += 10
+    second = _fill(ws, 100)
+    fake_clock.now += 10
+    with ws.hold(first):  # touch: second is now least recently used
+        pass
+    fake_clock.now += 10
+
+    third = _fill(ws, 100)  # over quota: the release collects
+    assert os.path.exists(first) and os.path.exists(third)
+    assert not os.path.exists(second)
+    assert ws.stats()["bytes"] == 200
+
+
+def test_quota_spares_recent_entries(tmp_path, fake_clock):
+    ws = Workspace(str(tmp_path), max_bytes=50, grace=60, clock=fake_clock)
+    path = _fill(ws, 100)
+    assert ws.collect() == 0 and os.path.exists(path)
+    fake_clock.now += 120
+    assert ws.collect() == 100
+
+
+def test_stats_per_provider_and_leftovers_adopted(tmp_path):
+    ws = Workspace(str(tmp_path))
+    _fill(ws, 10, provider="polyhaven")
+    _fill(ws, 20, provider="polyhaven")
+    held = ws.mkstemp(suffix=".glb", provider="hyper3d")
+
+    providers = ws.stats()["providers"]
+    assert providers["polyhaven"] == {"entries": 2, "bytes": 30, "held": 0}
+    assert providers["hyper3d"]["held"] == 1
+    assert held.endswith(".glb")
+
+    # A restarted process finds and manages what was left behind
+    restarted = Workspace(str(tmp_path), max_idle=0)
+    assert restarted.stats()["adopted"] == 3
+    restarted.collect()
+    assert restarted.stats()["entries"] == 0
+
+
+def test_entries_of_live_processes_not_adopted(tmp_path, fake_clock):
+    pdir = tmp_path / "sketchfab"
+    pdir.mkdir()
+    for name in ("model~4242~abc", "model~4343~abc", "untagged_new", "untagged_old"):
+        (pdir / name).mkdir()
+        os.utime(pdir / name, (500.0, 500.0))
+    os.utime(pdir / "untagged_new", (1000.0, 1000.0))
+    # Process 4242 still runs (holds its owner lock); 4343 exited
+    (tmp_path / workspace.OWNERS_DIR).mkdir()
+    with open(tmp_path / workspace.OWNERS_DIR / "4242.lock", "a+b") as owner:
+        assert workspace._try_lock(owner)
+        ws = Workspace(str(tmp_path), max_idle=0, grace=300, clock=fake_clock)
+    assert ws.stats()["adopted"] == 2
+
+    ws.collect()
+    assert sorted(os.listdir(pdir)) == ["model~4242~abc", "untagged_new"]
+    assert ws.mkdtemp(prefix="x_", provider="misc").startswith(str(tmp_path / "misc" / f"x_~{os.getpid()}~"))
+
+
+def test_provider_taken_from_context(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLENDER_MCP_WORKSPACE_DIR", str(tmp_path / "ws"))
+    workspace.reset_workspace()
+
+    def fake_download_to_file(url, path, timeout=None, headers=None):
+        with open(path, "wb") as fh:
+            fh.write(b"glb")
+
+    monkeypatch.setattr(downloaders, "download_to_file", fake_download_to_file)
+    with workspace.using_provider("hyper3d"):
+        path = downloaders.download_to_tempfile("https://example.com/m.glb", suffix=".glb")
+
+    assert path.startswith(str(tmp_path / "ws" / "hyper3d"))
+    assert workspace.get_workspace().stats()["providers"]["hyper3d"] == {"entries": 1, "bytes": 3, "held": 1}
+
+
+def test_returned_downloads_survive_collection_until_released(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLENDER_MCP_WORKSPACE_DIR", str(tmp_path / "ws"))
+    monkeypatch.setenv("BLENDER_MCP_WORKSPACE_MAX_IDLE", "0")
+    monkeypatch.setenv("BLENDER_MCP_WORKSPACE_BYTES", "0")
+    workspace.reset_workspace()
+
+    def fake_download_to_file(url, path, timeout=None, headers=None):
+        with open(path, "wb") as fh:
+            fh.write(b"texture")
+
+    monkeypatch.setattr(downloaders, "download_to_file", fake_download_to_file)
+    path = downloaders.download_to_tempfile("https://example.com/wood_color.jpg", suffix=".jpg")
+    ws = workspace.get_workspace()
+
+    # Blender loads the image from this path: idle and over quota, it stays
+    ws.collect()
+    assert os.path.exists(path)
+
+    ws.release(path)
+    ws.collect()
+    assert not os.path.exists(path)
+
+
+def test_failed_download_removed(monkeypatch):
+    def broken(url, path, timeout=None, headers=None):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(downloaders, "download_to_file", broken)
+    with pytest.raises(RuntimeError):
+        downloaders.download_to_tempfile("https://example.com/x.bin")
+    ws = workspace.get_workspace()
+    assert ws.stats()["entries"] == 0
+    assert os.listdir(os.path.join(ws.root, "misc")) == []
+
+
+def test_background_collector(tmp_path):
+    ws = Workspace(str(tmp_path), max_idle=0)
+    path = _fill(ws, 10)
+    ws.start_gc(0.05)
+    try:
+        deadline = time.monotonic() + 5
+        while os.path.exists(path) and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert not os.path.exists(path)
+        assert ws.stats()["gc_running"]
+    finally:
+        ws.stop_gc()
+    assert not ws.stats()["gc_running"]